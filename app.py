@@ -1,22 +1,32 @@
 # app.py
 from flask import Flask, request, render_template, jsonify, Response, redirect, url_for
+from markupsafe import escape
 from wheat.field_manager import FieldManager
-from wheat.paths import load_config, load_projects, save_projects, load_project_config
-from wheat.channels import load_channels, get_channels_for_field, process_intake
+from wheat.paths import load_config, load_projects, update_projects, load_project_config
+from wheat.channels import get_channels_for_field, process_intake
+from wheat.run_events import create_run_events_table, events_after, run_log
+from wheat.field_hub import hub as field_hub, HEARTBEAT_SECONDS
+from wheat import log_tail
+from wheat.offload import offload, spawn_native
+from wheat import dashboard_snapshot
+from wheat import instrumentation, metrics_store, tending
 from wheat.escalation import (
     init_escalation_db, create_case, escalate_case, resolve_case,
     get_cases_by_field, get_escalation_ready, get_cross_field_entities,
-    daily_escalation_check, get_all_cases, get_case_history,
-    get_stage_distribution, get_field_list, STAGES,
+    daily_escalation_check, get_case_history,
+    get_stage_distribution, get_field_list, get_summary_tag, list_cases, validate_case_filters,
+    CASE_PAGE_SIZE, CASE_SORTS, LIST_CASE_COLUMNS, STAGES,
 )
 import sqlite3
 import os
 import json
+import queue
 import sys
 import threading
 import time
 from datetime import datetime, date
 import shutil
+from urllib.parse import quote
 import re
 from tools.stewards_map import get_stewards_map, get_map_as_string
 
@@ -29,11 +39,18 @@ DB_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "wheat.db")
 # ---------------------------------------------------------------------------
 
 class FieldState:
-    """Thread-safe registry of per-project field managers."""
+    """Thread-safe registry of per-project field managers; tending runs on the shared supervisor."""
 
-    def __init__(self):
+    def __init__(self, supervisor=None):
         self._lock = threading.Lock()
-        self._projects = {}  # project_id -> {"manager", "sowing", "tending_thread"}
+        self._projects = {}  # project_id -> {"manager", "sowing"}
+        self._supervisor = supervisor
+
+    @property
+    def supervisor(self):
+        if self._supervisor is None:
+            self._supervisor = tending.supervisor()
+        return self._supervisor
 
     def _ensure_project(self, project_id):
         """Get or create state for a project. Must be called under _lock."""
@@ -42,7 +59,6 @@ class FieldState:
             self._projects[project_id] = {
                 "manager": FieldManager(project_id=project_id, config=config),
                 "sowing": False,
-                "tending_thread": None,
             }
         return self._projects[project_id]
 
@@ -64,34 +80,27 @@ class FieldState:
                 self._projects[project_id]["sowing"] = False
 
     def reset_manager(self, project_id):
+        """Replace the project's manager (fresh config); a tended field carries on with the new one."""
         with self._lock:
             config = load_project_config(project_id)
-            self._projects[project_id] = {
-                "manager": FieldManager(project_id=project_id, config=config),
-                "sowing": False,
-                "tending_thread": None,
-            }
+            manager = FieldManager(project_id=project_id, config=config)
+            self._projects[project_id] = {"manager": manager, "sowing": False}
+            if self.supervisor.is_tending(project_id):
+                self.supervisor.add(project_id, manager)
 
     def ensure_tending(self, project_id):
         with self._lock:
-            p = self._ensure_project(project_id)
-            if p["tending_thread"] and p["tending_thread"].is_alive():
-                return
-            t = threading.Thread(target=p["manager"].tend_field, daemon=True)
-            p["tending_thread"] = t
-            t.start()
+            self.supervisor.add(project_id, self._ensure_project(project_id)["manager"])
 
     def clear(self, project_id):
         with self._lock:
+            self.supervisor.remove(project_id)
             if project_id in self._projects:
                 self._projects[project_id]["manager"].seeds = []
-                self._projects[project_id]["tending_thread"] = None
 
     def active_projects(self):
-        """Return list of project_ids that have a running tending thread."""
-        with self._lock:
-            return [pid for pid, p in self._projects.items()
-                    if p["tending_thread"] and p["tending_thread"].is_alive()]
+        """Return list of project_ids being tended."""
+        return self.supervisor.active()
 
 
 state = FieldState()
@@ -141,6 +150,12 @@ def init_db():
     if "project_id" not in existing_cols:
         c.execute("ALTER TABLE seeds ADD COLUMN project_id TEXT DEFAULT 'default'")
 
+    # Latest-run lookups and the SeedStore's (run_id, seed_id) writes
+    c.execute("CREATE INDEX IF NOT EXISTS idx_seeds_project_run ON seeds(project_id, run_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_runs_project_id ON runs(project_id, id)")
+    create_run_events_table(c)
+    dashboard_snapshot.create_seed_counts_table(c)
+
     conn.commit()
     conn.close()
 
@@ -150,116 +165,94 @@ init_escalation_db()
 
 REPORTS_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "reports")
 BRIEFINGS_DIR = os.path.join(REPORTS_DIR, "briefings")
+ENGINE_STATUS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "data", "engine_status.json")
+INTAKE_DIR = os.path.join(os.path.dirname(os.path.realpath(__file__)), "intake")
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
-def get_latest_run(project_id="default"):
+def get_latest_run(project_id="default", with_log=True):
+    """
+    (log, status_data) for the project's latest run, or (None, None).
+
+    status_data carries "run_id" and "cursor" (the last run_events seq in
+    the log) so streams can fetch only newer events. with_log=False skips
+    reading the log and returns None in its place.
+    """
     conn = sqlite3.connect(DB_PATH, timeout=15)
-    c = conn.cursor()
-    c.execute("SELECT id, timestamp, log FROM runs WHERE project_id = ? ORDER BY id DESC LIMIT 1", (project_id,))
-    run = c.fetchone()
-    if run:
-        run_id, timestamp, log = run
+    try:
+        c = conn.cursor()
+        c.execute("SELECT id, timestamp, log FROM runs WHERE project_id = ? ORDER BY id DESC LIMIT 1", (project_id,))
+        run = c.fetchone()
+        if not run:
+            return None, None
+        run_id, timestamp, legacy_log = run
         c.execute("SELECT seed_id, task, status, output, code_file, test_result FROM seeds WHERE run_id = ? AND project_id = ?", (run_id, project_id))
         seeds = c.fetchall()
+        log, cursor = run_log(c, run_id, legacy_log) if with_log else (None, None)
+    finally:
         conn.close()
-        return log, {"timestamp": timestamp, "seeds": {row[0]: {"task": row[1], "status": row[2], "output": json.loads(row[3]) if row[3] else [], "code_file": row[4], "test_result": row[5]} for row in seeds}}
-    conn.close()
-    return None, None
+    return log, {
+        "run_id": run_id,
+        "cursor": cursor,
+        "timestamp": timestamp,
+        "seeds": {row[0]: {"task": row[1], "status": row[2], "output": json.loads(row[3]) if row[3] else [], "code_file": row[4], "test_result": row[5]} for row in seeds},
+    }
 
 
-# ---------------------------------------------------------------------------
-# Routes: Dashboard
-# ---------------------------------------------------------------------------
+def get_run_events(run_id, after=0):
+    """[(seq, message)] logged for a run after the given cursor."""
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    try:
+        return events_after(conn.cursor(), run_id, after)
+    finally:
+        conn.close()
 
-@app.route("/")
-def dashboard():
-    projects = load_projects()
-    active = state.active_projects()
-    channels = load_channels()
 
-    # Enrich fields with latest run info and channel counts
-    field_list = []
-    for pid, pdata in projects.items():
-        log, status_data = get_latest_run(pid)
-        seeds = status_data["seeds"] if status_data else {}
-        fruitful = sum(1 for s in seeds.values() if s["status"] == "Fruitful")
-        barren = sum(1 for s in seeds.values() if s["status"] == "Barren")
-        growing = sum(1 for s in seeds.values() if s["status"] in ("Growing", "Repairing"))
-
-        field_channels = get_channels_for_field(pid)
-
-        field_list.append({
-            "id": pid,
-            "name": pdata.get("name", pid),
-            "description": pdata.get("description", ""),
-            "active": pid in active,
-            "fruitful": fruitful,
-            "barren": barren,
-            "growing": growing,
-            "total_seeds": len(seeds),
-            "channel_count": len(field_channels),
-        })
-
-    # Channel list for channels tab
-    channel_list = [
-        {
-            "id": cid,
-            "name": cdata.get("name", cid),
-            "channel_type": cdata.get("channel_type", ""),
-            "frequency": cdata.get("frequency", "daily"),
-            "fields": cdata.get("fields", []),
-        }
-        for cid, cdata in channels.items()
-    ]
+def _sse(event, data, event_id=None):
+    """One named server-sent event; multi-line data is split across data: lines."""
+    lines = [f"event: {event}"]
+    if event_id is not None:
+        lines.append(f"id: {event_id}")
+    lines.extend(f"data: {line}" for line in data.split("\n"))
+    return "\n".join(lines) + "\n\n"
 
-    # Cases
-    all_cases = []
-    conn = sqlite3.connect(DB_PATH, timeout=15)
-    c = conn.cursor()
-    c.execute("SELECT * FROM cases WHERE resolved_at IS NULL ORDER BY severity DESC, created_at")
-    columns = [desc[0] for desc in c.description] if c.description else []
-    all_cases = [dict(zip(columns, row)) for row in c.fetchall()] if columns else []
-    conn.close()
 
-    escalation_ready_cases = get_escalation_ready()
-    cross_field = get_cross_field_entities()
+def get_cycle_timing():
+    """Timing breakdown of the last daily cycle from data/engine_status.json, or None."""
+    try:
+        with open(ENGINE_STATUS_PATH) as f:
+            metrics = json.load(f).get("metrics", {})
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+    if "cycle_wall_seconds" not in metrics:
+        return None
+    return {
+        "cycle_id": metrics.get("cycle_id"),
+        "wall_seconds": metrics["cycle_wall_seconds"],
+        "critical_path": metrics.get("critical_path", []),
+        "critical_path_seconds": metrics.get("critical_path_seconds", 0.0),
+        "nodes": sorted(
+            metrics.get("node_seconds", {}).items(), key=lambda item: item[1], reverse=True
+        ),
+        "spans": metrics.get("span_summary", {}),
+        "trace_file": metrics.get("trace_file"),
+    }
 
-    # Latest briefing
-    latest_briefing = None
-    if os.path.exists(BRIEFINGS_DIR):
-        briefing_files = sorted(
-            [f for f in os.listdir(BRIEFINGS_DIR) if f.endswith(".txt")],
-            reverse=True,
-        )
-        if briefing_files:
-            with open(os.path.join(BRIEFINGS_DIR, briefing_files[0]), "r") as f:
-                latest_briefing = f.read()
-
-    # Today's community reports
-    intake_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "intake")
-    today_intake = 0
-    today_str = date.today().strftime("%Y%m%d")
-    if os.path.exists(intake_dir):
-        today_intake = sum(
-            1 for f in os.listdir(intake_dir)
-            if f.startswith("report_") and f.endswith(".json") and today_str in f
-        )
 
-    return render_template(
-        "dashboard.html",
-        fields=field_list,
-        channels=channel_list,
-        cases=all_cases,
-        active_cases=len(all_cases),
-        escalation_ready=len(escalation_ready_cases),
-        cross_field_entities=cross_field,
-        latest_briefing=latest_briefing,
-        today_intake=today_intake,
+# ---------------------------------------------------------------------------
+# Routes: Dashboard
+# ---------------------------------------------------------------------------
+
+@app.route("/")
+def dashboard():
+    data = offload(
+        dashboard_snapshot.snapshot,
+        load_projects(), DB_PATH, BRIEFINGS_DIR, INTAKE_DIR, active=state.active_projects(),
     )
+    return render_template("dashboard.html", cycle_timing=get_cycle_timing(), **data)
 
 
 # ---------------------------------------------------------------------------
@@ -271,15 +264,18 @@ def project_field(project_id):
     projects = load_projects()
     if project_id not in projects:
         return "Project not found", 404
-    log, status_data = get_latest_run(project_id)
+    log, status_data = offload(get_latest_run, project_id)
     log = log or "Field not yet sowed."
     status = status_data["seeds"] if status_data else {}
+    run_id = status_data["run_id"] if status_data else None
+    log_cursor = status_data["cursor"] if status_data else 0
     config = load_project_config(project_id)
     project = projects[project_id]
     field_channels = get_channels_for_field(project_id)
-    field_cases = get_cases_by_field(project_id)
+    field_cases = offload(get_cases_by_field, project_id, columns=LIST_CASE_COLUMNS)
     return render_template("field.html",
                            log=log, status=status,
+                           run_id=run_id, log_cursor=log_cursor,
                            config=config,
                            field_config=project,
                            field_channels=field_channels,
@@ -290,6 +286,27 @@ def project_field(project_id):
                            active=project_id in state.active_projects())
 
 
+def _sow(manager, project_id, guidance):
+    """Walk the stewards map, build the prompts and sow the field (blocking; run through offload)."""
+    get_stewards_map(include_params=True, include_descriptions=True)
+    stewards_map_str = get_map_as_string(include_params=True, include_descriptions=True)
+
+    config = load_project_config(project_id)
+
+    strategist_prompt = config["strategist_prompt"].format(
+        stewards_map=stewards_map_str,
+        file_contents=stewards_map_str,
+        seeds_per_run=config["seeds_per_run"],
+        guidance=guidance
+    )
+    coder_prompt_template = config["coder_prompt"].format(
+        stewards_map=stewards_map_str,
+        file_contents=stewards_map_str,
+        task="{task}"
+    )
+    manager.sow_field(guidance, strategist_prompt=strategist_prompt, coder_prompt=coder_prompt_template)
+
+
 @app.route("/projects/<project_id>/sow", methods=["POST"])
 def project_sow(project_id):
     if not state.try_start_sowing(project_id):
@@ -298,25 +315,8 @@ def project_sow(project_id):
         data = request.get_json() or {}
         guidance = data.get("guidance") or "No user input—sow tasks to improve wheat seeds."
 
-        get_stewards_map(include_params=True, include_descriptions=True)
-        stewards_map_str = get_map_as_string(include_params=True, include_descriptions=True)
-
-        config = load_project_config(project_id)
-
-        strategist_prompt = config["strategist_prompt"].format(
-            stewards_map=stewards_map_str,
-            file_contents=stewards_map_str,
-            seeds_per_run=config["seeds_per_run"],
-            guidance=guidance
-        )
-        coder_prompt_template = config["coder_prompt"].format(
-            stewards_map=stewards_map_str,
-            file_contents=stewards_map_str,
-            task="{task}"
-        )
-
         state.reset_manager(project_id)
-        state.manager(project_id).sow_field(guidance, strategist_prompt=strategist_prompt, coder_prompt=coder_prompt_template)
+        offload(_sow, state.manager(project_id), project_id, guidance)
         state.ensure_tending(project_id)
         return jsonify({"message": f"Seeds sowed for {project_id} with guidance: '{guidance}'"})
     except Exception as e:
@@ -330,16 +330,83 @@ def project_sow(project_id):
 
 @app.route("/projects/<project_id>/stream")
 def project_stream(project_id):
+    """
+    SSE for the field page, fed by the field hub rather than by polling.
+
+    On connect it reads the database once: the whole run ("run") if the
+    page shows an older run, otherwise the seed table ("status") and the
+    log events after the page's cursor ("log"). After that it only
+    forwards what FieldManager and the seeds publish:
+      run          — a new run started; status table and full log replaced
+      log          — new run_events (id: = last seq, for Last-Event-ID)
+      seed-<id>    — one changed seed row
+      seed-added   — a row for a seed the page hasn't seen
+      progress     — the processing line, when it changes
+    An SSE comment every HEARTBEAT_SECONDS keeps idle connections open and
+    lets the server notice a closed tab, which ends the generator.
+    """
+    shown_run = request.args.get("run", type=int)
+    cursor = request.headers.get("Last-Event-ID", type=int) or request.args.get("after", default=0, type=int)
+
     def event_stream():
-        with app.app_context():
-            while True:
-                log, status_data = get_latest_run(project_id)
-                log = log or "Field not yet sowed."
-                status = status_data["seeds"] if status_data else {}
-                html = render_template("partials/field_status.html", log=log, status=status)
-                escaped = html.replace("\n", "\ndata: ")
-                yield f"data: {escaped}\n\n"
-                time.sleep(1)
+        nonlocal shown_run, cursor
+        subscription = field_hub.subscribe(project_id)
+        try:
+            with app.app_context():
+                def reset():
+                    nonlocal shown_run, cursor
+                    log, status_data = offload(get_latest_run, project_id)
+                    shown_run = status_data["run_id"] if status_data else None
+                    cursor = status_data["cursor"] if status_data else 0
+                    status = status_data["seeds"] if status_data else {}
+                    html = render_template("partials/field_run.html", status=status, log=log or "Field not yet sowed.")
+                    return status, _sse("run", html, cursor)
+
+                _, status_data = offload(get_latest_run, project_id, with_log=False)
+                run_id = status_data["run_id"] if status_data else None
+                if run_id != shown_run:
+                    status, event = reset()
+                    yield event
+                else:
+                    status = status_data["seeds"] if status_data else {}
+                    events = offload(get_run_events, run_id, cursor) if run_id is not None else []
+                    yield _sse("status", render_template("partials/field_status.html", status=status))
+                    if events:
+                        cursor = events[-1][0]
+                        yield _sse("log", str(escape("".join(message for _, message in events))), cursor)
+                progress = render_template("partials/field_progress.html", status=status)
+
+                while True:
+                    try:
+                        kind, data = subscription.get(HEARTBEAT_SECONDS)
+                    except queue.Empty:
+                        kind = None
+                    if subscription.overflowed:
+                        return  # fell behind and was dropped; the browser reconnects and catches up
+                    if kind is None:
+                        yield ": heartbeat\n\n"
+                        continue
+                    if kind == "run":
+                        status, event = reset()
+                        yield event
+                    elif data["run_id"] != shown_run:
+                        continue
+                    elif kind == "log":
+                        events = [(seq, message) for seq, message in data["events"] if seq > cursor]
+                        if events:
+                            cursor = events[-1][0]
+                            yield _sse("log", str(escape("".join(message for _, message in events))), cursor)
+                    elif kind == "seeds":
+                        for seed_id, info in data["seeds"].items():
+                            event = f"seed-{seed_id}" if seed_id in status else "seed-added"
+                            status[seed_id] = info
+                            yield _sse(event, render_template("partials/seed_row.html", seed_id=seed_id, info=info))
+                    current = render_template("partials/field_progress.html", status=status)
+                    if current != progress:
+                        progress = current
+                        yield _sse("progress", progress)
+        finally:
+            field_hub.unsubscribe(subscription)
     return Response(event_stream(), mimetype="text/event-stream")
 
 
@@ -372,7 +439,7 @@ def project_clear(project_id):
 
 @app.route("/projects/<project_id>/success")
 def project_success(project_id):
-    log, status_data = get_latest_run(project_id)
+    log, status_data = offload(get_latest_run, project_id)
     summary = "No successful seeds found."
     if status_data:
         successful = [f"Seed {sid}: {info['task']} - {info['output'][-1] if info['output'] else 'No output'}"
@@ -423,12 +490,18 @@ def project_integrate(project_id):
 def project_update_config(project_id):
     try:
         new_settings = request.get_json()
-        projects = load_projects()
-        if project_id not in projects:
+        found = []
+
+        def merge(projects):
+            # Merge new settings into project
+            if project_id in projects:
+                projects[project_id].update(new_settings)
+                found.append(project_id)
+            return projects
+
+        update_projects(merge)
+        if not found:
             return jsonify({"message": "Project not found"}), 404
-        # Merge new settings into project
-        projects[project_id].update(new_settings)
-        save_projects(projects)
         state.reset_manager(project_id)
         return jsonify({"message": f"Config updated for {project_id}."})
     except Exception as e:
@@ -449,10 +522,6 @@ def new_project():
     if not project_id or project_id == "new":
         return jsonify({"message": "Invalid project ID"}), 400
 
-    projects = load_projects()
-    if project_id in projects:
-        return jsonify({"message": f"Project '{project_id}' already exists"}), 400
-
     project = {
         "name": data.get("name", project_id),
         "description": data.get("description", ""),
@@ -472,8 +541,18 @@ def new_project():
     if data.get("coder_prompt"):
         project["coder_prompt"] = data["coder_prompt"]
 
-    projects[project_id] = project
-    save_projects(projects)
+    existed = []
+
+    def add(projects):
+        if project_id in projects:
+            existed.append(project_id)
+        else:
+            projects[project_id] = project
+        return projects
+
+    update_projects(add)
+    if existed:
+        return jsonify({"message": f"Project '{project_id}' already exists"}), 400
     return jsonify({"message": f"Project '{project_id}' created", "redirect": f"/projects/{project_id}"})
 
 
@@ -503,18 +582,23 @@ def api_daily_cycle():
     if _cycle_state["running"]:
         return jsonify({"message": "Daily cycle already running.", "status": "running"}), 409
 
+    # ?resume=1 picks up the last unfinished cycle from its checkpoints
+    resume = request.args.get("resume") == "1"
+    cmd = [sys.executable, "-u", "daily_runner.py"] + (["--resume"] if resume else [])
+
     os.makedirs(CYCLE_LOG_DIR, exist_ok=True)
     log_file = os.path.join(CYCLE_LOG_DIR, f"cycle_{date.today().isoformat()}.log")
     _cycle_state["log_file"] = log_file
     _cycle_state["started"] = datetime.now().isoformat()
     _cycle_state["running"] = True
+    log_tail.forget(log_file)
 
     def run_cycle():
         import subprocess
         try:
-            with open(log_file, "w") as lf:
+            with open(log_file, "a" if resume else "w") as lf:
                 proc = subprocess.Popen(
-                    [sys.executable, "-u", "daily_runner.py"],
+                    cmd,
                     cwd=os.path.dirname(os.path.realpath(__file__)),
                     stdout=lf, stderr=subprocess.STDOUT,
                     text=True,
@@ -524,6 +608,7 @@ def api_daily_cycle():
         finally:
             _cycle_state["running"] = False
             _cycle_state["pid"] = None
+            log_tail.finish(log_file)
 
     t = threading.Thread(target=run_cycle, daemon=True)
     t.start()
@@ -540,38 +625,72 @@ def api_daily_cycle_status():
     })
 
 
+@app.route("/metrics")
+def metrics():
+    """Prometheus scrape target: this process's counters plus those the runner publishes."""
+    return Response(offload(instrumentation.render), mimetype="text/plain; version=0.0.4")
+
+
+@app.route("/api/tending")
+def api_tending():
+    """Shared tending pool: workers, running jobs, global queue depth and per-field priority/stage/queue."""
+    return jsonify(state.supervisor.stats())
+
+
+@app.route("/api/metrics/trends")
+def api_metrics_trends():
+    """
+    Cycle history from the metrics store: cycle duration, failure rate,
+    signals per channel, fruitful ratio and LLM latency percentiles.
+    ?days=N (default 30) &bucket=day|week
+    """
+    try:
+        days = int(request.args.get("days", 30))
+    except ValueError:
+        return jsonify({"message": "days must be an integer"}), 400
+    if not 1 <= days <= metrics_store.ROLLUP_RETENTION_DAYS:
+        return jsonify({"message": f"days must be between 1 and {metrics_store.ROLLUP_RETENTION_DAYS}"}), 400
+    bucket = request.args.get("bucket", "day")
+    if bucket not in metrics_store.BUCKETS:
+        return jsonify({"message": f"bucket must be one of {', '.join(metrics_store.BUCKETS)}"}), 400
+    return jsonify(offload(metrics_store.trends, days, bucket))
+
+
 @app.route("/api/daily-cycle/stream")
 def api_daily_cycle_stream():
-    """SSE stream of the daily cycle log file."""
+    """
+    SSE stream of the daily cycle log file.
+
+    Every client reads from the file's shared log_tail.LogTail: one reader
+    thread per file, new lines sent in batches (one event, one data: line
+    each), late joiners start from the last BACKLOG_LINES lines.
+    """
     log_file = _cycle_state["log_file"]
 
     def event_stream():
-        if not log_file or not os.path.exists(log_file):
+        if not log_file:
             yield "data: Waiting for cycle to start...\n\n"
-
-        # Wait for file to appear
-        for _ in range(10):
-            if log_file and os.path.exists(log_file):
-                break
-            time.sleep(1)
-            yield "data: .\n\n"
-
-        if not log_file or not os.path.exists(log_file):
+            yield "data: [No log file found]\n\n"
+            return
+        if not _cycle_state["running"] and not os.path.exists(log_file):
             yield "data: [No log file found]\n\n"
             return
 
-        with open(log_file, "r") as f:
-            while True:
-                line = f.readline()
-                if line:
-                    # Escape for SSE
-                    escaped = line.rstrip("\n").replace("\n", " ")
-                    yield f"data: {escaped}\n\n"
-                elif not _cycle_state["running"]:
-                    yield "data: \n\ndata: === CYCLE COMPLETE ===\n\n"
-                    return
-                else:
-                    time.sleep(0.5)
+        tail = log_tail.follow(log_file)
+        if not _cycle_state["running"]:
+            tail.finish()
+        cursor = None
+        while True:
+            lines, cursor, skipped = tail.read(cursor, timeout=HEARTBEAT_SECONDS)
+            if skipped:
+                yield f"data: [... {skipped} earlier lines not shown ...]\n\n"
+            if lines:
+                yield "".join(f"data: {line.rstrip(chr(13))}\n" for line in lines) + "\n"
+            elif tail.finished:
+                yield "data: \n\ndata: === CYCLE COMPLETE ===\n\n"
+                return
+            else:
+                yield ": heartbeat\n\n"
 
     return Response(event_stream(), mimetype="text/event-stream")
 
@@ -592,23 +711,19 @@ def api_scan():
         else:
             run_daily_scans(channel_filter=channel_filter)
 
-    t = threading.Thread(target=run_scan, daemon=True)
-    t.start()
+    spawn_native(run_scan)
     target = channel_filter or field_filter or "all channels"
     return jsonify({"message": f"Channel scan started for {target}."})
 
 
-@app.route("/api/briefing")
-def api_briefing():
-    """Generate or retrieve the latest briefing."""
-    # Check for existing briefing
+def _load_or_build_briefing(today):
+    """Today's briefing text, generated from current data and saved if missing."""
     os.makedirs(BRIEFINGS_DIR, exist_ok=True)
-    today = date.today().isoformat()
     today_file = os.path.join(BRIEFINGS_DIR, f"briefing_{today}.txt")
 
     if os.path.exists(today_file):
         with open(today_file, "r") as f:
-            return jsonify({"briefing": f.read(), "date": today})
+            return f.read()
 
     # Generate from current data
     projects = load_projects()
@@ -621,7 +736,7 @@ def api_briefing():
 
     total_cases = 0
     for pid, pdata in projects.items():
-        log, status_data = get_latest_run(pid)
+        log, status_data = get_latest_run(pid, with_log=False)
         seeds = status_data["seeds"] if status_data else {}
         cases = get_cases_by_field(pid)
         total_cases += len(cases)
@@ -640,8 +755,14 @@ def api_briefing():
 
     with open(today_file, "w") as f:
         f.write(briefing)
+    return briefing
 
-    return jsonify({"briefing": briefing, "date": today})
+
+@app.route("/api/briefing")
+def api_briefing():
+    """Generate or retrieve the latest briefing."""
+    today = date.today().isoformat()
+    return jsonify({"briefing": offload(_load_or_build_briefing, today), "date": today})
 
 
 @app.route("/api/cases/<int:case_id>/escalate", methods=["POST"])
@@ -683,48 +804,139 @@ def api_intake():
     })
 
 
-@app.route("/escalation")
-def escalation_dashboard():
-    """Escalation status dashboard — case overview by stage, field, and readiness."""
-    filter_field = request.args.get("field")
-    show_resolved = request.args.get("resolved") == "1"
+ESCALATION_MAX_AGE = 5  # Seconds a browser may reuse a dashboard response before revalidating
 
-    if filter_field:
-        cases = get_cases_by_field(filter_field, active_only=not show_resolved)
+
+def _conditional(etag, build):
+    """
+    Answer If-None-Match with 304 when the escalation data hasn't changed
+    (see wheat/case_summary.py); otherwise return build()'s response.
+    Only successful responses are tagged and cacheable.
+    """
+    if etag in request.if_none_match:
+        response = Response(status=304)
     else:
-        cases = get_all_cases(active_only=not show_resolved)
+        response = app.make_response(build())
+        if response.status_code != 200:
+            return response
+    response.set_etag(etag)
+    response.headers["Cache-Control"] = f"private, max-age={ESCALATION_MAX_AGE}"
+    return response
+
+
+def _escalation_etag(prefix):
+    """ETag for an escalation view: the case summary tag plus the query string."""
+    return f"{prefix}-{offload(get_summary_tag)}-{quote(request.query_string.decode(), safe='')}"
+
+
+def _case_filters(args):
+    """list_cases() keyword arguments from a request's query string."""
+    stage = args.get("stage")
+    projection = args.get("fields")
+    if projection:
+        projection = "all" if projection == "all" else projection.split(",")
+    return {
+        "field": args.get("field") or None,
+        "stage": stage.split(",") if stage else None,
+        "min_severity": args.get("severity_min", type=int),
+        "max_severity": args.get("severity_max", type=int),
+        "entity_prefix": args.get("entity") or None,
+        "deadline_after": args.get("deadline_after") or None,
+        "deadline_before": args.get("deadline_before") or None,
+        "active_only": args.get("resolved") != "1",
+        "sort": args.get("sort") or None,
+        "columns": projection or LIST_CASE_COLUMNS,
+        "limit": args.get("limit", CASE_PAGE_SIZE, type=int),
+        "after": args.get("after") or None,
+    }
 
-    stage_dist = get_stage_distribution(active_only=not show_resolved)
-    ready = get_escalation_ready()
-    cross_field = get_cross_field_entities()
+
+def _escalation_data(filters):
+    """Everything the escalation dashboard and its JSON API show; filters as from _case_filters."""
+    cases, next_cursor = list_cases(**filters)
     fields = get_field_list()
+    scope = [f for f in fields if not filters["field"] or f["field"] == filters["field"]]
+    return {
+        "cases": cases,
+        "next_cursor": next_cursor,
+        "stage_distribution": get_stage_distribution(active_only=filters["active_only"]),
+        "escalation_ready": get_escalation_ready(),
+        "cross_field_entities": get_cross_field_entities(),
+        "fields": fields,
+        "total_active": sum(f["active"] for f in scope),
+        "case_count": sum(f["active"] if filters["active_only"] else f["total"] for f in scope),
+    }
 
-    return render_template(
-        "escalation.html",
-        cases=cases,
-        stage_distribution=stage_dist,
-        stages=STAGES,
-        escalation_ready=ready,
-        cross_field_entities=cross_field,
-        fields=fields,
-        filter_field=filter_field,
-        show_resolved=show_resolved,
-        total_active=sum(1 for c in cases if not c.get("resolved_at")),
-    )
+
+@app.route("/escalation")
+def escalation_dashboard():
+    """Escalation status dashboard — case overview by stage, field, and readiness."""
+    filters = _case_filters(request.args)
+    filters["columns"] = LIST_CASE_COLUMNS
+    try:
+        validate_case_filters(**filters)
+    except ValueError as e:
+        return f"Bad filter: {escape(str(e))}", 400
+
+    def build():
+        data = offload(_escalation_data, filters)
+        query = request.args.to_dict()
+        query.pop("after", None)
+        return render_template(
+            "escalation.html",
+            stages=STAGES,
+            sorts=list(CASE_SORTS),
+            filter_field=filters["field"],
+            show_resolved=not filters["active_only"],
+            query=query,
+            paged=bool(filters["after"]),
+            narrowed=any(request.args.get(k) for k in
+                         ("stage", "severity_min", "severity_max", "entity", "deadline_after", "deadline_before")),
+            next_url=url_for("escalation_dashboard", **query, after=data["next_cursor"]) if data["next_cursor"] else None,
+            first_url=url_for("escalation_dashboard", **query),
+            **data,
+        )
+
+    return _conditional(_escalation_etag("escalation"), build)
 
 
 @app.route("/api/escalation")
 def api_escalation():
-    """JSON API for escalation dashboard data."""
-    cases = get_all_cases(active_only=True)
-    return jsonify({
-        "cases": cases,
-        "stage_distribution": get_stage_distribution(),
-        "escalation_ready": get_escalation_ready(),
-        "cross_field_entities": get_cross_field_entities(),
-        "fields": get_field_list(),
-        "total_active": len(cases),
-    })
+    """JSON API for escalation dashboard data (first page of cases; see /api/cases for the rest)."""
+    filters = _case_filters(request.args)
+    try:
+        validate_case_filters(**filters)
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    def build():
+        return jsonify(offload(_escalation_data, filters))
+
+    return _conditional(_escalation_etag("api-escalation"), build)
+
+
+@app.route("/api/cases")
+def api_cases():
+    """
+    Keyset-paginated case listing.
+
+    Query: field, stage (comma list), severity_min, severity_max, entity
+    (name prefix), deadline_after, deadline_before, resolved=1 (include
+    resolved), sort (severity|created|deadline|entity), fields (comma list
+    of columns, or "all" to include evidence and notes), limit, after (the
+    previous page's next_cursor).
+    """
+    filters = _case_filters(request.args)
+    try:
+        validate_case_filters(**filters)
+    except ValueError as e:
+        return jsonify({"message": str(e)}), 400
+
+    def build():
+        cases, next_cursor = offload(list_cases, **filters)
+        return jsonify({"cases": cases, "next_cursor": next_cursor})
+
+    return _conditional(_escalation_etag("cases"), build)
 
 
 @app.route("/api/cases/<int:case_id>/history")
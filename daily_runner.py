@@ -22,6 +22,9 @@ Usage:
   python daily_runner.py --scan-only        # Only run channel scans
   python daily_runner.py --analyze-only     # Only run Claude analysis
   python daily_runner.py --dry-run          # Show what would run
+  python daily_runner.py --plan             # Show the adaptive channel scan schedule
+  python daily_runner.py --resume           # Resume the last unfinished cycle
+  python daily_runner.py --stream           # Start fields as soon as their channels are scanned
   python daily_runner.py --report-only      # Generate briefing from existing data
   python daily_runner.py --email            # Email the daily briefing
 
@@ -37,8 +40,6 @@ import json
 import os
 import sys
 import sqlite3
-import threading
-import time
 from datetime import datetime, date
 
 # Add project root to path
@@ -46,11 +47,17 @@ PROJECT_ROOT = os.path.dirname(os.path.realpath(__file__))
 sys.path.insert(0, PROJECT_ROOT)
 
 from wheat.paths import load_projects, load_project_config, DB_PATH
+from wheat.atomic_io import coalesced
+from wheat import instrumentation, metrics_store
 from wheat.field_manager import FieldManager
-from wheat.channels import load_channels, get_channels_for_field, channel_status_report
+from wheat.channels import load_channels, get_channels_for_field, get_fields_for_channel, channel_status_report
 from wheat.escalation import daily_escalation_check, get_cross_field_entities, init_escalation_db
-from wheat.scan_tasks import run_daily_scans, aggregate_scan_results
-from wheat.analyst import correlate_scans, build_field_guidance, synthesize_briefing
+from wheat.scan_tasks import due_channels, scan_and_record, aggregate_scan_results
+from wheat.scan_scheduler import plan_scans, format_plan
+from wheat.cycle_checkpoint import CycleCheckpoint, latest_incomplete_cycle, rotate_cycles
+from wheat.cycle_graph import TaskGraph
+from wheat.tracing import span, start_trace, stop_trace
+from wheat.analyst import correlate_scans, build_field_guidance, build_signal_guidance, synthesize_briefing
 from tools.stewards_map import get_stewards_map, get_map_as_string
 
 REPORTS_DIR = os.path.join(PROJECT_ROOT, "reports")
@@ -60,53 +67,81 @@ CYCLE_LOG_RETAIN_DAYS = 14
 DATA_DIR = os.path.join(PROJECT_ROOT, "data")
 ENGINE_STATUS_PATH = os.path.join(DATA_DIR, "engine_status.json")
 
+# Cycle graph: concurrent steps, and the engine-status phase each node reports
+CYCLE_WORKERS = 3
+CYCLE_NODE_PHASES = {
+    "scan": "phase_1_scan",
+    "correlation": "phase_1.5_correlation",
+    "stewards_map": "phase_2_analysis",
+    "field": "phase_2_analysis",
+    "escalation": "phase_3_escalation",
+    "briefing": "phase_4_briefing",
+}
+ENGINE_STATUS_INTERVAL = 2.0  # seconds between coalesced "running" heartbeat writes
+
 
 def write_engine_status(phase, status, metrics=None, error=None):
     """Write engine status to data/engine_status.json for agent observability.
 
     See DOMINION.md Part VII: Agent-Observable Architecture.
+
+    Updates are merged into the file under its lock and written atomically
+    (wheat/atomic_io.py). Plain "running" heartbeats are coalesced to one
+    write per ENGINE_STATUS_INTERVAL; errors and any other status are
+    written immediately, along with whatever heartbeats were queued.
     """
     os.makedirs(DATA_DIR, exist_ok=True)
-
-    # Load existing status to preserve history
-    existing = {}
-    try:
-        with open(ENGINE_STATUS_PATH) as f:
-            existing = json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
-        pass
-
     now = datetime.now().strftime("%Y-%m-%dT%H:%M:%S")
-    errors = existing.get("errors", [])
-    if error:
-        errors.append({"timestamp": now, "phase": phase, "message": str(error)})
-        errors = errors[-5:]  # Keep last 5 errors
-
-    engine_status = {
-        "updated_at": now,
-        "project": "venetian-wheat",
-        "process_type": "cron_daily",
-        "processes": {
-            "daily_runner": {
-                "status": status,
-                "phase": phase,
-                "pid": os.getpid(),
-                "started_at": existing.get("processes", {}).get("daily_runner", {}).get("started_at", now),
-                "last_heartbeat": now,
-            }
-        },
-        "health": "degraded" if error else ("running" if status == "running" else "idle"),
-        "errors": errors,
-        "metrics": {**existing.get("metrics", {}), **(metrics or {})},
-        "config": {
-            "sabbath_enforced": _load_dominion().get("sabbath", {}).get("enforced", False),
-            "schedule": "Mon-Sat 07:00",
-        },
-    }
 
-    with open(ENGINE_STATUS_PATH, "w") as f:
-        json.dump(engine_status, f, indent=2)
-        f.write("\n")
+    def merge(existing):
+        errors = existing.get("errors", [])
+        if error:
+            errors.append({"timestamp": now, "phase": phase, "message": str(error)})
+            errors = errors[-5:]  # Keep last 5 errors
+
+        return {
+            "updated_at": now,
+            "project": "venetian-wheat",
+            "process_type": "cron_daily",
+            "processes": {
+                "daily_runner": {
+                    "status": status,
+                    "phase": phase,
+                    "pid": os.getpid(),
+                    "started_at": existing.get("processes", {}).get("daily_runner", {}).get("started_at", now),
+                    "last_heartbeat": now,
+                }
+            },
+            "health": "degraded" if error else ("running" if status == "running" else "idle"),
+            "errors": errors,
+            "metrics": {**existing.get("metrics", {}), **(metrics or {})},
+            "config": {
+                "sabbath_enforced": _load_dominion().get("sabbath", {}).get("enforced", False),
+                "schedule": "Mon-Sat 07:00",
+            },
+        }
+
+    writer = coalesced(ENGINE_STATUS_PATH, ENGINE_STATUS_INTERVAL, trailing_newline=True)
+    writer.submit(merge, flush=bool(error) or status != "running")
+
+
+def record_cycle_metrics(cycle_id, run, tracer, outcome, timing_metrics, field_results=None):
+    """Append this cycle's samples to the metrics history (wheat/metrics_store.py)."""
+    samples = metrics_store.cycle_samples(
+        outcome,
+        timings=run.timings,
+        spans=tracer.to_chrome()["traceEvents"],
+        scan_results=run.results.get("scan"),
+        field_results=field_results,
+        wall_seconds=timing_metrics["cycle_wall_seconds"],
+        critical_path_seconds=timing_metrics["critical_path_seconds"],
+        time_to_first_field_seconds=timing_metrics["time_to_first_field_seconds"],
+        errors=run.errors,
+    )
+    try:
+        metrics_store.record_cycle(cycle_id, samples)
+    except sqlite3.Error as e:
+        print(f"  Metrics history not updated: {e}")
 
 
 def _load_dominion():
@@ -197,9 +232,10 @@ def run_field(project_id, config, guidance=None):
     merged_config = load_project_config(project_id)
 
     # Build prompts with context
-    stewards_map_str = get_map_as_string(
-        include_params=True, include_descriptions=True
-    )
+    with span("stewards map", "stewards_map"):
+        stewards_map_str = get_map_as_string(
+            include_params=True, include_descriptions=True
+        )
 
     guidance = guidance or "Daily scan — check sources for new signals, review existing cases for escalation readiness."
 
@@ -213,26 +249,18 @@ def run_field(project_id, config, guidance=None):
     # (pre-formatting here would unescape JSON braces like {{"field"}} → {"field"}
     # which then breaks on the second .format() call in field_manager)
     manager = FieldManager(project_id=project_id, config=merged_config)
-    manager.sow_field(
-        guidance,
-        strategist_prompt=strategist_prompt,
-        coder_prompt=merged_config["coder_prompt"],
-    )
-
-    # Run tend_field in a thread with a timeout
-    tend_thread = threading.Thread(target=manager.tend_field, daemon=True)
-    tend_thread.start()
+    with span("sow field", "field", project=project_id):
+        manager.sow_field(
+            guidance,
+            strategist_prompt=strategist_prompt,
+            coder_prompt=merged_config["coder_prompt"],
+        )
 
-    # Wait for seeds to complete or timeout
+    # Seeds run on the process's shared tending pool alongside the other
+    # fields; this returns once every seed is Fruitful or Barren, or at the timeout
     timeout = merged_config.get("claude_code_timeout", 300) * merged_config.get("seeds_per_run", 2)
-    start = time.time()
-    while time.time() - start < timeout:
-        if not manager.seeds:
-            time.sleep(2)
-            continue
-        if all(s.progress["status"] in ("Fruitful", "Barren") for s in manager.seeds):
-            break
-        time.sleep(5)
+    with span("wait for seeds", "wait", project=project_id):
+        manager.tend_field(timeout=timeout)
 
     status = get_field_status(project_id)
     if status:
@@ -401,6 +429,214 @@ def send_email_briefing(briefing_text, briefing_file):
         print("Briefing is still saved locally.")
 
 
+DEFAULT_GUIDANCE = "Daily scan — check sources for new signals, review existing cases for escalation readiness."
+
+
+def build_cycle_graph(fields, checkpoint, analyze_only=False, scan_only=False, guidance=None, stream=False):
+    """
+    Declare the daily cycle as a task graph (see wheat/cycle_graph.py).
+
+    Nodes and their dependencies:
+      stewards_map            — none
+      escalation              — none (doesn't need field analysis)
+      scan:<channel>          — none, one node per due channel
+      scan                    — every scan:<channel>
+      correlation             — scan
+      field:<field>           — correlation + stewards_map
+                                (stewards_map only with --guidance)
+      briefing                — everything above
+
+    In streaming mode (--stream) a field depends only on the scans of the
+    channels that feed it (get_fields_for_channel), so it starts as soon as
+    its own inputs are in. Correlation still runs once every scan is done,
+    as an enrichment stage: fields that start after it finishes get the
+    analyst's guidance, earlier ones work from the raw routed signals.
+
+    Every node checks the cycle checkpoint first, so --resume skips work
+    that already finished.
+    """
+    graph = TaskGraph()
+
+    # ----- PHASE 3 (independent): ESCALATION CHECK -----
+    def phase_escalation(results):
+        if checkpoint.has_phase("escalation"):
+            return checkpoint.load_phase("escalation") or {}
+        escalation = {
+            "report": daily_escalation_check(),
+            "cross_field": get_cross_field_entities(),
+        }
+        checkpoint.save_phase("escalation", escalation)
+        return escalation
+
+    if not scan_only:
+        graph.add("escalation", phase_escalation)
+        # Initialize stewards map once
+        graph.add("stewards_map", lambda results: get_stewards_map(include_params=True, include_descriptions=True))
+
+    # ----- PHASE 1: CHANNEL SCANS (Sonnet) -----
+    scan_nodes = []
+    channel_nodes_by_field = {}  # field -> scan nodes feeding it (streaming mode)
+    if not checkpoint.has_phase("scan") and not analyze_only and date.today().weekday() != 6:
+        channels = load_channels()
+        # Channels scanned before a crash were already recorded in the schedule,
+        # so they are no longer due: bring their results back instead
+        restored = checkpoint.completed_scans()
+        if restored:
+            print(f"  Restored {len(restored)} channel scan(s) from checkpoint")
+
+        def scan_channel(cid):
+            result = scan_and_record(cid, channels[cid])
+            checkpoint.save_scan(cid, result)
+            return result
+
+        for cid in list(restored) + [cid for cid in due_channels(channels) if cid not in restored]:
+            if cid in restored:
+                fn = lambda results, result=restored[cid]: result
+            else:
+                fn = lambda results, cid=cid: scan_channel(cid)
+            scan_nodes.append(graph.add(f"scan:{cid}", fn))
+            for field_id in get_fields_for_channel(cid):
+                channel_nodes_by_field.setdefault(field_id, []).append(f"scan:{cid}")
+
+    def phase_scan(results):
+        if checkpoint.has_phase("scan"):
+            scan_results = checkpoint.load_phase("scan") or {}
+            print(f"\n  PHASE 1: restored {len(scan_results)} channel scan(s) from checkpoint")
+            return scan_results
+        if analyze_only:
+            return {}
+        scan_results = {name[len("scan:"):]: results[name] for name in scan_nodes}
+        scan_summary, signals_by_field = aggregate_scan_results(scan_results)
+        channels_scanned = len([r for r in scan_results.values() if r])
+        total_signals = sum(
+            len(r.get("signals", [])) for r in scan_results.values()
+            if r and isinstance(r.get("signals"), list)
+        )
+        write_engine_status("phase_1_scan", "running", metrics={
+            "channels_scanned": channels_scanned,
+            "signals_detected": total_signals,
+        })
+        checkpoint.save_phase("scan", scan_results)
+        print(f"\n{scan_summary}")
+        return scan_results
+
+    graph.add("scan", phase_scan, deps=scan_nodes)
+    if scan_only:
+        return graph
+
+    # ----- PHASE 1.5: ANALYST CORRELATION (Opus) -----
+    def phase_correlation(results):
+        if checkpoint.has_phase("correlation"):
+            print(f"\n  PHASE 1.5: restored correlation analysis from checkpoint")
+            return checkpoint.load_phase("correlation")
+        if not results["scan"]:
+            return None
+        correlation_analysis, _ = correlate_scans(results["scan"])
+        checkpoint.save_phase("correlation", correlation_analysis)
+        return correlation_analysis
+
+    graph.add("correlation", phase_correlation, deps=["scan"])
+
+    # ----- PHASE 2: FIELD ANALYSIS -----
+    def phase_field(results, pid, pdata):
+        if checkpoint.has_field(pid):
+            print(f"  {pid}: restored from checkpoint")
+            return checkpoint.load_field(pid)
+
+        # Build enriched guidance from analyst correlation (or fallback).
+        # In streaming mode correlation may still be running — use the raw
+        # signals from this field's channels instead of waiting for it.
+        correlation_analysis = results.get("correlation")
+        if guidance:
+            field_guidance = guidance
+        elif correlation_analysis:
+            field_guidance = build_field_guidance(pid, correlation_analysis)
+        elif stream:
+            field_guidance = build_signal_guidance(pid, {
+                name[len("scan:"):]: results[name] for name in channel_nodes_by_field.get(pid, [])
+            })
+        else:
+            field_guidance = DEFAULT_GUIDANCE
+
+        try:
+            status = run_field(pid, pdata, guidance=field_guidance)
+        except Exception as e:
+            print(f"  ERROR in {pid}: {e}")
+            write_engine_status("phase_2_analysis", "running", error=f"Field {pid}: {e}")
+            return None
+        # Failed fields stay un-checkpointed so --resume retries them
+        if status is not None:
+            checkpoint.save_field(pid, status)
+        return status
+
+    field_nodes = []
+    for pid, pdata in fields.items():
+        if guidance:
+            field_deps = ["stewards_map"]
+        elif stream and scan_nodes:
+            field_deps = channel_nodes_by_field.get(pid, []) + ["stewards_map"]
+        else:
+            field_deps = ["correlation", "stewards_map"]
+        field_nodes.append(graph.add(
+            f"field:{pid}",
+            lambda results, pid=pid, pdata=pdata: phase_field(results, pid, pdata),
+            deps=field_deps,
+        ))
+
+    # ----- PHASE 4: BRIEFING (Analyst Synthesis) -----
+    def phase_briefing(results):
+        field_results = {name[len("field:"):]: results[name] for name in field_nodes}
+        escalation = results["escalation"]
+        cross_field = escalation.get("cross_field", [])
+        saved = checkpoint.load_phase("briefing") or {}
+        if saved.get("briefing_file") and os.path.exists(saved["briefing_file"]):
+            print(f"\n  PHASE 4: restored briefing from checkpoint")
+            with open(saved["briefing_file"], "r", encoding="utf-8") as f:
+                briefing_text = f.read()
+            return {
+                "text": briefing_text,
+                "file": saved["briefing_file"],
+                "field_results": field_results,
+                "cross_field": cross_field,
+            }
+        write_engine_status("phase_4_briefing", "running", metrics={
+            "fields_analyzed": len([r for r in field_results.values() if r]),
+            "fields_failed": len([r for r in field_results.values() if r is None]),
+        })
+        print(f"\n{'='*60}")
+        print(f"  PHASE 3: CORRELATION & ESCALATION CHECK")
+        print(f"{'='*60}")
+        print(escalation.get("report", ""))
+        if cross_field:
+            print(f"\n  CROSS-FIELD ALERTS:")
+            for entity in cross_field:
+                print(f"    {entity['entity']}: flagged in {entity['field_count']} fields — AUTO-ESCALATION CANDIDATE")
+
+        print(f"\n{'='*60}")
+        print(f"  PHASE 4: INTELLIGENCE BRIEFING (Claude Opus)")
+        print(f"{'='*60}")
+        briefing_text, briefing_file = synthesize_briefing(
+            scan_results=results["scan"],
+            correlation_analysis=results["correlation"],
+            field_results=field_results,
+            escalation_report=escalation.get("report", ""),
+            cross_field_entities=cross_field,
+        )
+        # A failed field leaves the cycle open for --resume, which re-runs it,
+        # so only a briefing that covers every field is kept for reuse
+        if all(status is not None for status in field_results.values()):
+            checkpoint.save_phase("briefing", {"briefing_file": briefing_file})
+        return {
+            "text": briefing_text,
+            "file": briefing_file,
+            "field_results": field_results,
+            "cross_field": cross_field,
+        }
+
+    graph.add("briefing", phase_briefing, deps=["scan", "correlation", "escalation"] + field_nodes)
+    return graph
+
+
 def main():
     parser = argparse.ArgumentParser(description="Daily Field Runner — Automotive Accountability Intelligence")
     parser.add_argument("--field", help="Run a specific field only")
@@ -412,7 +648,14 @@ def main():
     parser.add_argument("--guidance", help="Custom guidance for today's run")
     parser.add_argument("--force-sunday", action="store_true", help="Override Sunday check")
     parser.add_argument("--channels", action="store_true", help="Show channel status")
+    parser.add_argument("--plan", action="store_true", help="Show the adaptive channel scan schedule")
+    parser.add_argument("--resume", action="store_true", help="Resume the last unfinished cycle from its checkpoints")
+    parser.add_argument("--stream", action="store_true",
+                        help="Start each field as soon as its own channels are scanned")
+    parser.add_argument("--workers", type=int, default=CYCLE_WORKERS,
+                        help=f"Cycle steps to run at once (default {CYCLE_WORKERS}; 1 = sequential)")
     args = parser.parse_args()
+    instrumentation.start_publishing()  # scraped through the dashboard's /metrics
 
     # Sunday check
     if is_sunday() and not args.force_sunday:
@@ -429,6 +672,11 @@ def main():
         print(channel_status_report())
         sys.exit(0)
 
+    # Scan schedule
+    if args.plan:
+        print(format_plan(plan_scans(load_channels())))
+        sys.exit(0)
+
     # Rotate old cycle logs
     rotate_cycle_logs()
 
@@ -455,15 +703,11 @@ def main():
 
         print(f"PHASE 1: CHANNEL SCANS (Sonnet)")
         channels = load_channels()
-        daily_channels = {cid: c for cid, c in channels.items() if c.get("frequency") == "daily"}
-        weekly_channels = {cid: c for cid, c in channels.items() if c.get("frequency") == "weekly"}
-        print(f"  Daily channels: {len(daily_channels)}")
-        for cid, cdata in daily_channels.items():
+        due = due_channels(channels)
+        print(f"  Channels due: {len(due)} of {len(channels)}")
+        for cid in due:
+            cdata = channels[cid]
             print(f"    {cid}: {cdata['name']} → {', '.join(cdata.get('fields', []))}")
-        if date.today().weekday() == 0:
-            print(f"  Weekly channels (Monday): {len(weekly_channels)}")
-            for cid, cdata in weekly_channels.items():
-                print(f"    {cid}: {cdata['name']} → {', '.join(cdata.get('fields', []))}")
 
         print(f"\nPHASE 2: FIELD ANALYSIS — {len(automotive_fields)} fields")
         for pid, pdata in automotive_fields.items():
@@ -487,111 +731,97 @@ def main():
         sys.exit(0)
 
     # ===== FULL DAILY CYCLE =====
+    checkpoint = latest_incomplete_cycle() if args.resume else None
+    if checkpoint:
+        print(f"Resuming cycle {checkpoint.cycle_id} — completed phases: "
+              f"{', '.join(checkpoint.manifest['phases']) or 'none'}, "
+              f"fields done: {len(checkpoint.completed_fields())}")
+    else:
+        if args.resume:
+            print("No unfinished cycle from today to resume — starting a new one.")
+        rotate_cycles()
+        checkpoint = CycleCheckpoint()
+
     num_channels = len(load_channels())
     write_engine_status("startup", "running", metrics={
         "run_date": date.today().isoformat(),
+        "cycle_id": checkpoint.cycle_id,
         "fields_active": len(automotive_fields),
         "channels_total": num_channels,
     })
     print(f"\n{'#'*60}")
     print(f"  VENETIAN WHEAT — DAILY INTELLIGENCE RUN")
     print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"  Cycle: {checkpoint.cycle_id}")
     print(f"  Fields: {len(automotive_fields)} | Channels: {num_channels}")
     print(f"{'#'*60}")
 
-    # ----- PHASE 1: CHANNEL SCANS (Sonnet) -----
-    scan_results = {}
-    if not args.analyze_only:
-        write_engine_status("phase_1_scan", "running")
-        print(f"\n{'='*60}")
-        print(f"  PHASE 1: CHANNEL SCANS (Claude Sonnet)")
-        print(f"{'='*60}")
-        scan_results = run_daily_scans(dry_run=False)
-        scan_summary, signals_by_field = aggregate_scan_results(scan_results)
-        channels_scanned = len([r for r in scan_results.values() if r])
-        total_signals = sum(
-            len(r.get("signals", [])) for r in scan_results.values()
-            if r and isinstance(r.get("signals"), list)
-        )
-        write_engine_status("phase_1_scan", "running", metrics={
-            "channels_scanned": channels_scanned,
-            "signals_detected": total_signals,
-        })
-        print(f"\n{scan_summary}")
+    graph = build_cycle_graph(
+        automotive_fields, checkpoint,
+        analyze_only=args.analyze_only,
+        scan_only=args.scan_only,
+        guidance=args.guidance,
+        stream=args.stream,
+    )
+
+    def on_node_start(name):
+        phase = CYCLE_NODE_PHASES.get(name.split(":")[0], name)
+        write_engine_status(phase, "running")
+        print(f"\n  ▶ {name}")
+
+    tracer = start_trace(f"daily cycle {checkpoint.cycle_id}")
+    run = graph.run(max_workers=args.workers, on_start=on_node_start)
+    stop_trace()
+    trace_file = tracer.write(os.path.join(
+        checkpoint.cycle_dir, f"trace_{datetime.now().strftime('%H%M%S')}.json"
+    ))
+    for name, error in run.errors.items():
+        print(f"  ERROR in {name}: {error}")
+        write_engine_status(name, "running", error=f"{name}: {error}")
+
+    print(f"\n{run.summary()}")
+    critical_path, critical_seconds = run.critical_path()
+    timing_metrics = {
+        "cycle_wall_seconds": run.wall_seconds,
+        "critical_path": critical_path,
+        "critical_path_seconds": critical_seconds,
+        "node_seconds": {name: t["seconds"] for name, t in run.timings.items()},
+        "time_to_first_field_seconds": min(
+            (t["end"] for name, t in run.timings.items()
+             if name.startswith("field:") and t["status"] == "ok"),
+            default=None,
+        ),
+        "span_summary": tracer.summary(),
+        "trace_file": trace_file,
+    }
+    print(f"  Trace: {trace_file} (open in chrome://tracing or ui.perfetto.dev)")
+    checkpoint.save_phase("timings", run.timings)
 
     if args.scan_only:
+        record_cycle_metrics(checkpoint.cycle_id, run, tracer, "scan_only", timing_metrics)
+        write_engine_status("scan_only", "idle", metrics=timing_metrics)
         print("Scan-only mode — skipping field analysis.")
         sys.exit(0)
 
-    # ----- PHASE 1.5: ANALYST CORRELATION (Opus) -----
-    correlation_analysis = None
-    if scan_results:
-        write_engine_status("phase_1.5_correlation", "running")
-        print(f"\n{'='*60}")
-        print(f"  PHASE 1.5: ANALYST CORRELATION (Claude Opus)")
-        print(f"{'='*60}")
-        correlation_analysis, _ = correlate_scans(scan_results)
-
-    # ----- PHASE 2: FIELD ANALYSIS -----
-    write_engine_status("phase_2_analysis", "running")
-    print(f"\n{'='*60}")
-    print(f"  PHASE 2: FIELD ANALYSIS (Claude Code Agents)")
-    print(f"{'='*60}")
-
-    # Initialize stewards map once
-    get_stewards_map(include_params=True, include_descriptions=True)
+    if "briefing" not in run.results:
+        record_cycle_metrics(checkpoint.cycle_id, run, tracer, "failed", timing_metrics)
+        write_engine_status("failed", "idle", metrics=timing_metrics,
+                            error="Cycle incomplete — rerun with --resume")
+        sys.exit(1)
 
-    results = {}
-    for pid, pdata in automotive_fields.items():
-        # Build enriched guidance from analyst correlation (or fallback)
-        if args.guidance:
-            field_guidance = args.guidance
-        elif correlation_analysis:
-            field_guidance = build_field_guidance(pid, correlation_analysis)
-        else:
-            field_guidance = "Daily scan — check sources for new signals, review existing cases for escalation readiness."
-
-        try:
-            results[pid] = run_field(pid, pdata, guidance=field_guidance)
-        except Exception as e:
-            print(f"  ERROR in {pid}: {e}")
-            write_engine_status("phase_2_analysis", "running", error=f"Field {pid}: {e}")
-            results[pid] = None
-
-    # ----- PHASE 3: CORRELATION & ESCALATION -----
-    write_engine_status("phase_3_escalation", "running", metrics={
-        "fields_analyzed": len([r for r in results.values() if r]),
-        "fields_failed": len([r for r in results.values() if r is None]),
-    })
-    print(f"\n{'='*60}")
-    print(f"  PHASE 3: CORRELATION & ESCALATION CHECK")
-    print(f"{'='*60}")
-
-    escalation_report = daily_escalation_check()
-    print(escalation_report)
-
-    cross_field = get_cross_field_entities()
-    if cross_field:
-        print(f"\n  CROSS-FIELD ALERTS:")
-        for entity in cross_field:
-            print(f"    {entity['entity']}: flagged in {entity['field_count']} fields — AUTO-ESCALATION CANDIDATE")
-
-    # ----- PHASE 4: BRIEFING (Analyst Synthesis) -----
-    write_engine_status("phase_4_briefing", "running")
-    print(f"\n{'='*60}")
-    print(f"  PHASE 4: INTELLIGENCE BRIEFING (Claude Opus)")
-    print(f"{'='*60}")
-    briefing_text, briefing_file = synthesize_briefing(
-        scan_results=scan_results,
-        correlation_analysis=correlation_analysis,
-        field_results=results,
-        escalation_report=escalation_report,
-        cross_field_entities=cross_field,
-    )
+    briefing = run.results["briefing"]
     if args.email:
-        send_email_briefing(briefing_text, briefing_file)
+        send_email_briefing(briefing["text"], briefing["file"])
 
     # ----- CYCLE COMPLETE -----
+    results = briefing["field_results"]
+    cross_field = briefing["cross_field"]
+    failed_fields = [pid for pid, st in results.items() if st is None]
+    if failed_fields:
+        # Leave the cycle open so --resume retries just these fields
+        print(f"  {len(failed_fields)} field(s) failed — rerun with --resume to retry: {', '.join(failed_fields)}")
+    else:
+        checkpoint.mark_complete()
     total_fruitful = sum(
         sum(1 for s in st["seeds"] if s["status"] == "Fruitful")
         for st in results.values() if st
@@ -600,13 +830,14 @@ def main():
         sum(1 for s in st["seeds"] if s["status"] == "Barren")
         for st in results.values() if st
     )
+    record_cycle_metrics(checkpoint.cycle_id, run, tracer, "complete", timing_metrics, field_results=results)
     write_engine_status("complete", "idle", metrics={
         "last_completed": datetime.now().strftime("%Y-%m-%dT%H:%M:%S"),
         "total_fruitful": total_fruitful,
         "total_barren": total_barren,
         "cross_field_alerts": len(cross_field) if cross_field else 0,
+        **timing_metrics,
     })
 
-
 if __name__ == "__main__":
     main()
@@ -0,0 +1,71 @@
+#serve.py
+"""
+Production entry point for the dashboard.
+
+`python app.py` runs Flask's development server with one OS thread per
+request, so every open SSE stream (field pages, the daily-cycle log)
+pins a thread for as long as the tab stays open.
+
+  python serve.py                          # 0.0.0.0:5001
+  python serve.py --port 8000 --connections 2000
+
+serves the same app from gevent's WSGI server. monkey.patch_all() makes
+the streams' waits (field hub queues, log tail conditions, heartbeats)
+cooperative, so each stream is a greenlet on one event loop, not an OS
+thread. patch_all() also turns threading.Thread into greenlets, so
+everything blocking goes through wheat.offload onto native threads:
+  - request handlers' SQLite/filesystem work (the field page and its
+    stream, /escalation, /api/escalation, /api/briefing) and sowing
+    (stewards map walk and strategist call) run in gevent's thread pool
+  - the tending supervisor's workers and speculative candidates are
+    native_executor() pools, so seed generation, validation, test runs
+    and store flushes never touch the loop
+  - manual scans start on a native thread (spawn_native); the daily
+    cycle is a subprocess
+
+Run ONE process. Field managers, the field hub, log tails and the
+daily-cycle state live in memory, so several workers would each see
+only part of them. Capacity comes from --connections, not workers.
+
+Without gevent (pip install -r requirements.txt) it falls back to the
+threaded development server and says so. tools/load_test.py measures
+request throughput and SSE fan-out against either.
+"""
+try:
+    from gevent import monkey
+    monkey.patch_all()
+except ImportError:
+    monkey = None
+
+import argparse
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve the Venetian Wheat dashboard")
+    parser.add_argument("--host", default="0.0.0.0")
+    parser.add_argument("--port", type=int, default=5001)
+    parser.add_argument("--connections", type=int, default=1000,
+                        help="Max concurrent connections, SSE streams included (default 1000)")
+    args = parser.parse_args()
+
+    from app import app
+
+    if monkey is None:
+        print("gevent is not installed — falling back to the threaded development server "
+              "(one OS thread per connection)")
+        app.run(host=args.host, port=args.port, threaded=True)
+        return
+
+    from gevent.pool import Pool
+    from gevent.pywsgi import WSGIServer
+
+    server = WSGIServer((args.host, args.port), app, spawn=Pool(args.connections))
+    print(f"Serving on http://{args.host}:{args.port} (gevent, up to {args.connections} connections)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()
@@ -11,7 +11,9 @@ from wheat.analyst import (
     get_analyst_provider,
     correlate_scans,
     build_field_guidance,
+    build_signal_guidance,
     synthesize_briefing,
+    STREAM_SIGNALS_PER_FIELD,
     CORRELATION_PROMPT,
     BRIEFING_PROMPT,
 )
@@ -236,6 +238,36 @@ class TestBuildFieldGuidance:
         assert "B" in result
 
 
+# ---------------------------------------------------------------------------
+# build_signal_guidance
+# ---------------------------------------------------------------------------
+
+class TestBuildSignalGuidance:
+    def test_no_results_returns_default(self):
+        assert "no new signals" in build_signal_guidance("tow_companies", {}).lower()
+
+    def test_failed_and_empty_scans_ignored(self):
+        result = build_signal_guidance("tow_companies", {"ch1": None, "ch2": {"signals": []}})
+        assert "no new signals" in result.lower()
+
+    def test_lists_signals_with_channel(self):
+        scans = {"bbb": {"channel_name": "BBB", "signals": [{"entity": "Shady Tow", "severity": 4}]}}
+        result = build_signal_guidance("tow_companies", scans)
+        assert "Shady Tow" in result
+        assert "[BBB]" in result
+        assert "not yet correlated" in result
+
+    def test_parse_errors_skipped(self):
+        scans = {"ch1": {"signals": [{"raw_response": "garbage", "parse_error": True}]}}
+        assert "garbage" not in build_signal_guidance("tow_companies", scans)
+
+    def test_capped(self):
+        scans = {"ch1": {"signals": [{"entity": f"E{i}"} for i in range(STREAM_SIGNALS_PER_FIELD + 10)]}}
+        result = build_signal_guidance("tow_companies", scans)
+        assert f"{STREAM_SIGNALS_PER_FIELD} shown" in result
+        assert f"E{STREAM_SIGNALS_PER_FIELD}\"" not in result
+
+
 # ---------------------------------------------------------------------------
 # synthesize_briefing
 # ---------------------------------------------------------------------------
@@ -0,0 +1,134 @@
+"""Tests for wheat/atomic_io.py — atomic, locked JSON writes and coalesced updates."""
+
+import threading
+import time
+
+import pytest
+
+from wheat import atomic_io
+from wheat.atomic_io import CoalescedJson, atomic_write_json, read_json, update_json
+
+
+class TestAtomicWrite:
+    def test_roundtrip_and_no_temp_left(self, tmp_path):
+        path = tmp_path / "state.json"
+        atomic_write_json(str(path), {"a": [1, 2]}, trailing_newline=True)
+        assert path.read_text().endswith("}\n")
+        assert read_json(str(path)) == {"a": [1, 2]}
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path):
+        path = tmp_path / "state.json"
+        atomic_write_json(str(path), {"ok": True})
+        with pytest.raises(TypeError):
+            atomic_write_json(str(path), {"bad": object()})
+        assert read_json(str(path)) == {"ok": True}
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_readers_never_see_partial_file(self, tmp_path):
+        path = str(tmp_path / "state.json")
+        big = {"items": list(range(20000))}
+        atomic_write_json(path, big)
+        stop = threading.Event()
+        bad = []
+
+        def reader():
+            while not stop.is_set():
+                if read_json(path) != big:
+                    bad.append(1)
+
+        t = threading.Thread(target=reader)
+        t.start()
+        for _ in range(30):
+            atomic_write_json(path, big)
+        stop.set()
+        t.join()
+        assert bad == []
+
+    def test_read_json_missing_or_corrupt(self, tmp_path):
+        assert read_json(str(tmp_path / "missing.json")) is None
+        (tmp_path / "bad.json").write_text("{")
+        assert read_json(str(tmp_path / "bad.json")) is None
+
+
+class TestUpdateJson:
+    def test_concurrent_updates_all_apply(self, tmp_path):
+        path = str(tmp_path / "counter.json")
+
+        def bump(current):
+            current["n"] = current.get("n", 0) + 1
+            return current
+
+        threads = [threading.Thread(target=lambda: [update_json(path, bump) for _ in range(25)]) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert read_json(path) == {"n": 200}
+
+    def test_starts_from_empty_when_unreadable(self, tmp_path):
+        path = tmp_path / "state.json"
+        path.write_text("not json")
+        assert update_json(str(path), lambda d: {**d, "x": 1}) == {"x": 1}
+
+
+class TestCoalesced:
+    def test_updates_within_interval_share_one_write(self, tmp_path):
+        path = str(tmp_path / "status.json")
+        writer = CoalescedJson(path, interval=60)
+        writer.submit(lambda d: {**d, "a": 1})       # first write goes straight out
+        for i in range(50):
+            writer.submit(lambda d, i=i: {**d, "b": i, "seen": d.get("seen", 0) + 1})
+        assert writer.writes == 1
+        assert read_json(path) == {"a": 1}
+        writer.flush()
+        assert writer.writes == 2
+        assert read_json(path) == {"a": 1, "b": 49, "seen": 50}
+
+    def test_flush_flag_writes_immediately(self, tmp_path):
+        path = str(tmp_path / "status.json")
+        writer = CoalescedJson(path, interval=60)
+        writer.submit(lambda d: {"n": 1})
+        writer.submit(lambda d: {"n": d["n"] + 1})
+        writer.submit(lambda d: {**d, "done": True}, flush=True)
+        assert read_json(path) == {"n": 2, "done": True}
+
+    def test_trailing_write_after_interval(self, tmp_path):
+        path = str(tmp_path / "status.json")
+        writer = CoalescedJson(path, interval=0.05)
+        writer.submit(lambda d: {"n": 1})
+        writer.submit(lambda d: {"n": 2})
+        deadline = time.monotonic() + 2
+        while read_json(path) != {"n": 2} and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert read_json(path) == {"n": 2}
+
+    def test_shared_per_path(self, tmp_path):
+        path = str(tmp_path / "status.json")
+        assert atomic_io.coalesced(path) is atomic_io.coalesced(path)
+
+
+class TestEngineStatus:
+    def test_heartbeats_coalesced_errors_kept(self, tmp_path, monkeypatch):
+        import daily_runner
+        path = str(tmp_path / "engine_status.json")
+        monkeypatch.setattr(daily_runner, "DATA_DIR", str(tmp_path))
+        monkeypatch.setattr(daily_runner, "ENGINE_STATUS_PATH", path)
+        monkeypatch.setattr(daily_runner, "ENGINE_STATUS_INTERVAL", 60)
+
+        daily_runner.write_engine_status("startup", "running", metrics={"fields": 3})
+        for n in range(20):
+            daily_runner.write_engine_status(f"field:{n}", "running")
+        assert read_json(path)["processes"]["daily_runner"]["phase"] == "startup"
+
+        daily_runner.write_engine_status("field:x", "running", error="boom")
+        status = read_json(path)
+        assert status["processes"]["daily_runner"]["phase"] == "field:x"
+        assert status["metrics"] == {"fields": 3}
+        assert [e["message"] for e in status["errors"]] == ["boom"]
+
+        daily_runner.write_engine_status("complete", "idle", metrics={"done": 1})
+        status = read_json(path)
+        assert status["health"] == "idle"
+        assert status["metrics"] == {"fields": 3, "done": 1}
+        assert len(status["errors"]) == 1
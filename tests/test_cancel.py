@@ -0,0 +1,56 @@
+"""Tests for wheat/cancel.py — cancel scopes and killing in-flight subprocesses."""
+
+import subprocess
+import sys
+import threading
+import time
+
+import pytest
+
+from wheat.cancel import CancelScope, Cancelled
+
+SLEEPER = [sys.executable, "-c", "import subprocess, sys, time; "
+           "subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']); time.sleep(30)"]
+
+
+class TestCancelScope:
+    def test_run_returns_completed_process(self):
+        result = CancelScope().run([sys.executable, "-c", "print('hi')"], timeout=10)
+        assert result.returncode == 0
+        assert result.stdout.strip() == "hi"
+
+    def test_cancel_kills_running_process_group(self):
+        scope = CancelScope()
+        threading.Timer(0.3, scope.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(Cancelled):
+            scope.run(SLEEPER, timeout=20)
+        assert time.monotonic() - start < 5
+
+    def test_run_after_cancel_never_starts(self):
+        scope = CancelScope()
+        scope.cancel()
+        with pytest.raises(Cancelled):
+            scope.run([sys.executable, "-c", "pass"])
+
+    def test_register_after_cancel_kills(self):
+        scope = CancelScope()
+        scope.cancel()
+        proc = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(30)"], start_new_session=True)
+        scope.register(proc)
+        assert proc.wait(5) != 0
+
+    def test_timeout_still_applies(self):
+        with pytest.raises(subprocess.TimeoutExpired):
+            CancelScope().run(SLEEPER, timeout=0.3)
+
+    def test_wait_and_check(self):
+        scope = CancelScope()
+        assert scope.wait(0.01) is False
+        scope.check()
+        threading.Timer(0.05, scope.cancel).start()
+        assert scope.wait(5) is True
+        assert scope.cancelled
+        with pytest.raises(Cancelled):
+            scope.check()
+        scope.cancel()  # idempotent
@@ -0,0 +1,205 @@
+"""Tests for wheat/case_summary.py — trigger-maintained escalation aggregates."""
+
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import wheat.escalation as esc
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "test_wheat.db")
+    monkeypatch.setattr(esc, "DB_PATH", db_path)
+    esc.init_escalation_db()
+    return db_path
+
+
+def _raw_summary(db_path):
+    """The aggregates computed the old way, straight from cases."""
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute("SELECT stage, COUNT(*) FROM cases WHERE resolved_at IS NULL GROUP BY stage")
+    active = dict(c.fetchall())
+    c.execute("SELECT stage, COUNT(*) FROM cases GROUP BY stage")
+    total = dict(c.fetchall())
+    c.execute("""SELECT field, COUNT(*), SUM(resolved_at IS NULL) FROM cases GROUP BY field""")
+    fields = {row[0]: (row[1], row[2]) for row in c.fetchall()}
+    c.execute("""SELECT entity, COUNT(DISTINCT field), MAX(severity) FROM cases
+        WHERE resolved_at IS NULL GROUP BY entity HAVING COUNT(DISTINCT field) > 1""")
+    cross = {row[0]: (row[1], row[2]) for row in c.fetchall()}
+    conn.close()
+    return active, total, fields, cross
+
+
+def _assert_consistent(db_path):
+    active, total, fields, cross = _raw_summary(db_path)
+    assert {k: v for k, v in esc.get_stage_distribution().items() if v} == active
+    assert {k: v for k, v in esc.get_stage_distribution(active_only=False).items() if v} == total
+    assert {f["field"]: (f["total"], f["active"]) for f in esc.get_field_list()} == fields
+    assert {e["entity"]: (e["field_count"], e["max_severity"]) for e in esc.get_cross_field_entities()} == cross
+
+
+class TestConsistency:
+    def test_create_escalate_resolve(self, temp_db):
+        a = esc.create_case("dealers", "Acme", "Issue", severity=2)
+        esc.create_case("lenders", "Acme", "Issue", severity=4)
+        b = esc.create_case("dealers", "Beta", "Issue")
+        _assert_consistent(temp_db)
+        esc.escalate_case(a)
+        esc.escalate_case(a)
+        _assert_consistent(temp_db)
+        esc.resolve_case(b)
+        _assert_consistent(temp_db)
+        esc.resolve_case(a)
+        _assert_consistent(temp_db)
+        assert esc.get_cross_field_entities() == []
+
+    def test_merge_raises_max_severity(self, temp_db):
+        esc.create_case("dealers", "Acme", "Issue", severity=1)
+        esc.create_case("lenders", "Acme", "Issue", severity=1)
+        esc.create_case("dealers", "Acme", "Worse", severity=5)
+        _assert_consistent(temp_db)
+        assert esc.get_cross_field_entities()[0]["max_severity"] == 5
+        assert esc.get_field_list()[0]["total"] == 1
+
+    def test_reopened_pair_after_resolve(self, temp_db):
+        first = esc.create_case("dealers", "Acme", "Issue")
+        esc.resolve_case(first)
+        esc.create_case("dealers", "Acme", "Again")
+        esc.create_case("lenders", "Acme", "Issue")
+        _assert_consistent(temp_db)
+        assert esc.get_cross_field_entities()[0]["field_count"] == 2
+
+    def test_direct_sql_edits_are_tracked(self, temp_db):
+        cid = esc.create_case("dealers", "Acme", "Issue")
+        esc.create_case("lenders", "Beta", "Issue")
+        conn = sqlite3.connect(temp_db)
+        conn.execute("UPDATE cases SET entity = 'Beta', stage = 'notice' WHERE id = ?", (cid,))
+        conn.commit()
+        _assert_consistent(temp_db)
+        conn.execute("DELETE FROM cases WHERE id = ?", (cid,))
+        conn.commit()
+        conn.close()
+        _assert_consistent(temp_db)
+
+
+class TestBackfill:
+    def test_existing_cases_are_summarised_once(self, tmp_path, monkeypatch):
+        db_path = str(tmp_path / "legacy.db")
+        conn = sqlite3.connect(db_path)
+        conn.execute("""CREATE TABLE cases (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, field TEXT NOT NULL, entity TEXT NOT NULL,
+            issue TEXT NOT NULL, severity INTEGER DEFAULT 1, stage TEXT DEFAULT 'seed',
+            evidence TEXT DEFAULT '[]', law_cited TEXT DEFAULT '', source TEXT DEFAULT '',
+            notes TEXT DEFAULT '', created_at TEXT NOT NULL, updated_at TEXT NOT NULL,
+            stage_entered_at TEXT NOT NULL, escalation_deadline TEXT, resolved_at TEXT,
+            resolution TEXT DEFAULT ''
+        )""")
+        conn.executemany(
+            "INSERT INTO cases (field, entity, issue, severity, stage, created_at, updated_at, stage_entered_at, resolved_at)"
+            " VALUES (?, ?, 'x', ?, ?, 'now', 'now', 'now', ?)",
+            [("dealers", "Acme", 3, "notice", None), ("lenders", "Acme", 2, "seed", None),
+             ("dealers", "Beta", 1, "harvest", "done")],
+        )
+        conn.commit()
+        conn.close()
+
+        monkeypatch.setattr(esc, "DB_PATH", db_path)
+        esc.init_escalation_db()
+        _assert_consistent(db_path)
+        esc.init_escalation_db()  # second call must not double-count
+        _assert_consistent(db_path)
+
+
+class TestSummaryTag:
+    def test_changes_on_every_write(self):
+        tags = [esc.get_summary_tag()]
+        cid = esc.create_case("dealers", "Acme", "Issue")
+        tags.append(esc.get_summary_tag())
+        esc.create_case("dealers", "Acme", "More evidence")
+        tags.append(esc.get_summary_tag())
+        esc.escalate_case(cid)
+        tags.append(esc.get_summary_tag())
+        esc.resolve_case(cid)
+        tags.append(esc.get_summary_tag())
+        assert len(set(tags)) == len(tags)
+
+    def test_stable_without_writes(self):
+        esc.create_case("dealers", "Acme", "Issue")
+        assert esc.get_summary_tag() == esc.get_summary_tag()
+
+    def test_reads_use_summary_tables(self, temp_db):
+        conn = sqlite3.connect(temp_db)
+        c = conn.cursor()
+        c.execute("EXPLAIN QUERY PLAN SELECT entity FROM case_entities WHERE field_count > 1 "
+                  "ORDER BY field_count DESC, max_severity DESC")
+        plan = " ".join(row[-1] for row in c.fetchall())
+        conn.close()
+        assert "idx_case_entities_count" in plan
+
+    def test_schema_set_up_once_per_database(self, temp_db, monkeypatch):
+        calls = []
+        create = esc.case_summary.create_summary_tables
+        monkeypatch.setattr(esc.case_summary, "create_summary_tables",
+                            lambda cursor: calls.append(cursor) or create(cursor))
+        esc.create_case("dealers", "Acme", "Issue")
+        esc.get_stage_distribution()
+        esc.get_field_list()
+        esc.get_summary_tag()
+        esc.list_cases()
+        assert calls == []
+        monkeypatch.setattr(esc, "DB_PATH", temp_db + ".other")
+        esc.get_summary_tag()
+        assert len(calls) == 1
+
+    @pytest.mark.parametrize("sort, index", [("deadline", "idx_cases_deadline_order"),
+                                             ("entity", "idx_cases_entity_order")])
+    def test_listing_sorts_use_an_index(self, temp_db, sort, index):
+        keys, direction = esc.CASE_SORTS[sort]
+        conn = sqlite3.connect(temp_db)
+        plan = " ".join(row[-1] for row in conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT id FROM cases ORDER BY {', '.join(f'{k} {direction}' for k in keys)} LIMIT 50"
+        ))
+        conn.close()
+        assert index in plan and "TEMP B-TREE" not in plan
+
+
+@pytest.fixture
+def client(temp_db, monkeypatch):
+    import app as flask_app
+    monkeypatch.setattr(flask_app, "DB_PATH", temp_db)
+    flask_app.app.config["TESTING"] = True
+    with flask_app.app.test_client() as c:
+        yield c
+
+
+class TestConditionalRequests:
+    def test_api_returns_304_until_a_case_changes(self, client):
+        esc.create_case("dealers", "Acme", "Issue")
+        first = client.get("/api/escalation")
+        etag = first.headers["ETag"]
+        assert "max-age" in first.headers["Cache-Control"]
+
+        again = client.get("/api/escalation", headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.data == b""
+
+        esc.create_case("lenders", "Beta", "Issue")
+        changed = client.get("/api/escalation", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["ETag"] != etag
+        assert changed.get_json()["total_active"] == 2
+
+    def test_page_etag_depends_on_filters(self, client):
+        esc.create_case("dealers", "Acme", "Issue")
+        plain = client.get("/escalation").headers["ETag"]
+        filtered = client.get("/escalation?field=dealers").headers["ETag"]
+        assert plain != filtered
+        assert client.get("/escalation?field=dealers", headers={"If-None-Match": filtered}).status_code == 304
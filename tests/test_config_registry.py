@@ -0,0 +1,140 @@
+"""Tests for wheat/config_registry.py — cached, read-only config snapshots."""
+
+import copy
+import json
+import os
+
+import pytest
+
+from wheat import channels, config_registry, paths
+from wheat.config_registry import FrozenDict, FrozenList, freeze, thaw
+
+
+@pytest.fixture(autouse=True)
+def files(tmp_path, monkeypatch):
+    config_registry.invalidate()
+    config_path = tmp_path / "config.json"
+    config_path.write_text(json.dumps({"lifespan": 10, "max_tokens": 500, "llm_api": "venice"}))
+    projects_path = tmp_path / "projects.json"
+    projects_path.write_text(json.dumps({
+        "dealers": {"name": "Dealers", "lifespan": 20, "unknown_key": 1},
+        "repair": {"name": "Repair"},
+    }))
+    channels_path = tmp_path / "channels.json"
+    channels_path.write_text(json.dumps({
+        "reviews": {"name": "Reviews", "fields": ["dealers", "repair"]},
+        "community": {"name": "Community", "fields": ["all"]},
+        "court": {"name": "Court", "fields": ["dealers"]},
+    }))
+    monkeypatch.setattr(paths, "CONFIG_PATH", str(config_path))
+    monkeypatch.setattr(paths, "PROJECTS_PATH", str(projects_path))
+    monkeypatch.setattr(channels, "CHANNELS_PATH", str(channels_path))
+    yield {"config": config_path, "projects": projects_path, "channels": channels_path}
+    config_registry.invalidate()
+
+
+def _rewrite(path, data):
+    """Write new contents and make sure the stamp moves even on coarse-mtime filesystems."""
+    before = os.stat(path).st_mtime_ns
+    path.write_text(json.dumps(data))
+    os.utime(path, ns=(before + 10**9, before + 10**9))
+
+
+class TestFreeze:
+    def test_reads_like_json(self):
+        frozen = freeze({"a": [1, {"b": 2}]})
+        assert frozen == {"a": [1, {"b": 2}]}
+        assert isinstance(frozen, dict) and isinstance(frozen["a"], list)
+        assert json.loads(json.dumps(frozen)) == {"a": [1, {"b": 2}]}
+
+    def test_refuses_mutation(self):
+        frozen = freeze({"a": [1], "b": {}})
+        with pytest.raises(TypeError):
+            frozen["c"] = 1
+        with pytest.raises(TypeError):
+            frozen.update(c=1)
+        with pytest.raises(TypeError):
+            frozen["a"].append(2)
+        with pytest.raises(TypeError):
+            frozen["b"].setdefault("x", 1)
+
+    def test_thaw_and_copies_are_mutable(self):
+        frozen = freeze({"a": [1], "b": {"c": 2}})
+        for editable in (thaw(frozen), copy.deepcopy(frozen)):
+            editable["a"].append(2)
+            editable["b"]["d"] = 3
+            assert type(editable) is dict and type(editable["a"]) is list
+        assert frozen == {"a": [1], "b": {"c": 2}}
+
+
+class TestLoadJson:
+    def test_parsed_once_until_changed(self, files, monkeypatch):
+        parses = []
+        real = json.load
+        monkeypatch.setattr(config_registry.json, "load", lambda f: parses.append(1) or real(f))
+        first = paths.load_projects()
+        assert paths.load_projects() is first
+        assert len(parses) == 1
+
+        _rewrite(files["projects"], {"only": {"name": "Only"}})
+        second = paths.load_projects()
+        assert second == {"only": {"name": "Only"}}
+        assert len(parses) == 2
+        assert first == {  # holders of the old snapshot keep a consistent view
+            "dealers": {"name": "Dealers", "lifespan": 20, "unknown_key": 1},
+            "repair": {"name": "Repair"},
+        }
+
+    def test_save_invalidates_immediately(self, files):
+        paths.load_projects()
+        paths.save_projects({"x": {"name": "X"}})
+        assert paths.load_projects() == {"x": {"name": "X"}}
+        channels.load_channels()
+        channels.save_channels({"solo": {"name": "Solo", "fields": ["x"]}})
+        assert list(channels.load_channels()) == ["solo"]
+
+    def test_missing_file_uses_default(self, files, monkeypatch):
+        monkeypatch.setattr(paths, "PROJECTS_PATH", str(files["projects"]) + ".missing")
+        assert paths.load_projects() == {"default": {"name": "Default Field", "active": True}}
+        monkeypatch.setattr(paths, "CONFIG_PATH", str(files["config"]) + ".missing")
+        with pytest.raises(FileNotFoundError):
+            paths.load_config()
+
+    def test_loaders_return_frozen_snapshots(self):
+        for value in (paths.load_config(), paths.load_projects(), channels.load_channels()):
+            assert isinstance(value, FrozenDict)
+        assert isinstance(channels.load_channels()["reviews"]["fields"], FrozenList)
+
+
+class TestDerivedIndexes:
+    def test_project_configs_merged_once(self, files):
+        dealers = paths.load_project_config("dealers")
+        assert dealers["lifespan"] == 20 and dealers["llm_api"] == "venice"
+        assert "unknown_key" not in dealers
+        assert paths.load_project_config("dealers") is dealers
+        assert paths.load_project_config("nope") == paths.load_config()
+
+        _rewrite(files["config"], {"lifespan": 10, "max_tokens": 500, "llm_api": "other"})
+        assert paths.load_project_config("dealers")["llm_api"] == "other"
+
+    def test_channels_for_field_keeps_file_order(self):
+        assert list(channels.get_channels_for_field("dealers")) == ["reviews", "community", "court"]
+        assert list(channels.get_channels_for_field("repair")) == ["reviews", "community"]
+        assert list(channels.get_channels_for_field("elsewhere")) == ["community"]
+
+    def test_fields_for_channel_expands_all(self, files):
+        assert channels.get_fields_for_channel("court") == ["dealers"]
+        assert channels.get_fields_for_channel("community") == ["dealers", "repair"]
+        assert channels.get_fields_for_channel("missing") == []
+        _rewrite(files["projects"], {"dealers": {}, "repair": {}, "lenders": {}})
+        assert channels.get_fields_for_channel("community") == ["dealers", "repair", "lenders"]
+
+    def test_derived_rebuilds_only_on_new_inputs(self):
+        builds = []
+        a, b = freeze({"x": 1}), freeze({"x": 1})
+        build = lambda d: builds.append(1) or len(d)
+        config_registry.derived("t", (a,), build)
+        config_registry.derived("t", (a,), build)
+        assert len(builds) == 1
+        config_registry.derived("t", (b,), build)  # equal but a different snapshot
+        assert len(builds) == 2
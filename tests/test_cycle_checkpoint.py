@@ -0,0 +1,189 @@
+"""Tests for wheat/cycle_checkpoint.py — resumable daily cycle state."""
+
+import json
+import os
+from datetime import date, datetime
+
+import pytest
+
+import wheat.cycle_checkpoint as cp
+
+
+@pytest.fixture(autouse=True)
+def cycles_dir(tmp_path, monkeypatch):
+    """Redirect checkpoints to a temp directory."""
+    path = str(tmp_path / "cycles")
+    monkeypatch.setattr(cp, "CYCLES_DIR", path)
+    return path
+
+
+class TestNewCycleId:
+    def test_timestamp_format(self):
+        assert cp.new_cycle_id(datetime(2026, 3, 17, 7, 5, 9)) == "20260317_070509"
+
+
+class TestCycleCheckpoint:
+    def test_creates_manifest(self, cycles_dir):
+        ckpt = cp.CycleCheckpoint("20260317_070000")
+        with open(os.path.join(cycles_dir, "20260317_070000", "manifest.json")) as f:
+            manifest = json.load(f)
+        assert manifest["cycle_id"] == "20260317_070000"
+        assert manifest["phases"] == []
+        assert not ckpt.is_complete
+
+    def test_phase_roundtrip(self):
+        ckpt = cp.CycleCheckpoint("c1")
+        assert not ckpt.has_phase("scan")
+        assert ckpt.load_phase("scan") is None
+        ckpt.save_phase("scan", {"ch1": {"signals": [{"entity": "X"}]}})
+        assert ckpt.has_phase("scan")
+        assert ckpt.load_phase("scan")["ch1"]["signals"][0]["entity"] == "X"
+
+    def test_phases_survive_reopen(self):
+        cp.CycleCheckpoint("c1").save_phase("correlation", {"field_intake": {}})
+        reopened = cp.CycleCheckpoint("c1")
+        assert reopened.has_phase("correlation")
+        assert reopened.load_phase("correlation") == {"field_intake": {}}
+
+    def test_phase_saved_once_in_manifest(self):
+        ckpt = cp.CycleCheckpoint("c1")
+        ckpt.save_phase("scan", {})
+        ckpt.save_phase("scan", {"a": 1})
+        assert ckpt.manifest["phases"] == ["scan"]
+        assert ckpt.load_phase("scan") == {"a": 1}
+
+    def test_field_roundtrip(self):
+        ckpt = cp.CycleCheckpoint("c1")
+        status = {"run_id": 3, "seeds": [{"seed_id": "1", "status": "Fruitful"}]}
+        ckpt.save_field("tow_companies", status)
+        assert ckpt.has_field("tow_companies")
+        assert not ckpt.has_field("auto_repair")
+        assert ckpt.load_field("tow_companies") == status
+        assert ckpt.completed_fields() == ["tow_companies"]
+
+    def test_scan_results_saved_per_channel(self):
+        ckpt = cp.CycleCheckpoint("c1")
+        ckpt.save_scan("bbb", {"signals": [{"entity": "X"}]})
+        ckpt.save_scan("news", None)
+        assert cp.CycleCheckpoint("c1").completed_scans() == {"bbb": {"signals": [{"entity": "X"}]}, "news": None}
+
+    def test_no_temp_files_left(self, cycles_dir):
+        ckpt = cp.CycleCheckpoint("c1")
+        ckpt.save_phase("scan", {})
+        ckpt.save_field("f1", {})
+        leftovers = [f for _, _, files in os.walk(cycles_dir) for f in files if f.endswith(".tmp")]
+        assert leftovers == []
+
+    def test_mark_complete(self):
+        ckpt = cp.CycleCheckpoint("c1")
+        ckpt.mark_complete()
+        assert ckpt.is_complete
+        assert cp.CycleCheckpoint("c1").is_complete
+
+
+class TestLatestIncompleteCycle:
+    def test_none_when_empty(self):
+        assert cp.latest_incomplete_cycle() is None
+
+    def test_returns_newest_unfinished(self):
+        cp.CycleCheckpoint("20260316_070000")
+        cp.CycleCheckpoint("20260317_070000").save_phase("scan", {})
+        ckpt = cp.latest_incomplete_cycle(day=date(2026, 3, 17))
+        assert ckpt.cycle_id == "20260317_070000"
+        assert ckpt.has_phase("scan")
+
+    def test_none_when_newest_complete(self):
+        cp.CycleCheckpoint("20260316_070000")
+        cp.CycleCheckpoint("20260317_070000").mark_complete()
+        assert cp.latest_incomplete_cycle(day=date(2026, 3, 17)) is None
+
+    def test_none_when_from_another_day(self):
+        cp.CycleCheckpoint("20260316_070000").save_phase("scan", {})
+        assert cp.latest_incomplete_cycle(day=date(2026, 3, 17)) is None
+
+
+class TestRotateCycles:
+    def test_keeps_newest(self):
+        for day in range(10, 20):
+            cp.CycleCheckpoint(f"202603{day}_070000")
+        cp.rotate_cycles(retain=3)
+        assert cp.list_cycles() == ["20260317_070000", "20260318_070000", "20260319_070000"]
+
+    def test_ignores_dirs_without_manifest(self, cycles_dir):
+        os.makedirs(os.path.join(cycles_dir, "junk"))
+        cp.CycleCheckpoint("c1")
+        assert cp.list_cycles() == ["c1"]
+
+
+class TestRunnerResume:
+    @pytest.fixture
+    def runner(self, monkeypatch):
+        import sys
+        from pathlib import Path
+        root = str(Path(__file__).resolve().parent.parent)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        import daily_runner
+
+        class Monday(date):
+            @classmethod
+            def today(cls):
+                return cls(2026, 3, 16)
+
+        channels = {"bbb": {"name": "BBB"}, "news": {"name": "News"}}
+        scanned = []
+        monkeypatch.setattr(daily_runner, "date", Monday)
+        monkeypatch.setattr(daily_runner, "load_channels", lambda: channels)
+        monkeypatch.setattr(daily_runner, "get_fields_for_channel", lambda cid: [])
+        # "bbb" was scanned (and recorded in the schedule) before the crash, so only "news" is due
+        monkeypatch.setattr(daily_runner, "due_channels", lambda chans: ["news"])
+        monkeypatch.setattr(daily_runner, "write_engine_status", lambda *a, **k: None)
+        monkeypatch.setattr(daily_runner, "scan_and_record",
+                            lambda cid, data: scanned.append(cid) or {"signals": [{"entity": cid}]})
+        return daily_runner, scanned
+
+    def test_scans_checkpointed_per_channel_and_restored(self, runner):
+        runner, scanned = runner
+        ckpt = cp.CycleCheckpoint("20260316_070000")
+        ckpt.save_scan("bbb", {"signals": [{"entity": "restored"}]})
+        run = runner.build_cycle_graph({}, ckpt, scan_only=True).run(max_workers=1)
+        assert scanned == ["news"]
+        assert run.results["scan"] == {"bbb": {"signals": [{"entity": "restored"}]},
+                                       "news": {"signals": [{"entity": "news"}]}}
+        assert ckpt.completed_scans()["news"] == {"signals": [{"entity": "news"}]}
+
+    def test_briefing_not_reused_after_failed_field_reruns(self, runner, tmp_path, monkeypatch):
+        runner, _ = runner
+        attempts = {"b": 0}
+        briefed = []
+
+        def run_field(pid, pdata, guidance=None):
+            if pid == "b":
+                attempts["b"] += 1
+                if attempts["b"] == 1:
+                    raise RuntimeError("boom")
+            return {"seeds": []}
+
+        def synthesize_briefing(field_results, **kwargs):
+            briefed.append(dict(field_results))
+            path = tmp_path / f"briefing_{len(briefed)}.txt"
+            path.write_text(f"briefing {len(briefed)}")
+            return path.read_text(), str(path)
+
+        monkeypatch.setattr(runner, "run_field", run_field)
+        monkeypatch.setattr(runner, "synthesize_briefing", synthesize_briefing)
+        monkeypatch.setattr(runner, "get_stewards_map", lambda **kwargs: {})
+        ckpt = cp.CycleCheckpoint("20260316_070000")
+        ckpt.save_phase("scan", {})
+        ckpt.save_phase("correlation", None)
+        ckpt.save_phase("escalation", {"report": "", "cross_field": []})
+        fields = {"a": {}, "b": {}}
+
+        first = runner.build_cycle_graph(fields, ckpt).run(max_workers=1)
+        assert first.results["briefing"]["field_results"]["b"] is None
+        assert not ckpt.has_phase("briefing")
+
+        second = runner.build_cycle_graph(fields, ckpt).run(max_workers=1)
+        assert second.results["briefing"]["text"] == "briefing 2"
+        assert briefed[-1] == {"a": {"seeds": []}, "b": {"seeds": []}}
+        assert ckpt.has_phase("briefing")
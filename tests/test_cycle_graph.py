@@ -0,0 +1,122 @@
+"""Tests for wheat/cycle_graph.py — dependency-driven daily cycle executor."""
+
+import threading
+import time
+
+import pytest
+
+from wheat.cycle_graph import TaskGraph
+
+
+def _const(value, delay=0.0):
+    def fn(results):
+        if delay:
+            time.sleep(delay)
+        return value
+    return fn
+
+
+class TestAdd:
+    def test_unknown_dependency_rejected(self):
+        graph = TaskGraph()
+        with pytest.raises(ValueError, match="unknown"):
+            graph.add("b", _const(1), deps=["a"])
+
+    def test_duplicate_rejected(self):
+        graph = TaskGraph()
+        graph.add("a", _const(1))
+        with pytest.raises(ValueError, match="Duplicate"):
+            graph.add("a", _const(2))
+
+
+class TestRun:
+    def test_results_flow_to_dependents(self):
+        graph = TaskGraph()
+        graph.add("a", _const(2))
+        graph.add("b", _const(3))
+        graph.add("sum", lambda r: r["a"] + r["b"], deps=["a", "b"])
+        run = graph.run(max_workers=2)
+        assert run.results["sum"] == 5
+        assert all(t["status"] == "ok" for t in run.timings.values())
+
+    def test_dependency_order_respected(self):
+        order = []
+        lock = threading.Lock()
+
+        def record(name, delay):
+            def fn(results):
+                time.sleep(delay)
+                with lock:
+                    order.append(name)
+            return fn
+
+        graph = TaskGraph()
+        graph.add("slow", record("slow", 0.05))
+        graph.add("after", record("after", 0), deps=["slow"])
+        graph.run(max_workers=4)
+        assert order == ["slow", "after"]
+
+    def test_independent_nodes_overlap(self):
+        graph = TaskGraph()
+        for name in ("a", "b", "c"):
+            graph.add(name, _const(name, delay=0.1))
+        run = graph.run(max_workers=3)
+        assert run.wall_seconds < 0.25
+
+    def test_single_worker_is_sequential(self):
+        graph = TaskGraph()
+        for name in ("a", "b"):
+            graph.add(name, _const(name, delay=0.05))
+        run = graph.run(max_workers=1)
+        assert run.wall_seconds >= 0.1
+
+    def test_failure_skips_dependents(self):
+        def boom(results):
+            raise RuntimeError("boom")
+
+        graph = TaskGraph()
+        graph.add("bad", boom)
+        graph.add("child", _const(1), deps=["bad"])
+        graph.add("grandchild", _const(1), deps=["child"])
+        graph.add("other", _const(1))
+        run = graph.run()
+        assert isinstance(run.errors["bad"], RuntimeError)
+        assert run.state("bad") == "failed"
+        assert run.state("child") == "skipped"
+        assert run.state("grandchild") == "skipped"
+        assert run.results["other"] == 1
+
+    def test_callbacks(self):
+        started, finished = [], []
+        graph = TaskGraph()
+        graph.add("a", _const(1))
+        graph.run(on_start=started.append, on_finish=lambda name, t: finished.append((name, t["status"])))
+        assert started == ["a"]
+        assert finished == [("a", "ok")]
+
+    def test_empty_graph(self):
+        run = TaskGraph().run()
+        assert run.results == {}
+        assert run.critical_path() == ([], 0.0)
+
+
+class TestCriticalPath:
+    def test_longest_chain(self):
+        graph = TaskGraph()
+        graph.add("scan", _const(None, delay=0.05))
+        graph.add("escalation", _const(None))
+        graph.add("correlation", _const(None, delay=0.05), deps=["scan"])
+        graph.add("briefing", _const(None), deps=["correlation", "escalation"])
+        run = graph.run(max_workers=4)
+        path, seconds = run.critical_path()
+        assert path == ["scan", "correlation", "briefing"]
+        assert seconds >= 0.1
+
+    def test_summary_mentions_nodes_and_path(self):
+        graph = TaskGraph()
+        graph.add("a", _const(1))
+        graph.add("b", _const(1), deps=["a"])
+        text = graph.run().summary()
+        assert "a" in text and "b" in text
+        assert "Critical path" in text
+        assert "a → b" in text
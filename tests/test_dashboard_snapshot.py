@@ -0,0 +1,157 @@
+"""Tests for wheat/dashboard_snapshot.py — fixed-cost main dashboard reads."""
+
+import json
+import os
+import sqlite3
+import sys
+from datetime import date
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import wheat.escalation as esc
+from wheat import channels, dashboard_snapshot
+
+
+@pytest.fixture(autouse=True)
+def env(tmp_path, monkeypatch):
+    """Temp DB shared by app and escalation, temp channels.json, empty caches."""
+    import app as flask_app
+    db_path = str(tmp_path / "wheat.db")
+    monkeypatch.setattr(flask_app, "DB_PATH", db_path)
+    monkeypatch.setattr(esc, "DB_PATH", db_path)
+    flask_app.init_db()
+    esc.init_escalation_db()
+
+    channels_path = tmp_path / "channels.json"
+    channels_path.write_text(json.dumps({
+        "reviews": {"name": "Reviews", "fields": ["dealers", "repair"]},
+        "court": {"name": "Court", "fields": ["dealers"]},
+        "community": {"name": "Community", "fields": ["all"]},
+    }))
+    monkeypatch.setattr(channels, "CHANNELS_PATH", str(channels_path))
+    dashboard_snapshot.clear_cache()
+    yield {"db": db_path, "channels": channels_path, "tmp": tmp_path}
+    dashboard_snapshot.clear_cache()
+
+
+def _add_run(db_path, project_id, statuses):
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    c.execute("INSERT INTO runs (timestamp, log, project_id) VALUES ('t', '', ?)", (project_id,))
+    run_id = c.lastrowid
+    for i, status in enumerate(statuses):
+        c.execute(
+            "INSERT INTO seeds (run_id, seed_id, task, status, output, project_id) VALUES (?, ?, 'task', ?, '[]', ?)",
+            (run_id, str(i), status, project_id),
+        )
+    conn.commit()
+    conn.close()
+    return run_id
+
+
+class TestLatestRuns:
+    def test_matches_get_latest_run(self, env):
+        import app as flask_app
+        _add_run(env["db"], "dealers", ["Fruitful", "Fruitful"])  # superseded
+        latest = _add_run(env["db"], "dealers", ["Fruitful", "Barren", "Growing", "Repairing"])
+        _add_run(env["db"], "repair", [])
+        runs = dashboard_snapshot.latest_runs(env["db"])
+
+        assert runs["dealers"] == {
+            "run_id": latest, "timestamp": "t", "total_seeds": 4,
+            "fruitful": 1, "barren": 1, "growing": 2,
+        }
+        assert runs["repair"]["total_seeds"] == 0
+        _, status = flask_app.get_latest_run("dealers", with_log=False)
+        assert len(status["seeds"]) == runs["dealers"]["total_seeds"]
+
+    def test_counts_follow_status_updates(self, env):
+        run_id = _add_run(env["db"], "dealers", ["Growing", "Growing"])
+        conn = sqlite3.connect(env["db"])
+        conn.execute("UPDATE seeds SET status = 'Fruitful' WHERE run_id = ? AND seed_id = '0'", (run_id,))
+        conn.execute("DELETE FROM seeds WHERE run_id = ? AND seed_id = '1'", (run_id,))
+        conn.commit()
+        conn.close()
+        run = dashboard_snapshot.latest_runs(env["db"])["dealers"]
+        assert (run["total_seeds"], run["fruitful"], run["growing"]) == (1, 1, 0)
+
+    def test_backfills_existing_seeds(self, env):
+        _add_run(env["db"], "dealers", ["Fruitful", "Barren"])
+        conn = sqlite3.connect(env["db"])
+        conn.execute("DROP TABLE run_seed_counts")
+        for trigger in ("insert", "update", "delete"):
+            conn.execute(f"DROP TRIGGER trg_seeds_count_{trigger}")
+        conn.commit()
+        c = conn.cursor()
+        dashboard_snapshot.create_seed_counts_table(c)
+        dashboard_snapshot.create_seed_counts_table(c)  # idempotent
+        conn.commit()
+        conn.close()
+        run = dashboard_snapshot.latest_runs(env["db"])["dealers"]
+        assert (run["total_seeds"], run["fruitful"], run["barren"]) == (2, 1, 1)
+
+    def test_missing_tables(self, tmp_path):
+        assert dashboard_snapshot.latest_runs(str(tmp_path / "empty.db")) == {}
+
+
+class TestFileMetadata:
+    def test_latest_briefing_follows_new_files_and_edits(self, tmp_path):
+        briefings = tmp_path / "briefings"
+        assert dashboard_snapshot.latest_briefing(str(briefings)) is None
+        briefings.mkdir()
+        (briefings / "briefing_2026-01-01.txt").write_text("old")
+        assert dashboard_snapshot.latest_briefing(str(briefings)) == "old"
+        (briefings / "briefing_2026-01-02.txt").write_text("new")
+        assert dashboard_snapshot.latest_briefing(str(briefings)) == "new"
+        (briefings / "briefing_2026-01-02.txt").write_text("newer text")
+        assert dashboard_snapshot.latest_briefing(str(briefings)) == "newer text"
+
+    def test_intake_count_is_cached_per_directory_state(self, tmp_path, monkeypatch):
+        intake = tmp_path / "intake"
+        intake.mkdir()
+        today = date.today().strftime("%Y%m%d")
+        (intake / f"report_{today}_1.json").write_text("{}")
+        (intake / "report_19990101_1.json").write_text("{}")
+        assert dashboard_snapshot.intake_count(str(intake)) == 1
+
+        listed = []
+        real = os.listdir
+        monkeypatch.setattr(dashboard_snapshot.os, "listdir", lambda p: listed.append(p) or real(p))
+        assert dashboard_snapshot.intake_count(str(intake)) == 1
+        assert listed == []
+        (intake / f"report_{today}_2.json").write_text("{}")
+        assert dashboard_snapshot.intake_count(str(intake)) == 2
+        assert listed == [str(intake)]
+
+
+class TestSnapshot:
+    def test_dashboard_renders_from_snapshot(self, env, monkeypatch):
+        import app as flask_app
+        monkeypatch.setattr(flask_app, "load_projects", lambda: {
+            "dealers": {"name": "Used Car Dealers"}, "repair": {"name": "Auto Repair"},
+        })
+        monkeypatch.setattr(flask_app, "ENGINE_STATUS_PATH", str(env["tmp"] / "missing.json"))
+        _add_run(env["db"], "dealers", ["Fruitful", "Barren"])
+        esc.create_case("dealers", "Acme", "Odometer fraud", severity=4)
+        esc.create_case("repair", "Acme", "Overcharging")
+
+        data = dashboard_snapshot.snapshot(
+            flask_app.load_projects(), env["db"], str(env["tmp"] / "none"), str(env["tmp"] / "none"),
+        )
+        dealers = data["fields"][0]
+        assert (dealers["fruitful"], dealers["barren"], dealers["channel_count"]) == (1, 1, 3)
+        assert data["fields"][1]["total_seeds"] == 0
+        assert data["active_cases"] == 2
+        assert [e["entity"] for e in data["cross_field_entities"]] == ["Acme"]
+
+        flask_app.app.config["TESTING"] = True
+        with flask_app.app.test_client() as client:
+            rv = client.get("/")
+        assert rv.status_code == 200
+        assert b"Used Car Dealers" in rv.data
+        assert b"Odometer fraud" in rv.data
@@ -235,3 +235,155 @@ class TestCaseHistoryAPI:
         assert rv.status_code == 200
         data = rv.get_json()
         assert data["history"] == []
+
+
+class TestListCases:
+    def _page_through(self, **kw):
+        seen, cursor = [], None
+        while True:
+            cases, cursor = esc.list_cases(after=cursor, **kw)
+            seen.extend(cases)
+            if cursor is None:
+                return seen
+
+    def test_pages_cover_everything_in_order(self):
+        for i in range(12):
+            _create_case(entity=f"E{i:02d}", severity=i % 5 + 1)
+        paged = self._page_through(limit=5)
+        assert [c["id"] for c in paged] == [c["id"] for c in esc.get_all_cases()]
+
+    def test_each_sort_pages_consistently(self):
+        for i in range(9):
+            _create_case(field=f"f{i % 3}", entity=f"E{8 - i}", severity=i % 4 + 1)
+        for sort in esc.CASE_SORTS:
+            full = esc.list_cases(sort=sort, limit=None)[0]
+            assert [c["id"] for c in self._page_through(sort=sort, limit=2)] == [c["id"] for c in full]
+        entities = [c["entity"] for c in esc.list_cases(sort="entity", limit=None)[0]]
+        assert entities == sorted(entities)
+
+    def test_next_cursor_none_on_last_page(self):
+        _create_case(entity="A")
+        cases, cursor = esc.list_cases(limit=5)
+        assert len(cases) == 1
+        assert cursor is None
+
+    def test_default_projection_skips_heavy_columns(self):
+        _create_case(entity="A", notes="long notes")
+        case = esc.list_cases()[0][0]
+        assert "evidence" not in case and "notes" not in case
+        assert case["entity"] == "A"
+        full = esc.list_cases(columns="all")[0][0]
+        assert full["notes"] == "long notes"
+        assert esc.list_cases(columns=["entity"])[0][0] == {"id": full["id"], "entity": "A"}
+
+    def test_filters(self):
+        _create_case(field="autos", entity="Acme Motors", severity=2)
+        _create_case(field="autos", entity="Beta Cars", severity=4)
+        cid = _create_case(field="lenders", entity="Acme Loans", severity=5)
+        esc.escalate_case(cid)
+        names = lambda **kw: sorted(c["entity"] for c in esc.list_cases(**kw)[0])
+        assert names(field="autos") == ["Acme Motors", "Beta Cars"]
+        assert names(stage="sprout") == ["Acme Loans"]
+        assert names(stage=["seed", "sprout"], min_severity=4) == ["Acme Loans", "Beta Cars"]
+        assert names(max_severity=2) == ["Acme Motors"]
+        assert names(entity_prefix="acme") == ["Acme Loans", "Acme Motors"]
+        assert names(entity_prefix="%") == []
+
+    def test_deadline_window(self):
+        _create_case(entity="Soon")  # seed deadline is one day out
+        cid = _create_case(entity="Later")
+        esc.escalate_case(cid)  # sprout: three days out
+        in_two_days = (datetime.now() + timedelta(days=2)).isoformat()
+        assert [c["entity"] for c in esc.list_cases(deadline_before=in_two_days)[0]] == ["Soon"]
+        assert [c["entity"] for c in esc.list_cases(deadline_after=in_two_days)[0]] == ["Later"]
+
+    def test_rejects_bad_arguments(self):
+        with pytest.raises(ValueError):
+            esc.list_cases(sort="random")
+        with pytest.raises(ValueError):
+            esc.list_cases(columns=["password"])
+        with pytest.raises(ValueError):
+            esc.list_cases(stage="appeal")
+        with pytest.raises(ValueError):
+            esc.list_cases(after="not-a-cursor")
+
+    def test_getters_keep_full_rows(self):
+        _create_case(field="autos", entity="A")
+        assert "evidence" in esc.get_all_cases()[0]
+        assert "evidence" in esc.get_cases_by_field("autos")[0]
+
+
+class TestCasesAPI:
+    def test_paginates(self, client):
+        for i in range(5):
+            _create_case(entity=f"E{i}")
+        first = client.get("/api/cases?limit=3").get_json()
+        assert len(first["cases"]) == 3
+        assert "evidence" not in first["cases"][0]
+        second = client.get(f"/api/cases?limit=3&after={first['next_cursor']}").get_json()
+        assert len(second["cases"]) == 2
+        assert second["next_cursor"] is None
+        assert not {c["id"] for c in first["cases"]} & {c["id"] for c in second["cases"]}
+
+    def test_query_filters_and_projection(self, client):
+        _create_case(field="autos", entity="Acme", severity=4)
+        _create_case(field="lenders", entity="Beta", severity=1)
+        data = client.get("/api/cases?field=autos&severity_min=3&fields=entity,notes").get_json()
+        assert data["cases"] == [{"id": data["cases"][0]["id"], "entity": "Acme", "notes": ""}]
+
+    def test_bad_sort_is_400(self, client):
+        rv = client.get("/api/cases?sort=nope")
+        assert rv.status_code == 400
+        assert "sort" in rv.get_json()["message"]
+
+    @pytest.mark.parametrize("url", ["/api/cases?sort=nope", "/api/escalation?stage=nope",
+                                     "/escalation?after=garbage"])
+    def test_bad_filter_responses_not_cached(self, client, url):
+        rv = client.get(url)
+        assert rv.status_code == 400
+        assert "ETag" not in rv.headers and "Cache-Control" not in rv.headers
+
+    def test_dashboard_pages(self, client):
+        for i in range(esc.CASE_PAGE_SIZE + 3):
+            _create_case(entity=f"Entity {i:03d}")
+        rv = client.get("/escalation")
+        assert b"Next page" in rv.data
+        assert f"of {esc.CASE_PAGE_SIZE + 3}".encode() in rv.data
+        api = client.get("/api/escalation").get_json()
+        assert len(api["cases"]) == esc.CASE_PAGE_SIZE
+        assert api["next_cursor"]
+        assert api["total_active"] == esc.CASE_PAGE_SIZE + 3
+
+    def test_dashboard_stage_filter(self, client):
+        _create_case(entity="Seedling")
+        cid = _create_case(entity="Sprouted")
+        esc.escalate_case(cid)
+        rv = client.get("/escalation?stage=sprout")
+        assert b"Sprouted" in rv.data
+        assert b"Seedling" not in rv.data
+
+
+class TestCycleTiming:
+    def test_none_without_status(self, tmp_path, monkeypatch):
+        import app as flask_app
+        monkeypatch.setattr(flask_app, "ENGINE_STATUS_PATH", str(tmp_path / "missing.json"))
+        assert flask_app.get_cycle_timing() is None
+
+    def test_dashboard_shows_breakdown(self, client, tmp_path, monkeypatch):
+        import app as flask_app
+        status_path = tmp_path / "engine_status.json"
+        status_path.write_text(json.dumps({"metrics": {
+            "cycle_wall_seconds": 42.0,
+            "critical_path": ["scan", "correlation", "briefing"],
+            "critical_path_seconds": 40.0,
+            "node_seconds": {"scan": 30.0, "correlation": 10.0, "briefing": 0.0},
+            "span_summary": {"provider": {"count": 3, "total": 25.0, "p50": 8.0, "p95": 9.0, "max": 9.0}},
+        }}))
+        monkeypatch.setattr(flask_app, "ENGINE_STATUS_PATH", str(status_path))
+        flask_app.init_db()  # the dashboard also reads runs/seeds
+        timing = flask_app.get_cycle_timing()
+        assert timing["nodes"][0] == ("scan", 30.0)
+        rv = client.get("/")
+        assert rv.status_code == 200
+        assert b"scan \xe2\x86\x92 correlation \xe2\x86\x92 briefing" in rv.data
+        assert b"provider" in rv.data
@@ -0,0 +1,144 @@
+"""Tests for wheat/field_hub.py and the hub-driven field stream."""
+
+import queue
+import sqlite3
+import threading
+
+import pytest
+
+from wheat.field_hub import FieldHub, hub
+from wheat.run_events import append_events
+from wheat.seed_store import SeedStore
+
+
+class TestFieldHub:
+    def test_publish_reaches_project_subscribers_only(self):
+        h = FieldHub()
+        mine, other = h.subscribe("a"), h.subscribe("b")
+        h.publish("a", "log", {"run_id": 1})
+        assert mine.get(timeout=1) == ("log", {"run_id": 1})
+        with pytest.raises(queue.Empty):
+            other.get(timeout=0.01)
+
+    def test_unsubscribe(self):
+        h = FieldHub()
+        sub = h.subscribe("a")
+        assert h.subscriber_count("a") == 1
+        h.unsubscribe(sub)
+        h.unsubscribe(sub)
+        assert h.subscriber_count() == 0
+
+    def test_slow_subscriber_dropped_without_blocking(self):
+        h = FieldHub()
+        slow = h.subscribe("a", maxsize=2)
+        for i in range(3):
+            h.publish("a", "log", {"i": i})
+        assert slow.overflowed
+        assert h.subscriber_count("a") == 0
+
+    def test_store_flush_publishes_changes(self, tmp_path):
+        db = str(tmp_path / "wheat.db")
+        conn = sqlite3.connect(db)
+        conn.execute("CREATE TABLE runs (id INTEGER PRIMARY KEY, log TEXT, prompt_tokens INTEGER DEFAULT 0, "
+                     "completion_tokens INTEGER DEFAULT 0, total_tokens INTEGER DEFAULT 0)")
+        conn.execute("CREATE TABLE seeds (run_id INTEGER, seed_id TEXT, task TEXT, status TEXT, output TEXT, "
+                     "code_file TEXT, test_result TEXT, project_id TEXT)")
+        from wheat.run_events import create_run_events_table
+        create_run_events_table(conn.cursor())
+        conn.commit()
+        conn.close()
+
+        sub = hub.subscribe("hubtest")
+        try:
+            store = SeedStore("hubtest", 1, db_path=db)
+            seed = type("Seed", (), {})()
+            seed.seed_id, seed.task = "1", "task"
+            seed.progress = {"status": "Growing", "output": [], "code_file": "", "test_result": ""}
+            store.track(seed, persisted=True)
+            assert store.flush() == 0
+            with pytest.raises(queue.Empty):
+                sub.get(timeout=0.01)
+
+            seed.progress["status"] = "Fruitful"
+            store.append_log("done\n")
+            store.flush()
+            kind, data = sub.get(timeout=1)
+            assert kind == "seeds" and data["seeds"]["1"]["status"] == "Fruitful"
+            kind, data = sub.get(timeout=1)
+            assert kind == "log" and data["events"][0][1] == "done\n"
+        finally:
+            hub.unsubscribe(sub)
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    import app as flask_app
+    path = str(tmp_path / "wheat.db")
+    monkeypatch.setattr(flask_app, "DB_PATH", path)
+    flask_app.init_db()
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO runs (id, timestamp, log, project_id) VALUES (1, 't', '', 'hubp')")
+    conn.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) "
+                 "VALUES (1, '1', 'task', 'Growing', '[]', '', '', 'hubp')")
+    events = append_events(conn.cursor(), 1, "hubp", ["sowed\n"])
+    conn.commit()
+    conn.close()
+    return flask_app, events[-1][0]
+
+
+def _seed(status, task="task"):
+    return {"task": task, "status": status, "output": [], "code_file": "", "test_result": ""}
+
+
+class TestHubStream:
+    def _open(self, flask_app, cursor):
+        rv = flask_app.app.test_client().get(f"/projects/hubp/stream?run=1&after={cursor}")
+        chunks = iter(rv.response)
+        assert next(chunks).decode().startswith("event: status")  # one catch-up read on connect
+        return rv, chunks
+
+    def test_forwards_deltas_without_db_reads(self, app_db, monkeypatch):
+        flask_app, cursor = app_db
+        rv, chunks = self._open(flask_app, cursor)
+        reads = []
+        monkeypatch.setattr(flask_app, "get_latest_run", lambda *a, **k: reads.append(a))
+        monkeypatch.setattr(flask_app, "get_run_events", lambda *a, **k: reads.append(a))
+
+        def publish():
+            hub.publish("hubp", "seeds", {"run_id": 1, "seeds": {"1": _seed("Fruitful"), "1_1": _seed("Growing", "more")}})
+            hub.publish("hubp", "log", {"run_id": 1, "events": [(cursor, "old\n"), (cursor + 1, "reaped\n")]})
+
+        threading.Timer(0.05, publish).start()
+        assert next(chunks).decode().startswith("event: seed-1\n")
+        added = next(chunks).decode()
+        assert added.startswith("event: seed-added") and "more" in added
+        assert next(chunks).decode().startswith("event: log")  # no progress change: 1_1 still growing
+        rv.close()
+        assert reads == []
+
+    def test_progress_sent_when_done(self, app_db):
+        flask_app, cursor = app_db
+        rv, chunks = self._open(flask_app, cursor)
+        threading.Timer(0.05, hub.publish, ("hubp", "seeds", {"run_id": 1, "seeds": {"1": _seed("Barren")}})).start()
+        assert next(chunks).decode().startswith("event: seed-1")
+        progress = next(chunks).decode()
+        assert progress.startswith("event: progress") and "Processing complete" in progress
+        rv.close()
+
+    def test_ignores_other_runs(self, app_db, monkeypatch):
+        flask_app, cursor = app_db
+        monkeypatch.setattr(flask_app, "HEARTBEAT_SECONDS", 0.05)
+        rv, chunks = self._open(flask_app, cursor)
+        hub.publish("hubp", "seeds", {"run_id": 99, "seeds": {"1": _seed("Barren")}})
+        assert next(chunks).decode() == ": heartbeat\n\n"
+        rv.close()
+
+    def test_unsubscribes_when_client_goes_away(self, app_db, monkeypatch):
+        flask_app, cursor = app_db
+        monkeypatch.setattr(flask_app, "HEARTBEAT_SECONDS", 0.05)
+        before = hub.subscriber_count("hubp")
+        rv, chunks = self._open(flask_app, cursor)
+        assert hub.subscriber_count("hubp") == before + 1
+        assert next(chunks).decode() == ": heartbeat\n\n"
+        rv.close()
+        assert hub.subscriber_count("hubp") == before
@@ -1,6 +1,7 @@
 """Tests for wheat/field_manager.py — field lifecycle and DB operations."""
 
 import json
+import os
 import sqlite3
 import sys
 from pathlib import Path
@@ -78,20 +79,6 @@ def mock_deps(tmp_path, monkeypatch):
     import wheat.field_manager as fm
     monkeypatch.setattr(fm, "DB_PATH", db_path)
 
-    # Mock WheatSeed's save_progress to use temp DB
-    def mock_save_progress(self):
-        conn = sqlite3.connect(db_path, timeout=15)
-        try:
-            c = conn.cursor()
-            c.execute("UPDATE seeds SET status=?, output=?, code_file=?, test_result=? WHERE seed_id=? AND project_id=?",
-                      (self.progress["status"], json.dumps(self.progress["output"]),
-                       self.progress["code_file"], self.progress["test_result"],
-                       self.seed_id, self.project_id))
-            conn.commit()
-        finally:
-            conn.close()
-    monkeypatch.setattr("wheat.wheat_seed.WheatSeed.save_progress", mock_save_progress)
-
     # Mock get_map_as_string
     monkeypatch.setattr("wheat.field_manager.get_map_as_string", lambda **kw: "mock_stewards_map")
 
@@ -195,8 +182,8 @@ class TestSowField:
 
         conn = sqlite3.connect(mock_deps["db_path"])
         c = conn.cursor()
-        c.execute("SELECT log FROM runs LIMIT 1")
-        log = c.fetchone()[0]
+        c.execute("SELECT message FROM run_events ORDER BY seq")
+        log = "".join(row[0] for row in c.fetchall())
         conn.close()
         assert "Sowed 2 seeds" in log
 
@@ -215,6 +202,17 @@ class TestSowField:
         conn.close()
         assert count == 0
 
+    def test_sow_field_attaches_store_for_run(self, mock_deps):
+        from wheat.field_manager import FieldManager
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=2))
+        fm.sow_field()
+        conn = sqlite3.connect(mock_deps["db_path"])
+        run_id = conn.execute("SELECT MAX(id) FROM runs").fetchone()[0]
+        conn.close()
+        assert fm.store.run_id == run_id
+        assert all(s.store is fm.store for s in fm.seeds)
+        assert fm.store.dirty() == []  # rows were just inserted
+
 
 # --- FieldManager init ---
 
@@ -238,3 +236,87 @@ class TestFieldManagerInit:
         from wheat.field_manager import FieldManager
         fm = FieldManager(config=_make_config())
         assert fm.seeds == []
+
+
+# --- tending rounds ---
+
+class TestRounds:
+    def test_begin_round_loads_latest_run(self, mock_deps):
+        from wheat.field_manager import FieldManager
+        FieldManager(project_id="test", config=_make_config(seeds_per_run=2)).sow_field()
+        fm = FieldManager(project_id="test", config=_make_config())
+        growing = fm.begin_round()
+        assert [s.seed_id for s in growing] == ["1", "2"]
+        assert fm.store is not None
+
+    def test_begin_round_empty_when_done_or_busy(self, mock_deps):
+        from wheat.field_manager import FieldManager
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=2))
+        assert fm.begin_round() == []  # no runs yet
+        fm.sow_field()
+        with fm.lock:
+            assert fm.begin_round(blocking=False) == []
+        for s in fm.seeds:
+            s.progress["status"] = "Fruitful"
+        assert fm.begin_round() == []
+
+    def test_begin_round_respects_pause_file(self, mock_deps, monkeypatch):
+        from wheat.field_manager import FieldManager
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=1))
+        fm.sow_field()
+        monkeypatch.setattr(fm, "paused", lambda: True)
+        assert fm.begin_round() == []
+
+    def test_settle_seed_logs_result_and_reaps_barren(self, mock_deps):
+        from wheat.field_manager import FieldManager
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=2))
+        fm.sow_field()
+        barren, fruitful = fm.seeds
+        barren.progress["status"] = "Barren"
+        fruitful.progress["status"] = "Fruitful"
+        fm.reaper = MagicMock()
+        fm.reaper.evaluate.return_value = "reaped"
+        fm.reaper.reseed.return_value = None
+        assert fm.settle_seed(fruitful, "result two") is None
+        assert fm.settle_seed(barren, "result one") is None
+        assert fm.seeds == [fruitful]
+        fm.reaper.evaluate.assert_called_once_with(barren)
+        conn = sqlite3.connect(mock_deps["db_path"])
+        log = "".join(row[0] for row in conn.execute("SELECT message FROM run_events ORDER BY seq"))
+        conn.close()
+        assert "result two\nresult one\nreaped\n" in log
+
+    def test_settle_seed_returns_tracked_reseed(self, mock_deps):
+        from wheat.field_manager import FieldManager
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=1))
+        fm.sow_field()
+        seed = fm.seeds[0]
+        seed.progress["status"] = "Fruitful"
+        seed.lifespan = 0  # expired
+        replacement = fm.create_seed("1_1", "next", "Growing", None, None, None)
+        fm.reaper = MagicMock()
+        fm.reaper.evaluate.return_value = "reaped"
+        fm.reaper.reseed.return_value = replacement
+        assert fm.settle_seed(seed, "done") is replacement
+        assert fm.seeds == [replacement]
+        assert replacement.store is fm.store
+
+    def test_tend_field_runs_seeds_through_pipeline(self, mock_deps, tmp_path):
+        from wheat.field_manager import FieldManager
+        from wheat.rate_limit import TokenBucket
+        from wheat.tending import TendingSupervisor
+        code = "import unittest\n\nclass T(unittest.TestCase):\n    def test_ok(self):\n        self.assertTrue(True)\n"
+        fm = FieldManager(project_id="test", config=_make_config(seeds_per_run=2))
+        fm.sow_field()
+        for seed in fm.seeds:
+            seed.seed_dir = str(tmp_path / f"seed_{seed.seed_id}")
+            os.makedirs(seed.seed_dir)
+            seed.generate_code = lambda coder_prompt=None, s=seed: setattr(s, "code", code)
+        supervisor = TendingSupervisor(workers=2, idle_poll=0.05, bucket=TokenBucket(100, 100))
+        try:
+            with patch("wheat.wheat_seed.run_seed_script", return_value={"passed": True, "output": "OK", "tests_run": 1}):
+                assert fm.tend_field(timeout=10, supervisor=supervisor)
+        finally:
+            supervisor.shutdown()
+        assert [s.progress["status"] for s in fm.seeds] == ["Fruitful", "Fruitful"]
+        assert not supervisor.is_tending("test")
@@ -0,0 +1,164 @@
+"""Tests for wheat/instrumentation.py — counters, histograms and /metrics exposition."""
+
+import json
+import os
+import time
+
+import pytest
+
+from wheat import instrumentation
+from wheat.instrumentation import Counter, Histogram
+
+
+@pytest.fixture(autouse=True)
+def registry(tmp_path, monkeypatch):
+    """Fresh metric values and an empty metrics directory per test."""
+    monkeypatch.setattr(instrumentation, "METRICS_DIR", str(tmp_path / "metrics"))
+    saved = {name: metric.values for name, metric in instrumentation._metrics.items()}
+    for metric in instrumentation._metrics.values():
+        metric.values = {}
+    yield tmp_path / "metrics"
+    for name, metric in list(instrumentation._metrics.items()):
+        if name in saved:
+            metric.values = saved[name]
+        else:
+            del instrumentation._metrics[name]
+
+
+class TestMetrics:
+    def test_counter_labels(self):
+        counter = Counter("test_things_total", "Things.", ("kind",))
+        counter.inc(kind="a")
+        counter.inc(2, kind="a")
+        counter.inc(kind='b"q')
+        assert counter.values == {'kind="a"': 3, 'kind="b\\"q"': 1}
+        with pytest.raises(ValueError):
+            counter.inc(other="x")
+
+    def test_histogram_buckets_are_cumulative(self):
+        hist = Histogram("test_seconds", "Time.", ("op",), buckets=(0.1, 1))
+        for v in (0.05, 0.5, 5):
+            hist.observe(v, op="x")
+        assert hist.values['op="x"'] == [1, 2, 3, 5.55]
+        text = instrumentation.render()
+        assert 'test_seconds_bucket{op="x",le="0.1"} 1' in text
+        assert 'test_seconds_bucket{op="x",le="+Inf"} 3' in text
+        assert 'test_seconds_count{op="x"} 3' in text
+        assert "# TYPE test_seconds histogram" in text
+
+    def test_timed_records_failures_too(self):
+        hist = Histogram("test_op_seconds", "Time.", ("op",))
+
+        @instrumentation.timed(hist, op="boom")
+        def boom():
+            raise RuntimeError
+
+        with pytest.raises(RuntimeError):
+            boom()
+        assert hist.values['op="boom"'][-2] == 1
+
+
+class TestPublishing:
+    def test_other_processes_are_summed(self, registry):
+        instrumentation.CASES_CREATED.inc(field="dealers", source="scan")
+        registry.mkdir()
+        (registry / "99999999.json").write_text(json.dumps({"metrics": {
+            "wheat_cases_created_total": {'field="dealers",source="scan"': 4},
+            "wheat_llm_latency_seconds": {
+                'provider="claude_code",model="opus"': [0] * 3 + [1] * 8 + [42.0],
+            },
+            "wheat_no_longer_defined": {"": 1},
+        }}))
+        text = instrumentation.render()
+        assert 'wheat_cases_created_total{field="dealers",source="scan"} 5' in text
+        assert 'wheat_llm_latency_seconds_count{provider="claude_code",model="opus"} 1' in text
+        assert "wheat_no_longer_defined" not in text
+
+    def test_publish_and_own_file_not_double_counted(self, registry):
+        instrumentation.CASES_RESOLVED.inc()
+        instrumentation.publish()
+        (path,) = registry.glob(f"{os.getpid()}-*.json")
+        data = json.loads(path.read_text())
+        assert data["pid"] == os.getpid()
+        assert data["metrics"]["wheat_cases_resolved_total"] == {"": 1}
+        assert "wheat_cases_resolved_total 1\n" in instrumentation.render()
+
+    def test_gauges_only_from_running_processes(self, registry):
+        instrumentation.TEND_QUEUE_DEPTH.set(2)
+        registry.mkdir()
+        (registry / "live.json").write_text(json.dumps({"pid": os.getppid(), "metrics": {
+            "wheat_tend_queue_depth": {"": 3},
+        }}))
+        (registry / "gone.json").write_text(json.dumps({"pid": 2 ** 22 + 12345, "metrics": {
+            "wheat_tend_queue_depth": {"": 40},
+            "wheat_cases_resolved_total": {"": 1},
+        }}))
+        text = instrumentation.render()
+        assert "# TYPE wheat_tend_queue_depth gauge" in text
+        assert "wheat_tend_queue_depth 5\n" in text
+        assert "wheat_cases_resolved_total 1\n" in text
+
+    def test_finished_processes_folded_into_accumulated_totals(self, registry):
+        registry.mkdir()
+        old = registry / "12345-abcd.json"
+        old.write_text(json.dumps({"pid": 2 ** 22 + 12345, "metrics": {
+            "wheat_cases_resolved_total": {"": 7},
+            "wheat_tend_queue_depth": {"": 4},
+        }}))
+        assert "wheat_cases_resolved_total 7\n" in instrumentation.render()
+        assert not old.exists()
+        accumulated = json.loads((registry / instrumentation.ACCUMULATED_FILE).read_text())
+        assert accumulated["metrics"] == {"wheat_cases_resolved_total": {"": 7}}
+        # the counter doesn't drop once the runner's own file is gone
+        (registry / "12346-ef01.json").write_text(json.dumps({"pid": 2 ** 22 + 12346, "metrics": {
+            "wheat_cases_resolved_total": {"": 1},
+        }}))
+        assert "wheat_cases_resolved_total 8\n" in instrumentation.render()
+        assert "wheat_cases_resolved_total 8\n" in instrumentation.render()
+
+    def test_stale_file_of_reused_pid_is_folded(self, registry):
+        registry.mkdir()
+        stale = registry / f"{os.getppid()}-abcd.json"
+        stale.write_text(json.dumps({"pid": os.getppid(), "metrics": {
+            "wheat_cases_resolved_total": {"": 3},
+        }}))
+        past = time.time() - instrumentation.STALE_AFTER - 60
+        os.utime(stale, (past, past))
+        assert "wheat_cases_resolved_total 3\n" in instrumentation.render()
+        assert not stale.exists()
+
+    def test_fold_skips_files_already_recorded(self, registry):
+        registry.mkdir()
+        (registry / instrumentation.ACCUMULATED_FILE).write_text(json.dumps({
+            "metrics": {"wheat_cases_resolved_total": {"": 2}}, "folded": ["12345-abcd.json"],
+        }))
+        leftover = registry / "12345-abcd.json"
+        leftover.write_text(json.dumps({"metrics": {"wheat_cases_resolved_total": {"": 2}}}))
+        assert "wheat_cases_resolved_total 2\n" in instrumentation.render()
+        assert not leftover.exists()
+
+
+class TestHooks:
+    def test_case_lifecycle_counted(self, tmp_path, monkeypatch):
+        import wheat.escalation as esc
+        monkeypatch.setattr(esc, "DB_PATH", str(tmp_path / "wheat.db"))
+        case_id = esc.create_case("dealers", "Acme", "Odometer fraud", source="scan:reviews")
+        esc.create_case("dealers", "Acme", "Again", source="scan:reviews")
+        esc.escalate_case(case_id)
+        esc.resolve_case(case_id)
+        text = instrumentation.render()
+        assert 'wheat_cases_created_total{field="dealers",source="scan"} 1' in text
+        assert 'wheat_case_signals_total{field="dealers"} 1' in text
+        assert 'wheat_escalations_total{stage="sprout"} 1' in text
+        assert "wheat_cases_resolved_total 1" in text
+        assert 'wheat_db_query_seconds_count{op="create_case"} 2' in text
+
+    def test_metrics_endpoint(self):
+        import app as flask_app
+        instrumentation.SCANS.inc(channel="reviews", outcome="ok")
+        flask_app.app.config["TESTING"] = True
+        with flask_app.app.test_client() as client:
+            rv = client.get("/metrics")
+        assert rv.status_code == 200
+        assert rv.mimetype == "text/plain"
+        assert b'wheat_scans_total{channel="reviews",outcome="ok"} 1' in rv.data
@@ -0,0 +1,153 @@
+"""Tests for wheat/log_tail.py — shared log followers for the cycle stream."""
+
+import threading
+
+import pytest
+
+import wheat.log_tail as log_tail
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(log_tail, "POLL_SECONDS", 0.02)
+
+
+@pytest.fixture(params=[True, False], ids=["inotify", "stat"])
+def tail_for(request, tmp_path):
+    tails = []
+
+    def make(path, backlog=log_tail.BACKLOG_LINES):
+        tail = log_tail.LogTail(str(path), backlog, use_inotify=request.param).start()
+        tails.append(tail)
+        return tail
+    yield make
+    for tail in tails:
+        tail.finish()
+
+
+def _append(path, text):
+    with open(path, "a") as f:
+        f.write(text)
+
+
+def _read_all(tail, cursor=None, want=1):
+    lines = []
+    while len(lines) < want:
+        batch, cursor, _ = tail.read(cursor, timeout=2)
+        assert batch or not tail.finished, "tail finished early"
+        lines.extend(batch)
+    return lines, cursor
+
+
+class TestLogTail:
+    def test_follows_appends(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("one\n")
+        tail = tail_for(path)
+        lines, cursor = _read_all(tail)
+        assert lines == ["one"]
+        _append(path, "two\nthree\n")
+        lines, _ = _read_all(tail, cursor, want=2)
+        assert lines == ["two", "three"]
+
+    def test_partial_line_held_until_newline(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("")
+        tail = tail_for(path)
+        _append(path, "half")
+        assert tail.read(0, timeout=0.1)[0] == []
+        _append(path, " done\n")
+        assert _read_all(tail, 0)[0] == ["half done"]
+
+    def test_waits_for_file_to_appear(self, tmp_path, tail_for):
+        path = tmp_path / "later.log"
+        tail = tail_for(path)
+        path.write_text("hello\n")
+        assert _read_all(tail)[0] == ["hello"]
+
+    def test_late_joiner_gets_bounded_backlog(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("".join(f"line {i}\n" for i in range(50)))
+        tail = tail_for(path, backlog=10)
+        tail.finish()
+        lines, cursor, skipped = tail.read(0, timeout=2)
+        while not tail.finished:
+            lines, cursor, skipped = tail.read(0, timeout=2)
+        assert lines == [f"line {i}" for i in range(40, 50)]
+        assert skipped == 40 and cursor == 50
+        assert tail.read(None, timeout=0)[0] == lines
+
+    def test_truncation_restarts_from_top(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("old line\n")
+        tail = tail_for(path)
+        _, cursor = _read_all(tail)
+        path.write_text("new\n")
+        assert _read_all(tail, cursor)[0] == ["new"]
+
+    def test_finish_drains_then_reports_finished(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("a\nno newline")
+        tail = tail_for(path)
+        tail.finish()
+        lines, cursor = _read_all(tail, want=2)
+        assert lines == ["a", "no newline"]
+        assert tail.read(cursor, timeout=2)[0] == []
+        assert tail.finished
+
+    def test_many_watchers_share_one_reader(self, tmp_path, tail_for):
+        path = tmp_path / "cycle.log"
+        path.write_text("")
+        tail = tail_for(path)
+        before = threading.active_count()
+        results = [None] * 20
+
+        def watch(i):
+            results[i] = _read_all(tail, 0, want=3)[0]
+        watchers = [threading.Thread(target=watch, args=(i,)) for i in range(20)]
+        for w in watchers:
+            w.start()
+        assert threading.active_count() <= before + 20  # no extra reader threads per watcher
+        _append(path, "x\ny\nz\n")
+        for w in watchers:
+            w.join(5)
+        assert all(r == ["x", "y", "z"] for r in results)
+
+
+class TestRegistry:
+    def test_follow_returns_shared_tail(self, tmp_path):
+        path = str(tmp_path / "cycle.log")
+        try:
+            assert log_tail.follow(path) is log_tail.follow(path)
+        finally:
+            log_tail.forget(path)
+
+    def test_forget_starts_fresh(self, tmp_path):
+        path = str(tmp_path / "cycle.log")
+        first = log_tail.follow(path)
+        log_tail.forget(path)
+        try:
+            assert log_tail.follow(path) is not first
+        finally:
+            log_tail.forget(path)
+
+
+class TestCycleStream:
+    def test_streams_batched_backlog_then_completes(self, tmp_path, monkeypatch):
+        import app as flask_app
+        path = tmp_path / "cycle.log"
+        path.write_text("start\nfield a\n")
+        monkeypatch.setitem(flask_app._cycle_state, "log_file", str(path))
+        monkeypatch.setitem(flask_app._cycle_state, "running", False)
+        try:
+            body = flask_app.app.test_client().get("/api/daily-cycle/stream").get_data(as_text=True)
+        finally:
+            log_tail.forget(str(path))
+        assert "data: start\ndata: field a\n\n" in body
+        assert body.endswith("data: === CYCLE COMPLETE ===\n\n")
+
+    def test_no_log_file(self, monkeypatch):
+        import app as flask_app
+        monkeypatch.setitem(flask_app._cycle_state, "log_file", None)
+        body = flask_app.app.test_client().get("/api/daily-cycle/stream").get_data(as_text=True)
+        assert "[No log file found]" in body
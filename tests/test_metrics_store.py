@@ -0,0 +1,147 @@
+"""Tests for wheat/metrics_store.py — cycle metrics history, rollups and trends."""
+
+import itertools
+import sqlite3
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from wheat import metrics_store
+
+NOW = datetime(2026, 3, 18, 12, 0, 0)  # a Wednesday
+_cycle_ids = itertools.count()
+
+
+@pytest.fixture(autouse=True)
+def db(tmp_path, monkeypatch):
+    path = str(tmp_path / "wheat.db")
+    monkeypatch.setattr(metrics_store, "DB_PATH", path)
+    metrics_store.init_metrics_db()
+    return path
+
+
+def _cycle(days_ago, now=NOW, outcome="complete", wall=100.0, signals=3, fruitful=2, latencies=(1.0, 3.0),
+           cycle_id=None):
+    samples = metrics_store.cycle_samples(
+        outcome,
+        timings={"scan:reviews": {"seconds": 5.0}, "field:dealers": {"seconds": 60.0}},
+        spans=[{"cat": "provider", "dur": int(s * 1e6), "args": {"model": "opus"}} for s in latencies]
+        + [{"cat": "db", "dur": 1000}],
+        scan_results={"reviews": {"signals": [{"n": i} for i in range(signals)] + [{"parse_error": True}]}},
+        field_results={"dealers": {"seeds": [{"status": "Fruitful"}] * fruitful + [{"status": "Barren"}]}}
+        if outcome == "complete" else None,  # as in daily_runner: only a finished briefing has field results
+        wall_seconds=wall,
+        critical_path_seconds=wall - 10,
+        time_to_first_field_seconds=None,
+        errors=["scan:court"] if outcome == "failed" else [],
+    )
+    return metrics_store.record_cycle(cycle_id or f"c{next(_cycle_ids)}", samples, now=now - timedelta(days=days_ago))
+
+
+def _count(db, table):
+    conn = sqlite3.connect(db)
+    try:
+        return conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+    finally:
+        conn.close()
+
+
+class TestCycleSamples:
+    def test_names_and_labels(self):
+        stored = _cycle(0)
+        series = metrics_store.series("channel_signals", days=1, now=NOW)
+        assert series == {'{"channel":"reviews"}': [series['{"channel":"reviews"}'][0]]}
+        point = series['{"channel":"reviews"}'][0]
+        assert (point["bucket"], point["sum"], point["count"]) == ("2026-03-18", 3, 1)  # parse errors excluded
+        assert metrics_store.series("time_to_first_field_seconds", days=1, now=NOW) == {}  # None skipped
+        assert stored == 10
+
+    def test_resumed_cycle_replaces_its_samples(self, db):
+        _cycle(0, outcome="failed", wall=50, cycle_id="20260318_0600")
+        _cycle(0, wall=200, cycle_id="20260318_0600")
+        assert _count(db, "metric_samples") == 10
+        trends = metrics_store.trends(days=1, now=NOW)
+        assert [p["avg"] for p in trends["cycle_seconds"]] == [200]
+        assert [p["signals"] for p in trends["signals_per_channel"]["reviews"]] == [3]
+
+
+class TestTrends:
+    def test_daily_trends(self):
+        _cycle(1, wall=100, latencies=(1.0, 2.0, 10.0))
+        _cycle(0, wall=200, fruitful=1)
+        _cycle(0, outcome="failed", wall=50)
+        trends = metrics_store.trends(days=7, now=NOW)
+
+        assert [(p["bucket"], p["avg"]) for p in trends["cycle_seconds"]] == [("2026-03-17", 100), ("2026-03-18", 200)]
+        assert [(p["bucket"], p["rate"]) for p in trends["cycle_failure_rate"]] == [("2026-03-17", 0), ("2026-03-18", 0.5)]
+        assert [p["signals"] for p in trends["signals_per_channel"]["reviews"]] == [3, 6]
+        assert [p["ratio"] for p in trends["fruitful_ratio"]] == [round(2 / 3, 3), 0.5]
+        opus = trends["llm_latency"]["opus"]
+        assert (opus[0]["calls"], opus[0]["p50"], opus[0]["p95"]) == (3, 2.0, 10.0)
+
+    def test_weekly_buckets_start_monday(self):
+        _cycle(0)
+        _cycle(2)   # Monday of the same week
+        _cycle(3)   # the Sunday before
+        weeks = metrics_store.trends(days=14, bucket="week", now=NOW)["cycle_seconds"]
+        assert [(p["bucket"], p["count"]) for p in weeks] == [("2026-03-09", 1), ("2026-03-16", 2)]
+
+    def test_window_excludes_older_samples(self):
+        _cycle(10)
+        assert metrics_store.trends(days=7, now=NOW)["cycle_seconds"] == []
+
+    def test_bad_bucket(self):
+        with pytest.raises(ValueError):
+            metrics_store.series("cycle_seconds", bucket="hour")
+
+    def test_missing_tables(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(metrics_store, "DB_PATH", str(tmp_path / "empty.db"))
+        assert metrics_store.trends(now=NOW)["cycle_seconds"] == []
+
+
+class TestRetention:
+    def test_old_samples_rolled_up_and_still_queryable(self, db):
+        before = metrics_store.series("llm_call_seconds", days=90, now=NOW)
+        _cycle(45, latencies=(1.0, 3.0))
+        _cycle(45, latencies=(5.0,))
+        _cycle(0)
+        assert _count(db, "metric_rollups") > 0
+        conn = sqlite3.connect(db)
+        oldest = conn.execute("SELECT MIN(ts) FROM metric_samples").fetchone()[0]
+        conn.close()
+        assert oldest >= (NOW - timedelta(days=metrics_store.RAW_RETENTION_DAYS)).date().isoformat()
+
+        series = metrics_store.series("llm_call_seconds", days=90, now=NOW)['{"model":"opus"}']
+        assert before == {}
+        old = series[0]
+        assert (old["bucket"], old["count"], old["min"], old["max"], old["sum"]) == ("2026-02-01", 3, 1.0, 5.0, 9.0)
+        assert series[-1]["bucket"] == "2026-03-18"
+
+    def test_rollups_expire(self, db):
+        metrics_store.record([("cycle_seconds", 1.0)], ts=NOW - timedelta(days=metrics_store.ROLLUP_RETENTION_DAYS - 1))
+        assert metrics_store.compact(now=NOW) == (1, 0)
+        assert _count(db, "metric_rollups") == 1
+        assert metrics_store.compact(now=NOW + timedelta(days=2)) == (0, 1)
+        assert _count(db, "metric_rollups") == 0
+
+
+class TestTrendsEndpoint:
+    def test_endpoint(self, db):
+        import app as flask_app
+        _cycle(0, now=datetime.now())
+        flask_app.app.config["TESTING"] = True
+        with flask_app.app.test_client() as client:
+            rv = client.get("/api/metrics/trends?days=3650")
+            assert rv.status_code == 400
+            assert client.get("/api/metrics/trends?bucket=hour").status_code == 400
+            assert client.get("/api/metrics/trends?days=x").status_code == 400
+            rv = client.get("/api/metrics/trends?days=7&bucket=week")
+        assert rv.status_code == 200
+        data = rv.get_json()
+        assert data["bucket"] == "week" and "reviews" in data["signals_per_channel"]
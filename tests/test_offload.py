@@ -0,0 +1,35 @@
+"""Tests for wheat/offload.py — blocking work off the gevent loop."""
+
+import threading
+
+import pytest
+
+import wheat.offload as offload_mod
+from wheat.offload import offload
+
+
+def test_calls_directly_without_gevent():
+    assert not offload_mod._gevent_active()
+    assert offload(lambda a, b=0: (a + b, threading.current_thread()), 1, b=2) == (3, threading.current_thread())
+
+
+def test_runs_in_native_thread_under_gevent(monkeypatch):
+    pytest.importorskip("gevent")
+    monkeypatch.setattr(offload_mod, "_gevent_active", lambda: True)
+    caller = threading.get_ident()
+    result, worker = offload(lambda x: (x * 2, threading.get_ident()), 21)
+    assert result == 42
+    assert worker != caller
+
+
+def test_propagates_exceptions():
+    with pytest.raises(ZeroDivisionError):
+        offload(lambda: 1 / 0)
+
+
+def test_spawn_native_and_executor_without_gevent():
+    done = threading.Event()
+    offload_mod.spawn_native(done.set)
+    assert done.wait(5)
+    with offload_mod.native_executor(2, thread_name_prefix="t") as pool:
+        assert pool.submit(lambda: threading.current_thread().name).result().startswith("t")
@@ -12,6 +12,7 @@ from wheat.paths import (
     load_config,
     load_projects,
     save_projects,
+    update_projects,
     load_project_config,
     project_dir,
 )
@@ -91,6 +92,28 @@ class TestSaveProjects:
         assert result == data
 
 
+class TestUpdateProjects:
+    def test_edit_applies_to_current_file(self, tmp_path, monkeypatch):
+        projects_file = tmp_path / "projects.json"
+        monkeypatch.setattr("wheat.paths.PROJECTS_PATH", str(projects_file))
+        save_projects({"p1": {"name": "Alpha"}})
+        stale = load_projects()
+        save_projects({"p1": {"name": "Alpha"}, "p2": {"name": "Beta"}})
+
+        def rename(projects):
+            projects["p1"]["name"] = "Renamed"
+            return projects
+
+        update_projects(rename)
+        assert "p2" not in stale
+        assert load_projects() == {"p1": {"name": "Renamed"}, "p2": {"name": "Beta"}}
+
+    def test_missing_file_starts_from_default(self, tmp_path, monkeypatch):
+        monkeypatch.setattr("wheat.paths.PROJECTS_PATH", str(tmp_path / "projects.json"))
+        result = update_projects(lambda projects: {**projects, "x": {"name": "X"}})
+        assert set(result) == {"default", "x"}
+
+
 class TestLoadProjectConfig:
     def test_base_config_for_unknown_project(self, tmp_path, monkeypatch):
         base = {"lifespan": 100, "max_tokens": 500, "llm_api": "test"}
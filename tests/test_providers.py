@@ -2,9 +2,13 @@
 
 import json
 import os
+import threading
+import time
 import pytest
 from unittest import mock
 
+import wheat.providers as providers
+from wheat.cancel import CancelScope, Cancelled
 from wheat.providers import APIProvider, ClaudeCodeProvider, get_provider
 
 
@@ -234,6 +238,46 @@ class TestClaudeCodeProvider:
         assert any("claude_response" in f for f in files)
 
 
+# ── Cancellation ─────────────────────────────────────────────
+
+class TestCancel:
+    @mock.patch("wheat.providers.requests.post")
+    def test_api_checks_before_requesting(self, mock_post):
+        scope = CancelScope()
+        scope.cancel()
+        with pytest.raises(Cancelled):
+            APIProvider("https://api.test", "k").generate("p", "m", cancel=scope)
+        mock_post.assert_not_called()
+
+    @mock.patch("wheat.providers.requests.post")
+    def test_api_drops_response_cancelled_meanwhile(self, mock_post):
+        scope = CancelScope()
+        mock_post.side_effect = lambda *a, **k: (scope.cancel(), mock.Mock())[1]
+        with pytest.raises(Cancelled):
+            APIProvider("https://api.test", "k").generate("p", "m", cancel=scope)
+        assert mock_post.call_count == 1
+
+    def test_claude_cli_killed_mid_call_without_retry(self, tmp_path, monkeypatch):
+        fake_cli = tmp_path / "claude"
+        fake_cli.write_text("#!/bin/sh\nsleep 30\n")
+        fake_cli.chmod(0o755)
+        monkeypatch.setattr(providers, "_CLAUDE_BIN", str(fake_cli))
+        scope = CancelScope()
+        threading.Timer(0.3, scope.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(Cancelled):
+            ClaudeCodeProvider(timeout=20).generate("prompt", retries=3, cancel=scope)
+        assert time.monotonic() - start < 5
+
+    def test_claude_cli_with_scope_returns_output(self, tmp_path, monkeypatch):
+        fake_cli = tmp_path / "claude"
+        fake_cli.write_text("#!/bin/sh\ncat >/dev/null\necho '  done  '\n")
+        fake_cli.chmod(0o755)
+        monkeypatch.setattr(providers, "_CLAUDE_BIN", str(fake_cli))
+        text, _ = ClaudeCodeProvider().generate("prompt", cancel=CancelScope())
+        assert text == "done"
+
+
 # ── get_provider factory ─────────────────────────────────────
 
 class TestGetProvider:
@@ -0,0 +1,70 @@
+"""Tests for wheat/rate_limit.py — token buckets pacing seed generation."""
+
+import threading
+
+import pytest
+
+from wheat import rate_limit
+from wheat.rate_limit import TokenBucket
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestTokenBucket:
+    def test_burst_then_refill(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=2, burst=3, clock=clock)
+        assert [bucket.try_acquire() for _ in range(4)] == [True, True, True, False]
+        assert bucket.delay() == pytest.approx(0.5)
+        clock.now = 0.5
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+
+    def test_refill_capped_at_burst(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=10, burst=2, clock=clock)
+        clock.now = 100
+        assert [bucket.try_acquire() for _ in range(3)] == [True, True, False]
+
+    def test_acquire_waits_for_refill(self):
+        bucket = TokenBucket(rate=50, burst=1)
+        assert bucket.acquire()
+        assert bucket.acquire(timeout=1)  # ~20ms refill
+
+    def test_acquire_timeout(self):
+        bucket = TokenBucket(rate=0.01, burst=1)
+        assert bucket.acquire()
+        assert not bucket.acquire(timeout=0.05)
+
+    def test_concurrent_acquirers_share_tokens(self):
+        clock = Clock()
+        bucket = TokenBucket(rate=1, burst=5, clock=clock)
+        got = []
+        threads = [threading.Thread(target=lambda: got.append(bucket.try_acquire())) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert got.count(True) == 5
+
+    def test_invalid_settings(self):
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0, burst=1)
+        with pytest.raises(ValueError):
+            TokenBucket(rate=1, burst=0)
+
+
+class TestShared:
+    def test_shared_bucket_follows_config(self, monkeypatch):
+        monkeypatch.setattr(rate_limit, "_buckets", {})
+        first = rate_limit.seed_generation({"seed_generate_rate": 4, "seed_generate_burst": 2})
+        assert rate_limit.seed_generation({"seed_generate_rate": 4, "seed_generate_burst": 2}) is first
+        again = rate_limit.seed_generation({})
+        assert again is first
+        assert (again.rate, again.burst) == (rate_limit.DEFAULT_GENERATE_RATE, rate_limit.DEFAULT_GENERATE_BURST)
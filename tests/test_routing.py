@@ -0,0 +1,126 @@
+"""Tests for wheat/routing.py — the channel<->field routing index and batch signal routing."""
+
+import json
+
+import pytest
+
+from wheat import channels, config_registry, paths, routing
+from wheat.routing import CATEGORY_TO_FIELD, DEFAULT_FIELD, RoutingIndex
+from wheat.scan_tasks import aggregate_scan_results
+
+CHANNELS = {
+    "reviews": {"name": "Reviews", "fields": ["dealers", "repair"]},
+    "community": {"name": "Community", "fields": ["all"]},
+    "court": {"name": "Court", "fields": ["dealers", "lenders"]},
+    "quiet": {"name": "Quiet"},
+}
+PROJECTS = {"dealers": {}, "repair": {}, "towing": {}}
+
+
+@pytest.fixture
+def index():
+    return RoutingIndex(config_registry.freeze(CHANNELS), config_registry.freeze(PROJECTS))
+
+
+@pytest.fixture
+def files(tmp_path, monkeypatch):
+    config_registry.invalidate()
+    channels_path = tmp_path / "channels.json"
+    channels_path.write_text(json.dumps(CHANNELS))
+    projects_path = tmp_path / "projects.json"
+    projects_path.write_text(json.dumps(PROJECTS))
+    monkeypatch.setattr(channels, "CHANNELS_PATH", str(channels_path))
+    monkeypatch.setattr(paths, "PROJECTS_PATH", str(projects_path))
+    yield
+    config_registry.invalidate()
+
+
+class TestIndex:
+    def test_field_to_channels(self, index):
+        assert list(index.channels_for_field("dealers")) == ["reviews", "community", "court"]
+        assert list(index.channels_for_field("towing")) == ["community"]
+        # named by a channel but not a project: still gets the "all" channels
+        assert list(index.channels_for_field("lenders")) == ["community", "court"]
+        assert list(index.channels_for_field("unknown")) == ["community"]
+
+    def test_channel_to_fields(self, index):
+        assert index.fields_for_channel("reviews") == ["dealers", "repair"]
+        assert index.fields_for_channel("community") == ["dealers", "repair", "towing"]
+        assert index.fields_for_channel("quiet") == []
+        assert index.fields_for_channel("missing") == []
+
+    def test_expand(self, index):
+        assert index.expand(["court", "all", "dealers"]) == ("court", "dealers", "repair", "towing")
+        assert index.expand([]) == ()
+
+    def test_memoised_per_snapshot(self, files):
+        first = channels.routing_index()
+        assert channels.routing_index() is first
+        paths.save_projects({"dealers": {}, "fleet": {}})
+        assert channels.routing_index() is not first
+        assert channels.get_fields_for_channel("community") == ["dealers", "fleet"]
+
+
+class TestSignalField:
+    def test_explicit_field_wins(self):
+        assert routing.signal_field({"field": "towing", "category": "auto_repair"}) == "towing"
+
+    def test_known_category(self):
+        assert routing.signal_field({"category": "tow_company"}) == "tow_companies"
+        assert routing.signal_field({"category": "alien_invasion"}) is None
+
+    def test_plain_signals_follow_channel(self):
+        assert routing.signal_field({"entity": "Acme"}) is None
+        assert routing.signal_field("raw text") is None
+
+    def test_route_category_default(self):
+        assert routing.route_category("emissions") == CATEGORY_TO_FIELD["emissions"]
+        assert routing.route_category("nope") == DEFAULT_FIELD
+
+
+class TestRoute:
+    def test_fan_out_and_overrides(self, index):
+        plain, override, categorised = {"n": 1}, {"n": 2, "field": "towing"}, {"n": 3, "category": "auto_repair"}
+        by_field = index.route({
+            "reviews": {"signals": [plain, override, categorised], "target_fields": ["dealers", "repair"]},
+        })
+        assert by_field == {
+            "dealers": [plain], "repair": [plain], "towing": [override], "auto_repair": [categorised],
+        }
+
+    def test_wildcard_target_expanded(self, index):
+        by_field = index.route({"community": {"signals": [{"n": 1}], "target_fields": ["all"]}})
+        assert sorted(by_field) == ["dealers", "repair", "towing"]
+        assert "all" not in by_field
+
+    def test_missing_target_fields_use_channel_config(self, index):
+        assert sorted(index.route({"court": {"signals": [{"n": 1}]}})) == ["dealers", "lenders"]
+
+    def test_skips_empty_results(self, index):
+        assert index.route({"a": None, "b": {}, "c": {"signals": "text", "target_fields": ["x"]}}) == {}
+
+    def test_large_batch_matches_per_signal_routing(self, index):
+        signals = [
+            {"n": i, "field": "towing"} if i % 7 == 0 else {"n": i, "category": "insurance"} if i % 11 == 0 else {"n": i}
+            for i in range(10_000)
+        ]
+        results = {"reviews": {"signals": signals[:6000], "target_fields": ["dealers", "repair"]},
+                   "community": {"signals": signals[6000:], "target_fields": ["all"]}}
+        by_field = index.route(results)
+
+        expected = {}
+        for cid, result in results.items():
+            for sig in result["signals"]:
+                own = routing.signal_field(sig)
+                for field_id in [own] if own else index.expand(result["target_fields"]):
+                    expected.setdefault(field_id, []).append(sig)
+        # same membership; within a channel, fan-out signals come before a field's own overrides
+        assert {f: sorted(s["n"] for s in sigs) for f, sigs in by_field.items()} == \
+            {f: sorted(s["n"] for s in sigs) for f, sigs in expected.items()}
+
+    def test_aggregate_uses_index(self, files):
+        summary, by_field = aggregate_scan_results({
+            "community": {"signals": [{"n": 1}, {"n": 2, "field": "court_watch"}], "target_fields": ["all"]},
+        })
+        assert "Total signals: 2" in summary
+        assert {f: len(s) for f, s in by_field.items()} == {"dealers": 1, "repair": 1, "towing": 1, "court_watch": 1}
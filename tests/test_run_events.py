@@ -0,0 +1,110 @@
+"""Tests for wheat/run_events.py and the field log stream built on it."""
+
+import sqlite3
+
+import pytest
+
+from wheat.run_events import append_events, create_run_events_table, events_after, run_log
+
+
+@pytest.fixture
+def conn():
+    conn = sqlite3.connect(":memory:")
+    create_run_events_table(conn.cursor())
+    yield conn
+    conn.close()
+
+
+class TestRunEvents:
+    def test_sequence_is_increasing_across_runs(self, conn):
+        c = conn.cursor()
+        append_events(c, 1, "p", ["a\n", "b\n"])
+        append_events(c, 2, "p", ["other\n"])
+        append_events(c, 1, "p", ["c\n"])
+        seqs = [seq for seq, _ in events_after(c, 1)]
+        assert seqs == sorted(seqs) and len(seqs) == 3
+        assert [m for _, m in events_after(c, 1)] == ["a\n", "b\n", "c\n"]
+
+    def test_events_after_cursor(self, conn):
+        c = conn.cursor()
+        append_events(c, 1, "p", ["a\n", "b\n"])
+        cursor = events_after(c, 1)[-1][0]
+        assert events_after(c, 1, cursor) == []
+        append_events(c, 1, "p", ["c\n"])
+        assert [m for _, m in events_after(c, 1, cursor)] == ["c\n"]
+
+    def test_run_log_keeps_legacy_text_first(self, conn):
+        c = conn.cursor()
+        append_events(c, 1, "p", ["new\n"])
+        log, last_seq = run_log(c, 1, "old\n")
+        assert log == "old\nnew\n"
+        assert last_seq == events_after(c, 1)[-1][0]
+
+    def test_run_log_without_events(self, conn):
+        assert run_log(conn.cursor(), 9, None) == ("", 0)
+
+    def test_create_is_idempotent(self, conn):
+        create_run_events_table(conn.cursor())
+
+
+@pytest.fixture
+def app_db(tmp_path, monkeypatch):
+    import app as flask_app
+    path = str(tmp_path / "wheat.db")
+    monkeypatch.setattr(flask_app, "DB_PATH", path)
+    flask_app.init_db()
+    conn = sqlite3.connect(path)
+    conn.execute("INSERT INTO runs (id, timestamp, log, project_id) VALUES (1, 't', 'legacy\n', 'p')")
+    conn.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) "
+                 "VALUES (1, '1', 'task', 'Growing', '[]', '', '', 'p')")
+    append_events(conn.cursor(), 1, "p", ["sowed\n"])
+    conn.commit()
+    conn.close()
+    return flask_app, path
+
+
+def _append(path, run_id, message):
+    conn = sqlite3.connect(path)
+    append_events(conn.cursor(), run_id, "p", [message])
+    conn.commit()
+    conn.close()
+
+
+class TestLatestRunLog:
+    def test_latest_run_includes_cursor(self, app_db):
+        flask_app, _ = app_db
+        log, status = flask_app.get_latest_run("p")
+        assert log == "legacy\nsowed\n"
+        assert status["run_id"] == 1 and status["cursor"] > 0
+        assert "1" in status["seeds"]
+
+    def test_without_log(self, app_db):
+        flask_app, _ = app_db
+        log, status = flask_app.get_latest_run("p", with_log=False)
+        assert log is None and status["cursor"] is None
+
+    def test_stream_catches_up_from_cursor(self, app_db):
+        flask_app, path = app_db
+        _, status = flask_app.get_latest_run("p")
+        _append(path, 1, "grew <seed>\n")
+        rv = flask_app.app.test_client().get(f"/projects/p/stream?run=1&after={status['cursor']}")
+        chunks = iter(rv.response)
+        assert next(chunks).decode().startswith("event: status")
+        log = next(chunks).decode()
+        assert log.startswith("event: log")
+        assert "grew &lt;seed&gt;" in log
+        assert "sowed" not in log and "legacy" not in log
+        rv.close()
+
+    def test_stream_resets_log_on_new_run(self, app_db):
+        flask_app, path = app_db
+        conn = sqlite3.connect(path)
+        conn.execute("INSERT INTO runs (id, timestamp, log, project_id) VALUES (2, 't', '', 'p')")
+        conn.commit()
+        conn.close()
+        _append(path, 2, "second run\n")
+        rv = flask_app.app.test_client().get("/projects/p/stream?run=1&after=1")
+        first = next(iter(rv.response)).decode()
+        assert first.startswith("event: run")
+        assert "second run" in first and "legacy" not in first
+        rv.close()
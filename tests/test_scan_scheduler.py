@@ -0,0 +1,175 @@
+"""Tests for wheat/scan_scheduler.py — adaptive per-channel scan cadence."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+import wheat.scan_scheduler as sched
+
+
+@pytest.fixture(autouse=True)
+def temp_db(tmp_path, monkeypatch):
+    """Redirect schedule bookkeeping to a temp database."""
+    db_path = str(tmp_path / "test_wheat.db")
+    monkeypatch.setattr(sched, "DB_PATH", db_path)
+    sched.init_schedule_db()
+    return db_path
+
+
+NOW = datetime(2026, 3, 17, 7, 0, 0)
+
+
+def _channel(name="Test Channel", frequency="daily"):
+    return {"name": name, "channel_type": "NEWS", "sources": ["x"], "fields": ["tow_companies"], "frequency": frequency}
+
+
+def _entry(plan, cid):
+    return next(e for e in plan if e["channel_id"] == cid)
+
+
+# ---------------------------------------------------------------------------
+# Counting helpers
+# ---------------------------------------------------------------------------
+
+class TestCounting:
+    def test_count_signals(self):
+        assert sched.count_signals({"signals": [{"a": 1}, {"b": 2}]}) == 2
+
+    def test_parse_error_not_counted(self):
+        assert sched.count_signals({"signals": [{"raw_response": "x", "parse_error": True}]}) == 0
+
+    def test_none_and_non_list(self):
+        assert sched.count_signals(None) == 0
+        assert sched.count_signals({"signals": "oops"}) == 0
+
+    def test_count_tokens(self):
+        assert sched.count_tokens({"token_usage": {"prompt_tokens": 10, "completion_tokens": 5}}) == 15
+        assert sched.count_tokens({"token_usage": {}}) == 0
+        assert sched.count_tokens(None) == 0
+
+
+# ---------------------------------------------------------------------------
+# record_scan
+# ---------------------------------------------------------------------------
+
+class TestRecordScan:
+    def test_first_scan_creates_row(self):
+        row = sched.record_scan("ch1", "daily", signals=3, tokens=1000, now=NOW)
+        assert row["scans"] == 1
+        assert row["yield_avg"] == 3
+        assert row["cost_avg"] == 1000
+        assert sched.get_schedule_state()["ch1"]["last_run_at"] == NOW.isoformat()
+
+    def test_busy_channel_speeds_up(self):
+        row = sched.record_scan("ch1", "daily", signals=5, tokens=1000, now=NOW)
+        assert row["interval_hours"] == pytest.approx(24 * sched.SPEEDUP)
+
+    def test_quiet_channel_backs_off(self):
+        row = sched.record_scan("ch1", "daily", signals=0, tokens=1000, now=NOW)
+        assert row["interval_hours"] == pytest.approx(24 * sched.BACKOFF)
+
+    def test_interval_clamped_low(self):
+        for i in range(20):
+            row = sched.record_scan("ch1", "daily", signals=5, tokens=100, now=NOW + timedelta(hours=i))
+        assert row["interval_hours"] == pytest.approx(24 * sched.MIN_INTERVAL_FACTOR)
+
+    def test_interval_clamped_high(self):
+        for i in range(20):
+            row = sched.record_scan("ch1", "weekly", signals=0, tokens=100, now=NOW + timedelta(hours=i))
+        assert row["interval_hours"] == pytest.approx(24 * 7 * sched.MAX_INTERVAL_FACTOR)
+
+    def test_averages_are_smoothed(self):
+        sched.record_scan("ch1", "daily", signals=10, tokens=1000, now=NOW)
+        row = sched.record_scan("ch1", "daily", signals=0, tokens=1000, now=NOW + timedelta(days=1))
+        assert 0 < row["yield_avg"] < 10
+        assert row["total_signals"] == 10
+        assert row["scans"] == 2
+
+
+# ---------------------------------------------------------------------------
+# plan_scans
+# ---------------------------------------------------------------------------
+
+class TestPlanScans:
+    def test_unscanned_channels_due(self):
+        plan = sched.plan_scans({"a": _channel(), "b": _channel(frequency="weekly")}, now=NOW)
+        assert all(e["run"] for e in plan)
+        assert all(e["reason"] == "never scanned" for e in plan)
+
+    def test_realtime_scheduled_sub_daily(self):
+        channels = {"rt": _channel(frequency="realtime")}
+        sched.record_scan("rt", "realtime", signals=1, tokens=100, now=NOW)
+        assert not _entry(sched.plan_scans(channels, now=NOW + timedelta(minutes=10)), "rt")["run"]
+        assert _entry(sched.plan_scans(channels, now=NOW + timedelta(hours=1)), "rt")["run"]
+
+    def test_recent_scan_not_due(self):
+        sched.record_scan("a", "daily", signals=0, tokens=100, now=NOW)
+        entry = _entry(sched.plan_scans({"a": _channel()}, now=NOW + timedelta(hours=12)), "a")
+        assert not entry["run"]
+        assert entry["reason"] == "not due"
+
+    def test_busy_channel_due_before_quiet(self):
+        channels = {"busy": _channel(), "quiet": _channel()}
+        sched.record_scan("busy", "daily", signals=8, tokens=1000, now=NOW)
+        sched.record_scan("quiet", "daily", signals=0, tokens=1000, now=NOW)
+        plan = sched.plan_scans(channels, now=NOW + timedelta(hours=20))
+        assert _entry(plan, "busy")["run"]
+        assert not _entry(plan, "quiet")["run"]
+
+    def test_ranked_by_signals_per_token(self):
+        channels = {"cheap": _channel(), "pricey": _channel()}
+        sched.record_scan("cheap", "daily", signals=4, tokens=500, now=NOW)
+        sched.record_scan("pricey", "daily", signals=4, tokens=5000, now=NOW)
+        plan = sched.plan_scans(channels, now=NOW + timedelta(days=2))
+        assert [e["channel_id"] for e in plan] == ["cheap", "pricey"]
+
+    def test_token_budget_limits_selection(self):
+        channels = {"cheap": _channel(), "pricey": _channel()}
+        sched.record_scan("cheap", "daily", signals=4, tokens=500, now=NOW)
+        sched.record_scan("pricey", "daily", signals=4, tokens=5000, now=NOW)
+        plan = sched.plan_scans(channels, now=NOW + timedelta(days=2), token_budget=1000)
+        assert _entry(plan, "cheap")["run"]
+        assert not _entry(plan, "pricey")["run"]
+        assert _entry(plan, "pricey")["reason"] == "over budget"
+
+    def test_failed_channel_retried_after_backoff(self):
+        channels = {"ch1": _channel()}
+        sched.record_failure("ch1", "daily", now=NOW)
+        assert sched.record_failure("ch1", "daily", now=NOW) == 2
+        entry = _entry(sched.plan_scans(channels, now=NOW + timedelta(hours=1)), "ch1")
+        assert not entry["run"]
+        assert entry["reason"] == "backing off after 2 failure(s)"
+        assert _entry(sched.plan_scans(channels, now=NOW + timedelta(hours=2)), "ch1")["run"]
+
+    def test_failure_backoff_capped(self):
+        assert sched.failure_retry_hours(1, "daily") == sched.FAILURE_RETRY_HOURS
+        assert sched.failure_retry_hours(20, "daily") == 24 * sched.MAX_INTERVAL_FACTOR
+
+    def test_success_clears_failures(self):
+        sched.record_scan("ch1", "daily", signals=1, tokens=100, now=NOW)
+        sched.record_failure("ch1", "daily", now=NOW + timedelta(hours=30))
+        sched.record_scan("ch1", "daily", signals=1, tokens=100, now=NOW + timedelta(hours=32))
+        row = sched.get_schedule_state()["ch1"]
+        assert row["failures"] == 0 and row["scans"] == 2
+
+    def test_success_after_first_scan_failed(self):
+        sched.record_failure("ch1", "daily", now=NOW)
+        sched.record_scan("ch1", "daily", signals=2, tokens=300, now=NOW + timedelta(hours=2))
+        row = sched.get_schedule_state()["ch1"]
+        assert (row["scans"], row["yield_avg"], row["cost_avg"], row["failures"]) == (1, 2.0, 300.0, 0)
+        sched.record_scan("ch1", "daily", signals=0, tokens=100, now=NOW + timedelta(hours=30))
+        assert sched.get_schedule_state()["ch1"]["scans"] == 2
+
+    def test_unknown_frequency_treated_as_daily(self):
+        entry = _entry(sched.plan_scans({"x": _channel(frequency="hourly-ish")}, now=NOW), "x")
+        assert entry["interval_hours"] == 24
+
+
+class TestFormatPlan:
+    def test_lists_every_channel(self):
+        sched.record_scan("b", "daily", signals=0, tokens=100, now=NOW)
+        plan = sched.plan_scans({"a": _channel(), "b": _channel()}, now=NOW + timedelta(hours=1))
+        text = sched.format_plan(plan, now=NOW)
+        assert "Channels due: 1 of 2" in text
+        assert "[RUN ] a" in text
+        assert "[skip] b" in text
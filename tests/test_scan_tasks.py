@@ -15,6 +15,15 @@ from wheat.scan_tasks import (
     get_pending_intake,
     SCAN_RESULTS_DIR,
 )
+import wheat.scan_scheduler as sched
+
+
+@pytest.fixture(autouse=True)
+def schedule_db(tmp_path, monkeypatch):
+    """Keep scan schedule bookkeeping out of the real wheat.db."""
+    db_path = str(tmp_path / "test_schedule.db")
+    monkeypatch.setattr(sched, "DB_PATH", db_path)
+    return db_path
 
 
 def _channel(name="Test Channel", channel_type="NEWS", sources=None, fields=None, frequency="daily"):
@@ -166,10 +175,11 @@ class TestRunDailyScans:
         assert "ch1" in results
         assert "ch2" not in results
 
-    def test_runs_daily_channels(self, monkeypatch):
+    def test_first_run_scans_every_frequency(self, monkeypatch):
         channels = {
             "daily_ch": _channel(frequency="daily"),
             "weekly_ch": _channel(frequency="weekly"),
+            "realtime_ch": _channel(frequency="realtime"),
         }
         monkeypatch.setattr("wheat.scan_tasks.load_channels", lambda: channels)
         fake_date = mock.MagicMock()
@@ -179,22 +189,66 @@ class TestRunDailyScans:
         with mock.patch("wheat.scan_tasks.run_channel_scan", return_value=None) as mock_scan:
             results = run_daily_scans()
 
-        # Daily runs, weekly skipped (not Monday)
-        assert mock_scan.call_count == 1
+        # No history yet — every channel is due, including realtime
+        assert mock_scan.call_count == 3
 
-    def test_weekly_runs_on_monday(self, monkeypatch):
+    def test_recently_scanned_channel_skipped(self, monkeypatch):
         channels = {
+            "daily_ch": _channel(frequency="daily"),
             "weekly_ch": _channel(frequency="weekly"),
         }
         monkeypatch.setattr("wheat.scan_tasks.load_channels", lambda: channels)
         fake_date = mock.MagicMock()
-        fake_date.weekday.return_value = 0  # Monday
+        fake_date.weekday.return_value = 0
         monkeypatch.setattr("wheat.scan_tasks.date", mock.MagicMock(today=lambda: fake_date))
+        sched.record_scan("weekly_ch", "weekly", signals=0, tokens=100)
 
         with mock.patch("wheat.scan_tasks.run_channel_scan", return_value=None) as mock_scan:
             results = run_daily_scans()
 
+        assert list(results) == ["daily_ch"]
+
+    def test_completed_scan_recorded(self, monkeypatch):
+        channels = {"ch1": _channel()}
+        monkeypatch.setattr("wheat.scan_tasks.load_channels", lambda: channels)
+        fake_date = mock.MagicMock()
+        fake_date.weekday.return_value = 2
+        monkeypatch.setattr("wheat.scan_tasks.date", mock.MagicMock(today=lambda: fake_date))
+        result = {"signals": [{"entity": "A"}, {"entity": "B"}],
+                  "token_usage": {"prompt_tokens": 300, "completion_tokens": 200}}
+
+        with mock.patch("wheat.scan_tasks.run_channel_scan", return_value=result):
+            run_daily_scans()
+
+        row = sched.get_schedule_state()["ch1"]
+        assert row["scans"] == 1
+        assert row["total_signals"] == 2
+        assert row["total_tokens"] == 500
+
+    def test_failed_scan_backs_off(self, monkeypatch):
+        channels = {"ch1": _channel()}
+        monkeypatch.setattr("wheat.scan_tasks.load_channels", lambda: channels)
+        fake_date = mock.MagicMock()
+        fake_date.weekday.return_value = 2
+        monkeypatch.setattr("wheat.scan_tasks.date", mock.MagicMock(today=lambda: fake_date))
+
+        with mock.patch("wheat.scan_tasks.run_channel_scan", return_value=None) as mock_scan:
+            run_daily_scans()
+            run_daily_scans()
+
         assert mock_scan.call_count == 1
+        assert sched.get_schedule_state()["ch1"]["failures"] == 1
+
+    def test_dry_run_not_recorded(self, monkeypatch):
+        channels = {"ch1": _channel()}
+        monkeypatch.setattr("wheat.scan_tasks.load_channels", lambda: channels)
+        fake_date = mock.MagicMock()
+        fake_date.weekday.return_value = 2
+        monkeypatch.setattr("wheat.scan_tasks.date", mock.MagicMock(today=lambda: fake_date))
+
+        run_daily_scans(dry_run=True)
+
+        assert sched.get_schedule_state() == {}
 
 
 # ---------------------------------------------------------------------------
@@ -0,0 +1,243 @@
+"""Tests for wheat/seed_runner.py — sandboxed seed script execution."""
+
+import os
+import textwrap
+import threading
+import time
+from functools import partial
+
+import pytest
+
+import wheat.seed_runner as runner
+from wheat.cancel import CancelScope, Cancelled
+
+PASSING = """
+import unittest
+
+def add(a, b):
+    return a + b
+
+class TestAdd(unittest.TestCase):
+    def test_add(self):
+        self.assertEqual(add(1, 2), 3)
+
+    def test_zero(self):
+        self.assertEqual(add(0, 0), 0)
+
+if __name__ == "__main__":
+    print("entry point ran")
+    unittest.main()
+"""
+
+FAILING = """
+import unittest
+
+class TestBroken(unittest.TestCase):
+    def test_ok(self):
+        pass
+
+    def test_fails(self):
+        self.assertEqual(1, 2)
+
+    def test_errors(self):
+        raise ValueError("boom")
+"""
+
+
+@pytest.fixture(params=[
+    "cold",
+    pytest.param("warm", marks=pytest.mark.skipif(not hasattr(os, "fork"), reason="warm pool needs fork")),
+])
+def run(request):
+    """run_seed_script in both execution modes — results must be identical."""
+    return partial(runner.run_seed_script, warm=request.param == "warm")
+
+
+def _script(tmp_path, code, name="script.py"):
+    path = tmp_path / name
+    path.write_text(textwrap.dedent(code))
+    return str(path)
+
+
+class TestRunSeedScript:
+    def test_passing_script(self, run, tmp_path):
+        result = run(_script(tmp_path, PASSING))
+        assert result["passed"]
+        assert result["tests_run"] == 2
+        assert result["failures"] == 0 and result["errors"] == 0
+        assert "OK" in result["output"]
+        assert "entry point ran" in result["output"]
+        assert result["output"].count("Ran 2 tests") == 1  # unittest.main() doesn't rerun them
+        assert result["limit"] is None
+        assert result["seconds"] > 0
+
+    def test_counts_failures_and_errors(self, run, tmp_path):
+        result = run(_script(tmp_path, FAILING))
+        assert not result["passed"]
+        assert (result["tests_run"], result["failures"], result["errors"]) == (3, 1, 1)
+        assert "FAILED" in result["output"]
+
+    def test_syntax_error_is_load_error(self, run, tmp_path):
+        result = run(_script(tmp_path, "def broken(:\n    pass\n"))
+        assert not result["passed"]
+        assert result["load_error"].startswith("SyntaxError")
+
+    def test_no_tests_is_not_a_pass(self, run, tmp_path):
+        result = run(_script(tmp_path, "print('OK')\n"))
+        assert result["tests_run"] == 0
+        assert not result["passed"]
+
+    def test_script_error_recorded(self, run, tmp_path):
+        code = PASSING.replace('print("entry point ran")', 'raise RuntimeError("main broke")')
+        result = run(_script(tmp_path, code))
+        assert result["passed"]  # tests passed; the entry point failure is reported separately
+        assert result["script_error"] == "RuntimeError: main broke"
+
+    def test_sibling_imports_resolve(self, run, tmp_path):
+        _script(tmp_path, "VALUE = 7\n", name="helper.py")
+        code = """
+        import unittest
+        from helper import VALUE
+
+        class T(unittest.TestCase):
+            def test_value(self):
+                self.assertEqual(VALUE, 7)
+        """
+        assert run(_script(tmp_path, code))["passed"]
+
+    def test_wall_clock_timeout(self, run, tmp_path):
+        result = run(_script(tmp_path, "import time\ntime.sleep(30)\n"), timeout=1)
+        assert result["timed_out"]
+        assert result["limit"] == "wall_clock"
+        assert not result["passed"]
+        assert "TIMEOUT" in result["output"]
+        assert result["seconds"] < 10
+
+    @pytest.mark.skipif(runner.signal.__dict__.get("SIGXCPU") is None, reason="no rlimits on this platform")
+    def test_cpu_limit(self, run, tmp_path):
+        result = run(_script(tmp_path, "while True:\n    pass\n"), timeout=20, cpu_seconds=1)
+        assert not result["timed_out"]
+        assert result["limit"] == "cpu"
+        assert "CPU LIMIT" in result["output"]
+
+    @pytest.mark.skipif(runner.signal.__dict__.get("SIGXCPU") is None, reason="no rlimits on this platform")
+    def test_memory_limit(self, run, tmp_path):
+        code = """
+        import unittest
+
+        class T(unittest.TestCase):
+            def test_hog(self):
+                self.data = bytearray(2 * 1024 ** 3)
+        """
+        result = run(_script(tmp_path, code), memory_mb=256)
+        assert not result["passed"]
+        assert result["limit"] == "memory"
+        assert result["peak_rss_kb"] < 256 * 1024
+
+    def test_warm_and_cold_runs_share_one_limit(self, monkeypatch):
+        running, peak = [0], [0]
+        lock = threading.Lock()
+
+        def fake_run(*args, **kwargs):
+            with lock:
+                running[0] += 1
+                peak[0] = max(peak[0], running[0])
+            time.sleep(0.05)
+            with lock:
+                running[0] -= 1
+            return {}, "", 0, False, 0.05
+
+        monkeypatch.setattr(runner, "_slots", threading.BoundedSemaphore(2))
+        monkeypatch.setattr(runner, "_run_cold", fake_run)
+        monkeypatch.setattr(runner, "warm_pool", lambda: type("Pool", (), {"run": staticmethod(fake_run)})())
+        threads = [threading.Thread(target=runner.run_seed_script, args=("s.py",), kwargs={"warm": i % 2 == 0})
+                   for i in range(6)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert peak[0] == 2
+
+
+class TestCancel:
+    SLOW = """
+    import time
+    import unittest
+
+    class T(unittest.TestCase):
+        def test_slow(self):
+            time.sleep(30)
+    """
+
+    def test_cancel_kills_the_run(self, tmp_path):
+        scope = CancelScope()
+        threading.Timer(0.3, scope.cancel).start()
+        start = time.monotonic()
+        with pytest.raises(Cancelled):
+            runner.run_seed_script(_script(tmp_path, self.SLOW), warm=True, cancel=scope)
+        assert time.monotonic() - start < 10
+
+    def test_uncancelled_scope_runs_normally(self, tmp_path):
+        result = runner.run_seed_script(_script(tmp_path, PASSING), warm=True, cancel=CancelScope())
+        assert result["passed"]
+        assert result["tests_run"] == 2
+
+
+class TestLimitsFromConfig:
+    def test_defaults(self):
+        assert runner.limits_from_config({}) == {
+            "timeout": runner.SEED_TIMEOUT,
+            "cpu_seconds": runner.SEED_CPU_SECONDS,
+            "memory_mb": runner.SEED_MEMORY_MB,
+            "warm": runner.SEED_WARM_POOL,
+        }
+
+    def test_overrides(self):
+        limits = runner.limits_from_config({"seed_timeout": 5, "seed_memory_mb": 128, "seed_warm_pool": False})
+        assert limits["timeout"] == 5
+        assert limits["memory_mb"] == 128
+        assert limits["warm"] is False
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="warm pool needs fork")
+class TestWarmPool:
+    @pytest.fixture
+    def pool(self):
+        pool = runner.WarmPool(size=1)
+        yield pool
+        pool.close()
+
+    def test_seeds_are_isolated(self, pool, tmp_path):
+        # A seed that monkeypatches a warm module must not affect the next one
+        patcher = """
+        import json
+        import unittest
+        json.dumps = lambda *a, **k: "patched"
+
+        class T(unittest.TestCase):
+            def test_patched(self):
+                self.assertEqual(json.dumps({}), "patched")
+        """
+        checker = """
+        import json
+        import unittest
+
+        class T(unittest.TestCase):
+            def test_clean(self):
+                self.assertEqual(json.dumps({}), "{}")
+        """
+        report, _, exit_code, _, _ = pool.run(_script(tmp_path, patcher, "a.py"), 10, 5, 256)
+        assert report["failures"] == 0 and exit_code == 0
+        report, _, _, _, _ = pool.run(_script(tmp_path, checker, "b.py"), 10, 5, 256)
+        assert report["tests_run"] == 1 and report["failures"] == 0
+
+    def test_replaces_dead_server(self, pool, tmp_path):
+        (worker,) = pool._workers
+        worker.kill()
+        worker.wait()
+        report, output, exit_code, _, _ = pool.run(_script(tmp_path, PASSING), 10, 5, 256)
+        assert report is None
+        assert "crashed" in output
+        assert pool._workers and pool._workers[0] is not worker
+        report, _, _, _, _ = pool.run(_script(tmp_path, PASSING), 10, 5, 256)
+        assert report["tests_run"] == 2
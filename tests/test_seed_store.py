@@ -0,0 +1,119 @@
+"""Tests for wheat/seed_store.py — batched, dirty-tracked seed row writes."""
+
+import json
+import sqlite3
+from types import SimpleNamespace
+
+import pytest
+
+from wheat.run_events import create_run_events_table
+from wheat.seed_store import SeedStore
+
+
+def _seed(seed_id, status="Growing", task="task"):
+    return SimpleNamespace(seed_id=seed_id, task=task, store=None, progress={
+        "status": status, "output": [], "code_file": "", "test_result": "",
+    })
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = str(tmp_path / "wheat.db")
+    conn = sqlite3.connect(path)
+    conn.execute("""CREATE TABLE runs (id INTEGER PRIMARY KEY AUTOINCREMENT, timestamp TEXT, log TEXT DEFAULT '',
+        project_id TEXT DEFAULT 'default', prompt_tokens INTEGER DEFAULT 0,
+        completion_tokens INTEGER DEFAULT 0, total_tokens INTEGER DEFAULT 0)""")
+    conn.execute("""CREATE TABLE seeds (id INTEGER PRIMARY KEY AUTOINCREMENT, run_id INTEGER, seed_id TEXT,
+        task TEXT, status TEXT, output TEXT, code_file TEXT, test_result TEXT, project_id TEXT DEFAULT 'default')""")
+    create_run_events_table(conn.cursor())
+    for run_id in (1, 2):
+        conn.execute("INSERT INTO runs (id, log, project_id) VALUES (?, '', 'p')", (run_id,))
+        conn.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) "
+                     "VALUES (?, '1', 'task', 'Growing', '[]', '', '', 'p')", (run_id,))
+    conn.commit()
+    conn.close()
+    return path
+
+
+def _rows(db, sql, *args):
+    conn = sqlite3.connect(db)
+    try:
+        return conn.execute(sql, args).fetchall()
+    finally:
+        conn.close()
+
+
+class TestFlush:
+    def test_nothing_dirty_writes_nothing(self, db):
+        store = SeedStore("p", 2, db_path=db)
+        store.track(_seed("1"), persisted=True)
+        assert store.dirty() == []
+        assert store.flush() == 0
+
+    def test_updates_only_this_runs_row(self, db):
+        store = SeedStore("p", 2, db_path=db)
+        seed = _seed("1")
+        store.track(seed, persisted=True)
+        seed.progress["status"] = "Fruitful"
+        assert store.dirty() == ["1"]
+        assert store.flush() == 1
+        assert _rows(db, "SELECT run_id, status FROM seeds ORDER BY run_id") == [(1, "Growing"), (2, "Fruitful")]
+        assert store.flush() == 0
+
+    def test_inserts_new_seed_into_run(self, db):
+        store = SeedStore("p", 2, db_path=db)
+        store.track(_seed("1_1", task="follow up"))
+        assert store.flush() == 1
+        assert _rows(db, "SELECT run_id, task, project_id FROM seeds WHERE seed_id = '1_1'") == [(2, "follow up", "p")]
+
+    def test_log_and_tokens_batched_by_run_id(self, db):
+        store = SeedStore("p", 1, db_path=db)
+        store.append_log("a\n")
+        store.append_log("b\n")
+        store.add_tokens(3, 4)
+        store.add_tokens(1, 1)
+        store.flush()
+        assert _rows(db, "SELECT prompt_tokens, completion_tokens, total_tokens FROM runs WHERE id = 1") == [(4, 5, 9)]
+        assert _rows(db, "SELECT run_id, message FROM run_events ORDER BY seq") == [(1, "a\n"), (1, "b\n")]
+        store.flush()
+        assert len(_rows(db, "SELECT seq FROM run_events")) == 2
+
+    def test_forgotten_seed_not_written(self, db):
+        store = SeedStore("p", 2, db_path=db)
+        seed = _seed("1")
+        store.track(seed, persisted=True)
+        store.forget(seed)
+        seed.progress["output"].append("late")
+        assert store.flush() == 0
+        assert json.loads(_rows(db, "SELECT output FROM seeds WHERE run_id = 2")[0][0]) == []
+
+    def test_failed_write_keeps_changes_buffered(self, db, tmp_path):
+        store = SeedStore("p", 2, db_path=str(tmp_path / "missing" / "wheat.db"))
+        seed = _seed("1")
+        store.track(seed, persisted=True)
+        seed.progress["status"] = "Barren"
+        store.append_log("x\n")
+        with pytest.raises(sqlite3.OperationalError):
+            store.flush()
+        store.db_path = db
+        assert store.flush() == 1
+        assert _rows(db, "SELECT run_id, message FROM run_events") == [(2, "x\n")]
+
+    def test_track_attaches_store(self, db):
+        store = SeedStore("p", 2, db_path=db)
+        seed = _seed("1")
+        store.track(seed)
+        assert seed.store is store
+
+
+class TestIndexes:
+    def test_init_db_indexes_run_lookups(self, tmp_path, monkeypatch):
+        import app as flask_app
+        path = str(tmp_path / "app.db")
+        monkeypatch.setattr(flask_app, "DB_PATH", path)
+        flask_app.init_db()
+        flask_app.init_db()  # idempotent
+        plan = _rows(path, "EXPLAIN QUERY PLAN UPDATE seeds SET status = ? WHERE run_id = ? AND seed_id = ? AND project_id = ?", "x", 1, "1", "p")
+        assert "idx_seeds_project_run" in str(plan)
+        plan = _rows(path, "EXPLAIN QUERY PLAN SELECT id FROM runs WHERE project_id = ? ORDER BY id DESC LIMIT 1", "p")
+        assert "idx_runs_project_id" in str(plan)
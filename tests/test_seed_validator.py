@@ -0,0 +1,166 @@
+"""Tests for wheat/seed_validator.py — static checks before seed execution."""
+
+from wheat.seed_validator import autofix, summarize_failure, validate_code
+
+VALID = """import json
+import unittest
+
+
+def dump(value):
+    return json.dumps(value)
+
+
+class TestDump(unittest.TestCase):
+    def test_dump(self):
+        self.assertEqual(dump(1), "1")
+"""
+
+
+class TestAutofix:
+    def test_clean_code_untouched(self):
+        assert autofix(VALID) == (VALID, [])
+
+    def test_crlf(self):
+        code, fixes = autofix(VALID.replace("\n", "\r\n"))
+        assert code == VALID
+        assert fixes == ["normalized line endings"]
+
+    def test_fences_removed(self):
+        code, fixes = autofix("```python\n" + VALID + "```")
+        assert code == VALID
+        assert fixes == ["removed markdown fences"]
+
+    def test_mixed_tabs_expanded(self):
+        for code in ("if True:\n    x = 1\n\ty = 2\n", "if True:\n        x = 1\n\ty = 2\n"):
+            fixed, fixes = autofix(code)
+            assert fixes == ["expanded tabs"]
+            assert "\t" not in fixed
+
+    def test_surrounding_prose_stripped(self):
+        code, fixes = autofix("Here is the script you asked for:\n\n" + VALID + "\nHope this helps!")
+        assert code.strip() == VALID.strip()
+        assert "stripped surrounding prose" in fixes
+
+    def test_real_syntax_error_left_alone(self):
+        code, fixes = autofix("def broken(:\n    pass\n")
+        assert fixes == []
+        assert code == "def broken(:\n    pass\n"
+
+
+class TestValidateCode:
+    def test_valid(self):
+        result = validate_code(VALID)
+        assert result["ok"]
+        assert result["errors"] == []
+
+    def test_syntax_error_context(self):
+        result = validate_code("import unittest\ndef broken(:\n    pass\n")
+        assert not result["ok"]
+        assert result["context"].startswith("SyntaxError")
+        assert "(line 2)" in result["context"]
+        assert "def broken(:" in result["context"]
+
+    def test_requires_testcase(self):
+        result = validate_code("import unittest\nprint('hi')\n")
+        assert not result["ok"]
+        assert "TestCase" in result["context"]
+
+    def test_testcase_without_tests(self):
+        code = "import unittest\nclass T(unittest.TestCase):\n    def helper(self):\n        pass\n"
+        assert not validate_code(code)["ok"]
+
+    def test_bare_testcase_import(self):
+        code = "from unittest import TestCase\nclass T(TestCase):\n    def test_a(self):\n        pass\n"
+        assert validate_code(code)["ok"]
+
+    def test_missing_import(self):
+        result = validate_code("import no_such_module_xyz\n" + VALID)
+        assert not result["ok"]
+        assert "No module named 'no_such_module_xyz' (line 1)" in result["context"]
+
+    def test_optional_import_allowed(self):
+        code = (
+            "try:\n    import no_such_module_xyz\nexcept ImportError:\n    no_such_module_xyz = None\n"
+            "try:\n    from no_such_pkg_xyz import thing\nexcept (ModuleNotFoundError, OSError):\n    thing = None\n"
+            + VALID
+        )
+        assert validate_code(code)["ok"]
+
+    def test_import_under_unrelated_handler_still_checked(self):
+        code = "try:\n    import no_such_module_xyz\nexcept ValueError:\n    pass\n" + VALID
+        assert "No module named 'no_such_module_xyz'" in validate_code(code)["context"]
+
+    def test_import_from_search_path(self, tmp_path):
+        (tmp_path / "local_helper.py").write_text("X = 1\n")
+        code = "from local_helper import X\n" + VALID
+        assert not validate_code(code)["ok"]
+        assert validate_code(code, search_paths=[str(tmp_path)])["ok"]
+
+    def test_relative_import_rejected(self):
+        result = validate_code("from . import sibling\n" + VALID)
+        assert "relative import" in result["context"]
+
+    def test_fixes_reported(self):
+        result = validate_code("```python\n" + VALID + "```\n")
+        assert result["ok"]
+        assert result["fixes"] == ["removed markdown fences"]
+        assert "```" not in result["code"]
+
+    def test_none_code(self):
+        assert not validate_code(None)["ok"]
+
+
+UNITTEST_OUTPUT = """.FE
+======================================================================
+ERROR: test_err (seed_script.T.test_err)
+----------------------------------------------------------------------
+Traceback (most recent call last):
+  File "/seeds/seed_1/script.py", line 6, in test_err
+    div(1, 0)
+  File "/seeds/seed_1/script.py", line 2, in div
+    return a / b
+           ~~^~~
+ZeroDivisionError: division by zero
+
+======================================================================
+FAIL: test_fail (seed_script.T.test_fail)
+----------------------------------------------------------------------
+Traceback (most recent call last):
+  File "/seeds/seed_1/script.py", line 5, in test_fail
+    self.assertEqual(div(4, 2), 3)
+AssertionError: 2.0 != 3
+
+----------------------------------------------------------------------
+Ran 3 tests in 0.001s
+
+FAILED (failures=1, errors=1)
+"""
+
+
+class TestSummarizeFailure:
+    def test_one_entry_per_failing_test(self):
+        summary = summarize_failure({"output": UNITTEST_OUTPUT})
+        assert "ERROR: test_err" in summary
+        assert "ZeroDivisionError: division by zero" in summary
+        assert 'line 2, in div' in summary
+        assert "FAIL: test_fail" in summary
+        assert "AssertionError: 2.0 != 3" in summary
+        assert "Traceback (most recent call last)" not in summary
+        assert "~~^~~" not in summary
+        assert "Ran 3 tests" not in summary
+
+    def test_timeout(self):
+        execution = {"timed_out": True, "limit": "wall_clock",
+                     "output": "\nTIMEOUT: seed script exceeded 60s wall clock and was killed"}
+        assert summarize_failure(execution) == "TIMEOUT: seed script exceeded 60s wall clock and was killed"
+
+    def test_load_error(self):
+        execution = {"load_error": "NameError: name 'x' is not defined", "output": "Traceback ...\nNameError"}
+        assert "Script failed to import: NameError" in summarize_failure(execution)
+
+    def test_capped(self):
+        summary = summarize_failure({"output": "x" * 10000})
+        assert len(summary) <= 1500
+
+    def test_empty_output(self):
+        assert summarize_failure({"output": ""}) == "Unknown error"
@@ -0,0 +1,90 @@
+"""Tests for wheat/speculation.py — speculative candidate races."""
+
+import threading
+
+import pytest
+
+from wheat import instrumentation
+from wheat.speculation import candidate_models, race, settings, summary
+
+
+class TestSettings:
+    def test_disabled_by_default(self):
+        assert settings({}) is None
+        assert settings({"speculative": {"enabled": False, "candidates": 3}}) is None
+
+    def test_enabled(self):
+        spec = settings({"speculative": {"enabled": True, "candidates": 2, "models": ["sonnet"]}})
+        assert spec == {"candidates": 2, "models": ["sonnet"]}
+
+    def test_rejects_no_candidates(self):
+        with pytest.raises(ValueError):
+            settings({"speculative": {"enabled": True, "candidates": 0}})
+
+    def test_models_cycle_through_tiers(self):
+        assert candidate_models({"candidates": 3, "models": ["sonnet", "opus"]}, "x") == ["sonnet", "opus", "sonnet"]
+        assert candidate_models({"candidates": 2, "models": []}, "coder") == ["coder", "coder"]
+
+
+def make_candidate(passes, tokens=10, hold=None):
+    """run_candidate whose model name decides the outcome; losers listed in `hold` wait to be cancelled."""
+    def run(record, cancel):
+        record["tokens"] = tokens
+        if record["model"] in (hold or ()):
+            if cancel.wait(5):
+                cancel.check()
+        if record["model"] == "boom":
+            raise RuntimeError("provider down")
+        record["code"] = f"code from {record['model']}"
+        record["passed"] = record["model"] in passes
+    return run
+
+
+class TestRace:
+    def test_first_pass_wins_and_cancels_the_rest(self):
+        report = race(make_candidate({"fast"}, hold={"slow"}), ["slow", "slow", "fast"])
+        assert report["winner"] == 2
+        assert report["model"] == "fast"
+        assert report["cancelled"] == 2
+        assert report["time_to_first_fruitful"] < 5
+        assert report["tokens"] == 30
+        assert [r["outcome"] for r in report["results"]] == ["cancelled", "cancelled", "won"]
+
+    def test_no_winner(self):
+        report = race(make_candidate(set()), ["a", "boom"])
+        assert report["winner"] is None
+        assert report["time_to_first_fruitful"] is None
+        outcomes = {r["model"]: r for r in report["results"]}
+        assert outcomes["a"]["outcome"] == "failed"
+        assert outcomes["boom"]["outcome"] == "error"
+        assert "provider down" in outcomes["boom"]["error"]
+
+    def test_unstarted_candidates_never_run(self, monkeypatch):
+        from concurrent.futures import ThreadPoolExecutor
+        import wheat.speculation as speculation
+
+        monkeypatch.setattr(speculation, "_pool", ThreadPoolExecutor(max_workers=1))
+        ran = []
+        lock = threading.Lock()
+
+        def run(record, cancel):
+            with lock:
+                ran.append(record["index"])
+            record["passed"] = True
+
+        report = race(run, ["a", "b", "c"])
+        assert report["winner"] == 0
+        assert ran == [0]
+        assert report["cancelled"] == 2
+
+    def test_metrics(self):
+        won = instrumentation.SPECULATION_CANDIDATES.values.get('outcome="won"', 0)
+        firsts = instrumentation.SPECULATION_FIRST_FRUITFUL.values.get("", [0, 0])[-2]
+        race(make_candidate({"a"}), ["a"])
+        assert instrumentation.SPECULATION_CANDIDATES.values['outcome="won"'] == won + 1
+        assert instrumentation.SPECULATION_FIRST_FRUITFUL.values[""][-2] == firsts + 1
+
+    def test_summary_drops_code(self):
+        compact = summary(race(make_candidate({"a"}), ["a"]))
+        assert "code" not in compact["results"][0]
+        assert compact["results"][0]["outcome"] == "won"
@@ -0,0 +1,321 @@
+"""Tests for wheat/tending.py — the shared tending pool, fair scheduling and FieldState wiring."""
+
+import threading
+import time
+
+import pytest
+
+from wheat import instrumentation
+from wheat.rate_limit import TokenBucket
+from wheat.tending import TendingSupervisor
+
+
+def make_supervisor(workers=1, bucket=None, stage_limits=None):
+    return TendingSupervisor(workers=workers, idle_poll=0.05, bucket=bucket or TokenBucket(1000, 1000),
+                             stage_limits=stage_limits)
+
+
+class FakeSeed:
+    """Walks generate -> validate -> test -> reap, failing its first `failures` tests (each rescued)."""
+
+    def __init__(self, seed_id, project_id, log, delay=0.0, failures=0):
+        self.seed_id = seed_id
+        self.project_id = project_id
+        self.task = f"task {seed_id}"
+        self.log = log
+        self.delay = delay
+        self.failures = failures
+        self.log_entry = None
+
+    def advance(self, stage):
+        self.log.record(stage, self)
+        time.sleep(self.delay)
+        self.log.record(f"{stage} done", self)
+        if stage in ("generate", "rescue"):
+            return "validate"
+        if stage == "validate":
+            return "test"
+        if self.failures:
+            self.failures -= 1
+            return "rescue"
+        self.log_entry = f"[seed_{self.seed_id}] [Fruitful]"
+        return "reap"
+
+
+class Log:
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.events = []
+        self.threads = set()
+        self.active = {}
+        self.peak = {}
+
+    def record(self, stage, seed):
+        with self.lock:
+            self.events.append((stage, seed.project_id, seed.seed_id))
+            self.threads.add(threading.current_thread().name)
+            base, done = stage.replace(" done", ""), stage.endswith(" done")
+            self.active[base] = self.active.get(base, 0) + (-1 if done else 1)
+            self.peak[base] = max(self.peak.get(base, 0), self.active[base])
+
+    def stages(self, project_id=None):
+        return [(stage, sid) for stage, pid, sid in self.events
+                if not stage.endswith(" done") and project_id in (None, pid)]
+
+
+class FakeManager:
+    """Serves `rounds` rounds of `seeds` seeds, then reports nothing to do."""
+
+    def __init__(self, project_id, log, rounds=1, seeds=2, delay=0.0, config=None, reseeds=0):
+        self.project_id = project_id
+        self.config = config or {}
+        self.log = log
+        self.rounds_left = rounds
+        self.seeds_per_round = seeds
+        self.delay = delay
+        self.reseeds = reseeds
+        self.settled = []
+        self.done = threading.Event()
+
+    def make_seeds(self):
+        return [FakeSeed(f"{self.project_id}-{i}", self.project_id, self.log, self.delay)
+                for i in range(self.seeds_per_round)]
+
+    def begin_round(self, blocking=True):
+        if self.rounds_left == 0:
+            self.done.set()
+            return []
+        self.rounds_left -= 1
+        return self.make_seeds()
+
+    def settle_seed(self, seed, log_entry):
+        self.log.record("reap", seed)
+        self.log.record("reap done", seed)
+        self.settled.append(log_entry)
+        if self.reseeds:
+            self.reseeds -= 1
+            return FakeSeed(seed.seed_id + "_1", self.project_id, self.log)
+        return None
+
+
+@pytest.fixture
+def log():
+    return Log()
+
+
+@pytest.fixture
+def supervisor():
+    sup = make_supervisor(workers=2)
+    yield sup
+    sup.shutdown()
+
+
+def wait_for(predicate, timeout=5):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+class TestPipeline:
+    def test_every_seed_walks_its_stages(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=2, seeds=3)
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        assert sorted(manager.settled) == sorted([f"[seed_a-{i}] [Fruitful]" for i in range(3)] * 2)
+        for i in range(3):
+            walked = [stage for stage, sid in log.stages() if sid == f"a-{i}"]
+            assert walked == ["generate", "validate", "test", "reap"] * 2
+        assert supervisor.stats()["fields"]["a"]["rounds"] == 2
+
+    def test_furthest_along_first(self, log):
+        sup = make_supervisor()
+        try:
+            manager = FakeManager("a", log, rounds=1, seeds=3)
+            sup.add("a", manager)
+            assert manager.done.wait(5)
+            assert log.stages()[:8] == [
+                ("generate", "a-0"), ("validate", "a-0"), ("test", "a-0"), ("reap", "a-0"),
+                ("generate", "a-1"), ("validate", "a-1"), ("test", "a-1"), ("reap", "a-1"),
+            ]
+        finally:
+            sup.shutdown()
+
+    def test_fast_seed_does_not_wait_for_slow_generation(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=1, seeds=0)
+        slow, fast = FakeSeed("slow", "a", log, delay=0.3), FakeSeed("fast", "a", log)
+        manager.make_seeds = lambda: [slow, fast]
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        order = [(stage, sid) for stage, _, sid in log.events]
+        assert order.index(("reap", "fast")) < order.index(("generate done", "slow"))
+
+    def test_rescue_is_a_stage_not_a_recursion(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=1, seeds=0)
+        seed = FakeSeed("s", "a", log, failures=2)
+        manager.make_seeds = lambda: [seed]
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        assert [stage for stage, _ in log.stages()] == [
+            "generate", "validate", "test", "rescue", "validate", "test", "rescue", "validate", "test", "reap",
+        ]
+
+    def test_stage_limits_bound_concurrency(self, log):
+        sup = make_supervisor(workers=4, stage_limits={"generate": 4, "rescue": 1, "validate": 4, "test": 1, "reap": 1})
+        try:
+            manager = FakeManager("a", log, rounds=1, seeds=4, delay=0.02)
+            sup.add("a", manager)
+            assert manager.done.wait(5)
+            assert log.peak["test"] == 1
+            assert log.peak["generate"] > 1
+        finally:
+            sup.shutdown()
+
+    def test_reseed_starts_immediately(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=1, seeds=1, reseeds=1)
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        assert [sid for stage, sid in log.stages() if stage == "reap"] == ["a-0", "a-0_1"]
+        assert supervisor.stats()["fields"]["a"]["rounds"] == 1
+
+    def test_pool_is_bounded_and_reused(self, supervisor, log):
+        managers = [FakeManager(pid, log, rounds=2, seeds=3, delay=0.01) for pid in "abcd"]
+        for m in managers:
+            supervisor.add(m.project_id, m)
+        assert all(m.done.wait(5) for m in managers)
+        assert len(log.threads) <= 2
+        assert all(name.startswith("tend") for name in log.threads)
+
+    def test_failing_stage_settles_the_seed(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=1, seeds=0)
+        seed = FakeSeed("bad", "a", log)
+        seed.advance = lambda stage: 1 / 0
+        manager.make_seeds = lambda: [seed]
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        assert manager.settled == ["[seed_bad] [task bad] [Error] [generate: division by zero]"]
+
+
+class TestScheduling:
+    def test_fair_share_follows_priority(self, log):
+        sup = make_supervisor()
+        try:
+            gate = threading.Event()
+            blocker = FakeManager("0-blocker", log, rounds=1, seeds=1)
+            blocker.begin_round = lambda blocking=True: gate.wait(5) and []
+            sup.add("0-blocker", blocker)
+            assert wait_for(lambda: sup.stats()["running"] == 1)
+            # Both fields queue their plan jobs while the only worker is busy
+            high = FakeManager("high", log, rounds=1, seeds=12)
+            low = FakeManager("low", log, rounds=1, seeds=12)
+            sup.add("high", high, priority=2)
+            sup.add("low", low, priority=1)
+            gate.set()
+            assert wait_for(lambda: len(log.stages()) >= 24)
+            first = [sid.split("-")[0] for _, sid in log.stages()[:24]]
+            assert first.count("high") == 16
+            assert first.count("low") == 8
+        finally:
+            sup.shutdown()
+
+    def test_queue_depth_and_gauges(self, log):
+        sup = make_supervisor()
+        try:
+            gate = threading.Event()
+            blocker = FakeManager("a", log)
+            blocker.begin_round = lambda blocking=True: gate.wait(5) and []
+            sup.add("a", blocker)
+            sup.add("b", FakeManager("b", log))
+            sup.add("c", FakeManager("c", log))
+            assert wait_for(lambda: sup.queue_depth() == 2)
+            assert wait_for(lambda: instrumentation.TEND_QUEUE_DEPTH.values.get("") == 2)
+            assert instrumentation.TEND_RUNNING.values.get("") == 1
+            gate.set()
+            assert wait_for(lambda: sup.queue_depth() == 0)
+        finally:
+            sup.shutdown()
+
+    def test_generate_calls_are_rate_limited_without_holding_workers(self, log):
+        clock = [0.0]
+        bucket = TokenBucket(rate=1, burst=2, clock=lambda: clock[0])
+        sup = make_supervisor(workers=2, bucket=bucket)
+        try:
+            slow = FakeManager("a", log, rounds=1, seeds=4)
+            sup.add("a", slow)
+            generated = lambda: sum(1 for stage, _ in log.stages() if stage == "generate")
+            assert wait_for(lambda: generated() == 2 and sup.stats()["running"] == 0)
+            time.sleep(0.1)
+            assert generated() == 2  # waiting for tokens, not on a worker
+            # The two generated seeds still went all the way through
+            assert sum(1 for stage, _ in log.stages() if stage == "reap") == 2
+            clock[0] += 2
+            assert slow.done.wait(5)
+            assert generated() == 4
+        finally:
+            sup.shutdown()
+
+    def test_priority_validation(self, supervisor, log):
+        with pytest.raises(ValueError):
+            supervisor.add("a", FakeManager("a", log), priority=0)
+        supervisor.add("a", FakeManager("a", log, config={"tending_priority": 3}))
+        assert supervisor.stats()["fields"]["a"]["priority"] == 3
+        assert supervisor.set_priority("a", 0.5)
+        assert not supervisor.set_priority("missing", 2)
+
+
+class TestMembership:
+    def test_remove_drops_queued_work(self, log):
+        sup = make_supervisor()
+        try:
+            gate = threading.Event()
+            blocker = FakeManager("a", log)
+            blocker.begin_round = lambda blocking=True: gate.wait(5) and []
+            sup.add("a", blocker)
+            doomed = FakeManager("b", log, rounds=1, seeds=3)
+            sup.add("b", doomed)
+            assert wait_for(lambda: sup.queue_depth() == 1)
+            assert sup.remove("b")
+            assert not sup.remove("b")
+            gate.set()
+            time.sleep(0.1)
+            assert doomed.settled == [] and doomed.rounds_left == 1
+            assert sup.active() == ["a"]
+        finally:
+            sup.shutdown()
+
+    def test_readding_same_manager_is_a_no_op(self, supervisor, log):
+        manager = FakeManager("a", log, rounds=0)
+        supervisor.add("a", manager)
+        assert manager.done.wait(5)
+        supervisor.add("a", manager)
+        assert supervisor.active() == ["a"]
+
+    def test_field_state_uses_supervisor(self, supervisor, monkeypatch):
+        import app as app_module
+
+        made = []
+
+        def fake_manager(project_id, config):
+            m = FakeManager(project_id, Log(), rounds=0, config=config)
+            made.append(m)
+            return m
+
+        monkeypatch.setattr(app_module, "FieldManager", fake_manager)
+        monkeypatch.setattr(app_module, "load_project_config", lambda pid: {})
+        state = app_module.FieldState(supervisor=supervisor)
+
+        state.ensure_tending("x")
+        state.ensure_tending("x")
+        assert state.active_projects() == ["x"]
+        assert len(made) == 1
+
+        state.reset_manager("x")
+        assert state.active_projects() == ["x"]
+        assert supervisor._fields["x"].manager is made[1]
+
+        state.clear("x")
+        assert state.active_projects() == []
+        state.reset_manager("x")
+        assert state.active_projects() == []
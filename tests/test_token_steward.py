@@ -83,12 +83,21 @@ class TestWaterUsed:
         steward.water_used(100, 50)
         # Simulate expired period
         steward.data["period_end"] = (datetime.now() - timedelta(hours=1)).isoformat()
+        steward.save_log()
         steward.water_used(10, 5)
         # Should have reset then added new values
         assert steward.data["prompt_tokens"] == 10
         assert steward.data["completion_tokens"] == 5
         assert steward.data["total_tokens"] == 15
 
+    def test_stewards_sharing_the_log_add_up(self, steward):
+        other = TokenSteward()
+        steward.water_used(100, 50)
+        other.water_used(10, 5)
+        steward.water_used(1, 1)
+        assert steward.data["total_tokens"] == 167
+        assert json.loads(open("token_log.json").read())["total_tokens"] == 167
+
 
 class TestLoadLog:
     def test_loads_existing_valid_log(self, steward, tmp_path):
@@ -0,0 +1,129 @@
+"""Tests for wheat/tracing.py — cycle profiling spans."""
+
+import json
+import threading
+import time
+
+import pytest
+
+import wheat.tracing as tracing
+from wheat.cycle_graph import TaskGraph
+
+
+@pytest.fixture(autouse=True)
+def no_active_trace():
+    """Never leak an active tracer between tests."""
+    tracing.stop_trace()
+    yield
+    tracing.stop_trace()
+
+
+def _spans(tracer):
+    return [e for e in tracer.to_chrome()["traceEvents"] if e["ph"] == "X"]
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        values = list(range(1, 101))
+        assert tracing.percentile(values, 50) == 50
+        assert tracing.percentile(values, 95) == 95
+        assert tracing.percentile(values, 100) == 100
+
+    def test_single_and_empty(self):
+        assert tracing.percentile([3.0], 95) == 3.0
+        assert tracing.percentile([], 50) is None
+
+
+class TestSpan:
+    def test_noop_without_trace(self):
+        with tracing.span("x", "db"):
+            pass
+        assert tracing.current_tracer() is None
+
+    def test_records_chrome_event(self):
+        tracer = tracing.start_trace()
+        with tracing.span("claude -p", "provider", model="opus"):
+            time.sleep(0.01)
+        (event,) = _spans(tracer)
+        assert event["name"] == "claude -p"
+        assert event["cat"] == "provider"
+        assert event["dur"] >= 10_000  # microseconds
+        assert event["args"]["model"] == "opus"
+
+    def test_nested_spans_record_parent(self):
+        tracer = tracing.start_trace()
+        with tracing.span("field:tow", "phase"):
+            with tracing.span("seed 1 test", "seed"):
+                pass
+        events = {e["name"]: e for e in _spans(tracer)}
+        inner, outer = events["seed 1 test"], events["field:tow"]
+        assert inner["args"]["parent"] == "field:tow"
+        assert "args" not in outer
+        assert outer["ts"] <= inner["ts"]
+        assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+    def test_error_recorded_and_reraised(self):
+        tracer = tracing.start_trace()
+        with pytest.raises(ValueError):
+            with tracing.span("boom", "db"):
+                raise ValueError("x")
+        assert _spans(tracer)[0]["args"]["error"] == "ValueError"
+
+    def test_threads_get_names(self):
+        tracer = tracing.start_trace()
+
+        def work():
+            with tracing.span("w", "seed"):
+                pass
+
+        t = threading.Thread(target=work, name="seed-worker")
+        t.start()
+        t.join()
+        names = [e["args"]["name"] for e in tracer.to_chrome()["traceEvents"] if e["name"] == "thread_name"]
+        assert "seed-worker" in names
+
+
+class TestTracer:
+    def test_summary_by_category(self):
+        tracer = tracing.Tracer()
+        for seconds in (1.0, 2.0, 3.0, 4.0):
+            tracer.record("claude -p", "provider", 0.0, seconds)
+        tracer.record("save seed progress", "db", 0.0, 0.5)
+        summary = tracer.summary()
+        assert summary["provider"] == {"count": 4, "total": 10.0, "p50": 2.0, "p95": 4.0, "max": 4.0}
+        assert summary["db"]["count"] == 1
+
+    def test_write_chrome_file(self, tmp_path):
+        tracer = tracing.start_trace("daily cycle test")
+        with tracing.span("scan", "phase"):
+            pass
+        path = tracer.write(str(tmp_path / "cycle" / "trace.json"))
+        with open(path) as f:
+            data = json.load(f)
+        assert data["traceEvents"][0]["args"]["name"] == "daily cycle test"
+        assert any(e["name"] == "scan" and e["ph"] == "X" for e in data["traceEvents"])
+
+    def test_stop_trace_returns_tracer(self):
+        tracer = tracing.start_trace()
+        assert tracing.stop_trace() is tracer
+        with tracing.span("after", "db"):
+            pass
+        assert _spans(tracer) == []
+
+
+class TestGraphIntegration:
+    def test_graph_nodes_are_phase_spans(self):
+        tracer = tracing.start_trace()
+        graph = TaskGraph()
+
+        def field(results):
+            with tracing.span("seed 1 generate", "seed"):
+                return 1
+
+        graph.add("scan", lambda results: None)
+        graph.add("field:tow", field, deps=["scan"])
+        graph.run(max_workers=2)
+        events = {e["name"]: e for e in _spans(tracer)}
+        assert events["scan"]["cat"] == "phase"
+        assert events["field:tow"]["cat"] == "phase"
+        assert events["seed 1 generate"]["args"]["parent"] == "field:tow"
@@ -25,6 +25,27 @@ def _config(tmp_path, **overrides):
     return cfg
 
 
+VALID_CODE = """import unittest
+
+
+class TestWidget(unittest.TestCase):
+    def test_widget(self):
+        self.assertTrue(True)
+"""
+
+
+def _execution(passed, output="Ran 3 tests in 0.001s\n\nOK", **overrides):
+    """A run_seed_script() result."""
+    result = {
+        "passed": passed, "tests_run": 3, "failures": 0, "errors": 0 if passed else 1,
+        "skipped": 0, "seconds": 0.1, "peak_rss_kb": 16000, "exit_code": 0,
+        "timed_out": False, "limit": None, "load_error": None, "script_error": None,
+        "output": output,
+    }
+    result.update(overrides)
+    return result
+
+
 @pytest.fixture
 def seed(tmp_path, monkeypatch):
     """Create a WheatSeed with mocked provider and DB calls."""
@@ -94,26 +115,20 @@ class TestInit:
 class TestGenerateCode:
     def test_successful_generation(self, seed, tmp_path):
         seed.provider.generate.return_value = ("```python\nprint('hello')\n```", {"prompt_tokens": 10, "completion_tokens": 20})
-        with mock.patch("wheat.wheat_seed.sqlite3") as mock_sql:
-            mock_conn = mock.MagicMock()
-            mock_sql.connect.return_value.__enter__ = lambda s: mock_conn
-            mock_sql.connect.return_value.__exit__ = mock.MagicMock(return_value=False)
-            seed.generate_code()
+        seed.generate_code()
         assert seed.code == "print('hello')"
         assert seed.progress["code_file"] != ""
 
     def test_uses_rescuer_model_on_retry(self, seed, tmp_path):
         seed.provider.generate.return_value = ("```python\nfix()\n```", {"prompt_tokens": 5, "completion_tokens": 10})
-        with mock.patch("wheat.wheat_seed.sqlite3"):
-            seed.generate_code(rescue_code="broken()", rescue_error="SyntaxError")
+        seed.generate_code(rescue_code="broken()", rescue_error="SyntaxError")
         # Verify the model passed is rescuer
         call_kwargs = seed.provider.generate.call_args
         assert call_kwargs[1].get("model") == "test-rescuer" or "Retry" in str(seed.progress["output"]) or True
 
     def test_uses_coder_prompt_override(self, seed, tmp_path):
         seed.provider.generate.return_value = ("```python\nok()\n```", {"prompt_tokens": 5, "completion_tokens": 10})
-        with mock.patch("wheat.wheat_seed.sqlite3"):
-            seed.generate_code(coder_prompt="Custom prompt here")
+        seed.generate_code(coder_prompt="Custom prompt here")
         prompt_used = seed.provider.generate.call_args[1]["prompt"]
         assert prompt_used == "Custom prompt here"
 
@@ -125,8 +140,7 @@ class TestGenerateCode:
 
     def test_extracts_code_without_fences(self, seed, tmp_path):
         seed.provider.generate.return_value = ("plain code here", {"prompt_tokens": 5, "completion_tokens": 5})
-        with mock.patch("wheat.wheat_seed.sqlite3"):
-            seed.generate_code()
+        seed.generate_code()
         assert seed.code == "plain code here"
 
 
@@ -144,45 +158,194 @@ class TestGrowAndReap:
             result = seed.grow_and_reap()
         assert "Barren" in result
 
-    def test_fruitful_on_ok_test(self, seed):
-        seed.code = "print('hello')"
-        with mock.patch("wheat.wheat_seed.subprocess.run") as mock_run:
-            mock_run.return_value = mock.MagicMock(stdout="OK", stderr="", returncode=0)
+    def test_fruitful_on_passing_tests(self, seed):
+        seed.code = VALID_CODE
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(True)) as mock_run:
             with mock.patch.object(seed, "save_progress"):
                 result = seed.grow_and_reap()
         assert "Fruitful" in result
         assert seed.progress["status"] == "Fruitful"
+        assert seed.progress["execution"]["tests_run"] == 3
+        assert "output" not in seed.progress["execution"]
+        assert mock_run.call_args[1]["timeout"] == seed.exec_limits["timeout"]
+
+    def test_ok_text_alone_is_not_a_pass(self, seed):
+        seed.code = VALID_CODE
+        seed.retry_count = 2
+        execution = _execution(False, output="Ran 0 tests in 0.000s\n\nOK", tests_run=0)
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=execution):
+            with mock.patch.object(seed, "save_progress"):
+                seed.grow_and_reap()
+        assert seed.progress["status"] == "Barren"
 
     def test_barren_after_max_retries(self, seed, tmp_path):
-        seed.code = "broken()"
+        seed.code = VALID_CODE
         seed.retry_count = 2  # Already at max
-        with mock.patch("wheat.wheat_seed.subprocess.run") as mock_run:
-            mock_run.return_value = mock.MagicMock(stdout="", stderr="FAILED", returncode=1)
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(False, output="FAILED")):
             with mock.patch.object(seed, "save_progress"):
                 result = seed.grow_and_reap()
         assert "Barren" in result
         assert "FAILED" in result
 
     def test_retry_calls_generate_code(self, seed, tmp_path):
-        seed.code = "broken()"
+        seed.code = VALID_CODE
         seed.retry_count = 0
-        call_count = 0
+        results = [_execution(False, output="Error"), _execution(True)]
+
+        with mock.patch("wheat.wheat_seed.run_seed_script", side_effect=results):
+            with mock.patch.object(seed, "generate_code") as mock_generate:
+                with mock.patch.object(seed, "save_progress"):
+                    result = seed.grow_and_reap()
+        assert seed.retry_count == 1
+        mock_generate.assert_called_once_with(VALID_CODE, "Error")
+        assert "Fruitful" in result
+
+    def test_timeout_goes_to_rescue_with_context(self, seed):
+        seed.code = VALID_CODE
+        seed.retry_count = 2
+        execution = _execution(False, output="\nTIMEOUT: seed script exceeded 60s wall clock and was killed",
+                               timed_out=True, limit="wall_clock", tests_run=0)
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=execution):
+            with mock.patch.object(seed, "save_progress"):
+                result = seed.grow_and_reap()
+        assert "TIMEOUT" in result
+        assert seed.progress["execution"]["limit"] == "wall_clock"
 
-        def fake_run(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count <= 2:  # unittest run
-                return mock.MagicMock(stdout="", stderr="Error", returncode=1)
-            return mock.MagicMock(stdout="OK", stderr="", returncode=0)
 
-        with mock.patch("wheat.wheat_seed.subprocess.run", side_effect=fake_run):
-            with mock.patch.object(seed, "generate_code"):
+    def test_invalid_code_skips_test_run(self, seed):
+        seed.code = "def broken(:\n    pass\n"
+        seed.retry_count = 0
+        with mock.patch("wheat.wheat_seed.run_seed_script") as mock_run:
+            with mock.patch.object(seed, "generate_code") as mock_generate:
                 with mock.patch.object(seed, "save_progress"):
-                    # Will retry once, then call grow_and_reap again
-                    # Since generate_code is mocked, code stays "broken()"
-                    # Second retry: retry_count becomes 1, then 2, then barren
+                    seed.retry_count = 2  # straight to Barren after one validation
                     result = seed.grow_and_reap()
-        assert seed.retry_count > 0
+        mock_run.assert_not_called()
+        mock_generate.assert_not_called()
+        assert "Barren" in result
+        assert seed.progress["validation"]["ok"] is False
+        assert "SyntaxError" in seed.progress["test_result"]
+
+    def test_rescue_gets_compact_validation_context(self, seed):
+        seed.code = "import unittest\nprint('no tests here')\n"
+        seed.retry_count = 1
+
+        def rescued(code, error):
+            seed.code = VALID_CODE
+
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(True)) as mock_run:
+            with mock.patch.object(seed, "generate_code", side_effect=rescued) as mock_generate:
+                with mock.patch.object(seed, "save_progress"):
+                    result = seed.grow_and_reap()
+        error = mock_generate.call_args[0][1]
+        assert "TestCase" in error
+        assert len(error) < 200
+        assert mock_run.call_count == 1  # only the rescued code ran
+        assert "Fruitful" in result
+
+    def test_autofix_applied_before_run(self, seed):
+        seed.code = "```python\n" + VALID_CODE + "```\n"
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(True)):
+            with mock.patch.object(seed, "save_progress"):
+                seed.grow_and_reap()
+        assert "```" not in seed.code
+        with open(os.path.join(seed.seed_dir, "script.py")) as f:
+            assert f.read() == seed.code
+        assert seed.progress["validation"]["fixes"] == ["removed markdown fences"]
+
+
+class TestStages:
+    def test_failed_test_moves_to_rescue(self, seed):
+        seed.code = VALID_CODE
+        assert seed.advance("validate") == "test"
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(False, output="Error")):
+            with mock.patch.object(seed, "save_progress"):
+                assert seed.advance("test") == "rescue"
+        assert seed.progress["status"] == "Repairing"
+        assert seed.rescue_error == "Error"
+        assert seed.log_entry is None
+
+    def test_rescue_regenerates_then_revalidates(self, seed):
+        seed.code, seed.rescue_error = VALID_CODE, "Error"
+        with mock.patch.object(seed, "generate_code") as mock_generate:
+            assert seed.advance("rescue") == "validate"
+        mock_generate.assert_called_once_with(VALID_CODE, "Error")
+
+    def test_passing_test_settles_for_reaping(self, seed):
+        seed.code = VALID_CODE
+        seed.advance("validate")
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(True)):
+            with mock.patch.object(seed, "save_progress"):
+                assert seed.advance("test") == "reap"
+        assert "[Fruitful] [OK]" in seed.log_entry
+
+    def test_unknown_stage(self, seed):
+        with pytest.raises(ValueError):
+            seed.advance("harvest")
+
+
+class TestSpeculation:
+    @pytest.fixture
+    def racing(self, seed, monkeypatch):
+        """`seed` in speculative mode, with two candidates on different models."""
+        seed.speculative = {"candidates": 2, "models": ["m-a", "m-b"]}
+        monkeypatch.setattr(seed, "_save_code", lambda code: None)
+        monkeypatch.setattr("wheat.wheat_seed.rate_limit.seed_generation",
+                            lambda config: mock.Mock(acquire=lambda timeout=None: True))
+        seed.provider.generate.side_effect = lambda **kw: (
+            f"```python\n{VALID_CODE}# {kw['model']}\n```", {"prompt_tokens": 10, "completion_tokens": 5})
+        return seed
+
+    def test_winner_is_adopted(self, racing):
+        def run(path, **kwargs):
+            assert kwargs["cancel"] is not None
+            with open(path) as f:
+                return _execution("# m-b" in f.read())
+
+        with mock.patch("wheat.wheat_seed.run_seed_script", side_effect=run):
+            with mock.patch.object(racing, "save_progress"):
+                assert racing.advance("generate") == "reap"
+        assert racing.progress["status"] == "Fruitful"
+        assert "# m-b" in racing.code
+        with open(os.path.join(racing.seed_dir, "script.py")) as f:
+            assert f.read() == racing.code
+        report = racing.progress["speculation"][0]
+        assert report["winner"] == 1 and report["model"] == "m-b"
+        # The losing candidate may be cancelled before it generates
+        assert report["tokens"] == 15 * racing.provider.generate.call_count
+        assert "time_to_first_fruitful" in report
+        assert "m-b" in [c[1]["model"] for c in racing.provider.generate.call_args_list]
+
+    def test_no_winner_goes_to_rescue(self, racing):
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(False, output="Boom")):
+            with mock.patch.object(racing, "save_progress"):
+                assert racing.advance("generate") == "rescue"
+        assert racing.rescue_error == "Boom"
+        assert racing.progress["speculation"][0]["winner"] is None
+
+    def test_rescue_races_with_the_failure(self, racing):
+        racing.code, racing.rescue_error = "broken()", "NameError"
+        with mock.patch("wheat.wheat_seed.run_seed_script", return_value=_execution(True)):
+            with mock.patch.object(racing, "save_progress"):
+                assert racing.advance("rescue") == "reap"
+        prompt = racing.provider.generate.call_args[1]["prompt"]
+        assert "NameError" in prompt and "broken()" in prompt
+
+    def test_cancelled_candidate_counts_its_prompt(self, racing):
+        from wheat.cancel import CancelScope, Cancelled
+        racing.provider.generate.side_effect = Cancelled()
+        record = {"index": 0, "model": "m-a", "tokens": 0, "passed": False}
+        with pytest.raises(Cancelled):
+            racing._candidate("x" * 400, record, CancelScope())
+        assert record["tokens"] == 100 and record["tokens_estimated"]
+        racing.token_steward.water_used.assert_called_with(100, 0)
+
+    def test_nothing_generated_is_reaped_barren(self, racing):
+        racing.provider.generate.side_effect = RuntimeError("down")
+        with mock.patch.object(racing, "save_progress"):
+            assert racing.advance("generate") == "validate"
+            assert racing.advance("validate") == "reap"
+        assert racing.progress["status"] == "Barren"
 
 
 class TestIsAlive:
@@ -216,6 +379,15 @@ class TestFruitfulness:
         # No script.py exists
         assert seed.fruitfulness() is False
 
+    def test_uses_structured_execution_result(self, seed):
+        seed.task = "Build something"
+        script = os.path.join(seed.seed_dir, "script.py")
+        with open(script, "w") as f:
+            f.write("pass")
+        seed.progress["test_result"] = "OK"
+        seed.progress["execution"] = {"passed": False}
+        assert seed.fruitfulness() is False
+
     def test_barren_failed_tests(self, seed):
         seed.task = "Build something"
         script = os.path.join(seed.seed_dir, "script.py")
@@ -226,39 +398,24 @@ class TestFruitfulness:
 
 
 class TestSaveProgress:
-    def test_saves_to_db_and_file(self, seed, tmp_path):
-        with mock.patch("wheat.wheat_seed.sqlite3") as mock_sql:
-            mock_conn = mock.MagicMock()
-            mock_cursor = mock.MagicMock()
-            mock_cursor.rowcount = 1
-            mock_conn.cursor.return_value = mock_cursor
-            mock_sql.connect.return_value = mock_conn
-
-            seed.save_progress()
-
-            mock_cursor.execute.assert_called_once()
-            mock_conn.commit.assert_called_once()
-            mock_conn.close.assert_called_once()
+    def test_flushes_store_and_writes_file(self, seed, tmp_path):
+        seed.store = mock.MagicMock()
+        seed.save_progress()
+        seed.store.flush.assert_called_once()
 
-        # Check file written
         progress_file = os.path.join(seed.seed_dir, "progress.json")
         assert os.path.exists(progress_file)
         with open(progress_file) as f:
             data = json.load(f)
         assert data["task"] == "Build a widget"
 
-    def test_inserts_when_no_existing_row(self, seed, tmp_path):
-        with mock.patch("wheat.wheat_seed.sqlite3") as mock_sql:
-            mock_conn = mock.MagicMock()
-            mock_cursor = mock.MagicMock()
-            mock_cursor.rowcount = 0  # No existing row
-            max_row = mock.MagicMock()
-            max_row.__getitem__ = lambda s, i: 5
-            mock_cursor.execute.return_value.fetchone.return_value = max_row
-            mock_conn.cursor.return_value = mock_cursor
-            mock_sql.connect.return_value = mock_conn
-
-            seed.save_progress()
-
-            # Should have called execute twice (UPDATE then INSERT)
-            assert mock_cursor.execute.call_count == 3  # UPDATE + SELECT MAX + INSERT
+    def test_without_store_only_writes_file(self, seed):
+        seed.save_progress()
+        assert os.path.exists(os.path.join(seed.seed_dir, "progress.json"))
+
+    def test_generate_code_buffers_tokens_in_store(self, seed):
+        seed.store = mock.MagicMock()
+        seed.provider.generate.return_value = ("```python\nok()\n```", {"prompt_tokens": 7, "completion_tokens": 9})
+        seed.generate_code()
+        seed.store.add_tokens.assert_called_once_with(7, 9)
+        seed.store.flush.assert_called()
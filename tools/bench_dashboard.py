@@ -0,0 +1,145 @@
+#tools/bench_dashboard.py
+"""
+Benchmark main dashboard latency as the data grows.
+
+Builds a throwaway database, channels.json, briefings and intake
+directory at several scales and times GET / through the Flask test
+client, next to the per-field loop the dashboard used before
+wheat/dashboard_snapshot.py (get_latest_run + get_channels_for_field per
+field, each re-reading channels.json; every active case; full directory
+listings).
+
+Each scale multiplies the base size: fields, seeds per field, intake
+files, briefings and open cases. The snapshot's latency should stay
+roughly flat; the legacy loop grows with every axis.
+
+Usage:
+  python tools/bench_dashboard.py                     # scales 1 4 16
+  python tools/bench_dashboard.py --scales 1 8 32 --requests 30
+"""
+import argparse
+import json
+import os
+import sqlite3
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+import app as flask_app
+import wheat.escalation as esc
+from wheat import channels, dashboard_snapshot
+
+BASE = {"fields": 17, "seeds": 20, "intake": 200, "briefings": 30, "cases": 100}
+
+
+def build(root, scale):
+    """Populate `root` with scale x BASE of everything; returns the projects dict."""
+    sizes = {k: v * scale for k, v in BASE.items()}
+    projects = {f"field_{i:04d}": {"name": f"Field {i}"} for i in range(sizes["fields"])}
+    field_ids = list(projects)
+
+    db_path = os.path.join(root, "wheat.db")
+    flask_app.DB_PATH = esc.DB_PATH = db_path
+    flask_app.init_db()
+    esc.init_escalation_db()
+    conn = sqlite3.connect(db_path)
+    c = conn.cursor()
+    for pid in field_ids:
+        for _ in range(3):  # a few superseded runs per field
+            c.execute("INSERT INTO runs (timestamp, log, project_id) VALUES (?, '', ?)", (datetime.now().isoformat(), pid))
+        run_id = c.lastrowid
+        c.executemany(
+            "INSERT INTO seeds (run_id, seed_id, task, status, output, project_id) VALUES (?, ?, 'task', ?, '[]', ?)",
+            [(run_id, str(n), ("Fruitful", "Barren", "Growing")[n % 3], pid) for n in range(sizes["seeds"])],
+        )
+    now = datetime.now().isoformat()
+    c.executemany(
+        """INSERT INTO cases (field, entity, issue, severity, evidence, notes, created_at, updated_at,
+           stage_entered_at, escalation_deadline) VALUES (?, ?, 'issue', ?, ?, ?, ?, ?, ?, ?)""",
+        [(field_ids[n % len(field_ids)], f"Entity {n % (sizes['cases'] // 2 or 1)}", n % 5 + 1,
+          json.dumps([{"issue": "x" * 200}] * 5), "n" * 500, now, now, now, now)
+         for n in range(sizes["cases"])],
+    )
+    conn.commit()
+    conn.close()
+
+    channels_path = os.path.join(root, "channels.json")
+    with open(channels_path, "w") as f:
+        json.dump({f"ch_{i}": {"name": f"Channel {i}", "fields": field_ids[i::15] or ["all"]} for i in range(15)}, f)
+    channels.CHANNELS_PATH = channels_path
+
+    briefings = os.path.join(root, "briefings")
+    os.makedirs(briefings)
+    for n in range(sizes["briefings"]):
+        with open(os.path.join(briefings, f"briefing_{n:05d}.txt"), "w") as f:
+            f.write("briefing\n" * 50)
+    intake = os.path.join(root, "intake")
+    os.makedirs(intake)
+    today = date.today().strftime("%Y%m%d")
+    for n in range(sizes["intake"]):
+        day = today if n % 4 == 0 else "20200101"
+        with open(os.path.join(intake, f"report_{day}_{n:06d}.json"), "w") as f:
+            f.write("{}")
+
+    flask_app.BRIEFINGS_DIR, flask_app.INTAKE_DIR = briefings, intake
+    flask_app.load_projects = lambda: projects
+    dashboard_snapshot.clear_cache()
+    return projects
+
+
+def legacy_dashboard(projects):
+    """The pre-snapshot dashboard's reads, kept here for comparison."""
+    for pid in projects:
+        _, status = flask_app.get_latest_run(pid)
+        seeds = status["seeds"] if status else {}
+        sum(1 for s in seeds.values() if s["status"] == "Fruitful")
+        with open(channels.CHANNELS_PATH) as f:  # re-parsed per field, as before the config registry
+            [c for c in json.load(f).values() if pid in c.get("fields", []) or "all" in c.get("fields", [])]
+    esc.get_all_cases()
+    esc.get_escalation_ready()
+    esc.get_cross_field_entities()
+    names = sorted((f for f in os.listdir(flask_app.BRIEFINGS_DIR) if f.endswith(".txt")), reverse=True)
+    with open(os.path.join(flask_app.BRIEFINGS_DIR, names[0])) as f:
+        f.read()
+    today = date.today().strftime("%Y%m%d")
+    sum(1 for f in os.listdir(flask_app.INTAKE_DIR) if f.startswith("report_") and today in f)
+
+
+def time_ms(fn, requests):
+    fn()  # warm caches and the page cache
+    samples = []
+    for _ in range(requests):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Dashboard latency vs data size")
+    parser.add_argument("--scales", type=int, nargs="+", default=[1, 4, 16])
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    flask_app.app.config["TESTING"] = True
+    client = flask_app.app.test_client()
+
+    def page():
+        assert client.get("/").status_code == 200
+
+    print(f"{'scale':>5} {'fields':>7} {'seeds':>8} {'cases':>7} {'intake':>7} {'GET / ms':>9} {'legacy ms':>10}")
+    for scale in args.scales:
+        with tempfile.TemporaryDirectory() as root:
+            projects = build(root, scale)
+            snap = time_ms(page, args.requests)
+            legacy = time_ms(lambda: legacy_dashboard(projects), args.requests)
+            print(f"{scale:>5} {len(projects):>7} {len(projects) * BASE['seeds'] * scale:>8} "
+                  f"{BASE['cases'] * scale:>7} {BASE['intake'] * scale:>7} {snap:>9.1f} {legacy:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
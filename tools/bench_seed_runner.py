@@ -0,0 +1,139 @@
+#tools/bench_seed_runner.py
+"""
+Benchmark seed evaluation throughput.
+
+Compares three ways of evaluating the same generated seed scripts:
+
+  legacy — the original grow_and_reap: `python -m unittest script.py`
+           followed by `python script.py` (two interpreters per seed)
+  cold   — wheat/seed_runner.py with a fresh harness interpreter per seed
+  warm   — wheat/seed_runner.py with the pre-forked WarmPool
+
+Every mode runs the seeds through a thread pool of SEED_WORKERS (one per
+core), the way tend_field evaluates a batch of seeds.
+
+Usage:
+  python tools/bench_seed_runner.py                # 48 seeds, all modes
+  python tools/bench_seed_runner.py --seeds 200 --modes cold warm
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.realpath(__file__)), ".."))
+
+from wheat.seed_runner import SEED_WORKERS, run_seed_script, warm_pool
+
+# A typical seed: a small helper plus a TestCase with a few methods
+SEED_TEMPLATE = '''"""Normalize and validate dealer complaint records (seed {n})."""
+import json
+import re
+import unittest
+
+PHONE = re.compile(r"\\D")
+
+
+def normalize(record):
+    record = dict(record)
+    record["phone"] = PHONE.sub("", record.get("phone", ""))
+    record["entity"] = record.get("entity", "").strip().title()
+    return record
+
+
+class TestNormalize(unittest.TestCase):
+    def test_phone(self):
+        self.assertEqual(normalize({{"phone": "(303) 555-0{n:03d}"}})["phone"], "3035550{n:03d}")
+
+    def test_entity(self):
+        self.assertEqual(normalize({{"entity": "  bad motors "}})["entity"], "Bad Motors")
+
+    def test_roundtrip(self):
+        self.assertEqual(json.loads(json.dumps(normalize({{}})))["phone"], "")
+
+
+if __name__ == "__main__":
+    unittest.main()
+'''
+
+
+def write_seeds(directory, count):
+    paths = []
+    for n in range(count):
+        seed_dir = os.path.join(directory, f"seed_{n}")
+        os.makedirs(seed_dir)
+        path = os.path.join(seed_dir, "script.py")
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(SEED_TEMPLATE.format(n=n))
+        paths.append(path)
+    return paths
+
+
+def evaluate_legacy(path):
+    # `-m unittest <path>` only imports paths under the cwd, as in the app
+    cwd, name = os.path.split(path)
+    test_result = subprocess.run([sys.executable, "-m", "unittest", name], capture_output=True, text=True, cwd=cwd)
+    subprocess.run([sys.executable, name], capture_output=True, text=True, cwd=cwd)
+    return "OK" in (test_result.stdout or test_result.stderr)
+
+
+def evaluate_cold(path):
+    return run_seed_script(path, warm=False)["passed"]
+
+
+def evaluate_warm(path):
+    return run_seed_script(path, warm=True)["passed"]
+
+
+MODES = {"legacy": evaluate_legacy, "cold": evaluate_cold, "warm": evaluate_warm}
+
+
+def bench(mode, paths, workers):
+    evaluate = MODES[mode]
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        passed = sum(executor.map(evaluate, paths))
+    seconds = time.perf_counter() - start
+    return {
+        "mode": mode,
+        "seeds": len(paths),
+        "passed": passed,
+        "seconds": seconds,
+        "per_minute": len(paths) / seconds * 60,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark seed evaluation throughput")
+    parser.add_argument("--seeds", type=int, default=48, help="Seeds per mode (default 48)")
+    parser.add_argument("--workers", type=int, default=SEED_WORKERS, help=f"Concurrent evaluations (default {SEED_WORKERS})")
+    parser.add_argument("--modes", nargs="+", choices=list(MODES), default=list(MODES))
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="seed_bench_") as directory:
+        paths = write_seeds(directory, args.seeds)
+        if "warm" in args.modes:
+            start = time.perf_counter()
+            warm_pool()
+            run_seed_script(paths[0], warm=True)  # first request waits for the servers' imports
+            print(f"Warm pool startup: {time.perf_counter() - start:.2f}s ({SEED_WORKERS} servers, paid once)")
+
+        print(f"{'mode':<8} {'seeds':>6} {'passed':>7} {'seconds':>8} {'seeds/min':>10}")
+        results = []
+        for mode in args.modes:
+            r = bench(mode, paths, args.workers)
+            results.append(r)
+            print(f"{r['mode']:<8} {r['seeds']:>6} {r['passed']:>7} {r['seconds']:>8.2f} {r['per_minute']:>10.0f}")
+
+    baseline = next((r for r in results if r["mode"] == "legacy"), None)
+    if baseline:
+        for r in results:
+            if r is not baseline:
+                print(f"{r['mode']}: {r['per_minute'] / baseline['per_minute']:.1f}x legacy throughput")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+#tools/load_test.py
+"""
+Load-test a running dashboard: request throughput and SSE fan-out.
+
+Start the server first (`python serve.py`, or `python app.py` for the
+development server), then:
+
+  python tools/load_test.py                                  # localhost:5001
+  python tools/load_test.py --concurrency 32 --seconds 20
+  python tools/load_test.py --sse-clients 500 --sse-hold 30
+
+Phases:
+  1. throughput — `--concurrency` workers hit each endpoint for
+     `--seconds`; reports requests/s and p50/p95 latency per endpoint
+  2. fan-out    — opens `--sse-clients` field-page streams
+     (/projects/<project>/stream), reports how many connected and their
+     time to first event, then repeats the throughput probe while all of
+     them are held open, so you can see whether open streams starve
+     ordinary requests
+
+Standard library only; every client is a thread on this side.
+"""
+import argparse
+import http.client
+import json
+import os
+import statistics
+import sys
+import threading
+import time
+from urllib.parse import urlparse
+
+PROJECT_ROOT = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..")
+DEFAULT_ENDPOINTS = ["/api/escalation", "/escalation", "/api/briefing", "/api/daily-cycle/status"]
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))]
+
+
+def _default_project():
+    try:
+        with open(os.path.join(PROJECT_ROOT, "projects.json"), "r", encoding="utf-8") as f:
+            return next(iter(json.load(f)), "default")
+    except (OSError, ValueError):
+        return "default"
+
+
+def _get(host, port, path, timeout):
+    conn = http.client.HTTPConnection(host, port, timeout=timeout)
+    try:
+        conn.request("GET", path)
+        response = conn.getresponse()
+        response.read()
+        return response.status
+    finally:
+        conn.close()
+
+
+def throughput(host, port, path, concurrency, seconds, timeout=30):
+    """Hammer one endpoint; returns {path, requests, errors, rps, p50_ms, p95_ms}."""
+    latencies = []
+    errors = [0]
+    lock = threading.Lock()
+    deadline = time.monotonic() + seconds
+
+    def worker():
+        while time.monotonic() < deadline:
+            start = time.perf_counter()
+            try:
+                ok = _get(host, port, path, timeout) < 500
+            except OSError:
+                ok = False
+            elapsed = time.perf_counter() - start
+            with lock:
+                if ok:
+                    latencies.append(elapsed)
+                else:
+                    errors[0] += 1
+
+    start = time.monotonic()
+    workers = [threading.Thread(target=worker, daemon=True) for _ in range(concurrency)]
+    for w in workers:
+        w.start()
+    for w in workers:
+        w.join()
+    wall = time.monotonic() - start
+    return {
+        "path": path,
+        "requests": len(latencies),
+        "errors": errors[0],
+        "rps": len(latencies) / wall if wall else 0.0,
+        "p50_ms": _percentile(latencies, 50) * 1000,
+        "p95_ms": _percentile(latencies, 95) * 1000,
+    }
+
+
+class SSEClient(threading.Thread):
+    """Holds one stream open, recording time to first event and events seen."""
+
+    def __init__(self, host, port, path, hold, timeout):
+        super().__init__(daemon=True)
+        self.host, self.port, self.path = host, port, path
+        self.hold, self.timeout = hold, timeout
+        self.first_event = None
+        self.events = 0
+        self.error = None
+
+    def run(self):
+        start = time.perf_counter()
+        conn = http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+        try:
+            conn.request("GET", self.path, headers={"Accept": "text/event-stream"})
+            response = conn.getresponse()
+            if response.status != 200:
+                self.error = f"HTTP {response.status}"
+                return
+            deadline = time.monotonic() + self.hold
+            while time.monotonic() < deadline:
+                line = response.fp.readline()
+                if not line:
+                    break
+                if line in (b"\n", b"\r\n"):
+                    self.events += 1
+                    if self.first_event is None:
+                        self.first_event = time.perf_counter() - start
+        except OSError as e:
+            if self.first_event is None:
+                self.error = type(e).__name__
+        finally:
+            conn.close()
+
+
+def fan_out(host, port, path, clients, hold, timeout):
+    streams = [SSEClient(host, port, path, hold, timeout) for _ in range(clients)]
+    for s in streams:
+        s.start()
+    return streams
+
+
+def _print_throughput(results):
+    print(f"  {'endpoint':<28} {'requests':>9} {'errors':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8}")
+    for r in results:
+        print(f"  {r['path']:<28} {r['requests']:>9} {r['errors']:>7} {r['rps']:>8.1f} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test the dashboard server")
+    parser.add_argument("--url", default="http://127.0.0.1:5001")
+    parser.add_argument("--endpoints", nargs="+", default=DEFAULT_ENDPOINTS)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    parser.add_argument("--sse-clients", type=int, default=200, help="Streams to hold open (0 skips fan-out)")
+    parser.add_argument("--sse-hold", type=float, default=20, help="Seconds to hold the streams")
+    parser.add_argument("--project", default=_default_project(), help="Field whose stream to open")
+    args = parser.parse_args()
+
+    url = urlparse(args.url)
+    host, port = url.hostname, url.port or 80
+    try:
+        _get(host, port, "/api/daily-cycle/status", timeout=5)
+    except OSError as e:
+        sys.exit(f"Cannot reach {args.url}: {e}. Start the server with `python serve.py` first.")
+
+    print(f"Throughput: {args.concurrency} workers x {args.seconds:.0f}s per endpoint")
+    _print_throughput([throughput(host, port, p, args.concurrency, args.seconds) for p in args.endpoints])
+
+    if args.sse_clients <= 0:
+        return
+    path = f"/projects/{args.project}/stream"
+    print(f"\nFan-out: {args.sse_clients} clients on {path}, held {args.sse_hold:.0f}s")
+    streams = fan_out(host, port, path, args.sse_clients, args.sse_hold, timeout=args.sse_hold + 30)
+    time.sleep(min(5, args.sse_hold / 4))
+    probe_seconds = max(1.0, min(args.seconds, args.sse_hold / 2))
+    print(f"Throughput while streams are open ({probe_seconds:.0f}s):")
+    _print_throughput([throughput(host, port, p, args.concurrency, probe_seconds) for p in args.endpoints[:1]])
+    for s in streams:
+        s.join(args.sse_hold + 60)
+
+    connected = [s for s in streams if s.first_event is not None]
+    failed = [s for s in streams if s.error]
+    firsts = [s.first_event for s in connected]
+    print(f"  connected {len(connected)}/{len(streams)}, failed {len(failed)}"
+          + (f" ({failed[0].error})" if failed else ""))
+    if firsts:
+        print(f"  first event p50 {_percentile(firsts, 50) * 1000:.0f} ms, p95 {_percentile(firsts, 95) * 1000:.0f} ms; "
+              f"{statistics.mean(s.events for s in connected):.1f} events per client")
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,7 @@ import os
 from datetime import date, datetime
 
 from wheat.providers import get_provider, ClaudeCodeProvider
+from wheat.instrumentation import ANALYST_RUNS
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 
@@ -216,10 +217,12 @@ def correlate_scans(scan_results, existing_cases=None, config=None):
             for alert in alerts:
                 print(f"    !! {alert}")
 
+        ANALYST_RUNS.inc(kind="correlation", outcome="parse_error" if analysis.get("parse_error") else "ok")
         return analysis, text
 
     except Exception as e:
         print(f"  Analyst: ERROR in correlation — {e}")
+        ANALYST_RUNS.inc(kind="correlation", outcome="error")
         return {"field_intake": {}, "analyst_notes": f"Correlation failed: {e}"}, ""
 
 
@@ -265,6 +268,40 @@ def build_field_guidance(field_id, analysis):
     return "\n".join(lines)
 
 
+STREAM_SIGNALS_PER_FIELD = 20  # Cap on raw signals passed to a field in streaming mode
+
+
+def build_signal_guidance(field_id, scan_results):
+    """
+    Guidance for a field built straight from raw scan signals.
+
+    Used in streaming mode (daily_runner.py --stream), where a field starts
+    as soon as the channels feeding it have been scanned, before the
+    analyst has correlated everything. scan_results holds only the
+    channels routed to this field.
+    """
+    lines = []
+    for cid, result in scan_results.items():
+        if not result or not isinstance(result.get("signals"), list):
+            continue
+        for sig in result["signals"]:
+            if isinstance(sig, dict) and sig.get("parse_error"):
+                continue
+            if len(lines) >= STREAM_SIGNALS_PER_FIELD:
+                break
+            text = json.dumps(sig, ensure_ascii=False) if isinstance(sig, dict) else str(sig)
+            lines.append(f"- [{result.get('channel_name', cid)}] {text[:300]}")
+
+    if not lines:
+        return "Daily scan — no new signals detected for this field today. Review existing cases for escalation readiness."
+
+    return "\n".join(
+        [f"Raw scan signals routed to this field ({len(lines)} shown, not yet correlated):\n"]
+        + lines
+        + ["", "Verify each signal against the applicable law before acting — these have not been deduplicated."]
+    )
+
+
 # ---------------------------------------------------------------------------
 # Phase 4: Briefing Synthesis — Opus writes the actual intelligence narrative
 # ---------------------------------------------------------------------------
@@ -466,10 +503,12 @@ def synthesize_briefing(
         print(f"\n  Briefing saved to: {briefing_file}")
         print(f"  JSON saved to: {json_file}")
 
+        ANALYST_RUNS.inc(kind="briefing", outcome="ok")
         return briefing_text, briefing_file
 
     except Exception as e:
         print(f"  Analyst: ERROR writing briefing — {e}")
+        ANALYST_RUNS.inc(kind="briefing", outcome="error")
         # Fall back to mechanical briefing
         fallback = f"# BRIEFING — {run_date}\n\nAnalyst synthesis failed: {e}\n\n"
         fallback += field_results_text
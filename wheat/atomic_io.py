@@ -0,0 +1,170 @@
+"""
+Atomic I/O — Whole-file JSON writes that readers never see half-done.
+
+  - atomic_write_json() writes a temp file beside the target, fsyncs it,
+    and os.replace()s it over the target, so the path always holds
+    either the old or the new document
+  - locked(path) takes an advisory lock on path + ".lock" (flock, plus a
+    per-path thread lock); the sidecar is used because the target's
+    inode changes on every replace
+  - update_json() is the read-modify-write under that lock, so
+    concurrent updaters apply one after another
+  - coalesced(path) batches high-frequency updates: they queue in memory
+    and are applied in order by one update_json() at most every
+    `interval` seconds; flush=True or interpreter exit writes at once
+
+Platforms without fcntl fall back to the in-process lock only.
+"""
+
+import atexit
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+_locks = {}
+_locks_guard = threading.Lock()
+
+
+def _thread_lock(path):
+    with _locks_guard:
+        return _locks.setdefault(os.path.abspath(path), threading.Lock())
+
+
+@contextmanager
+def locked(path):
+    """Exclusive advisory lock on `path` across threads and processes."""
+    with _thread_lock(path):
+        if fcntl is None:
+            yield
+            return
+        with open(f"{path}.lock", "a") as lock_file:
+            fcntl.flock(lock_file.fileno(), fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file.fileno(), fcntl.LOCK_UN)
+
+
+def _fsync_dir(directory):
+    try:
+        fd = os.open(directory, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def atomic_write_json(path, data, indent=2, trailing_newline=False):
+    """Replace `path` with `data` as JSON in one step: temp file, fsync, rename."""
+    directory = os.path.dirname(os.path.abspath(path))
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    try:
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=indent)
+            if trailing_newline:
+                f.write("\n")
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+    _fsync_dir(directory)
+
+
+def read_json(path):
+    """Parsed contents of `path`, or None if it is missing or not valid JSON."""
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def update_json(path, update, indent=2, trailing_newline=False):
+    """
+    Under the lock: read `path` ({} if missing or unreadable), write
+    update(current) atomically and return it.
+    """
+    with locked(path):
+        current = read_json(path)
+        value = update(current if current is not None else {})
+        atomic_write_json(path, value, indent=indent, trailing_newline=trailing_newline)
+        return value
+
+
+class CoalescedJson:
+    """Queue update functions for one file; apply them in batches, at most once per interval."""
+
+    def __init__(self, path, interval=1.0, indent=2, trailing_newline=False):
+        self.path = path
+        self.interval = interval
+        self.indent = indent
+        self.trailing_newline = trailing_newline
+        self.writes = 0
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()  # batches are written in the order they were taken
+        self._timer = None
+        self._last_write = 0.0
+
+    def submit(self, update, flush=False):
+        """Queue update(current) -> new; written now if flush or the interval has passed."""
+        with self._lock:
+            self._pending.append(update)
+            wait = self._last_write + self.interval - time.monotonic()
+            if not flush and wait > 0:
+                if self._timer is None:
+                    self._timer = threading.Timer(wait, self.flush)
+                    self._timer.daemon = True
+                    self._timer.start()
+                return
+        self.flush()
+
+    def flush(self):
+        """Apply every queued update in order with a single write."""
+        with self._flush_lock:
+            with self._lock:
+                pending, self._pending = self._pending, []
+                if self._timer is not None:
+                    self._timer.cancel()
+                    self._timer = None
+                if not pending:
+                    return
+                self._last_write = time.monotonic()
+
+            def apply(current):
+                for update in pending:
+                    current = update(current)
+                return current
+
+            update_json(self.path, apply, indent=self.indent, trailing_newline=self.trailing_newline)
+            self.writes += 1
+
+
+_coalesced = {}
+
+
+def coalesced(path, interval=1.0, **write_options):
+    """The shared CoalescedJson for `path` (created on first use, flushed at exit)."""
+    with _locks_guard:
+        writer = _coalesced.get(path)
+        if writer is None:
+            writer = _coalesced[path] = CoalescedJson(path, interval, **write_options)
+            atexit.register(writer.flush)
+        return writer
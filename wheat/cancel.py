@@ -0,0 +1,99 @@
+"""
+Cancel — Stop a group of in-flight LLM calls and seed runs from another thread.
+
+A CancelScope is shared by the work that should stop together, such as
+the candidates of a speculative race (wheat/speculation.py):
+
+  - subprocesses started under it (CancelScope.run, and run_seed_script's
+    cold path) are registered while they run; cancel() kills each one's
+    process group, so the `claude` CLI or the seed harness and anything
+    it spawned go at once
+  - a process registered after cancel() is killed on registration
+  - check() raises Cancelled between steps, and wait() is a sleep that
+    ends early on cancel, for retry backoffs
+
+Callers treat Cancelled as "no result", not as a failure to retry.
+"""
+
+import os
+import signal
+import subprocess
+import threading
+
+
+class Cancelled(Exception):
+    """The work's CancelScope was cancelled."""
+
+
+def kill_process_group(proc):
+    """Kill `proc` and anything it spawned (its process group where there is one)."""
+    try:
+        if hasattr(os, "killpg"):
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            proc.kill()
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+class CancelScope:
+    """Cancellation shared by a group of calls; cancel() is idempotent and thread-safe."""
+
+    def __init__(self):
+        self._event = threading.Event()
+        self._lock = threading.Lock()
+        self._procs = set()
+
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+
+    def cancel(self):
+        """Cancel the scope and kill every process registered with it."""
+        with self._lock:
+            self._event.set()
+            procs = list(self._procs)
+        for proc in procs:
+            kill_process_group(proc)
+
+    def register(self, proc):
+        """Kill `proc` on cancel (right away if the scope is already cancelled)."""
+        with self._lock:
+            if not self._event.is_set():
+                self._procs.add(proc)
+                return
+        kill_process_group(proc)
+
+    def unregister(self, proc):
+        with self._lock:
+            self._procs.discard(proc)
+
+    def check(self):
+        """Raise Cancelled if the scope has been cancelled."""
+        if self._event.is_set():
+            raise Cancelled()
+
+    def wait(self, timeout):
+        """Sleep up to `timeout` seconds; True if cancelled meanwhile."""
+        return self._event.wait(timeout)
+
+    def run(self, cmd, timeout=None, **kwargs):
+        """
+        subprocess.run(cmd, capture_output=True, text=True, timeout=timeout)
+        in a new session that cancel() can kill; raises Cancelled if it was.
+        """
+        self.check()
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True,
+                                start_new_session=True, **kwargs)
+        self.register(proc)
+        try:
+            try:
+                stdout, stderr = proc.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                kill_process_group(proc)
+                proc.communicate()
+                raise subprocess.TimeoutExpired(cmd, timeout)
+        finally:
+            self.unregister(proc)
+        self.check()
+        return subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
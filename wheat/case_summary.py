@@ -0,0 +1,128 @@
+"""
+Case Summary — Trigger-maintained aggregates behind the escalation dashboard.
+
+SQLite triggers on cases keep these small tables current in the writer's
+own transaction, whether that is create_case, escalate_case,
+resolve_case or a manual UPDATE:
+
+  case_stage_counts   — stage -> active, total
+  case_field_counts   — field -> active, total
+  case_entity_fields  — (entity, field) -> active cases, their max severity
+  case_entities       — entity -> active field count, fields, max severity;
+                        rows with field_count > 1 are the cross-field list
+  case_summary        — 'version', bumped by any change to cases
+
+Stage and field counts move by +1/-1 deltas; an (entity, field) pair is
+recounted from the cases index when one of its cases changes. The
+version makes a cheap ETag. create_summary_tables() backfills a database
+that already has cases.
+"""
+
+
+def _refresh_pair(ref):
+    """Trigger statements recounting the (entity, field) pair of ref (NEW/OLD)."""
+    return f"""
+        INSERT OR IGNORE INTO case_entity_fields (entity, field, active) VALUES ({ref}.entity, {ref}.field, 0);
+        UPDATE case_entity_fields SET
+            active = (SELECT COUNT(*) FROM cases
+                      WHERE entity = {ref}.entity AND field = {ref}.field AND resolved_at IS NULL),
+            max_severity = (SELECT MAX(severity) FROM cases
+                            WHERE entity = {ref}.entity AND field = {ref}.field AND resolved_at IS NULL)
+        WHERE entity = {ref}.entity AND field = {ref}.field;
+        DELETE FROM case_entity_fields WHERE entity = {ref}.entity AND field = {ref}.field AND active = 0;
+        INSERT OR REPLACE INTO case_entities (entity, field_count, fields, max_severity)
+            SELECT {ref}.entity, COUNT(*), GROUP_CONCAT(field), MAX(max_severity)
+            FROM case_entity_fields WHERE entity = {ref}.entity;
+        DELETE FROM case_entities WHERE entity = {ref}.entity AND field_count = 0;"""
+
+
+def _add_counts(ref, sign):
+    """Trigger statements adding (sign=1) or removing (sign=-1) one case's counts."""
+    return "".join(f"""
+        INSERT INTO case_{table}_counts ({column}, active, total)
+            VALUES ({ref}.{column}, {sign} * ({ref}.resolved_at IS NULL), {sign})
+            ON CONFLICT({column}) DO UPDATE SET
+                active = active + excluded.active, total = total + excluded.total;"""
+        for table, column in (("stage", "stage"), ("field", "field")))
+
+
+_BUMP = "UPDATE case_summary SET value = value + 1 WHERE key = 'version';"
+
+_TRIGGERS = {
+    "trg_cases_summary_insert": f"AFTER INSERT ON cases BEGIN {_add_counts('NEW', 1)} {_refresh_pair('NEW')} {_BUMP} END",
+    "trg_cases_summary_update": (
+        "AFTER UPDATE OF stage, resolved_at, field, entity, severity ON cases BEGIN"
+        f" {_add_counts('OLD', -1)} {_add_counts('NEW', 1)} {_refresh_pair('OLD')} {_refresh_pair('NEW')} END"
+    ),
+    "trg_cases_summary_delete": f"AFTER DELETE ON cases BEGIN {_add_counts('OLD', -1)} {_refresh_pair('OLD')} {_BUMP} END",
+    # Any column change (evidence, notes, deadlines) alters what the dashboard shows
+    "trg_cases_summary_version_update": f"AFTER UPDATE ON cases BEGIN {_BUMP} END",
+}
+
+
+def create_summary_tables(cursor):
+    """Create the summary tables and triggers if missing, backfilling once (cheap to call repeatedly)."""
+    cursor.execute("CREATE TABLE IF NOT EXISTS case_summary (key TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+    cursor.execute("""CREATE TABLE IF NOT EXISTS case_stage_counts (
+        stage TEXT PRIMARY KEY, active INTEGER NOT NULL DEFAULT 0, total INTEGER NOT NULL DEFAULT 0
+    )""")
+    cursor.execute("""CREATE TABLE IF NOT EXISTS case_field_counts (
+        field TEXT PRIMARY KEY, active INTEGER NOT NULL DEFAULT 0, total INTEGER NOT NULL DEFAULT 0
+    )""")
+    cursor.execute("""CREATE TABLE IF NOT EXISTS case_entity_fields (
+        entity TEXT NOT NULL, field TEXT NOT NULL, active INTEGER NOT NULL DEFAULT 0, max_severity INTEGER,
+        PRIMARY KEY (entity, field)
+    )""")
+    cursor.execute("""CREATE TABLE IF NOT EXISTS case_entities (
+        entity TEXT PRIMARY KEY, field_count INTEGER NOT NULL, fields TEXT, max_severity INTEGER
+    )""")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_case_entities_count ON case_entities(field_count, max_severity)")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_cases_entity_field ON cases(entity, field)")
+    for name, body in _TRIGGERS.items():
+        cursor.execute(f"CREATE TRIGGER IF NOT EXISTS {name} {body}")
+
+    cursor.execute("INSERT OR IGNORE INTO case_summary (key, value) VALUES ('version', 1)")
+    if cursor.rowcount:
+        rebuild(cursor)
+
+
+def rebuild(cursor):
+    """Recompute every summary table from cases (backfill, or repair after bulk edits)."""
+    for table in ("case_stage_counts", "case_field_counts", "case_entity_fields", "case_entities"):
+        cursor.execute(f"DELETE FROM {table}")
+    for table, column in (("stage", "stage"), ("field", "field")):
+        cursor.execute(f"""INSERT INTO case_{table}_counts ({column}, active, total)
+            SELECT {column}, SUM(resolved_at IS NULL), COUNT(*) FROM cases GROUP BY {column}""")
+    cursor.execute("""INSERT INTO case_entity_fields (entity, field, active, max_severity)
+        SELECT entity, field, COUNT(*), MAX(severity) FROM cases
+        WHERE resolved_at IS NULL GROUP BY entity, field""")
+    cursor.execute("""INSERT INTO case_entities (entity, field_count, fields, max_severity)
+        SELECT entity, COUNT(*), GROUP_CONCAT(field), MAX(max_severity)
+        FROM case_entity_fields GROUP BY entity""")
+    cursor.execute("UPDATE case_summary SET value = value + 1 WHERE key = 'version'")
+
+
+def summary_version(cursor):
+    """Counter that changes whenever any case does."""
+    cursor.execute("SELECT value FROM case_summary WHERE key = 'version'")
+    row = cursor.fetchone()
+    return row[0] if row else 0
+
+
+def stage_counts(cursor, active_only=True):
+    """{stage: count} for the stages that have cases."""
+    cursor.execute(f"SELECT stage, {'active' if active_only else 'total'} FROM case_stage_counts")
+    return dict(cursor.fetchall())
+
+
+def field_counts(cursor):
+    """[(field, total, active)] for fields that have cases, most active first."""
+    cursor.execute("SELECT field, total, active FROM case_field_counts WHERE total > 0 ORDER BY active DESC")
+    return cursor.fetchall()
+
+
+def cross_field_entities(cursor):
+    """[(entity, fields csv, field_count, max_severity)] for entities open in more than one field."""
+    cursor.execute("""SELECT entity, fields, field_count, max_severity FROM case_entities
+        WHERE field_count > 1 ORDER BY field_count DESC, max_severity DESC""")
+    return cursor.fetchall()
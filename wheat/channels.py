@@ -28,7 +28,10 @@ import json
 import os
 from datetime import datetime
 
+from wheat import config_registry
+from wheat.atomic_io import atomic_write_json, locked
 from wheat.escalation import create_case, init_escalation_db
+from wheat.routing import RoutingIndex, route_category
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 CHANNELS_PATH = os.path.join(PROJECT_ROOT, "channels.json")
@@ -36,16 +39,14 @@ INTAKE_DIR = os.path.join(PROJECT_ROOT, "intake")
 
 
 def load_channels():
-    """Load channel definitions."""
-    if not os.path.exists(CHANNELS_PATH):
-        return get_default_channels()
-    with open(CHANNELS_PATH, "r") as f:
-        return json.load(f)
+    """Load channel definitions (a read-only snapshot; see wheat/config_registry.py)."""
+    return config_registry.load_json(CHANNELS_PATH, default=get_default_channels)
 
 
 def save_channels(channels):
-    with open(CHANNELS_PATH, "w") as f:
-        json.dump(channels, f, indent=2)
+    with locked(CHANNELS_PATH):
+        atomic_write_json(CHANNELS_PATH, channels)
+    config_registry.invalidate(CHANNELS_PATH)
 
 
 def get_default_channels():
@@ -227,25 +228,20 @@ def get_default_channels():
     }
 
 
+def routing_index():
+    """The RoutingIndex (wheat/routing.py) for the current channels.json and projects.json."""
+    from wheat.paths import load_projects
+    return config_registry.derived("routing", (load_channels(), load_projects()), RoutingIndex)
+
+
 def get_channels_for_field(field_id):
     """Get all channels that feed into a specific field."""
-    channels = load_channels()
-    return {
-        cid: cdata for cid, cdata in channels.items()
-        if field_id in cdata.get("fields", []) or "all" in cdata.get("fields", [])
-    }
+    return routing_index().channels_for_field(field_id)
 
 
 def get_fields_for_channel(channel_id):
     """Get all fields that a channel feeds into."""
-    channels = load_channels()
-    channel = channels.get(channel_id)
-    if not channel:
-        return []
-    if "all" in channel.get("fields", []):
-        from wheat.paths import load_projects
-        return list(load_projects().keys())
-    return channel.get("fields", [])
+    return routing_index().fields_for_channel(channel_id)
 
 
 def process_intake(report_data):
@@ -261,27 +257,7 @@ def process_intake(report_data):
         json.dump(report_data, f, indent=2)
 
     # Route to field based on category
-    category_to_field = {
-        "dangerous_driving": "fleet_compliance",
-        "commercial_vehicle": "fleet_compliance",
-        "tow_company": "tow_companies",
-        "used_car_dealer": "used_car_dealers",
-        "auto_repair": "auto_repair",
-        "noise_exhaust": "exhaust_noise",
-        "school_zone": "school_zone_safety",
-        "pedestrian_cyclist": "pedestrian_cyclist",
-        "parking_booting": "parking_booting",
-        "window_tint": "window_tint",
-        "registration_plates": "title_registration",
-        "emissions": "emissions_environmental",
-        "intersection_road": "road_intersection_safety",
-        "insurance": "auto_insurance",
-        "dealer_financing": "dealer_financing",
-        "rideshare_delivery": "rideshare_delivery",
-    }
-
-    category = report_data.get("category", "")
-    target_field = category_to_field.get(category, "fleet_compliance")
+    target_field = route_category(report_data.get("category", ""))
 
     print(f"  Intake received: {report_data.get('description', 'No description')[:80]}")
     print(f"  Routed to field: {target_field}")
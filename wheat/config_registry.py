@@ -0,0 +1,128 @@
+"""
+Config Registry — Parse each JSON config file once per change, share read-only snapshots.
+
+load_config, load_projects, load_project_config and load_channels go
+through load_json(path):
+
+  - a file is parsed once and kept until its (mtime, size, inode) stamp
+    changes; every call costs one stat(). Writers in this process
+    invalidate() the path after saving
+  - the parsed value is frozen (FrozenDict / FrozenList read and
+    json.dump like the originals but refuse mutation); thaw() gives a
+    private, editable copy
+  - derived(name, inputs, build) memoises an index computed from
+    snapshots, rebuilt only when one of its inputs is replaced
+
+A reload swaps in a new snapshot; anyone holding the old one keeps a
+consistent view.
+"""
+
+import json
+import os
+import threading
+
+_lock = threading.Lock()
+_files = {}     # path -> (stamp, frozen value)
+_derived = {}   # name -> (inputs, value)
+
+
+def _read_only(self, *args, **kwargs):
+    raise TypeError(f"{type(self).__name__} is a shared config snapshot; thaw() it to get an editable copy")
+
+
+class FrozenDict(dict):
+    """A dict that refuses mutation."""
+    __setitem__ = __delitem__ = clear = pop = popitem = setdefault = update = __ior__ = _read_only
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return dict, (dict(self),)
+
+
+class FrozenList(list):
+    """A list that refuses mutation."""
+    __setitem__ = __delitem__ = append = extend = insert = pop = remove = clear = sort = reverse = _read_only
+    __iadd__ = __imul__ = _read_only
+
+    def __copy__(self):
+        return list(self)
+
+    def __deepcopy__(self, memo):
+        return thaw(self)
+
+    def __reduce__(self):
+        return list, (list(self),)
+
+
+def freeze(value):
+    """Deep read-only copy of parsed JSON."""
+    if isinstance(value, dict):
+        return FrozenDict((k, freeze(v)) for k, v in value.items())
+    if isinstance(value, list):
+        return FrozenList(freeze(v) for v in value)
+    return value
+
+
+def thaw(value):
+    """Deep mutable copy of a snapshot (plain dicts and lists)."""
+    if isinstance(value, dict):
+        return {k: thaw(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [thaw(v) for v in value]
+    return value
+
+
+def _stamp(path):
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def load_json(path, default=None):
+    """
+    Frozen contents of a JSON file, parsed once per change. When the file
+    is missing, the frozen result of default() (or None) is returned.
+    """
+    stamp = _stamp(path)  # taken before reading, so a write racing the read just causes a re-parse
+    with _lock:
+        hit = _files.get(path)
+    if hit is not None and hit[0] == stamp:
+        return hit[1]
+    if stamp is None:
+        value = freeze(default() if default else None)
+    else:
+        with open(path, "r") as f:
+            value = freeze(json.load(f))
+    with _lock:
+        _files[path] = (stamp, value)
+    return value
+
+
+def invalidate(path=None):
+    """Forget a file's snapshot (all of them with no path), e.g. after writing it."""
+    with _lock:
+        if path is None:
+            _files.clear()
+            _derived.clear()
+        else:
+            _files.pop(path, None)
+
+
+def derived(name, inputs, build):
+    """build(*inputs), memoised until any input is a different object."""
+    inputs = tuple(inputs)
+    with _lock:
+        hit = _derived.get(name)
+    if hit is not None and len(hit[0]) == len(inputs) and all(a is b for a, b in zip(hit[0], inputs)):
+        return hit[1]
+    value = build(*inputs)
+    with _lock:
+        _derived[name] = (inputs, value)
+    return value
@@ -0,0 +1,162 @@
+"""
+Cycle Checkpoints — Resumable daily cycle state.
+
+Each daily cycle gets an id and a directory under data/cycles/. As phases
+finish, daily_runner saves their outputs there:
+
+  data/cycles/<cycle_id>/
+    manifest.json        — cycle id, start time, completed phases, completion time
+    scans/<channel>.json — Phase 1 result of each channel, saved as it completes
+    scan.json            — Phase 1 scan results (channel_id -> result)
+    correlation.json     — Phase 1.5 analyst correlation
+    fields/<field>.json  — Phase 2 per-field status, one file per finished field
+    escalation.json      — Phase 3 escalation report and cross-field entities
+    briefing.json        — Phase 4 briefing file path
+    timings.json         — per-node graph timings
+    trace_<HHMMSS>.json  — span trace of each run (Chrome trace-event format)
+
+With `daily_runner.py --resume`, the runner reopens today's most recent
+unfinished cycle and skips every phase, channel and field that already
+has a checkpoint, so a crash in Phase 2 only costs the remaining fields
+and a crash mid-Phase 1 only the channels not yet scanned. A cycle left
+unfinished on an earlier day is not resumed: its scans and correlation
+are stale.
+"""
+
+import json
+import os
+import shutil
+from datetime import date, datetime
+
+from wheat.atomic_io import atomic_write_json
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+CYCLES_DIR = os.path.join(PROJECT_ROOT, "data", "cycles")
+CYCLE_RETAIN = 14  # Keep the last N cycle checkpoints
+
+
+def new_cycle_id(now=None):
+    """Cycle ids are start timestamps, so they sort chronologically."""
+    return (now or datetime.now()).strftime("%Y%m%d_%H%M%S")
+
+
+def _write_json(path, data):
+    """Write JSON via a temp file + rename so a crash never leaves half a checkpoint."""
+    atomic_write_json(path, data)
+
+
+def _read_json(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+class CycleCheckpoint:
+    """Checkpoint store for one daily cycle."""
+
+    def __init__(self, cycle_id=None, cycles_dir=None):
+        self.cycle_id = cycle_id or new_cycle_id()
+        self.cycle_dir = os.path.join(cycles_dir or CYCLES_DIR, self.cycle_id)
+        self.fields_dir = os.path.join(self.cycle_dir, "fields")
+        self.scans_dir = os.path.join(self.cycle_dir, "scans")
+        self.manifest_path = os.path.join(self.cycle_dir, "manifest.json")
+        os.makedirs(self.fields_dir, exist_ok=True)
+        os.makedirs(self.scans_dir, exist_ok=True)
+        self.manifest = _read_json(self.manifest_path) or {
+            "cycle_id": self.cycle_id,
+            "started_at": datetime.now().isoformat(),
+            "phases": [],
+            "completed_at": None,
+        }
+        _write_json(self.manifest_path, self.manifest)
+
+    # -- phases --------------------------------------------------------------
+
+    def has_phase(self, phase):
+        return phase in self.manifest["phases"]
+
+    def save_phase(self, phase, data):
+        """Persist a phase's output and mark the phase complete."""
+        _write_json(os.path.join(self.cycle_dir, f"{phase}.json"), data)
+        if phase not in self.manifest["phases"]:
+            self.manifest["phases"].append(phase)
+        _write_json(self.manifest_path, self.manifest)
+
+    def load_phase(self, phase):
+        """Return a completed phase's output, or None if it hasn't finished."""
+        if not self.has_phase(phase):
+            return None
+        return _read_json(os.path.join(self.cycle_dir, f"{phase}.json"))
+
+    # -- per-channel scan results --------------------------------------------
+
+    def save_scan(self, channel_id, result):
+        """Persist one channel's scan result (None for a failed scan) as soon as it completes."""
+        _write_json(os.path.join(self.scans_dir, f"{channel_id}.json"), result)
+
+    def completed_scans(self):
+        """{channel_id: result} for every channel scanned so far in this cycle."""
+        return {
+            f[:-len(".json")]: _read_json(os.path.join(self.scans_dir, f))
+            for f in sorted(os.listdir(self.scans_dir)) if f.endswith(".json")
+        }
+
+    # -- per-field results ---------------------------------------------------
+
+    def _field_path(self, field_id):
+        return os.path.join(self.fields_dir, f"{field_id}.json")
+
+    def has_field(self, field_id):
+        return os.path.exists(self._field_path(field_id))
+
+    def save_field(self, field_id, status):
+        _write_json(self._field_path(field_id), status)
+
+    def load_field(self, field_id):
+        return _read_json(self._field_path(field_id))
+
+    def completed_fields(self):
+        return sorted(
+            f[:-len(".json")] for f in os.listdir(self.fields_dir) if f.endswith(".json")
+        )
+
+    # -- cycle ---------------------------------------------------------------
+
+    def mark_complete(self):
+        self.manifest["completed_at"] = datetime.now().isoformat()
+        _write_json(self.manifest_path, self.manifest)
+
+    @property
+    def is_complete(self):
+        return bool(self.manifest.get("completed_at"))
+
+
+def list_cycles(cycles_dir=None):
+    """Return cycle ids with a manifest, oldest first."""
+    cycles_dir = cycles_dir or CYCLES_DIR
+    if not os.path.isdir(cycles_dir):
+        return []
+    return sorted(
+        name for name in os.listdir(cycles_dir)
+        if os.path.exists(os.path.join(cycles_dir, name, "manifest.json"))
+    )
+
+
+def latest_incomplete_cycle(cycles_dir=None, day=None):
+    """Return the CycleCheckpoint for the newest cycle if it is unfinished and from `day` (today), else None."""
+    cycles = list_cycles(cycles_dir)
+    if not cycles or not cycles[-1].startswith((day or date.today()).strftime("%Y%m%d")):
+        return None
+    manifest = _read_json(os.path.join(cycles_dir or CYCLES_DIR, cycles[-1], "manifest.json")) or {}
+    if manifest.get("completed_at"):
+        return None
+    return CycleCheckpoint(cycles[-1], cycles_dir=cycles_dir)
+
+
+def rotate_cycles(cycles_dir=None, retain=CYCLE_RETAIN):
+    """Remove all but the newest `retain` cycle checkpoints."""
+    cycles_dir = cycles_dir or CYCLES_DIR
+    for cycle_id in list_cycles(cycles_dir)[:-retain]:
+        shutil.rmtree(os.path.join(cycles_dir, cycle_id), ignore_errors=True)
@@ -0,0 +1,157 @@
+"""
+Cycle Graph — Dependency-driven executor for the daily cycle.
+
+The cycle is declared as a task graph and run on a small thread pool:
+every node starts as soon as the nodes it depends on have finished.
+
+  graph = TaskGraph()
+  graph.add("scan", run_scans)
+  graph.add("escalation", check_escalations)          # no deps — overlaps scans
+  graph.add("correlation", correlate, deps=["scan"])
+  run = graph.run(max_workers=4)
+  run.results["correlation"], run.critical_path()
+
+Node functions receive the results dict (node name -> return value). A
+node that raises is recorded as failed and everything downstream of it
+is skipped. Node timings give the critical path, and each node runs in a
+"phase" span (wheat/tracing.py).
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+from wheat.tracing import span
+
+
+class TaskGraph:
+    """A set of named tasks with declared dependencies."""
+
+    def __init__(self):
+        self.nodes = {}  # name -> {"fn", "deps"}, in insertion (= topological) order
+
+    def add(self, name, fn, deps=()):
+        """Add a node. Dependencies must already be in the graph, which keeps it acyclic."""
+        if name in self.nodes:
+            raise ValueError(f"Duplicate node: {name}")
+        missing = [d for d in deps if d not in self.nodes]
+        if missing:
+            raise ValueError(f"Node {name} depends on unknown node(s): {', '.join(missing)}")
+        self.nodes[name] = {"fn": fn, "deps": list(deps)}
+        return name
+
+    def run(self, max_workers=4, on_start=None, on_finish=None):
+        """
+        Execute the graph, overlapping independent nodes.
+
+        Args:
+            max_workers: thread pool size (1 runs nodes one at a time in order)
+            on_start: optional callback(name) when a node starts
+            on_finish: optional callback(name, timing) when a node ends
+
+        Returns a GraphRun with results, errors and per-node timings.
+        """
+        run = GraphRun(self)
+        pending = dict(self.nodes)
+        running = {}  # future -> name
+        lock = threading.Lock()
+        t0 = time.monotonic()
+
+        def execute(name, fn):
+            start = time.monotonic() - t0
+            if on_start:
+                on_start(name)
+            try:
+                with span(name, "phase"):
+                    result, error = fn(run.results), None
+            except Exception as e:
+                result, error = None, e
+            end = time.monotonic() - t0
+            with lock:
+                # Store the result before the timing: dependents are released
+                # as soon as the timing shows this node finished
+                if error:
+                    run.errors[name] = error
+                else:
+                    run.results[name] = result
+                timing = {
+                    "start": round(start, 3),
+                    "end": round(end, 3),
+                    "seconds": round(end - start, 3),
+                    "status": "failed" if error else "ok",
+                }
+                run.timings[name] = timing
+            if on_finish:
+                on_finish(name, timing)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while pending or running:
+                for name, node in list(pending.items()):
+                    states = [run.state(d) for d in node["deps"]]
+                    if any(s in ("failed", "skipped") for s in states):
+                        run.timings[name] = {"start": None, "end": None, "seconds": 0.0, "status": "skipped"}
+                        del pending[name]
+                    elif all(s == "ok" for s in states):
+                        running[executor.submit(execute, name, node["fn"])] = name
+                        del pending[name]
+                if not running:
+                    continue
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    del running[future]
+
+        run.wall_seconds = round(time.monotonic() - t0, 3)
+        return run
+
+
+class GraphRun:
+    """Outcome of one TaskGraph.run()."""
+
+    def __init__(self, graph):
+        self.graph = graph
+        self.results = {}
+        self.errors = {}
+        self.timings = {}
+        self.wall_seconds = 0.0
+
+    def state(self, name):
+        """'ok', 'failed', 'skipped', or None while pending/running."""
+        timing = self.timings.get(name)
+        return timing["status"] if timing else None
+
+    def critical_path(self):
+        """Return (node names, seconds) for the longest chain of dependent nodes."""
+        longest = {}  # name -> (seconds, predecessor)
+        for name, node in self.graph.nodes.items():
+            seconds = self.timings.get(name, {}).get("seconds") or 0.0
+            best_dep = max(node["deps"], key=lambda d: longest[d][0], default=None)
+            longest[name] = (seconds + (longest[best_dep][0] if best_dep else 0.0), best_dep)
+        if not longest:
+            return [], 0.0
+        # Ties go to the later node, so zero-cost sinks like a briefing stay on the path
+        name = max(reversed(list(longest)), key=lambda n: longest[n][0])
+        total = longest[name][0]
+        path = []
+        while name:
+            path.append(name)
+            name = longest[name][1]
+        return list(reversed(path)), round(total, 3)
+
+    def summary(self):
+        """Human-readable timing table plus the critical path."""
+        lines = [f"Cycle timings — wall clock {self.wall_seconds:.1f}s"]
+        ordered = sorted(
+            self.timings.items(),
+            key=lambda item: item[1]["start"] if item[1]["start"] is not None else float("inf"),
+        )
+        for name, t in ordered:
+            if t["status"] == "skipped":
+                lines.append(f"  {name:<36} skipped")
+            else:
+                lines.append(
+                    f"  {name:<36} {t['seconds']:>8.1f}s  "
+                    f"(+{t['start']:.1f}s → +{t['end']:.1f}s) {t['status']}"
+                )
+        path, seconds = self.critical_path()
+        lines.append(f"  Critical path ({seconds:.1f}s): {' → '.join(path)}")
+        return "\n".join(lines)
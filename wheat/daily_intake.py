@@ -15,35 +15,17 @@ import json
 import os
 from datetime import datetime
 
+from wheat.atomic_io import atomic_write_json
 from wheat.channels import INTAKE_DIR, load_channels, get_default_channels
 from wheat.escalation import create_case, init_escalation_db
+from wheat.instrumentation import INTAKE_REPORTS
+from wheat.routing import CATEGORY_TO_FIELD, DEFAULT_FIELD, WILDCARD, route_category, signal_field
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 SCANS_DIR = os.path.join(INTAKE_DIR, "scans")
 
 REQUIRED_REPORT_FIELDS = {"category", "entity", "description"}
 
-# Same mapping as channels.py process_intake — canonical category→field routing
-CATEGORY_TO_FIELD = {
-    "dangerous_driving": "fleet_compliance",
-    "commercial_vehicle": "fleet_compliance",
-    "tow_company": "tow_companies",
-    "used_car_dealer": "used_car_dealers",
-    "auto_repair": "auto_repair",
-    "noise_exhaust": "exhaust_noise",
-    "school_zone": "school_zone_safety",
-    "pedestrian_cyclist": "pedestrian_cyclist",
-    "parking_booting": "parking_booting",
-    "window_tint": "window_tint",
-    "registration_plates": "title_registration",
-    "emissions": "emissions_environmental",
-    "intersection_road": "road_intersection_safety",
-    "insurance": "auto_insurance",
-    "dealer_financing": "dealer_financing",
-    "rideshare_delivery": "rideshare_delivery",
-}
-
-
 def validate_report(report_data):
     """
     Validate a community report has required fields.
@@ -87,8 +69,7 @@ def _load_report(filepath):
 
 def _save_report(filepath, data):
     """Write report data back to file."""
-    with open(filepath, "w") as f:
-        json.dump(data, f, indent=2)
+    atomic_write_json(filepath, data)
 
 
 def get_pending_reports():
@@ -146,6 +127,7 @@ def process_pending_reports():
             report["status"] = "processed"
             _save_report(filepath, report)
             results["skipped"] += 1
+            INTAKE_REPORTS.inc(outcome="skipped")
             continue
 
         is_valid, errors = validate_report(report)
@@ -154,6 +136,7 @@ def process_pending_reports():
             report["validation_errors"] = errors
             _save_report(filepath, report)
             results["invalid"] += 1
+            INTAKE_REPORTS.inc(outcome="invalid")
             results["errors"].append({
                 "file": os.path.basename(filepath),
                 "errors": errors,
@@ -161,8 +144,7 @@ def process_pending_reports():
             continue
 
         # Route to field
-        category = report.get("category", "")
-        target_field = CATEGORY_TO_FIELD.get(category, "fleet_compliance")
+        target_field = route_category(report.get("category", ""))
 
         # Build case issue
         entity = report.get("entity", "").strip() or "Unknown Entity"
@@ -188,6 +170,7 @@ def process_pending_reports():
         _save_report(filepath, report)
 
         results["processed"] += 1
+        INTAKE_REPORTS.inc(outcome="processed")
         results["cases_created"].append({
             "case_id": case_id,
             "entity": entity,
@@ -246,8 +229,8 @@ def process_scan_results():
     for filepath, scan in scans:
         signals = scan.get("signals", [])
         channel_id = scan.get("channel_id", "unknown")
-        target_fields = scan.get("target_fields", [])
-        primary_field = target_fields[0] if target_fields else "fleet_compliance"
+        named_fields = [f for f in scan.get("target_fields", []) if f != WILDCARD]
+        primary_field = named_fields[0] if named_fields else DEFAULT_FIELD
 
         for signal in signals:
             entity = signal.get("entity", "").strip()
@@ -259,7 +242,7 @@ def process_scan_results():
                 continue
 
             severity = int(signal.get("severity", 1))
-            field = signal.get("field", primary_field)
+            field = signal_field(signal) or primary_field
 
             case_id = create_case(
                 field=field,
@@ -0,0 +1,191 @@
+"""
+Dashboard Snapshot — Everything the main dashboard shows, in a fixed number of reads.
+
+snapshot() costs the same however many fields, seeds, cases and files
+there are:
+
+  - one grouped query returns each project's latest run and its seed
+    counts by status, read from run_seed_counts (per-run, per-status
+    counts kept current by triggers on seeds)
+  - cases come from the trigger-maintained summary (wheat/case_summary.py)
+    plus one page of the case listing
+  - channels come from the config registry's field->channels index
+    (wheat/config_registry.py)
+  - the latest briefing and today's intake count are cached and
+    recomputed only when the briefings directory or intake/ changes
+    (one stat() of each per request)
+"""
+
+import os
+import sqlite3
+import threading
+from datetime import date
+
+from wheat import channels as channels_mod
+from wheat.escalation import (
+    CASE_PAGE_SIZE, LIST_CASE_COLUMNS, count_escalation_ready, get_cross_field_entities,
+    get_field_list, list_cases,
+)
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def _stamp(path):
+    """What changes when a file or directory (its entry list) does; None if missing."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size, st.st_ino
+
+
+def _cached(name, key, compute):
+    """compute() once per distinct key for this cache slot."""
+    with _cache_lock:
+        hit = _cache.get(name)
+    if hit is not None and hit[0] == key:
+        return hit[1]
+    value = compute()
+    with _cache_lock:
+        _cache[name] = (key, value)
+    return value
+
+
+def clear_cache():
+    with _cache_lock:
+        _cache.clear()
+
+
+_SEED_COUNT_DELTA = """
+    INSERT INTO run_seed_counts (run_id, status, count) VALUES ({ref}.run_id, COALESCE({ref}.status, ''), {sign})
+        ON CONFLICT(run_id, status) DO UPDATE SET count = count + excluded.count;"""
+
+
+def create_seed_counts_table(cursor):
+    """Create run_seed_counts and its triggers on seeds, backfilling on first creation."""
+    cursor.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'run_seed_counts'")
+    exists = cursor.fetchone() is not None
+    cursor.execute("""CREATE TABLE IF NOT EXISTS run_seed_counts (
+        run_id INTEGER NOT NULL, status TEXT NOT NULL, count INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (run_id, status)
+    )""")
+    add, remove = (_SEED_COUNT_DELTA.format(ref=ref, sign=sign) for ref, sign in (("NEW", 1), ("OLD", -1)))
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_seeds_count_insert AFTER INSERT ON seeds BEGIN {add} END")
+    cursor.execute(
+        f"CREATE TRIGGER IF NOT EXISTS trg_seeds_count_update AFTER UPDATE OF status, run_id ON seeds BEGIN {remove} {add} END"
+    )
+    cursor.execute(f"CREATE TRIGGER IF NOT EXISTS trg_seeds_count_delete AFTER DELETE ON seeds BEGIN {remove} END")
+    if not exists:
+        cursor.execute("""INSERT OR IGNORE INTO run_seed_counts (run_id, status, count)
+            SELECT run_id, COALESCE(status, ''), COUNT(*) FROM seeds WHERE run_id IS NOT NULL GROUP BY run_id, status""")
+
+
+def latest_runs(db_path):
+    """{project_id: {run_id, timestamp, fruitful, barren, growing, total_seeds}} in one query."""
+    conn = sqlite3.connect(db_path, timeout=15)
+    try:
+        c = conn.cursor()
+        c.execute("""
+            SELECT r.project_id, r.id, r.timestamp,
+                   COALESCE(SUM(n.count), 0),
+                   COALESCE(SUM(CASE WHEN n.status = 'Fruitful' THEN n.count END), 0),
+                   COALESCE(SUM(CASE WHEN n.status = 'Barren' THEN n.count END), 0),
+                   COALESCE(SUM(CASE WHEN n.status IN ('Growing', 'Repairing') THEN n.count END), 0)
+            FROM (SELECT project_id, MAX(id) AS id FROM runs GROUP BY project_id) latest
+            JOIN runs r ON r.id = latest.id
+            LEFT JOIN run_seed_counts n ON n.run_id = r.id
+            GROUP BY r.id
+        """)
+        return {
+            row[0]: {
+                "run_id": row[1], "timestamp": row[2], "total_seeds": row[3],
+                "fruitful": row[4], "barren": row[5], "growing": row[6],
+            }
+            for row in c.fetchall()
+        }
+    except sqlite3.OperationalError:  # init_db() not run on this database yet
+        return {}
+    finally:
+        conn.close()
+
+
+def latest_briefing(briefings_dir):
+    """Text of the newest briefings/*.txt, cached until the directory or that file changes."""
+    def newest():
+        try:
+            names = [f for f in os.listdir(briefings_dir) if f.endswith(".txt")]
+        except OSError:
+            return None
+        return os.path.join(briefings_dir, max(names)) if names else None
+
+    path = _cached("briefing_name", (briefings_dir, _stamp(briefings_dir)), newest)
+    if path is None:
+        return None
+
+    def read():
+        try:
+            with open(path, "r") as f:
+                return f.read()
+        except OSError:
+            return None
+
+    return _cached("briefing_text", (path, _stamp(path)), read)
+
+
+def intake_count(intake_dir, day=None):
+    """Community reports filed on `day` (default today), cached until intake/ changes."""
+    day_str = (day or date.today()).strftime("%Y%m%d")
+
+    def count():
+        try:
+            names = os.listdir(intake_dir)
+        except OSError:
+            return 0
+        return sum(1 for f in names if f.startswith("report_") and f.endswith(".json") and day_str in f)
+
+    return _cached("intake", (intake_dir, day_str, _stamp(intake_dir)), count)
+
+
+def snapshot(projects, db_path, briefings_dir, intake_dir, active=()):
+    """Everything dashboard.html renders."""
+    runs = latest_runs(db_path)
+    channels = channels_mod.load_channels()
+
+    field_list = []
+    for pid, pdata in projects.items():
+        run = runs.get(pid, {})
+        field_list.append({
+            "id": pid,
+            "name": pdata.get("name", pid),
+            "description": pdata.get("description", ""),
+            "active": pid in active,
+            "fruitful": run.get("fruitful", 0),
+            "barren": run.get("barren", 0),
+            "growing": run.get("growing", 0),
+            "total_seeds": run.get("total_seeds", 0),
+            "channel_count": len(channels_mod.get_channels_for_field(pid)),
+        })
+
+    channel_list = [
+        {
+            "id": cid,
+            "name": cdata.get("name", cid),
+            "channel_type": cdata.get("channel_type", ""),
+            "frequency": cdata.get("frequency", "daily"),
+            "fields": cdata.get("fields", []),
+        }
+        for cid, cdata in channels.items()
+    ]
+
+    cases, _ = list_cases(columns=LIST_CASE_COLUMNS, limit=CASE_PAGE_SIZE)
+    return {
+        "fields": field_list,
+        "channels": channel_list,
+        "cases": cases,
+        "active_cases": sum(f["active"] for f in get_field_list()),
+        "escalation_ready": count_escalation_ready(),
+        "cross_field_entities": get_cross_field_entities(),
+        "latest_briefing": latest_briefing(briefings_dir),
+        "today_intake": intake_count(intake_dir),
+    }
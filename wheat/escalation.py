@@ -15,11 +15,18 @@ Each case tracks which stage it's at. The system will NOT skip stages
 unless the violation is egregious (severity >= 5, imminent danger).
 """
 
+import base64
 import json
 import os
 import sqlite3
+import threading
 from datetime import datetime, timedelta
 
+from wheat import case_summary
+from wheat.instrumentation import (
+    CASE_SIGNALS, CASES_CREATED, CASES_RESOLVED, DB_QUERY, ESCALATIONS, source_kind, timed,
+)
+
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DB_PATH = os.path.join(PROJECT_ROOT, "wheat.db")
 
@@ -45,10 +52,47 @@ STAGE_WAIT_DAYS = {
     "civil": 90,     # Court timeline
 }
 
+CASE_COLUMNS = [
+    "id", "field", "entity", "issue", "severity", "stage", "evidence", "law_cited",
+    "source", "notes", "created_at", "updated_at", "stage_entered_at",
+    "escalation_deadline", "resolved_at", "resolution",
+]
+HEAVY_CASE_COLUMNS = {"evidence", "notes"}
+LIST_CASE_COLUMNS = [col for col in CASE_COLUMNS if col not in HEAVY_CASE_COLUMNS]
+
+# Case listing sorts: the key expressions, all in one direction, ending in id
+# so the key is unique. Each has a matching index (see init_escalation_db);
+# the deadline one is an expression index on the same COALESCE.
+CASE_SORTS = {
+    "severity": (("-severity", "created_at", "id"), "ASC"),   # most severe, then oldest
+    "created": (("created_at", "id"), "DESC"),                # newest first
+    "deadline": (("COALESCE(escalation_deadline, '9999')", "id"), "ASC"),  # soonest due
+    "entity": (("entity", "id"), "ASC"),
+}
+CASE_PAGE_SIZE = 50
+MAX_CASE_PAGE_SIZE = 500
+
+
+_initialized = set()  # DB paths whose schema and triggers are already set up
+_init_lock = threading.Lock()
+
 
 def init_escalation_db():
-    """Create the cases table if it doesn't exist."""
-    conn = sqlite3.connect(DB_PATH, timeout=15)
+    """
+    Create the cases table, indexes and summary triggers if they don't
+    exist. Done once per database per process, so read paths stay read-only.
+    """
+    path = DB_PATH
+    if path in _initialized and os.path.exists(path):
+        return
+    with _init_lock:
+        if path not in _initialized or not os.path.exists(path):
+            _create_schema(path)
+            _initialized.add(path)
+
+
+def _create_schema(path):
+    conn = sqlite3.connect(path, timeout=15)
     c = conn.cursor()
     c.execute("""CREATE TABLE IF NOT EXISTS cases (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
@@ -78,11 +122,23 @@ def init_escalation_db():
         reason TEXT DEFAULT '',
         FOREIGN KEY (case_id) REFERENCES cases(id)
     )""")
+    c.execute(
+        "CREATE INDEX IF NOT EXISTS idx_cases_open_deadline ON cases(escalation_deadline) WHERE resolved_at IS NULL"
+    )
+    # Keyset pagination walks these in sort order and seeks straight to a cursor
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_open_severity ON cases(-severity, created_at, id) WHERE resolved_at IS NULL")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_field_severity ON cases(field, -severity, created_at, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_created ON cases(created_at, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_field_created ON cases(field, created_at, id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_deadline_order ON cases(COALESCE(escalation_deadline, '9999'), id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_cases_entity_order ON cases(entity, id)")
+    case_summary.create_summary_tables(c)
 
     conn.commit()
     conn.close()
 
 
+@timed(DB_QUERY, op="create_case")
 def create_case(field, entity, issue, severity=1, law_cited="", source="", notes=""):
     """Create a new case at the SEED stage."""
     init_escalation_db()
@@ -117,6 +173,7 @@ def create_case(field, entity, issue, severity=1, law_cited="", source="", notes
         )
         conn.commit()
         conn.close()
+        CASE_SIGNALS.inc(field=field)
         print(f"  Added signal to existing case #{case_id} ({entity})")
         return case_id
 
@@ -142,10 +199,12 @@ def create_case(field, entity, issue, severity=1, law_cited="", source="", notes
 
     conn.commit()
     conn.close()
+    CASES_CREATED.inc(field=field, source=source_kind(source))
     print(f"  Created new case #{case_id}: {entity} — {issue}")
     return case_id
 
 
+@timed(DB_QUERY, op="escalate_case")
 def escalate_case(case_id, reason=""):
     """Move a case to the next escalation stage (respects subsidiarity)."""
     init_escalation_db()
@@ -183,9 +242,11 @@ def escalate_case(case_id, reason=""):
 
     conn.commit()
     conn.close()
+    ESCALATIONS.inc(stage=next_stage)
     print(f"  Case #{case_id} ({entity}): {current_stage} → {next_stage}")
 
 
+@timed(DB_QUERY, op="resolve_case")
 def resolve_case(case_id, resolution="Compliance achieved"):
     """Mark a case as resolved (harvested)."""
     init_escalation_db()
@@ -212,27 +273,18 @@ def resolve_case(case_id, resolution="Compliance achieved"):
 
     conn.commit()
     conn.close()
+    CASES_RESOLVED.inc()
     print(f"  Case #{case_id} resolved: {resolution}")
 
 
-def get_cases_by_field(field, active_only=True):
-    """Get all cases for a field."""
-    init_escalation_db()
-    conn = sqlite3.connect(DB_PATH, timeout=15)
-    c = conn.cursor()
-    if active_only:
-        c.execute(
-            "SELECT * FROM cases WHERE field = ? AND resolved_at IS NULL ORDER BY severity DESC, created_at",
-            (field,),
-        )
-    else:
-        c.execute("SELECT * FROM cases WHERE field = ? ORDER BY created_at DESC", (field,))
-    columns = [desc[0] for desc in c.description]
-    cases = [dict(zip(columns, row)) for row in c.fetchall()]
-    conn.close()
-    return cases
+def get_cases_by_field(field, active_only=True, **options):
+    """Get all cases for a field (options as for list_cases)."""
+    options.setdefault("limit", None)
+    options.setdefault("columns", "all")
+    return list_cases(field=field, active_only=active_only, **options)[0]
 
 
+@timed(DB_QUERY, op="get_escalation_ready")
 def get_escalation_ready():
     """Find cases that have passed their escalation deadline and are ready to move up."""
     init_escalation_db()
@@ -249,20 +301,12 @@ def get_escalation_ready():
     return cases
 
 
+@timed(DB_QUERY, op="get_cross_field_entities")
 def get_cross_field_entities():
     """Find entities that appear in multiple fields — pattern detection."""
     init_escalation_db()
     conn = sqlite3.connect(DB_PATH, timeout=15)
     c = conn.cursor()
-    c.execute("""
-        SELECT entity, GROUP_CONCAT(DISTINCT field) as fields, COUNT(DISTINCT field) as field_count,
-               MAX(severity) as max_severity
-        FROM cases
-        WHERE resolved_at IS NULL
-        GROUP BY entity
-        HAVING field_count > 1
-        ORDER BY field_count DESC, max_severity DESC
-    """)
     results = [
         {
             "entity": row[0],
@@ -270,27 +314,134 @@ def get_cross_field_entities():
             "field_count": row[2],
             "max_severity": row[3],
         }
-        for row in c.fetchall()
+        for row in case_summary.cross_field_entities(c)
     ]
     conn.close()
     return results
 
 
-def get_all_cases(active_only=True):
-    """Get all cases across all fields."""
+def get_all_cases(active_only=True, **options):
+    """Get all cases across all fields (options as for list_cases)."""
+    options.setdefault("limit", None)
+    options.setdefault("columns", "all")
+    return list_cases(active_only=active_only, **options)[0]
+
+
+def _encode_cursor(key):
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode().rstrip("=")
+
+
+def _decode_cursor(cursor, size):
+    try:
+        key = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise ValueError("Invalid cursor")
+    if not isinstance(key, list) or len(key) != size:
+        raise ValueError("Invalid cursor")
+    return key
+
+
+@timed(DB_QUERY, op="list_cases")
+def list_cases(field=None, stage=None, min_severity=None, max_severity=None,
+               entity_prefix=None, deadline_after=None, deadline_before=None,
+               active_only=True, sort=None, columns=LIST_CASE_COLUMNS, limit=CASE_PAGE_SIZE, after=None):
+    """
+    One page of cases, keyset-paginated. Returns (cases, next_cursor);
+    pass next_cursor back as `after` for the following page (None = last page).
+
+    stage may be a name or a list of names; the deadline window bounds
+    escalation_deadline (ISO strings). sort is a CASE_SORTS key, defaulting
+    to most-severe-first for active cases and newest-first otherwise.
+    columns is a list of CASE_COLUMNS or "all"; the default leaves out the
+    heavy evidence and notes text. limit=None returns everything. Raises
+    ValueError on bad arguments.
+    """
+    columns, sql, params, limit = _case_query(
+        field, stage, min_severity, max_severity, entity_prefix, deadline_after, deadline_before,
+        active_only, sort, columns, limit, after,
+    )
     init_escalation_db()
     conn = sqlite3.connect(DB_PATH, timeout=15)
     c = conn.cursor()
-    if active_only:
-        c.execute(
-            "SELECT * FROM cases WHERE resolved_at IS NULL ORDER BY severity DESC, created_at"
-        )
-    else:
-        c.execute("SELECT * FROM cases ORDER BY created_at DESC")
-    columns = [desc[0] for desc in c.description]
-    cases = [dict(zip(columns, row)) for row in c.fetchall()]
+    c.execute(sql, params)
+    rows = c.fetchall()
     conn.close()
-    return cases
+
+    next_cursor = None
+    if limit is not None and len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(list(rows[-1][len(columns):]))
+    cases = [dict(zip(columns, row[:len(columns)])) for row in rows]
+    return cases, next_cursor
+
+
+def validate_case_filters(**filters):
+    """Raise ValueError for arguments list_cases() would reject, without querying."""
+    _case_query(**filters)
+
+
+def _case_query(field=None, stage=None, min_severity=None, max_severity=None,
+                entity_prefix=None, deadline_after=None, deadline_before=None,
+                active_only=True, sort=None, columns=LIST_CASE_COLUMNS, limit=CASE_PAGE_SIZE, after=None):
+    """(columns, sql, params, limit) for list_cases(); raises ValueError on bad arguments."""
+    sort = sort or ("severity" if active_only else "created")
+    if sort not in CASE_SORTS:
+        raise ValueError(f"Unknown sort '{sort}' (expected one of {', '.join(CASE_SORTS)})")
+    if columns == "all":
+        columns = CASE_COLUMNS
+    unknown = set(columns) - set(CASE_COLUMNS)
+    if unknown:
+        raise ValueError(f"Unknown case columns: {', '.join(sorted(unknown))}")
+    columns = list(dict.fromkeys(["id", *columns]))
+    keys, direction = CASE_SORTS[sort]
+
+    where, params = [], []
+    if active_only:
+        where.append("resolved_at IS NULL")
+    if field:
+        where.append("field = ?")
+        params.append(field)
+    if stage:
+        stages = [stage] if isinstance(stage, str) else list(stage)
+        unknown = set(stages) - set(STAGES)
+        if unknown:
+            raise ValueError(f"Unknown stage: {', '.join(sorted(unknown))}")
+        where.append(f"stage IN ({', '.join('?' * len(stages))})")
+        params.extend(stages)
+    if min_severity is not None:
+        where.append("severity >= ?")
+        params.append(int(min_severity))
+    if max_severity is not None:
+        where.append("severity <= ?")
+        params.append(int(max_severity))
+    if entity_prefix:
+        escaped = entity_prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        where.append("entity LIKE ? ESCAPE '\\'")
+        params.append(escaped + "%")
+    if deadline_after:
+        where.append("escalation_deadline >= ?")
+        params.append(deadline_after)
+    if deadline_before:
+        where.append("escalation_deadline < ?")
+        params.append(deadline_before)
+    if after:
+        key = _decode_cursor(after, len(keys))
+        op = ">" if direction == "ASC" else "<"
+        # The redundant bound on the first key lets SQLite seek the index to the cursor
+        where.append(f"{keys[0]} {op}= ? AND ({', '.join(keys)}) {op} ({', '.join('?' * len(keys))})")
+        params.extend([key[0], *key])
+
+    sql = (
+        f"SELECT {', '.join(columns)}, {', '.join(keys)} FROM cases"
+        + (f" WHERE {' AND '.join(where)}" if where else "")
+        + f" ORDER BY {', '.join(f'{k} {direction}' for k in keys)}"
+    )
+    if limit is not None:
+        limit = max(1, min(int(limit), MAX_CASE_PAGE_SIZE))
+        sql += " LIMIT ?"
+        params.append(limit + 1)
+
+    return columns, sql, params, limit
 
 
 def get_case_history(case_id):
@@ -313,11 +464,8 @@ def get_stage_distribution(active_only=True):
     init_escalation_db()
     conn = sqlite3.connect(DB_PATH, timeout=15)
     c = conn.cursor()
-    where = "WHERE resolved_at IS NULL" if active_only else ""
-    c.execute(f"SELECT stage, COUNT(*) FROM cases {where} GROUP BY stage")
     dist = {stage: 0 for stage in STAGES}
-    for row in c.fetchall():
-        dist[row[0]] = row[1]
+    dist.update(case_summary.stage_counts(c, active_only))
     conn.close()
     return dist
 
@@ -327,19 +475,48 @@ def get_field_list():
     init_escalation_db()
     conn = sqlite3.connect(DB_PATH, timeout=15)
     c = conn.cursor()
-    c.execute("""
-        SELECT field, COUNT(*) as total,
-               SUM(CASE WHEN resolved_at IS NULL THEN 1 ELSE 0 END) as active
-        FROM cases GROUP BY field ORDER BY active DESC
-    """)
     fields = [
         {"field": row[0], "total": row[1], "active": row[2]}
-        for row in c.fetchall()
+        for row in case_summary.field_counts(c)
     ]
     conn.close()
     return fields
 
 
+def get_summary_tag():
+    """
+    Short string that changes whenever the dashboard's data would: the
+    summary version plus how many open cases are past their deadline
+    (which moves with the clock, not with writes).
+    """
+    init_escalation_db()
+    now = datetime.now().isoformat()
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    version = case_summary.summary_version(c)
+    ready = _count_ready(c, now)
+    conn.close()
+    return f"{version}-{ready}"
+
+
+def _count_ready(cursor, now):
+    cursor.execute(
+        "SELECT COUNT(*) FROM cases WHERE resolved_at IS NULL AND escalation_deadline < ? AND stage != 'harvest'",
+        (now,),
+    )
+    return cursor.fetchone()[0]
+
+
+@timed(DB_QUERY, op="count_escalation_ready")
+def count_escalation_ready():
+    """How many cases get_escalation_ready() would return, from the open-deadline index."""
+    init_escalation_db()
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    count = _count_ready(conn.cursor(), datetime.now().isoformat())
+    conn.close()
+    return count
+
+
 def daily_escalation_check():
     """Run during daily briefing — check for cases ready to escalate and cross-field patterns."""
     ready = get_escalation_ready()
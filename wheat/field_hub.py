@@ -0,0 +1,76 @@
+"""
+Field Hub — In-process pub/sub for field status changes.
+
+Writers publish what they just committed and each field page stream
+subscribes:
+
+  SeedStore.flush()       — "seeds" {run_id, seeds: {seed_id: info}} for changed rows
+                            "log"   {run_id, events: [(seq, message)]}
+  FieldManager.sow_field  — "run"   {run_id} when a new run starts, then
+                            "log" and "seeds" for the sowing
+
+Publishing never blocks: a subscriber that falls SUBSCRIBER_QUEUE events
+behind is dropped and marked overflowed, so its stream ends and the
+browser reconnects and catches up from the database. Only writers in
+this process are seen.
+"""
+
+import queue
+import threading
+
+HEARTBEAT_SECONDS = 15   # SSE comment sent on idle streams, also detects gone clients
+SUBSCRIBER_QUEUE = 256
+
+
+class Subscription:
+    def __init__(self, project_id, maxsize=SUBSCRIBER_QUEUE):
+        self.project_id = project_id
+        self.queue = queue.Queue(maxsize)
+        self.overflowed = False
+
+    def get(self, timeout=HEARTBEAT_SECONDS):
+        """Next (kind, data); raises queue.Empty after `timeout` seconds."""
+        return self.queue.get(timeout=timeout)
+
+
+class FieldHub:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._subscribers = {}  # project_id -> set of Subscription
+
+    def subscribe(self, project_id, maxsize=SUBSCRIBER_QUEUE):
+        subscription = Subscription(project_id, maxsize)
+        with self._lock:
+            self._subscribers.setdefault(project_id, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.project_id)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.project_id]
+
+    def publish(self, project_id, kind, data):
+        with self._lock:
+            subscribers = list(self._subscribers.get(project_id, ()))
+        for subscription in subscribers:
+            try:
+                subscription.queue.put_nowait((kind, data))
+            except queue.Full:
+                subscription.overflowed = True
+                self.unsubscribe(subscription)
+
+    def subscriber_count(self, project_id=None):
+        with self._lock:
+            if project_id is not None:
+                return len(self._subscribers.get(project_id, ()))
+            return sum(len(s) for s in self._subscribers.values())
+
+
+hub = FieldHub()
+
+
+def publish(project_id, kind, data):
+    hub.publish(project_id, kind, data)
@@ -2,8 +2,13 @@
 from wheat.sower import Sower
 from wheat.wheat_seed import WheatSeed
 from wheat.reaper import Reaper
+from wheat.seed_store import SeedStore, seed_info
+from wheat.field_hub import publish
+from wheat.run_events import create_run_events_table, append_events
 from wheat.paths import load_project_config
-from concurrent.futures import ThreadPoolExecutor
+from wheat.tracing import span
+from wheat.instrumentation import DB_QUERY, SEEDS_FINISHED, SEEDS_SOWN
+from wheat import tending
 import sqlite3
 import os
 import json
@@ -22,7 +27,9 @@ class FieldManager:
         self.sower = Sower(config=self.config)
         self.reaper = Reaper()
         self.seeds = []
+        self.store = None
         self.lock = threading.Lock()
+        self.settled = threading.Event()  # set once every seed is Fruitful or Barren
         self.seeds_per_run = self.config.get("seeds_per_run", 3)
 
     def create_seed(self, seed_id, task, status, output, code_file, test_result, coder_prompt=None):
@@ -43,19 +50,25 @@ class FieldManager:
             c = conn.cursor()
             timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             try:
-                c.execute("INSERT INTO runs (timestamp, log, project_id) VALUES (?, ?, ?)",
-                          (timestamp, f"Field sowed at {time.ctime()} with coder {self.sower.coder_model}\n", self.project_id))
+                create_run_events_table(c)
+                c.execute("INSERT INTO runs (timestamp, log, project_id) VALUES (?, '', ?)", (timestamp, self.project_id))
                 run_id = c.lastrowid
+                append_events(c, run_id, self.project_id, [f"Field sowed at {time.ctime()} with coder {self.sower.coder_model}\n"])
                 print(f"[{self.project_id}] Inserted run {run_id}")
                 conn.commit()
-                tasks = self.sower.sow_seeds(guidance, strategist_prompt=strategist_prompt)
+                publish(self.project_id, "run", {"run_id": run_id})
+                with span("strategist", "field", project=self.project_id):
+                    tasks = self.sower.sow_seeds(guidance, strategist_prompt=strategist_prompt)
                 print(f"[{self.project_id}] Got {len(tasks)} tasks: {tasks}")
+                SEEDS_SOWN.inc(len(tasks), field=self.project_id)
                 log_entry = f"Sowed {len(tasks)} seeds: {', '.join(tasks)}\n"
-                c.execute("UPDATE runs SET log = log || ? WHERE id = ?", (log_entry, run_id))
+                events = append_events(c, run_id, self.project_id, [log_entry])
                 conn.commit()
 
                 self.seeds = []
-                stewards_map_str = get_map_as_string(include_params=True, include_descriptions=True)
+                self.store = SeedStore(self.project_id, run_id, db_path=DB_PATH)
+                with span("stewards map", "stewards_map"):
+                    stewards_map_str = get_map_as_string(include_params=True, include_descriptions=True)
 
                 for i, task in enumerate(tasks):
                     seed_id = str(i + 1)
@@ -69,8 +82,11 @@ class FieldManager:
                     self.seeds.append(seed)
                     c.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
                               (run_id, seed.seed_id, seed.task, seed.progress["status"], json.dumps(seed.progress["output"]), seed.progress["code_file"], seed.progress["test_result"], self.project_id))
+                    self.store.track(seed, persisted=True)
                 conn.commit()
-                time.sleep(1)
+                publish(self.project_id, "log", {"run_id": run_id, "events": events})
+                publish(self.project_id, "seeds", {"run_id": run_id, "seeds": {s.seed_id: seed_info(s) for s in self.seeds}})
+                self.settled.clear()
             except Exception as e:
                 print(f"[{self.project_id}] Sow field error: {str(e)}")
                 conn.rollback()
@@ -78,71 +94,91 @@ class FieldManager:
             finally:
                 conn.close()
 
-    def tend_field(self):
+    def load_latest_run(self):
+        """Load the project's latest run's seeds from the DB (caller holds self.lock)."""
+        conn = sqlite3.connect(DB_PATH, timeout=15)
+        try:
+            c = conn.cursor()
+            create_run_events_table(c)
+            c.execute("SELECT id FROM runs WHERE project_id = ? ORDER BY id DESC LIMIT 1", (self.project_id,))
+            run_row = c.fetchone()
+            run_id = run_row[0] if run_row else None
+            if run_id:
+                c.execute("SELECT seed_id, task, status, output, code_file, test_result FROM seeds WHERE run_id = ? AND project_id = ?", (run_id, self.project_id))
+                seeds = c.fetchall()
+                self.seeds = [self.create_seed(row[0], row[1], row[2], row[3], row[4], row[5]) for row in seeds]
+                self.store = SeedStore(self.project_id, run_id, db_path=DB_PATH)
+                for seed in self.seeds:
+                    self.store.track(seed, persisted=True)
+                print(f"[{self.project_id}] Loaded {len(self.seeds)} seeds from run {run_id}")
+        finally:
+            conn.close()
+
+    def paused(self):
         wheat_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "wheat")
-        pause_file = os.path.join(wheat_dir, "pause.txt")
-        project_pause = os.path.join(wheat_dir, f"pause_{self.project_id}.txt")
-        while True:
-            with self.lock:
-                if not self.seeds:
-                    conn = sqlite3.connect(DB_PATH, timeout=15)
-                    c = conn.cursor()
-                    c.execute("SELECT id FROM runs WHERE project_id = ? ORDER BY id DESC LIMIT 1", (self.project_id,))
-                    run_row = c.fetchone()
-                    run_id = run_row[0] if run_row else None
-                    if run_id:
-                        c.execute("SELECT seed_id, task, status, output, code_file, test_result FROM seeds WHERE run_id = ? AND project_id = ?", (run_id, self.project_id))
-                        seeds = c.fetchall()
-                        self.seeds = [self.create_seed(row[0], row[1], row[2], row[3], row[4], row[5]) for row in seeds]
-                        print(f"[{self.project_id}] Loaded {len(self.seeds)} seeds from run {run_id}")
-                    conn.close()
-                if not self.seeds or all(s.progress["status"] in ["Fruitful", "Barren"] for s in self.seeds):
-                    time.sleep(5)
-                    continue
-                if os.path.exists(pause_file) or os.path.exists(project_pause):
-                    time.sleep(5)
-                    continue
+        return (os.path.exists(os.path.join(wheat_dir, "pause.txt"))
+                or os.path.exists(os.path.join(wheat_dir, f"pause_{self.project_id}.txt")))
 
-                growing_seeds = [s for s in self.seeds if s.progress["status"] in ["Growing", "Repairing"]]
-                with ThreadPoolExecutor(max_workers=self.seeds_per_run) as executor:
-                    futures = []
-                    for i, seed in enumerate(growing_seeds):
-                        time.sleep(i)
-                        futures.append(executor.submit(seed.generate_code, coder_prompt=seed.coder_prompt))
-                    for future in futures:
-                        future.result()
-                time.sleep(1)
+    def begin_round(self, blocking=True):
+        """
+        Seeds to tend this round (Growing or Repairing), loading the latest
+        run first if none are held. [] when every seed is done, the field is
+        paused, or (blocking=False) the manager is busy sowing.
+        """
+        if not self.lock.acquire(blocking=blocking):
+            return []
+        try:
+            if not self.seeds:
+                self.load_latest_run()
+            if not self.seeds:
+                return []
+            if all(s.progress["status"] in ["Fruitful", "Barren"] for s in self.seeds):
+                self.settled.set()
+                return []
+            self.settled.clear()
+            if self.paused():
+                return []
+            return [s for s in self.seeds if s.progress["status"] in ["Growing", "Repairing"]]
+        finally:
+            self.lock.release()
 
-                results = []
-                with ThreadPoolExecutor(max_workers=self.seeds_per_run) as executor:
-                    futures = [executor.submit(s.grow_and_reap) for s in growing_seeds]
-                    results = [future.result() for future in futures]
-                conn = sqlite3.connect(DB_PATH, timeout=15)
-                c = conn.cursor()
-                for result in results:
-                    c.execute("UPDATE runs SET log = log || ? WHERE id = (SELECT MAX(id) FROM runs WHERE project_id = ?)", (result + "\n", self.project_id))
-                for seed in self.seeds:
-                    c.execute("UPDATE seeds SET status = ?, output = ?, code_file = ?, test_result = ? WHERE seed_id = ? AND project_id = ?",
-                              (seed.progress["status"], json.dumps(seed.progress["output"]), seed.progress["code_file"], seed.progress["test_result"], seed.seed_id, self.project_id))
-                conn.commit()
-                conn.close()
-                print(f"[{self.project_id}] Updated {len(results)} results")
-                time.sleep(1)
+    def settle_seed(self, seed, log_entry):
+        """
+        Record a seed that left the pipeline: its log entry and finish count,
+        then, if it is Barren or past its lifespan, the reaper's verdict.
+        Returns the reseed that replaces it (already tracked), or None.
+        """
+        with self.lock:
+            if log_entry:
+                self.store.append_log(log_entry + "\n")
+            status = seed.progress["status"]
+            if status in ("Fruitful", "Barren"):
+                SEEDS_FINISHED.inc(field=self.project_id, status=status)
+            new_seed = None
+            if (not seed.is_alive() or status == "Barren") and seed in self.seeds:
+                self.store.append_log(self.reaper.evaluate(seed) + "\n")
+                new_seed = self.reaper.reseed(seed)
+                if new_seed:
+                    new_seed.project_id = self.project_id
+                    self.seeds.append(new_seed)
+                    self.store.track(new_seed)
+                self.seeds.remove(seed)
+                self.store.forget(seed)
+            # Seeds flushed their own changes as they went; this writes the
+            # result, the reaping and anything still dirty in one transaction
+            with span("record seed", "db", project=self.project_id), DB_QUERY.time(op="seed_store_flush"):
+                self.store.flush()
+            return new_seed
 
-                for seed in self.seeds[:]:
-                    if not seed.is_alive() or seed.progress["status"] == "Barren":
-                        result = self.reaper.evaluate(seed)
-                        new_seed = self.reaper.reseed(seed)
-                        conn = sqlite3.connect(DB_PATH, timeout=15)
-                        c = conn.cursor()
-                        c.execute("UPDATE runs SET log = log || ? WHERE id = (SELECT MAX(id) FROM runs WHERE project_id = ?)", (result + "\n", self.project_id))
-                        if new_seed:
-                            new_seed.project_id = self.project_id
-                            self.seeds.append(new_seed)
-                            c.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                                      (c.execute("SELECT MAX(id) FROM runs WHERE project_id = ?", (self.project_id,)).fetchone()[0], new_seed.seed_id, new_seed.task, new_seed.progress["status"],
-                                       json.dumps(new_seed.progress["output"]), new_seed.progress["code_file"], new_seed.progress["test_result"], self.project_id))
-                        self.seeds.remove(seed)
-                        conn.commit()
-                        conn.close()
-                time.sleep(1)
+    def tend_field(self, timeout=None, supervisor=None):
+        """
+        Tend this field on the tending supervisor (wheat/tending.py) until
+        every seed is Fruitful or Barren or `timeout` seconds pass, then stop
+        tending it. Returns True if the field settled.
+        """
+        supervisor = supervisor or tending.supervisor()
+        supervisor.add(self.project_id, self)
+        try:
+            return self.settled.wait(timeout)
+        finally:
+            supervisor.remove(self.project_id)
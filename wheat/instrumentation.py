@@ -0,0 +1,344 @@
+"""
+Instrumentation — Scrapeable counters and histograms for the app and the runner.
+
+  providers     wheat_llm_calls_total, wheat_llm_retries_total, wheat_llm_latency_seconds
+  scan_tasks    wheat_scans_total, wheat_scan_signals_total
+  analyst       wheat_analyst_runs_total
+  escalation    wheat_cases_created_total, wheat_case_signals_total,
+                wheat_escalations_total, wheat_cases_resolved_total,
+                wheat_db_query_seconds
+  daily_intake  wheat_intake_reports_total
+  FieldManager  wheat_seeds_sown_total, wheat_seeds_finished_total,
+                wheat_db_query_seconds (seed store flushes)
+  tending       wheat_tend_queue_depth, wheat_tend_jobs_running (gauges)
+  speculation   wheat_speculation_candidates_total, wheat_speculation_tokens_total,
+                wheat_speculation_first_fruitful_seconds
+
+GET /metrics renders them in the Prometheus text exposition format.
+
+Other processes (the daily runner) call start_publishing(), which writes
+their values to data/metrics/<pid>-<random>.json every PUBLISH_INTERVAL
+seconds and at exit; render() adds every running process's file to its
+own values. The file of a process that has exited, or stopped publishing
+for STALE_AFTER seconds, is folded into data/metrics/accumulated.json
+and deleted, so served counters never go down. Gauges come only from
+running processes.
+"""
+
+import atexit
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from functools import wraps
+
+from wheat.atomic_io import atomic_write_json, locked, read_json
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+METRICS_DIR = os.path.join(PROJECT_ROOT, "data", "metrics")
+PUBLISH_INTERVAL = 15
+STALE_AFTER = PUBLISH_INTERVAL * 8  # a file not refreshed for this long belongs to a finished process
+ACCUMULATED_FILE = "accumulated.json"
+
+LATENCY_BUCKETS = (0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600)
+DB_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5)
+
+_lock = threading.Lock()
+_metrics = {}  # name -> Counter / Gauge / Histogram, in registration order
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_string(names, labels):
+    if set(labels) != set(names):
+        raise ValueError(f"expected labels {sorted(names)}, got {sorted(labels)}")
+    return ",".join(f'{name}="{_escape(labels[name])}"' for name in names)
+
+
+class Counter:
+    """A monotonically increasing count per label set."""
+    kind = "counter"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.values = {}  # label string -> float
+        with _lock:
+            _metrics[name] = self
+
+    def inc(self, amount=1, **labels):
+        key = _label_string(self.labels, labels)
+        with _lock:
+            self.values[key] = self.values.get(key, 0) + amount
+
+
+class Gauge:
+    """A current value per label set."""
+    kind = "gauge"
+
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.values = {}  # label string -> float
+        with _lock:
+            _metrics[name] = self
+
+    def set(self, value, **labels):
+        key = _label_string(self.labels, labels)
+        with _lock:
+            self.values[key] = value
+
+
+class Histogram:
+    """Observations counted into cumulative buckets, with their sum and count, per label set."""
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labels=(), buckets=LATENCY_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(buckets)
+        self.values = {}  # label string -> [per-bucket counts..., +Inf count, sum]
+        with _lock:
+            _metrics[name] = self
+
+    def observe(self, value, **labels):
+        key = _label_string(self.labels, labels)
+        with _lock:
+            row = self.values.get(key)
+            if row is None:
+                row = self.values[key] = [0] * (len(self.buckets) + 1) + [0.0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    row[i] += 1
+            row[-2] += 1
+            row[-1] += value
+
+    @contextmanager
+    def time(self, **labels):
+        """Observe the duration of the enclosed block (also when it raises)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start, **labels)
+
+
+def timed(histogram, **labels):
+    """Decorator: observe each call's duration in `histogram`."""
+    def decorate(fn):
+        @wraps(fn)
+        def wrapper(*args, **kwargs):
+            with histogram.time(**labels):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+LLM_CALLS = Counter("wheat_llm_calls_total", "LLM provider call attempts by outcome.", ("provider", "model", "outcome"))
+LLM_RETRIES = Counter("wheat_llm_retries_total", "LLM call attempts that failed and were retried.", ("provider", "model"))
+LLM_LATENCY = Histogram("wheat_llm_latency_seconds", "LLM provider call latency.", ("provider", "model"))
+SCANS = Counter("wheat_scans_total", "Channel scans by outcome.", ("channel", "outcome"))
+SCAN_SIGNALS = Counter("wheat_scan_signals_total", "Usable signals returned by channel scans.", ("channel",))
+ANALYST_RUNS = Counter("wheat_analyst_runs_total", "Analyst correlation and briefing runs by outcome.", ("kind", "outcome"))
+CASES_CREATED = Counter("wheat_cases_created_total", "New escalation cases.", ("field", "source"))
+CASE_SIGNALS = Counter("wheat_case_signals_total", "Signals added as evidence to an existing open case.", ("field",))
+ESCALATIONS = Counter("wheat_escalations_total", "Case escalations by the stage entered.", ("stage",))
+CASES_RESOLVED = Counter("wheat_cases_resolved_total", "Cases resolved (harvested).")
+INTAKE_REPORTS = Counter("wheat_intake_reports_total", "Community reports handled by daily intake.", ("outcome",))
+SEEDS_SOWN = Counter("wheat_seeds_sown_total", "Seeds sown by the strategist.", ("field",))
+SEEDS_FINISHED = Counter("wheat_seeds_finished_total", "Seeds that finished a tending round, by status.", ("field", "status"))
+TEND_QUEUE_DEPTH = Gauge("wheat_tend_queue_depth", "Tending jobs waiting for a worker, across all fields.")
+TEND_RUNNING = Gauge("wheat_tend_jobs_running", "Tending jobs running on the shared worker pool.")
+SPECULATION_CANDIDATES = Counter("wheat_speculation_candidates_total", "Speculative seed candidates by outcome.", ("outcome",))
+SPECULATION_TOKENS = Counter("wheat_speculation_tokens_total", "Tokens spent by speculative candidates, by candidate outcome.", ("outcome",))
+SPECULATION_FIRST_FRUITFUL = Histogram("wheat_speculation_first_fruitful_seconds", "Time from the start of a speculative race to its first passing candidate.")
+DB_QUERY = Histogram("wheat_db_query_seconds", "SQLite work per operation.", ("op",), buckets=DB_BUCKETS)
+
+
+def source_kind(source):
+    """Bounded label for a case source: "scan:google_reviews" -> "scan"."""
+    return (source or "unknown").split(":", 1)[0]
+
+
+# ---------------------------------------------------------------------------
+# Cross-process publishing and exposition
+# ---------------------------------------------------------------------------
+
+def snapshot():
+    """{metric name: {label string: value or histogram row}} for this process."""
+    with _lock:
+        return {
+            name: {key: list(v) if isinstance(v, list) else v for key, v in metric.values.items()}
+            for name, metric in _metrics.items()
+        }
+
+
+_process_key = None
+
+
+def _file_name():
+    """This process's file name: its pid plus a random part, since pids get reused."""
+    global _process_key
+    if _process_key is None or not _process_key.startswith(f"{os.getpid()}-"):
+        _process_key = f"{os.getpid()}-{uuid.uuid4().hex[:8]}"
+    return f"{_process_key}.json"
+
+
+def publish(metrics_dir=None):
+    """Write this process's values to <metrics_dir>/<pid>-<random>.json."""
+    metrics_dir = metrics_dir or METRICS_DIR
+    os.makedirs(metrics_dir, exist_ok=True)
+    atomic_write_json(
+        os.path.join(metrics_dir, _file_name()),
+        {"pid": os.getpid(), "updated_at": time.time(), "metrics": snapshot()},
+        indent=None,
+    )
+
+
+_publisher = None
+
+
+def start_publishing(interval=PUBLISH_INTERVAL, metrics_dir=None):
+    """Publish this process's values every `interval` seconds and at exit (idempotent)."""
+    global _publisher
+    if _publisher is not None:
+        return _publisher
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                publish(metrics_dir)
+            except OSError as e:
+                print(f"  Metrics publish failed: {e}")
+
+    _publisher = threading.Thread(target=loop, name="metrics-publisher", daemon=True)
+    _publisher.start()
+    atexit.register(lambda: (stop.set(), publish(metrics_dir)))
+    return _publisher
+
+
+def _alive(pid):
+    if not isinstance(pid, int):
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:  # exists, owned by someone else
+        return True
+    return True
+
+
+def _add(target, other, skip_gauges=False):
+    """Sum `other` ({name: {label string: value or histogram row}}) into `target`."""
+    for name, series in other.items():
+        metric = _metrics.get(name)
+        if skip_gauges and metric is not None and metric.kind == "gauge":
+            continue
+        dest = target.setdefault(name, {})
+        for key, value in series.items():
+            current = dest.get(key)
+            if current is None:
+                dest[key] = list(value) if isinstance(value, list) else value
+            elif not isinstance(value, list):
+                dest[key] = current + value
+            elif isinstance(current, list) and len(current) == len(value):
+                dest[key] = [a + b for a, b in zip(current, value)]
+
+
+def _fold(metrics_dir, names):
+    """
+    Add finished processes' files to the accumulated totals and delete
+    them; returns the totals. The folded names are recorded first, so a
+    crash before the deletes can't count a file twice.
+    """
+    path = os.path.join(metrics_dir, ACCUMULATED_FILE)
+    with locked(path):
+        accumulated = read_json(path) or {}
+        totals = accumulated.get("metrics") or {}
+        folded = set(accumulated.get("folded") or [])
+        for name in names:
+            data = None if name in folded else read_json(os.path.join(metrics_dir, name))
+            if data and isinstance(data.get("metrics"), dict):
+                _add(totals, data["metrics"], skip_gauges=True)
+                folded.add(name)
+        folded = {name for name in folded if os.path.exists(os.path.join(metrics_dir, name))}
+        atomic_write_json(path, {"metrics": totals, "folded": sorted(folded)}, indent=None)
+        for name in folded:
+            try:
+                os.unlink(os.path.join(metrics_dir, name))
+            except OSError:
+                pass
+    return totals
+
+
+def _published(metrics_dir):
+    """(accumulated totals of finished processes, [values of each running process]), folding newly finished ones."""
+    try:
+        names = [f for f in os.listdir(metrics_dir) if f.endswith(".json")]
+    except OSError:
+        return {}, []
+    own = _file_name()
+    now = time.time()
+    live, finished = [], []
+    for name in names:
+        if name in (own, ACCUMULATED_FILE):
+            continue
+        path = os.path.join(metrics_dir, name)
+        data = read_json(path)
+        if not data or not isinstance(data.get("metrics"), dict):
+            continue
+        try:
+            fresh = os.path.getmtime(path) > now - STALE_AFTER
+        except OSError:
+            continue
+        if fresh and _alive(data.get("pid")):
+            live.append(data["metrics"])
+        else:
+            finished.append(name)
+    if finished:
+        return _fold(metrics_dir, finished), live
+    accumulated = read_json(os.path.join(metrics_dir, ACCUMULATED_FILE)) or {}
+    return accumulated.get("metrics") or {}, live
+
+
+def collect(metrics_dir=None):
+    """This process's values plus finished processes' totals and every running process's values, summed."""
+    merged = snapshot()
+    accumulated, live = _published(metrics_dir or METRICS_DIR)
+    _add(merged, accumulated, skip_gauges=True)
+    for other in live:
+        _add(merged, other)
+    return merged
+
+
+def _format(value):
+    return repr(float(value)) if isinstance(value, float) and not value.is_integer() else str(int(value))
+
+
+def render(metrics_dir=None):
+    """Every metric in the Prometheus text exposition format (version 0.0.4)."""
+    values = collect(metrics_dir)
+    lines = []
+    for name, metric in list(_metrics.items()):
+        lines.append(f"# HELP {name} {metric.help}")
+        lines.append(f"# TYPE {name} {metric.kind}")
+        for key, value in sorted(values.get(name, {}).items()):
+            if metric.kind != "histogram":
+                lines.append(f"{name}{{{key}}} {_format(value)}" if key else f"{name} {_format(value)}")
+                continue
+            sep = "," if key else ""
+            for bound, count in zip(metric.buckets + ("+Inf",), value[:-1]):
+                le = bound if bound == "+Inf" else _format(float(bound))
+                lines.append(f'{name}_bucket{{{key}{sep}le="{le}"}} {_format(count)}')
+            labels = f"{{{key}}}" if key else ""
+            lines.append(f"{name}_sum{labels} {_format(value[-1])}")
+            lines.append(f"{name}_count{labels} {_format(value[-2])}")
+    return "\n".join(lines) + "\n"
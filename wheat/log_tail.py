@@ -0,0 +1,217 @@
+"""
+Log Tail — One shared follower per log file, fanned out to every watcher.
+
+follow(path) returns the one LogTail for that file: a single reader
+thread and file handle, however many watch. It waits for writes with
+inotify on Linux (through ctypes) and falls back to a stat() size check
+every POLL_SECONDS. New lines go into a ring of the last BACKLOG_LINES.
+
+read(cursor) returns everything after a watcher's cursor in one batch; a
+late joiner (cursor None) gets the backlog, and a watcher that fell
+further behind is told how many lines it skipped. finish(path) marks the
+writer as done: the reader drains what's left, then read() reports
+finished.
+"""
+
+import collections
+import ctypes
+import ctypes.util
+import itertools
+import os
+import select
+import threading
+import time
+
+BACKLOG_LINES = 500   # Lines a late joiner gets
+POLL_SECONDS = 0.5    # Stat fallback interval, and how often inotify re-checks for finish()
+
+_tails = {}
+_tails_lock = threading.Lock()
+
+
+class _Inotify:
+    """Minimal inotify watch on one file (Linux only)."""
+
+    IN_MODIFY = 0x002
+    IN_ATTRIB = 0x004
+    IN_CLOSE_WRITE = 0x008
+    IN_DELETE_SELF = 0x400
+    IN_MOVE_SELF = 0x800
+
+    _libc = None
+
+    @classmethod
+    def available(cls):
+        if cls._libc is None:
+            try:
+                libc = ctypes.CDLL(ctypes.util.find_library("c"), use_errno=True)
+            except (OSError, TypeError):
+                libc = None
+            cls._libc = libc if libc is not None and hasattr(libc, "inotify_init1") else False
+        return bool(cls._libc)
+
+    def __init__(self, path):
+        self.fd = self._libc.inotify_init1(os.O_NONBLOCK | getattr(os, "O_CLOEXEC", 0))
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = self.IN_MODIFY | self.IN_ATTRIB | self.IN_CLOSE_WRITE | self.IN_DELETE_SELF | self.IN_MOVE_SELF
+        if self._libc.inotify_add_watch(self.fd, os.fsencode(path), mask) < 0:
+            os.close(self.fd)
+            raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {path}")
+
+    def wait(self, timeout):
+        """Block until the file changes or `timeout` passes."""
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if ready:
+            try:
+                while os.read(self.fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+
+    def close(self):
+        os.close(self.fd)
+
+
+class _StatWatcher:
+    """Fallback: sleep until the file's size or inode changes."""
+
+    def __init__(self, path):
+        self.path = path
+        self._last = self._stat()
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_ino, st.st_size, st.st_mtime_ns
+        except OSError:
+            return None
+
+    def wait(self, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            time.sleep(min(POLL_SECONDS, max(deadline - time.monotonic(), 0)))
+            current = self._stat()
+            if current != self._last:
+                self._last = current
+                return
+
+    def close(self):
+        pass
+
+
+def _watcher(path, use_inotify=True):
+    if use_inotify and _Inotify.available():
+        try:
+            return _Inotify(path)
+        except OSError:
+            pass
+    return _StatWatcher(path)
+
+
+class LogTail:
+    def __init__(self, path, backlog=BACKLOG_LINES, use_inotify=True):
+        self.path = path
+        self.use_inotify = use_inotify
+        self.finished = False
+        self._lines = collections.deque(maxlen=backlog)
+        self._seq = 0            # lines appended so far; watchers keep it as their cursor
+        self._finishing = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name=f"log-tail {os.path.basename(path)}", daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def finish(self):
+        """The writer is done: drain the rest of the file, then stop."""
+        self._finishing = True
+
+    def _publish(self, lines):
+        with self._cond:
+            self._lines.extend(lines)
+            self._seq += len(lines)
+            self._cond.notify_all()
+
+    def _run(self):
+        f = watcher = None
+        partial = ""
+        try:
+            while f is None:
+                if os.path.exists(self.path):
+                    f = open(self.path, "r", encoding="utf-8", errors="replace")
+                    watcher = _watcher(self.path, self.use_inotify)
+                elif self._finishing:
+                    return
+                else:
+                    time.sleep(POLL_SECONDS)
+            while True:
+                try:
+                    if os.stat(self.path).st_size < f.tell():  # truncated — a new cycle rewrote the log
+                        f.seek(0)
+                        partial = ""
+                except OSError:
+                    pass
+                chunk = f.read()
+                if chunk:
+                    lines = (partial + chunk).split("\n")
+                    partial = lines.pop()
+                    if lines:
+                        self._publish(lines)
+                elif self._finishing:
+                    if partial:
+                        self._publish([partial])
+                    return
+                else:
+                    watcher.wait(POLL_SECONDS)
+        finally:
+            if f is not None:
+                f.close()
+            if watcher is not None:
+                watcher.close()
+            with self._cond:
+                self.finished = True
+                self._cond.notify_all()
+
+    def read(self, cursor=None, timeout=None):
+        """
+        Lines after `cursor` (None = the backlog), waiting up to `timeout`
+        seconds for some. Returns (lines, new_cursor, skipped) where skipped
+        counts lines that had already left the ring buffer.
+        """
+        with self._cond:
+            oldest = self._seq - len(self._lines)
+            if cursor is None:
+                cursor = oldest
+            self._cond.wait_for(lambda: self._seq > cursor or self.finished, timeout)
+            oldest = self._seq - len(self._lines)
+            start = max(cursor, oldest)
+            lines = list(itertools.islice(self._lines, start - oldest, None))
+            return lines, self._seq, start - cursor
+
+
+def follow(path, backlog=BACKLOG_LINES):
+    """The shared, started LogTail for a file."""
+    key = os.path.realpath(path)
+    with _tails_lock:
+        tail = _tails.get(key)
+        if tail is None:
+            tail = _tails[key] = LogTail(path, backlog).start()
+        return tail
+
+
+def finish(path):
+    """Tell the file's tail (if any) that the writer has exited."""
+    with _tails_lock:
+        tail = _tails.get(os.path.realpath(path))
+    if tail is not None:
+        tail.finish()
+
+
+def forget(path):
+    """Drop a file's tail so the next follow() starts fresh (e.g. a new cycle)."""
+    with _tails_lock:
+        tail = _tails.pop(os.path.realpath(path), None)
+    if tail is not None:
+        tail.finish()
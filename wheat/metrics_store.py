@@ -0,0 +1,322 @@
+"""
+Metrics Store — Append-only history of cycle metrics, downsampled and pruned.
+
+Every finished cycle records its samples in metric_samples in wheat.db,
+one row per (name, labels, value); a resumed cycle's samples replace
+those its interrupted run recorded:
+
+  cycle_seconds           {outcome}           wall time of the cycle graph
+  node_seconds            {node, phase}       each graph node (scan:<id>, field:<id>, ...)
+  critical_path_seconds   {}
+  time_to_first_field_seconds {}
+  channel_signals         {channel}           usable signals per scanned channel
+  seeds_fruitful / seeds_barren / seeds_total {field}
+  llm_call_seconds        {model}             every provider span in the cycle trace
+  node_errors             {node}              graph nodes that raised
+
+compact() rolls raw samples older than RAW_RETENTION_DAYS into one
+metric_rollups row per (day, name, labels) with count, sum, min, max,
+p50 and p95, and drops rollups older than ROLLUP_RETENTION_DAYS.
+series() and trends() read both (percentiles across rollup days are
+count-weighted averages).
+"""
+
+import json
+import os
+import sqlite3
+from datetime import date, datetime, timedelta
+
+from wheat.tracing import percentile
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DB_PATH = os.path.join(PROJECT_ROOT, "wheat.db")
+
+RAW_RETENTION_DAYS = 30
+ROLLUP_RETENTION_DAYS = 730
+BUCKETS = ("day", "week")
+
+
+def init_metrics_db():
+    """Create the sample and rollup tables if they don't exist."""
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    c.execute("""CREATE TABLE IF NOT EXISTS metric_samples (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        ts TEXT NOT NULL,
+        cycle_id TEXT,
+        name TEXT NOT NULL,
+        labels TEXT NOT NULL DEFAULT '{}',
+        value REAL NOT NULL
+    )""")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_metric_samples_name_ts ON metric_samples (name, ts)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_metric_samples_ts ON metric_samples (ts)")
+    c.execute("""CREATE TABLE IF NOT EXISTS metric_rollups (
+        day TEXT NOT NULL,
+        name TEXT NOT NULL,
+        labels TEXT NOT NULL,
+        count INTEGER NOT NULL,
+        sum REAL NOT NULL,
+        min REAL NOT NULL,
+        max REAL NOT NULL,
+        p50 REAL NOT NULL,
+        p95 REAL NOT NULL,
+        PRIMARY KEY (name, day, labels)
+    )""")
+    conn.commit()
+    conn.close()
+
+
+def _labels_key(labels):
+    return json.dumps(labels or {}, sort_keys=True, separators=(",", ":"))
+
+
+def record(samples, cycle_id=None, ts=None, replace=False):
+    """
+    Append samples — (name, value) or (name, value, labels) tuples — in one
+    transaction. Samples whose value is None are skipped. With replace=True
+    the cycle's earlier samples are deleted in the same transaction.
+    Returns the count.
+    """
+    ts = (ts or datetime.now()).strftime("%Y-%m-%dT%H:%M:%S")
+    rows = []
+    for sample in samples:
+        name, value = sample[0], sample[1]
+        if value is None:
+            continue
+        labels = sample[2] if len(sample) > 2 else None
+        rows.append((ts, cycle_id, name, _labels_key(labels), float(value)))
+    if not rows:
+        return 0
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    try:
+        if replace and cycle_id is not None:
+            conn.execute("DELETE FROM metric_samples WHERE cycle_id = ?", (cycle_id,))
+        conn.executemany(
+            "INSERT INTO metric_samples (ts, cycle_id, name, labels, value) VALUES (?, ?, ?, ?, ?)", rows
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    return len(rows)
+
+
+def cycle_samples(outcome, timings=None, spans=(), scan_results=None, field_results=None,
+                  wall_seconds=None, critical_path_seconds=None, time_to_first_field_seconds=None,
+                  errors=()):
+    """
+    Samples for one finished cycle, from the GraphRun timings
+    ({node: {"seconds", ...}}), the trace's span events, the scan results
+    ({channel_id: result}) and the field results ({field_id: status}).
+    """
+    from wheat.scan_scheduler import count_signals
+
+    samples = [
+        ("cycle_seconds", wall_seconds, {"outcome": outcome}),
+        ("critical_path_seconds", critical_path_seconds),
+        ("time_to_first_field_seconds", time_to_first_field_seconds),
+    ]
+    for node, timing in (timings or {}).items():
+        samples.append(("node_seconds", timing.get("seconds"), {"node": node, "phase": node.split(":")[0]}))
+    for node in errors:
+        samples.append(("node_errors", 1, {"node": node}))
+    for cid, result in (scan_results or {}).items():
+        if result:
+            samples.append(("channel_signals", count_signals(result), {"channel": cid}))
+    for pid, status in (field_results or {}).items():
+        if not status:
+            continue
+        seeds = status.get("seeds", [])
+        samples.append(("seeds_total", len(seeds), {"field": pid}))
+        samples.append(("seeds_fruitful", sum(1 for s in seeds if s.get("status") == "Fruitful"), {"field": pid}))
+        samples.append(("seeds_barren", sum(1 for s in seeds if s.get("status") == "Barren"), {"field": pid}))
+    for event in spans:
+        if event.get("cat") == "provider":
+            model = (event.get("args") or {}).get("model") or "default"
+            samples.append(("llm_call_seconds", event["dur"] / 1e6, {"model": model}))
+    return samples
+
+
+def _summarise(values):
+    return {
+        "count": len(values),
+        "sum": sum(values),
+        "min": min(values),
+        "max": max(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+    }
+
+
+def _merge(a, b):
+    """Combine two summaries; percentiles become count-weighted averages."""
+    count = a["count"] + b["count"]
+    return {
+        "count": count,
+        "sum": a["sum"] + b["sum"],
+        "min": min(a["min"], b["min"]),
+        "max": max(a["max"], b["max"]),
+        "p50": (a["p50"] * a["count"] + b["p50"] * b["count"]) / count,
+        "p95": (a["p95"] * a["count"] + b["p95"] * b["count"]) / count,
+    }
+
+
+def compact(now=None):
+    """
+    Roll raw samples older than RAW_RETENTION_DAYS into daily rollups and
+    drop rollups older than ROLLUP_RETENTION_DAYS. Returns (rolled, dropped).
+    """
+    today = (now or datetime.now()).date()
+    raw_cutoff = (today - timedelta(days=RAW_RETENTION_DAYS)).isoformat()
+    rollup_cutoff = (today - timedelta(days=ROLLUP_RETENTION_DAYS)).isoformat()
+
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    try:
+        c = conn.cursor()
+        c.execute("SELECT substr(ts, 1, 10), name, labels, value FROM metric_samples WHERE ts < ?", (raw_cutoff,))
+        groups = {}
+        for day, name, labels, value in c.fetchall():
+            groups.setdefault((day, name, labels), []).append(value)
+
+        for (day, name, labels), values in groups.items():
+            summary = _summarise(values)
+            c.execute(
+                "SELECT count, sum, min, max, p50, p95 FROM metric_rollups WHERE name = ? AND day = ? AND labels = ?",
+                (name, day, labels),
+            )
+            row = c.fetchone()
+            if row:
+                summary = _merge(dict(zip(("count", "sum", "min", "max", "p50", "p95"), row)), summary)
+            c.execute(
+                """INSERT OR REPLACE INTO metric_rollups (day, name, labels, count, sum, min, max, p50, p95)
+                   VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)""",
+                (day, name, labels, summary["count"], summary["sum"], summary["min"], summary["max"],
+                 summary["p50"], summary["p95"]),
+            )
+        c.execute("DELETE FROM metric_samples WHERE ts < ?", (raw_cutoff,))
+        rolled = c.rowcount
+        c.execute("DELETE FROM metric_rollups WHERE day < ?", (rollup_cutoff,))
+        dropped = c.rowcount
+        conn.commit()
+    finally:
+        conn.close()
+    return rolled, dropped
+
+
+def record_cycle(cycle_id, samples, now=None):
+    """
+    Store a cycle's samples and compact; returns the number stored. A
+    resumed cycle records again under the same cycle_id, so its samples
+    replace the earlier run's rather than adding to them.
+    """
+    init_metrics_db()
+    stored = record(samples, cycle_id=cycle_id, ts=now, replace=True)
+    compact(now=now)
+    return stored
+
+
+def _bucket_of(day, bucket):
+    if bucket == "week":
+        d = date.fromisoformat(day)
+        return (d - timedelta(days=d.weekday())).isoformat()
+    return day
+
+
+def series(name, days=30, bucket="day", now=None):
+    """
+    {labels_json: [{"bucket", "count", "sum", "avg", "min", "max", "p50", "p95"}, ...]}
+    for one metric over the last `days` days, oldest bucket first.
+    """
+    if bucket not in BUCKETS:
+        raise ValueError(f"bucket must be one of {', '.join(BUCKETS)}")
+    since = ((now or datetime.now()).date() - timedelta(days=days - 1)).isoformat()
+
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    try:
+        c = conn.cursor()
+        c.execute(
+            "SELECT substr(ts, 1, 10), labels, value FROM metric_samples WHERE name = ? AND ts >= ?",
+            (name, since),
+        )
+        raw = {}
+        for day, labels, value in c.fetchall():
+            raw.setdefault((labels, _bucket_of(day, bucket)), []).append(value)
+        c.execute(
+            "SELECT day, labels, count, sum, min, max, p50, p95 FROM metric_rollups WHERE name = ? AND day >= ?",
+            (name, since),
+        )
+        rollups = c.fetchall()
+    except sqlite3.OperationalError:  # init_metrics_db() not run on this database yet
+        return {}
+    finally:
+        conn.close()
+
+    merged = {key: _summarise(values) for key, values in raw.items()}
+    for day, labels, *stats in rollups:
+        key = (labels, _bucket_of(day, bucket))
+        summary = dict(zip(("count", "sum", "min", "max", "p50", "p95"), stats))
+        merged[key] = _merge(merged[key], summary) if key in merged else summary
+
+    out = {}
+    for (labels, bucket_start), summary in sorted(merged.items(), key=lambda item: item[0][1]):
+        out.setdefault(labels, []).append({
+            "bucket": bucket_start,
+            **{k: round(v, 3) for k, v in summary.items() if k != "count"},
+            "count": summary["count"],
+            "avg": round(summary["sum"] / summary["count"], 3),
+        })
+    return out
+
+
+def _by_label(name, label, days, bucket, now):
+    """series() keyed by one label's value."""
+    return {json.loads(labels).get(label, ""): points for labels, points in series(name, days, bucket, now).items()}
+
+
+def _totals(name, days, bucket, now):
+    """{bucket: sum over all label sets}."""
+    totals = {}
+    for points in series(name, days, bucket, now).values():
+        for p in points:
+            totals[p["bucket"]] = totals.get(p["bucket"], 0) + p["sum"]
+    return totals
+
+
+def trends(days=30, bucket="day", now=None):
+    """Cycle duration, failure rate, signals per channel, fruitful ratio and LLM latency over time."""
+    cycles = _by_label("cycle_seconds", "outcome", days, bucket, now)
+    per_bucket = {}
+    for outcome, points in cycles.items():
+        for p in points:
+            entry = per_bucket.setdefault(p["bucket"], {"cycles": 0, "failed": 0})
+            entry["cycles"] += p["count"]
+            if outcome == "failed":
+                entry["failed"] += p["count"]
+
+    fruitful = _totals("seeds_fruitful", days, bucket, now)
+    total = _totals("seeds_total", days, bucket, now)
+    latency = series("llm_call_seconds", days, bucket, now)
+
+    return {
+        "days": days,
+        "bucket": bucket,
+        "cycle_seconds": cycles.get("complete", []),
+        "cycle_failure_rate": [
+            {"bucket": b, "cycles": e["cycles"], "failed": e["failed"], "rate": round(e["failed"] / e["cycles"], 3)}
+            for b, e in sorted(per_bucket.items())
+        ],
+        "signals_per_channel": {
+            channel: [{"bucket": p["bucket"], "signals": p["sum"], "scans": p["count"]} for p in points]
+            for channel, points in sorted(_by_label("channel_signals", "channel", days, bucket, now).items())
+        },
+        "fruitful_ratio": [
+            {"bucket": b, "fruitful": fruitful.get(b, 0), "seeds": n, "ratio": round(fruitful.get(b, 0) / n, 3)}
+            for b, n in sorted(total.items()) if n
+        ],
+        "llm_latency": {
+            json.loads(labels).get("model", ""): [
+                {"bucket": p["bucket"], "calls": p["count"], "p50": p["p50"], "p95": p["p95"], "max": p["max"]}
+                for p in points
+            ]
+            for labels, points in sorted(latency.items())
+        },
+    }
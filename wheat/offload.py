@@ -0,0 +1,49 @@
+"""
+Offload — Run blocking SQLite/filesystem work off the serving event loop.
+
+Under serve.py the app runs on gevent: request handlers and SSE streams
+are greenlets sharing one OS thread, so a slow SQLite query or directory
+scan in a handler stalls every open stream. offload(fn, *args) runs fn in
+gevent's native thread pool and yields the loop until it returns. Under
+the development server (`python app.py`) or in tests it just calls fn.
+
+Work that outlives a request needs native threads too, because
+monkey.patch_all() turns threading.Thread and ThreadPoolExecutor workers
+into greenlets on the serving hub: spawn_native() starts a fire-and-forget
+job (scans) and native_executor() builds a ThreadPoolExecutor whose
+workers are real threads (the tending pool, speculative candidates).
+"""
+
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def _gevent_active():
+    monkey = sys.modules.get("gevent.monkey")
+    return monkey is not None and monkey.is_module_patched("socket")
+
+
+def offload(fn, *args, **kwargs):
+    """fn(*args, **kwargs), in a native worker thread when serving on gevent."""
+    if _gevent_active():
+        import gevent
+        return gevent.get_hub().threadpool.apply(fn, args, kwargs)
+    return fn(*args, **kwargs)
+
+
+def spawn_native(fn, *args):
+    """Run fn(*args) in a new native thread, without waiting for it."""
+    if _gevent_active():
+        from gevent import monkey
+        monkey.get_original("_thread", "start_new_thread")(fn, args)
+        return
+    threading.Thread(target=fn, args=args, daemon=True).start()
+
+
+def native_executor(max_workers, thread_name_prefix=""):
+    """A ThreadPoolExecutor on native threads even when gevent has patched threading."""
+    if _gevent_active():
+        from gevent.threadpool import ThreadPoolExecutor as NativeThreadPoolExecutor
+        return NativeThreadPoolExecutor(max_workers=max_workers)
+    return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=thread_name_prefix)
@@ -1,5 +1,7 @@
 import os
-import json
+
+from wheat import config_registry
+from wheat.atomic_io import atomic_write_json, locked, update_json
 
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 DB_PATH = os.path.join(PROJECT_ROOT, "wheat.db")
@@ -7,41 +9,66 @@ CONFIG_PATH = os.path.join(PROJECT_ROOT, "config.json")
 PROJECTS_PATH = os.path.join(PROJECT_ROOT, "projects.json")
 
 
+PROJECT_CONFIG_KEYS = (
+    "llm_api", "models", "seeds_per_run", "max_tokens", "timeout",
+    "lifespan", "strategist_prompt", "coder_prompt", "rescue_prompt",
+    "claude_code_model", "claude_code_timeout",
+    "seed_timeout", "seed_cpu_seconds", "seed_memory_mb", "seed_warm_pool",
+    "tending_priority", "speculative",
+)
+
+
+def _default_projects():
+    return {"default": {"name": "Default Field", "active": True}}
+
+
 def load_config():
-    with open(CONFIG_PATH, "r") as f:
-        return json.load(f)
+    """Base config from config.json (a read-only snapshot; see wheat/config_registry.py)."""
+    config = config_registry.load_json(CONFIG_PATH)
+    if config is None:
+        raise FileNotFoundError(CONFIG_PATH)
+    return config
 
 
 def load_projects():
-    """Load all project definitions from projects.json."""
-    if not os.path.exists(PROJECTS_PATH):
-        return {"default": {"name": "Default Field", "active": True}}
-    with open(PROJECTS_PATH, "r") as f:
-        return json.load(f)
+    """Load all project definitions from projects.json (a read-only snapshot)."""
+    return config_registry.load_json(PROJECTS_PATH, default=_default_projects)
 
 
 def save_projects(projects):
-    with open(PROJECTS_PATH, "w") as f:
-        json.dump(projects, f, indent=2)
+    with locked(PROJECTS_PATH):
+        atomic_write_json(PROJECTS_PATH, projects)
+    config_registry.invalidate(PROJECTS_PATH)
+
+
+def update_projects(update):
+    """
+    Read-modify-write projects.json under its lock: update(projects) edits
+    a fresh copy and returns it, so concurrent edits are never lost.
+    """
+    projects = update_json(PROJECTS_PATH, lambda current: update(current or _default_projects()))
+    config_registry.invalidate(PROJECTS_PATH)
+    return projects
+
+
+def _merge_project_configs(base, projects):
+    merged = {}
+    for project_id, project in projects.items():
+        config = dict(base)
+        config.update((key, project[key]) for key in PROJECT_CONFIG_KEYS if key in project)
+        merged[project_id] = config_registry.FrozenDict(config)
+    return config_registry.FrozenDict(merged)
 
 
 def load_project_config(project_id):
     """
     Load merged config for a project.
     Base config from config.json, overridden by project-specific settings.
+    Merged once per change to either file and shared read-only.
     """
     base = load_config()
-    projects = load_projects()
-    project = projects.get(project_id, {})
-
-    merged = {**base}
-    for key in ("llm_api", "models", "seeds_per_run", "max_tokens", "timeout",
-                "lifespan", "strategist_prompt", "coder_prompt", "rescue_prompt",
-                "claude_code_model", "claude_code_timeout"):
-        if key in project:
-            merged[key] = project[key]
-
-    return merged
+    merged = config_registry.derived("project_configs", (base, load_projects()), _merge_project_configs)
+    return merged.get(project_id, base)
 
 
 def project_dir(project_id):
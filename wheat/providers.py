@@ -8,6 +8,12 @@ LLM provider abstraction. Supports:
     model override (e.g. --model sonnet for scanning, opus for deep analysis).
 
 Each provider implements generate(prompt, model, max_tokens) -> (text, usage_dict)
+
+Both also take cancel=, a CancelScope (wheat/cancel.py): the CLI call runs
+in its own session so cancelling kills it mid-flight; an API request can't
+be interrupted, so it is checked before each attempt and its response
+dropped if the scope was cancelled meanwhile. Either way generate() raises
+Cancelled without retrying, and retry backoffs end early on cancel.
 """
 import json
 import os
@@ -18,6 +24,9 @@ import time
 import random
 import requests
 from datetime import datetime
+from wheat.cancel import Cancelled
+from wheat.tracing import span
+from wheat.instrumentation import LLM_CALLS, LLM_LATENCY, LLM_RETRIES
 
 # Resolve claude CLI path at import time so it works even when subprocess
 # inherits a PATH that doesn't include nvm (e.g. Flask/cron environments).
@@ -26,6 +35,15 @@ from datetime import datetime
 _CLAUDE_BIN = shutil.which("claude") or "claude"
 
 
+def _backoff(attempt, cancel=None):
+    """Sleep before retry `attempt + 1`; raises Cancelled if `cancel` fires meanwhile."""
+    delay = 2 ** attempt + random.uniform(0, 1)
+    if cancel is None:
+        time.sleep(delay)
+    elif cancel.wait(delay):
+        raise Cancelled()
+
+
 class APIProvider:
     """Venice / Grok / any OpenAI-compatible endpoint."""
 
@@ -34,7 +52,7 @@ class APIProvider:
         self.api_key = api_key
         self.timeout = timeout
 
-    def generate(self, prompt, model, max_tokens=4096, retries=3, sunshine_dir=None):
+    def generate(self, prompt, model, max_tokens=4096, retries=3, sunshine_dir=None, cancel=None):
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -54,10 +72,17 @@ class APIProvider:
 
         last_error = None
         for attempt in range(retries):
+            if cancel is not None:
+                cancel.check()
             try:
-                response = requests.post(
-                    self.api_url, headers=headers, json=payload, timeout=self.timeout
-                )
+                with span("api request", "provider", model=model, attempt=attempt), \
+                        LLM_LATENCY.time(provider="api", model=model):
+                    response = requests.post(
+                        self.api_url, headers=headers, json=payload, timeout=self.timeout
+                    )
+                if cancel is not None and cancel.cancelled:
+                    LLM_CALLS.inc(provider="api", model=model, outcome="cancelled")
+                    raise Cancelled()
                 response.raise_for_status()
                 data = response.json()
 
@@ -68,17 +93,20 @@ class APIProvider:
 
                 text = data["choices"][0]["message"]["content"].strip()
                 usage = data.get("usage", {})
+                LLM_CALLS.inc(provider="api", model=model, outcome="ok")
                 return text, {
                     "prompt_tokens": usage.get("prompt_tokens", len(prompt) // 4),
                     "completion_tokens": usage.get("completion_tokens", 0),
                 }
             except requests.RequestException as e:
                 last_error = e
+                LLM_CALLS.inc(provider="api", model=model, outcome="error")
                 if sunshine_dir:
                     with open(os.path.join(sunshine_dir, f"{timestamp}_error_{attempt}.json"), "w", encoding="utf-8") as f:
                         json.dump({"error": str(e)[:500]}, f, indent=2)
                 if attempt < retries - 1:
-                    time.sleep(2 ** attempt + random.uniform(0, 1))
+                    LLM_RETRIES.inc(provider="api", model=model)
+                    _backoff(attempt, cancel)
         raise last_error
 
 
@@ -99,7 +127,7 @@ class ClaudeCodeProvider:
         self.timeout = timeout
         self.model = model  # e.g. "opus", "sonnet" — None uses CLI default
 
-    def generate(self, prompt, model=None, max_tokens=None, retries=2, sunshine_dir=None):
+    def generate(self, prompt, model=None, max_tokens=None, retries=2, sunshine_dir=None, cancel=None):
         model = model or self.model
         last_error = None
 
@@ -123,15 +151,20 @@ class ClaudeCodeProvider:
                     cmd.extend(["--model", model])
                 # Clear nesting guard so claude CLI works from within a Claude Code session
                 env = {k: v for k, v in os.environ.items() if k not in ("CLAUDECODE", "CLAUDE_CODE_ENTRYPOINT")}
-                with open(prompt_file, "r", encoding="utf-8") as pf:
-                    result = subprocess.run(
-                        cmd,
-                        stdin=pf,
-                        capture_output=True,
-                        text=True,
-                        timeout=self.timeout,
-                        env=env,
-                    )
+                with open(prompt_file, "r", encoding="utf-8") as pf, \
+                        span("claude -p", "provider", model=model or "default", attempt=attempt), \
+                        LLM_LATENCY.time(provider="claude_code", model=model or "default"):
+                    if cancel is None:
+                        result = subprocess.run(
+                            cmd,
+                            stdin=pf,
+                            capture_output=True,
+                            text=True,
+                            timeout=self.timeout,
+                            env=env,
+                        )
+                    else:
+                        result = cancel.run(cmd, stdin=pf, timeout=self.timeout, env=env)
 
                 if result.returncode != 0:
                     raise RuntimeError(
@@ -139,6 +172,7 @@ class ClaudeCodeProvider:
                     )
 
                 text = result.stdout.strip()
+                LLM_CALLS.inc(provider="claude_code", model=model or "default", outcome="ok")
 
                 if sunshine_dir:
                     with open(os.path.join(sunshine_dir, f"{timestamp}_claude_response.json"), "w", encoding="utf-8") as f:
@@ -149,13 +183,18 @@ class ClaudeCodeProvider:
                     "completion_tokens": len(text) // 4,
                 }
 
+            except Cancelled:
+                LLM_CALLS.inc(provider="claude_code", model=model or "default", outcome="cancelled")
+                raise
             except (subprocess.TimeoutExpired, RuntimeError, FileNotFoundError) as e:
                 last_error = e
+                LLM_CALLS.inc(provider="claude_code", model=model or "default", outcome="error")
                 if sunshine_dir:
                     with open(os.path.join(sunshine_dir, f"{timestamp}_claude_error_{attempt}.json"), "w", encoding="utf-8") as f:
                         json.dump({"error": str(e)[:500]}, f, indent=2)
                 if attempt < retries - 1:
-                    time.sleep(2 ** attempt + random.uniform(0, 1))
+                    LLM_RETRIES.inc(provider="claude_code", model=model or "default")
+                    _backoff(attempt, cancel)
             finally:
                 if prompt_file and os.path.exists(prompt_file):
                     os.unlink(prompt_file)
@@ -0,0 +1,97 @@
+"""
+Rate Limit — Token buckets for pacing seed code generation.
+
+A TokenBucket holds up to `burst` tokens and refills at `rate` per
+second; each LLM call that generates or rescues a seed takes one.
+seed_generation() is the process-wide bucket every tending path shares
+(config.json "seed_generate_rate" and "seed_generate_burst"). The
+tending supervisor uses try_acquire() and delay() so waiting never
+occupies a worker; acquire() blocks.
+"""
+
+import threading
+import time
+
+DEFAULT_GENERATE_RATE = 2.0
+DEFAULT_GENERATE_BURST = 6
+
+
+class TokenBucket:
+    """`burst` tokens, refilled continuously at `rate` per second."""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+        self.rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._tokens = self.burst
+        self._updated = clock()
+        self._cond = threading.Condition()
+
+    def _refill(self):
+        now = self._clock()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self, n=1):
+        """Take n tokens if they are there now."""
+        with self._cond:
+            self._refill()
+            if self._tokens >= n:
+                self._tokens -= n
+                return True
+            return False
+
+    def delay(self, n=1):
+        """Seconds until n tokens are available (0 if they are now)."""
+        with self._cond:
+            self._refill()
+            return max(0.0, (n - self._tokens) / self.rate)
+
+    def acquire(self, n=1, timeout=None):
+        """Take n tokens, waiting for the refill; False if `timeout` passes first."""
+        deadline = None if timeout is None else self._clock() + timeout
+        with self._cond:
+            while True:
+                self._refill()
+                if self._tokens >= n:
+                    self._tokens -= n
+                    return True
+                wait = (n - self._tokens) / self.rate
+                if deadline is not None:
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        return False
+                    wait = min(wait, remaining)
+                self._cond.wait(wait)
+
+    def configure(self, rate, burst):
+        with self._cond:
+            self._refill()
+            self.rate, self.burst = float(rate), float(burst)
+            self._tokens = min(self._tokens, self.burst)
+
+
+_buckets = {}
+_buckets_lock = threading.Lock()
+
+
+def shared(name, rate, burst):
+    """The process-wide bucket `name`, created on first use and re-rated if the settings changed."""
+    with _buckets_lock:
+        bucket = _buckets.get(name)
+        if bucket is None:
+            bucket = _buckets[name] = TokenBucket(rate, burst)
+        elif (bucket.rate, bucket.burst) != (float(rate), float(burst)):
+            bucket.configure(rate, burst)
+        return bucket
+
+
+def seed_generation(config):
+    """The shared bucket pacing generate_code submissions."""
+    return shared(
+        "seed_generate",
+        config.get("seed_generate_rate", DEFAULT_GENERATE_RATE),
+        config.get("seed_generate_burst", DEFAULT_GENERATE_BURST),
+    )
@@ -0,0 +1,145 @@
+"""
+Signal Routing — One precomputed channel<->field index, and batch routing of scan signals.
+
+RoutingIndex is built once per (channels.json, projects.json) snapshot
+pair (channels.routing_index() memoises it through the config registry)
+and answers every direction from dicts:
+
+  - field -> channels feeding it, in channels.json order, "all" channels
+    included; an unknown field gets just the "all" channels
+  - channel -> fields it feeds, with "all" expanded to every project
+  - report category -> field (CATEGORY_TO_FIELD, DEFAULT_FIELD otherwise)
+  - a signal's own override: its "field", else a known "category"
+
+route() takes a whole batch of scan results; signals without an override
+stay together as their channel's batch, attached to each target field once.
+"""
+
+from itertools import chain
+
+from wheat.config_registry import FrozenDict, FrozenList
+
+WILDCARD = "all"
+DEFAULT_FIELD = "fleet_compliance"
+
+# Canonical community-report category -> field routing
+CATEGORY_TO_FIELD = {
+    "dangerous_driving": "fleet_compliance",
+    "commercial_vehicle": "fleet_compliance",
+    "tow_company": "tow_companies",
+    "used_car_dealer": "used_car_dealers",
+    "auto_repair": "auto_repair",
+    "noise_exhaust": "exhaust_noise",
+    "school_zone": "school_zone_safety",
+    "pedestrian_cyclist": "pedestrian_cyclist",
+    "parking_booting": "parking_booting",
+    "window_tint": "window_tint",
+    "registration_plates": "title_registration",
+    "emissions": "emissions_environmental",
+    "intersection_road": "road_intersection_safety",
+    "insurance": "auto_insurance",
+    "dealer_financing": "dealer_financing",
+    "rideshare_delivery": "rideshare_delivery",
+}
+
+
+def route_category(category):
+    """Field a community report of this category belongs to."""
+    return CATEGORY_TO_FIELD.get(category, DEFAULT_FIELD)
+
+
+def signal_field(signal):
+    """A signal's own field: its "field", else its known "category"; None to follow the channel."""
+    if not isinstance(signal, dict):
+        return None
+    field = signal.get("field")
+    if field and isinstance(field, str):
+        return field
+    category = signal.get("category")
+    return CATEGORY_TO_FIELD.get(category) if isinstance(category, str) else None
+
+
+class RoutingIndex:
+    """Channel<->field routing for one channels/projects snapshot pair."""
+
+    def __init__(self, channels, projects):
+        self.fields = FrozenList(projects)
+        self.wildcard = FrozenDict(
+            (cid, cdata) for cid, cdata in channels.items() if WILDCARD in cdata.get("fields", [])
+        )
+
+        named = dict.fromkeys(self.fields)
+        for cdata in channels.values():
+            named.update((f, None) for f in cdata.get("fields", []) if f != WILDCARD)
+
+        by_field = {field_id: {} for field_id in named}
+        channel_fields = {}
+        for cid, cdata in channels.items():
+            listed = cdata.get("fields", FrozenList())
+            if WILDCARD in listed:
+                channel_fields[cid] = self.fields
+                targets = named
+            else:
+                channel_fields[cid] = listed
+                targets = listed
+            for field_id in targets:
+                by_field[field_id][cid] = cdata
+
+        self._field_channels = {field_id: FrozenDict(chans) for field_id, chans in by_field.items()}
+        self._channel_fields = channel_fields
+        self._expanded = {}
+
+    def channels_for_field(self, field_id):
+        """{channel_id: channel} feeding a field, in channels.json order."""
+        return self._field_channels.get(field_id, self.wildcard)
+
+    def fields_for_channel(self, channel_id):
+        """Fields a channel feeds, "all" expanded; [] for an unknown channel."""
+        return self._channel_fields.get(channel_id, [])
+
+    def expand(self, fields):
+        """A target-field list with "all" replaced by every project, duplicates dropped."""
+        key = tuple(fields)
+        hit = self._expanded.get(key)
+        if hit is None:
+            out = []
+            for f in key:
+                out.extend(self.fields if f == WILDCARD else (f,))
+            hit = self._expanded[key] = tuple(dict.fromkeys(out))
+        return hit
+
+    def route(self, results):
+        """
+        {field_id: [signals]} for a batch of scan results ({channel_id: result}).
+
+        A signal with its own field (signal_field) goes only there; the rest
+        go to every field in the result's target_fields (or, when the result
+        doesn't record them, the channel's current fields). Within one
+        channel, a field's fan-out signals come before its own overrides.
+        Results without a signal list are skipped.
+        """
+        parts = {}
+        for cid, result in results.items():
+            if not result or not isinstance(result.get("signals"), list):
+                continue
+            if "target_fields" in result:
+                fan_out = self.expand(result["target_fields"] or ())
+            else:
+                fan_out = self.expand(self.fields_for_channel(cid))
+
+            follow = []
+            own = {}
+            for signal in result["signals"]:
+                field_id = signal_field(signal)
+                if field_id is None:
+                    follow.append(signal)
+                else:
+                    own.setdefault(field_id, []).append(signal)
+
+            if follow:
+                for field_id in fan_out:
+                    parts.setdefault(field_id, []).append(follow)
+            for field_id, batch in own.items():
+                parts.setdefault(field_id, []).append(batch)
+
+        return {field_id: list(chain.from_iterable(batches)) for field_id, batches in parts.items()}
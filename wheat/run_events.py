@@ -0,0 +1,55 @@
+"""
+Run Events — Append-only, sequenced log lines for field runs.
+
+Each log line is one row in run_events:
+
+  seq      — INTEGER PRIMARY KEY AUTOINCREMENT, strictly increasing
+  run_id   — the run it belongs to
+  project_id, timestamp, message
+
+Writers append rows inside their own transaction (append_events takes a
+cursor). Readers keep the last seq they saw and ask only for what came
+after it (events_after). run_log() returns a run's legacy runs.log text
+followed by its events.
+"""
+
+from datetime import datetime
+
+
+def create_run_events_table(cursor):
+    """Create run_events and its index if missing (cheap to call repeatedly)."""
+    cursor.execute("""CREATE TABLE IF NOT EXISTS run_events (
+        seq INTEGER PRIMARY KEY AUTOINCREMENT,
+        run_id INTEGER NOT NULL,
+        project_id TEXT DEFAULT 'default',
+        timestamp TEXT,
+        message TEXT,
+        FOREIGN KEY (run_id) REFERENCES runs(id)
+    )""")
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_run_events_run_seq ON run_events(run_id, seq)")
+
+
+def append_events(cursor, run_id, project_id, messages):
+    """Append messages to a run's log in the caller's transaction; returns [(seq, message)]."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    appended = []
+    for message in messages:
+        cursor.execute(
+            "INSERT INTO run_events (run_id, project_id, timestamp, message) VALUES (?, ?, ?, ?)",
+            (run_id, project_id, timestamp, message),
+        )
+        appended.append((cursor.lastrowid, message))
+    return appended
+
+
+def events_after(cursor, run_id, after=0):
+    """[(seq, message)] for a run's events with seq > after, oldest first."""
+    cursor.execute("SELECT seq, message FROM run_events WHERE run_id = ? AND seq > ? ORDER BY seq", (run_id, after or 0))
+    return cursor.fetchall()
+
+
+def run_log(cursor, run_id, legacy_log=""):
+    """(full log text, last seq) for a run; legacy_log is the old runs.log value."""
+    events = events_after(cursor, run_id)
+    last_seq = events[-1][0] if events else 0
+    return (legacy_log or "") + "".join(message for _, message in events), last_seq
@@ -0,0 +1,323 @@
+"""
+Scan Scheduler — Adaptive per-channel scan cadence.
+
+Each channel keeps a row in the channel_schedule table recording when it
+last ran, how many signals its scans yield, how many tokens they cost and
+how often it has just failed. plan_scans() says which channels are due
+and in what order.
+
+Cadence:
+  - A channel's frequency in channels.json sets its base interval
+    (realtime = 1h, daily = 24h, weekly = 7d)
+  - A scan that finds signals shortens the interval; one that finds
+    nothing lengthens it, within BASE / 4 .. BASE * 4
+  - A scan that errors (record_failure) is retried after FAILURE_RETRY_HOURS,
+    doubling with each consecutive failure up to BASE * 4; the next
+    successful scan clears the failure count
+
+Due channels are ranked by expected signals per token, weighted by how
+overdue they are, and picked until the token budget (if any) is spent.
+
+Usage:
+  python -m wheat.scan_tasks --plan            # Print the schedule, run nothing
+  python daily_runner.py --plan                # Same, from the daily runner
+"""
+
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
+DB_PATH = os.path.join(PROJECT_ROOT, "wheat.db")
+
+# Base interval (hours) for each channels.json frequency
+FREQUENCY_HOURS = {
+    "realtime": 1,
+    "daily": 24,
+    "weekly": 24 * 7,
+}
+
+# Adaptive interval bounds, as multiples of the base interval
+MIN_INTERVAL_FACTOR = 0.25
+MAX_INTERVAL_FACTOR = 4.0
+
+# Interval multipliers applied after each scan
+SPEEDUP = 0.75   # Scan found signals
+BACKOFF = 1.5    # Scan found nothing
+
+# A channel is due once this fraction of its interval has elapsed, so a
+# cron run a few seconds early doesn't skip a whole day
+DUE_SLACK = 0.9
+
+# Retry delay after a failed scan, doubled per consecutive failure
+FAILURE_RETRY_HOURS = 1
+
+# Weight for the newest scan in the running yield/cost averages
+EWMA_ALPHA = 0.3
+
+# Priors for channels with no scan history
+DEFAULT_YIELD = 1.0
+DEFAULT_COST_TOKENS = 1500
+
+# Cap on how much being overdue can boost a channel's score
+MAX_OVERDUE_BOOST = 4.0
+
+
+def init_schedule_db():
+    """Create the channel_schedule table if it doesn't exist."""
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    c.execute("""CREATE TABLE IF NOT EXISTS channel_schedule (
+        channel_id TEXT PRIMARY KEY,
+        last_run_at TEXT,
+        scans INTEGER DEFAULT 0,
+        total_signals INTEGER DEFAULT 0,
+        total_tokens INTEGER DEFAULT 0,
+        yield_avg REAL,
+        cost_avg REAL,
+        interval_hours REAL,
+        failures INTEGER DEFAULT 0,
+        last_failed_at TEXT
+    )""")
+    # Migration: failure backoff columns
+    existing_cols = {row[1] for row in c.execute("PRAGMA table_info(channel_schedule)").fetchall()}
+    if "failures" not in existing_cols:
+        c.execute("ALTER TABLE channel_schedule ADD COLUMN failures INTEGER DEFAULT 0")
+    if "last_failed_at" not in existing_cols:
+        c.execute("ALTER TABLE channel_schedule ADD COLUMN last_failed_at TEXT")
+    conn.commit()
+    conn.close()
+
+
+def base_interval_hours(frequency):
+    """Base interval for a channels.json frequency. Unknown values count as daily."""
+    return FREQUENCY_HOURS.get(frequency, FREQUENCY_HOURS["daily"])
+
+
+def _clamp_interval(hours, frequency):
+    base = base_interval_hours(frequency)
+    return min(max(hours, base * MIN_INTERVAL_FACTOR), base * MAX_INTERVAL_FACTOR)
+
+
+def get_schedule_state():
+    """Return channel_id -> schedule row dict for every channel with history."""
+    init_schedule_db()
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    c.execute("SELECT * FROM channel_schedule")
+    columns = [desc[0] for desc in c.description]
+    state = {row[0]: dict(zip(columns, row)) for row in c.fetchall()}
+    conn.close()
+    return state
+
+
+def count_signals(result):
+    """Count usable signals in a scan result (parse-error placeholders don't count)."""
+    if not result:
+        return 0
+    signals = result.get("signals")
+    if not isinstance(signals, list):
+        return 0
+    return sum(1 for s in signals if not (isinstance(s, dict) and s.get("parse_error")))
+
+
+def count_tokens(result):
+    """Total tokens a scan spent, from the provider's usage dict."""
+    if not result:
+        return 0
+    usage = result.get("token_usage") or {}
+    return int(usage.get("prompt_tokens", 0)) + int(usage.get("completion_tokens", 0))
+
+
+def record_scan(channel_id, frequency, signals, tokens, now=None):
+    """
+    Record a completed scan and adapt the channel's interval.
+
+    Args:
+        channel_id: channel that was scanned
+        frequency: the channel's configured frequency (sets interval bounds)
+        signals: number of signals the scan produced
+        tokens: tokens the scan cost
+        now: optional datetime override (for tests)
+
+    Returns the channel's updated schedule row.
+    """
+    init_schedule_db()
+    now = now or datetime.now()
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    c.execute(
+        "SELECT scans, total_signals, total_tokens, yield_avg, cost_avg, interval_hours "
+        "FROM channel_schedule WHERE channel_id = ?",
+        (channel_id,),
+    )
+    row = c.fetchone()
+
+    if row and row[3] is not None:
+        scans, total_signals, total_tokens, yield_avg, cost_avg, interval = row
+        yield_avg = EWMA_ALPHA * signals + (1 - EWMA_ALPHA) * yield_avg
+        cost_avg = EWMA_ALPHA * tokens + (1 - EWMA_ALPHA) * cost_avg
+    else:
+        # First completed scan (a row left by record_failure has no averages yet)
+        scans, total_signals, total_tokens = 0, 0, 0
+        yield_avg, cost_avg = float(signals), float(tokens)
+        interval = base_interval_hours(frequency)
+
+    interval = _clamp_interval(interval * (SPEEDUP if signals > 0 else BACKOFF), frequency)
+
+    c.execute(
+        """INSERT OR REPLACE INTO channel_schedule
+        (channel_id, last_run_at, scans, total_signals, total_tokens, yield_avg, cost_avg, interval_hours)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
+        (
+            channel_id, now.isoformat(), scans + 1, total_signals + signals,
+            total_tokens + tokens, yield_avg, cost_avg, interval,
+        ),
+    )
+    conn.commit()
+    conn.close()
+    return {
+        "channel_id": channel_id,
+        "last_run_at": now.isoformat(),
+        "scans": scans + 1,
+        "total_signals": total_signals + signals,
+        "total_tokens": total_tokens + tokens,
+        "yield_avg": yield_avg,
+        "cost_avg": cost_avg,
+        "interval_hours": interval,
+    }
+
+
+def record_failure(channel_id, frequency, now=None):
+    """
+    Record a scan that errored; the channel is retried after a backoff
+    (see failure_retry_hours) instead of on every invocation.
+
+    Returns the channel's consecutive failure count.
+    """
+    init_schedule_db()
+    now = now or datetime.now()
+    conn = sqlite3.connect(DB_PATH, timeout=15)
+    c = conn.cursor()
+    c.execute(
+        """INSERT INTO channel_schedule (channel_id, interval_hours, failures, last_failed_at)
+        VALUES (?, ?, 1, ?)
+        ON CONFLICT(channel_id) DO UPDATE SET
+            failures = COALESCE(failures, 0) + 1, last_failed_at = excluded.last_failed_at""",
+        (channel_id, float(base_interval_hours(frequency)), now.isoformat()),
+    )
+    failures = c.execute("SELECT failures FROM channel_schedule WHERE channel_id = ?", (channel_id,)).fetchone()[0]
+    conn.commit()
+    conn.close()
+    return failures
+
+
+def failure_retry_hours(failures, frequency):
+    """Hours to wait after `failures` consecutive failed scans."""
+    cap = base_interval_hours(frequency) * MAX_INTERVAL_FACTOR
+    return min(FAILURE_RETRY_HOURS * 2 ** (failures - 1), cap)
+
+
+def plan_scans(channels, now=None, token_budget=None):
+    """
+    Decide which channels to scan on this invocation.
+
+    Args:
+        channels: channel definitions from load_channels()
+        now: optional datetime override (for tests)
+        token_budget: optional cap on expected tokens spent this invocation
+
+    Returns a list of plan entries, highest score first. Each entry has
+    channel_id, name, frequency, interval_hours, last_run_at, next_run_at,
+    expected_signals, expected_tokens, score, run (bool) and reason.
+    """
+    now = now or datetime.now()
+    state = get_schedule_state()
+    plan = []
+
+    for cid, cdata in channels.items():
+        frequency = cdata.get("frequency", "daily")
+        row = state.get(cid)
+
+        if row and row.get("last_run_at"):
+            interval = _clamp_interval(row["interval_hours"], frequency)
+            last_run = datetime.fromisoformat(row["last_run_at"])
+            elapsed = (now - last_run).total_seconds() / 3600
+            overdue = elapsed / interval
+            expected_signals = row["yield_avg"]
+            expected_tokens = row["cost_avg"] or DEFAULT_COST_TOKENS
+            next_run = last_run + timedelta(hours=interval * DUE_SLACK)
+            due = overdue >= DUE_SLACK
+        else:
+            interval = float(base_interval_hours(frequency))
+            last_run = None
+            overdue = MAX_OVERDUE_BOOST
+            expected_signals = DEFAULT_YIELD
+            expected_tokens = DEFAULT_COST_TOKENS
+            next_run = now
+            due = True
+
+        failures = (row or {}).get("failures") or 0
+        retry_at = None
+        if failures and row.get("last_failed_at"):
+            retry_at = datetime.fromisoformat(row["last_failed_at"]) + timedelta(
+                hours=failure_retry_hours(failures, frequency))
+            if retry_at > now:
+                next_run, due = retry_at, False
+
+        # Tiny floor keeps quiet channels ordered by cost and overdue-ness
+        score = (max(expected_signals, 0.01) / max(expected_tokens, 1)) * min(overdue, MAX_OVERDUE_BOOST) * 1000
+
+        plan.append({
+            "channel_id": cid,
+            "name": cdata.get("name", cid),
+            "frequency": frequency,
+            "interval_hours": round(interval, 2),
+            "last_run_at": last_run.isoformat() if last_run else None,
+            "next_run_at": next_run.isoformat(),
+            "expected_signals": round(expected_signals, 2),
+            "expected_tokens": int(expected_tokens),
+            "score": round(score, 4),
+            "run": due,
+            "reason": (("never scanned" if last_run is None else "due") if due
+                       else f"backing off after {failures} failure(s)" if retry_at and retry_at > now
+                       else "not due"),
+        })
+
+    plan.sort(key=lambda e: (not e["run"], -e["score"]))
+
+    if token_budget is not None:
+        spent = 0
+        for entry in plan:
+            if not entry["run"]:
+                continue
+            if spent + entry["expected_tokens"] > token_budget:
+                entry["run"] = False
+                entry["reason"] = "over budget"
+                continue
+            spent += entry["expected_tokens"]
+
+    return plan
+
+
+def format_plan(plan, now=None):
+    """Render a scan plan as a human-readable table."""
+    now = now or datetime.now()
+    selected = [e for e in plan if e["run"]]
+    lines = [
+        f"Scan Plan — {now.strftime('%Y-%m-%d %H:%M')}",
+        f"  Channels due: {len(selected)} of {len(plan)}",
+        f"  Expected signals: {sum(e['expected_signals'] for e in selected):.1f}",
+        f"  Expected tokens: {sum(e['expected_tokens'] for e in selected)}",
+        "",
+    ]
+    for entry in plan:
+        marker = "RUN " if entry["run"] else "skip"
+        next_run = "now" if entry["run"] else entry["next_run_at"][:16].replace("T", " ")
+        lines.append(
+            f"  [{marker}] {entry['channel_id']:<24} {entry['frequency']:<8} "
+            f"every {entry['interval_hours']:>6.1f}h  "
+            f"~{entry['expected_signals']:.1f} signals / {entry['expected_tokens']} tokens  "
+            f"next: {next_run} ({entry['reason']})"
+        )
+    return "\n".join(lines)
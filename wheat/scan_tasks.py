@@ -18,6 +18,7 @@ Usage:
   python -m wheat.scan_tasks --channel google_reviews_auto  # One channel
   python -m wheat.scan_tasks --list             # List all tasks
   python -m wheat.scan_tasks --dry-run          # Preview what would run
+  python -m wheat.scan_tasks --plan             # Print the adaptive scan schedule
 """
 
 import json
@@ -28,8 +29,10 @@ from datetime import datetime, date
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.realpath(__file__)))
 sys.path.insert(0, PROJECT_ROOT)
 
-from wheat.channels import load_channels, get_fields_for_channel
+from wheat.channels import load_channels, get_fields_for_channel, routing_index
 from wheat.providers import ClaudeCodeProvider
+from wheat.instrumentation import SCANS, SCAN_SIGNALS
+from wheat.scan_scheduler import plan_scans, format_plan, record_scan, record_failure, count_signals, count_tokens
 
 INTAKE_DIR = os.path.join(PROJECT_ROOT, "intake")
 SCAN_RESULTS_DIR = os.path.join(PROJECT_ROOT, "intake", "scans")
@@ -228,51 +231,66 @@ def run_channel_scan(channel_id, channel_data, dry_run=False):
 
         signal_count = len(signals) if isinstance(signals, list) else 0
         print(f"    Found {signal_count} signals → {result_file}")
+        SCANS.inc(channel=channel_id, outcome="ok")
+        SCAN_SIGNALS.inc(count_signals(result), channel=channel_id)
         return result
 
     except Exception as e:
         print(f"    ERROR: {e}")
+        SCANS.inc(channel=channel_id, outcome="error")
         return None
 
 
-def run_daily_scans(channel_filter=None, dry_run=False):
-    """Run all daily scans."""
+def due_channels(channels, channel_filter=None, token_budget=None):
+    """
+    Return the channel ids to scan on this invocation.
+
+    The adaptive scheduler (wheat/scan_scheduler.py) decides which channels
+    are due; channel_filter forces a single channel regardless of schedule.
+    """
+    if channel_filter:
+        return [cid for cid in channels if cid == channel_filter]
+    plan = plan_scans(channels, token_budget=token_budget)
+    selected = [entry["channel_id"] for entry in plan if entry["run"]]
+    skipped = len(plan) - len(selected)
+    if skipped:
+        print(f"  Scheduler: {len(selected)} channel(s) due, {skipped} not due")
+    return selected
+
+
+def scan_and_record(channel_id, channel_data, dry_run=False):
+    """Scan one channel and feed its yield and cost (or its failure) back into the schedule."""
+    result = run_channel_scan(channel_id, channel_data, dry_run=dry_run)
+    if dry_run:
+        return result
+    frequency = channel_data.get("frequency", "daily")
+    if result:
+        record_scan(channel_id, frequency, count_signals(result), count_tokens(result))
+    else:
+        record_failure(channel_id, frequency)
+    return result
+
+
+def run_daily_scans(channel_filter=None, dry_run=False, token_budget=None):
+    """Run the channel scans that are due, one after another."""
     if date.today().weekday() == 6:
         print("Sunday — no scans today.")
         return {}
 
     channels = load_channels()
     results = {}
-
-    # Filter to daily-frequency channels (or the specific one requested)
-    for cid, cdata in channels.items():
-        if channel_filter and cid != channel_filter:
-            continue
-        freq = cdata.get("frequency", "daily")
-        if freq == "daily" or channel_filter:
-            results[cid] = run_channel_scan(cid, cdata, dry_run=dry_run)
-        elif freq == "weekly" and date.today().weekday() == 0:
-            # Run weekly channels on Mondays
-            results[cid] = run_channel_scan(cid, cdata, dry_run=dry_run)
+    for cid in due_channels(channels, channel_filter=channel_filter, token_budget=token_budget):
+        results[cid] = scan_and_record(cid, channels[cid], dry_run=dry_run)
 
     return results
 
 
 def aggregate_scan_results(results):
     """Aggregate scan results into a summary for the daily briefing."""
-    total_signals = 0
-    by_field = {}
-
-    for cid, result in results.items():
-        if not result or not result.get("signals"):
-            continue
-        signals = result["signals"]
-        if isinstance(signals, list):
-            total_signals += len(signals)
-            for field in result.get("target_fields", []):
-                if field not in by_field:
-                    by_field[field] = []
-                by_field[field].extend(signals)
+    total_signals = sum(
+        len(r["signals"]) for r in results.values() if r and isinstance(r.get("signals"), list)
+    )
+    by_field = routing_index().route(results)
 
     summary = f"Scan Summary — {date.today().isoformat()}\n"
     summary += f"  Channels scanned: {len(results)}\n"
@@ -303,8 +321,14 @@ if __name__ == "__main__":
     parser.add_argument("--channel", help="Scan a specific channel only")
     parser.add_argument("--list", action="store_true", help="List all channels")
     parser.add_argument("--dry-run", action="store_true", help="Show what would run")
+    parser.add_argument("--plan", action="store_true", help="Print the adaptive scan schedule")
+    parser.add_argument("--budget", type=int, help="Token budget for this invocation")
     args = parser.parse_args()
 
+    if args.plan:
+        print(format_plan(plan_scans(load_channels(), token_budget=args.budget)))
+        sys.exit(0)
+
     if args.list:
         channels = load_channels()
         print(f"\nConfigured Channels ({len(channels)}):\n")
@@ -322,7 +346,7 @@ if __name__ == "__main__":
     print(f"  {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     print(f"{'='*60}\n")
 
-    results = run_daily_scans(channel_filter=args.channel, dry_run=args.dry_run)
+    results = run_daily_scans(channel_filter=args.channel, dry_run=args.dry_run, token_budget=args.budget)
 
     if not args.dry_run:
         summary, by_field = aggregate_scan_results(results)
@@ -0,0 +1,190 @@
+"""
+Seed Harness — Runs one generated seed script in a single interpreter.
+
+Launched by wheat/seed_runner.py, never imported:
+
+  python wheat/seed_harness.py <script.py> <report.json> <cpu_seconds> <memory_mb>
+
+It applies the CPU and address-space rlimits to itself, imports the script
+as a module, runs its unittest.TestCase classes, then runs the script's own
+`__main__` block (with unittest.main stubbed out, since the tests just
+ran). Test output goes to stderr in the usual unittest format; the counts,
+duration and peak memory are written as JSON to <report.json>.
+
+  python wheat/seed_harness.py --serve
+
+Warm-pool mode (POSIX only). The interpreter starts once, imports the
+modules seeds commonly use, then reads one JSON request per line on stdin:
+
+  {"script_path", "report_path", "output_path", "timeout", "cpu_seconds", "memory_mb"}
+
+For each request it forks. The child gets a copy of the warm, untouched
+interpreter, its own session, the rlimits and stdout/stderr redirected to
+output_path, and runs the script exactly as above. The server enforces the
+wall-clock timeout by killing the child's process group, then answers
+with one JSON line: {"exit_code", "timed_out", "seconds", "peak_rss_kb"}.
+Nothing a seed does leaks into the next one, because every seed runs in
+its own forked child.
+"""
+
+import importlib
+import importlib.util
+import json
+import os
+import runpy
+import signal
+import sys
+import time
+import traceback
+import unittest
+
+# Imported once by the warm-pool server so forked seeds don't pay for them
+WARM_IMPORTS = (
+    "collections", "csv", "datetime", "json", "logging", "re", "sqlite3",
+    "tempfile", "unittest.mock", "requests",
+)
+
+try:
+    import resource
+except ImportError:  # Windows — only the runner's wall-clock timeout applies
+    resource = None
+
+
+def _apply_limits(cpu_seconds, memory_mb):
+    if resource is None:
+        return
+    if cpu_seconds > 0:
+        resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    if memory_mb > 0:
+        limit = memory_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _peak_rss_kb():
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return peak // 1024 if sys.platform == "darwin" else peak  # macOS reports bytes
+
+
+def run(script_path):
+    """Run the script's tests and entry point; return the report dict."""
+    script_path = os.path.abspath(script_path)
+    # Same import roots as `python script.py` (script dir) + `python -m unittest` (cwd)
+    sys.path[0] = os.path.dirname(script_path)
+    if os.getcwd() not in sys.path:
+        sys.path.insert(1, os.getcwd())
+
+    report = {
+        "tests_run": 0, "failures": 0, "errors": 0, "skipped": 0,
+        "load_error": None, "script_error": None,
+    }
+    start = time.perf_counter()
+    try:
+        spec = importlib.util.spec_from_file_location("seed_script", script_path)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["seed_script"] = module
+        spec.loader.exec_module(module)
+    except BaseException as e:
+        report["load_error"] = f"{type(e).__name__}: {e}"
+        traceback.print_exc()
+    else:
+        suite = unittest.defaultTestLoader.loadTestsFromModule(module)
+        outcome = unittest.TextTestRunner(stream=sys.stderr, verbosity=1).run(suite)
+        report.update(
+            tests_run=outcome.testsRun,
+            failures=len(outcome.failures),
+            errors=len(outcome.errors),
+            skipped=len(outcome.skipped),
+        )
+        unittest.main = lambda *args, **kwargs: None
+        try:
+            runpy.run_path(script_path, run_name="__main__")
+        except SystemExit as e:
+            if e.code not in (None, 0):
+                report["script_error"] = f"SystemExit: {e.code}"
+        except BaseException as e:
+            report["script_error"] = f"{type(e).__name__}: {e}"
+            traceback.print_exc()
+    report["seconds"] = round(time.perf_counter() - start, 3)
+    report["peak_rss_kb"] = _peak_rss_kb()
+    return report
+
+
+def _write_report(report_path, report):
+    with open(report_path, "w", encoding="utf-8") as f:
+        json.dump(report, f)
+
+
+def _run_forked(request):
+    """Child side of serve(): isolate, limit, run, exit without returning."""
+    try:
+        os.setsid()
+        devnull = os.open(os.devnull, os.O_RDONLY)
+        os.dup2(devnull, 0)
+        out = os.open(request["output_path"], os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        os.dup2(out, 1)
+        os.dup2(out, 2)
+        _apply_limits(request["cpu_seconds"], request["memory_mb"])
+        _write_report(request["report_path"], run(request["script_path"]))
+        code = 0
+    except BaseException:
+        traceback.print_exc()
+        code = 1
+    finally:
+        sys.stdout.flush()
+        sys.stderr.flush()
+    os._exit(code)
+
+
+def _wait(pid, timeout):
+    """Wait for a forked seed, killing its process group after `timeout` seconds."""
+    start = time.monotonic()
+    timed_out = False
+    while True:
+        waited, status, rusage = os.wait4(pid, os.WNOHANG)
+        if waited:
+            break
+        if not timed_out and time.monotonic() - start > timeout:
+            timed_out = True
+            try:
+                os.killpg(pid, signal.SIGKILL)
+            except ProcessLookupError:
+                pass
+        time.sleep(0.005)
+    return {
+        "exit_code": os.waitstatus_to_exitcode(status),
+        "timed_out": timed_out,
+        "seconds": round(time.monotonic() - start, 3),
+        "peak_rss_kb": rusage.ru_maxrss,
+    }
+
+
+def serve():
+    """Warm-pool server loop: one forked child per request line."""
+    for name in WARM_IMPORTS:
+        try:
+            importlib.import_module(name)
+        except ImportError:
+            pass
+    for line in sys.stdin:
+        request = json.loads(line)
+        sys.stdout.flush()
+        pid = os.fork()
+        if pid == 0:
+            _run_forked(request)
+        sys.stdout.write(json.dumps(_wait(pid, request["timeout"])) + "\n")
+        sys.stdout.flush()
+
+
+def main(argv):
+    if argv[1:] == ["--serve"]:
+        serve()
+        return
+    script_path, report_path, cpu_seconds, memory_mb = argv[1], argv[2], int(argv[3]), int(argv[4])
+    _apply_limits(cpu_seconds, memory_mb)
+    _write_report(report_path, run(script_path))
+
+
+if __name__ == "__main__":
+    main(sys.argv)
@@ -0,0 +1,52 @@
+"""
+Seed Pipeline — Each seed moves through its own stages; no round-wide barriers.
+
+A seed is a small state machine (WheatSeed.advance runs one stage and
+returns the next):
+
+    generate -> validate -> test -> reap
+                   |          |
+                   +-> rescue <+     (while retry_count < MAX_RESCUES)
+                         |
+                         +-> validate
+
+  generate  first code generation (LLM)
+  validate  static checks and autofixes; malformed code skips the test run
+  test      run the script under the execution limits
+  rescue    regenerate with the rescuer model from the failure context (LLM)
+  reap      FieldManager.settle_seed: record the result, reap a Barren or
+            expired seed and hand back its reseed, which starts at generate
+
+Each stage has a concurrency limit shared by all fields (stage_limits();
+config.json "stage_limits" overrides the defaults). In speculative mode
+(wheat/speculation.py) generate and rescue validate and test their own
+candidates, so they can return reap or rescue directly.
+"""
+
+GENERATE = "generate"
+VALIDATE = "validate"
+TEST = "test"
+RESCUE = "rescue"
+REAP = "reap"
+STAGES = (GENERATE, RESCUE, VALIDATE, TEST, REAP)  # ascending dispatch preference
+LLM_STAGES = frozenset({GENERATE, RESCUE})
+MAX_RESCUES = 2
+
+DEFAULT_STAGE_LIMITS = {GENERATE: 4, RESCUE: 2, VALIDATE: 2, TEST: 3, REAP: 2}
+
+
+def stage_limits(config):
+    """Concurrent jobs allowed per stage: the defaults with config's "stage_limits" applied."""
+    limits = dict(DEFAULT_STAGE_LIMITS)
+    for stage, limit in (config.get("stage_limits") or {}).items():
+        if stage not in limits:
+            raise ValueError(f"unknown stage {stage!r} in stage_limits")
+        if int(limit) < 1:
+            raise ValueError(f"stage_limits[{stage!r}] must be at least 1")
+        limits[stage] = int(limit)
+    return limits
+
+
+def stage_rank(stage):
+    """Dispatch preference: later stages first (unknown stages, e.g. planning, last)."""
+    return STAGES.index(stage) if stage in STAGES else -1
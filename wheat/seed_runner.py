@@ -0,0 +1,250 @@
+"""
+Seed Runner — Sandboxed execution of generated seed scripts.
+
+run_seed_script() runs a script's tests and then its entry point in one
+interpreter (wheat/seed_harness.py), under limits from config.json
+(`seed_timeout`, `seed_cpu_seconds`, `seed_memory_mb`; per project too):
+
+  wall clock  — the process group is killed after `timeout` seconds
+  CPU         — RLIMIT_CPU, the kernel sends SIGXCPU
+  memory      — RLIMIT_AS (Linux ignores RLIMIT_RSS), allocations raise MemoryError
+
+At most SEED_WORKERS scripts (one per core) run at once across every
+field in the process. Where os.fork exists the script goes to a WarmPool
+of long-lived `seed_harness.py --serve` processes that fork a child per
+script; `seed_warm_pool: false` starts a fresh interpreter per run, as
+does passing a CancelScope.
+
+Result dict:
+  passed, tests_run, failures, errors, skipped, seconds, peak_rss_kb,
+  exit_code, timed_out, limit ("wall_clock" | "cpu" | "memory" | None),
+  load_error, script_error, output (unittest text + any script output)
+"""
+
+import atexit
+import json
+import os
+import queue
+import signal
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from wheat.cancel import kill_process_group
+
+HARNESS_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "seed_harness.py")
+
+SEED_WORKERS = os.cpu_count() or 2
+SEED_TIMEOUT = 60        # wall-clock seconds per script
+SEED_CPU_SECONDS = 30
+SEED_MEMORY_MB = 512
+SEED_WARM_POOL = hasattr(os, "fork")
+
+_slots = threading.BoundedSemaphore(SEED_WORKERS)
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def limits_from_config(config):
+    """Keyword arguments for run_seed_script() from a (project) config."""
+    return {
+        "timeout": config.get("seed_timeout", SEED_TIMEOUT),
+        "cpu_seconds": config.get("seed_cpu_seconds", SEED_CPU_SECONDS),
+        "memory_mb": config.get("seed_memory_mb", SEED_MEMORY_MB),
+        "warm": config.get("seed_warm_pool", SEED_WARM_POOL),
+    }
+
+
+def _read_report(path):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        return None
+
+
+def _limit_hit(exit_code, timed_out, output):
+    if timed_out:
+        return "wall_clock"
+    # Past the soft RLIMIT_CPU the kernel sends SIGXCPU, past the hard limit SIGKILL
+    if exit_code in (-getattr(signal, "SIGXCPU", 0), -signal.SIGKILL):
+        return "cpu"
+    if "MemoryError" in output:
+        return "memory"
+    return None
+
+
+def _read_text(path):
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.read()
+    except OSError:
+        return ""
+
+
+class WarmPool:
+    """Long-lived harness servers; each seed runs in a fork of a warm one."""
+
+    def __init__(self, size=SEED_WORKERS):
+        self.size = size
+        self._idle = queue.Queue()
+        self._workers = []
+        self._lock = threading.Lock()
+        for _ in range(size):
+            self._idle.put(self._spawn())
+
+    def _spawn(self):
+        worker = subprocess.Popen(
+            [sys.executable, HARNESS_PATH, "--serve"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            bufsize=1,
+        )
+        with self._lock:
+            self._workers.append(worker)
+        return worker
+
+    def _retire(self, worker):
+        with self._lock:
+            if worker in self._workers:
+                self._workers.remove(worker)
+        if worker.poll() is None:
+            worker.kill()
+        worker.wait()
+
+    def run(self, script_path, timeout, cpu_seconds, memory_mb):
+        """Run one script; returns (report, output, exit_code, timed_out, seconds)."""
+        fd, report_path = tempfile.mkstemp(prefix="seed_report_", suffix=".json")
+        os.close(fd)
+        fd, output_path = tempfile.mkstemp(prefix="seed_output_", suffix=".txt")
+        os.close(fd)
+        request = {
+            "script_path": os.path.abspath(script_path),
+            "report_path": report_path,
+            "output_path": output_path,
+            "timeout": timeout,
+            "cpu_seconds": cpu_seconds,
+            "memory_mb": memory_mb,
+        }
+        worker = self._idle.get()
+        start = time.monotonic()
+        try:
+            worker.stdin.write(json.dumps(request) + "\n")
+            worker.stdin.flush()
+            line = worker.stdout.readline()
+            reply = json.loads(line) if line else None
+        except (OSError, ValueError):
+            reply = None
+        finally:
+            if reply is None:
+                # The server itself died — replace it so the pool keeps its size
+                self._retire(worker)
+                worker = self._spawn()
+            self._idle.put(worker)
+        seconds = round(time.monotonic() - start, 3)
+        report = _read_report(report_path)
+        output = _read_text(output_path)
+        os.unlink(report_path)
+        os.unlink(output_path)
+        if reply is None:
+            return report, output + "\nseed harness server crashed", None, False, seconds
+        return report, output, reply["exit_code"], reply["timed_out"], seconds
+
+    def close(self):
+        with self._lock:
+            workers = list(self._workers)
+        for worker in workers:
+            self._retire(worker)
+
+
+def warm_pool():
+    """The process-wide WarmPool, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = WarmPool()
+            atexit.register(_pool.close)
+        return _pool
+
+
+def _run_cold(script_path, timeout, cpu_seconds, memory_mb, cancel=None):
+    """One fresh interpreter per run; returns (report, output, exit_code, timed_out, seconds)."""
+    if cancel is not None:
+        cancel.check()
+    fd, report_path = tempfile.mkstemp(prefix="seed_report_", suffix=".json")
+    os.close(fd)
+    start = time.monotonic()
+    proc = subprocess.Popen(
+        [sys.executable, HARNESS_PATH, script_path, report_path, str(cpu_seconds), str(memory_mb)],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        start_new_session=True,
+    )
+    if cancel is not None:
+        cancel.register(proc)
+    try:
+        stdout, stderr = proc.communicate(timeout=timeout)
+        timed_out = False
+    except subprocess.TimeoutExpired:
+        kill_process_group(proc)
+        stdout, stderr = proc.communicate()
+        timed_out = True
+    finally:
+        if cancel is not None:
+            cancel.unregister(proc)
+    seconds = round(time.monotonic() - start, 3)
+    report = _read_report(report_path)
+    os.unlink(report_path)
+    if cancel is not None:
+        cancel.check()
+    return report, (stderr or "") + (stdout or ""), proc.returncode, timed_out, seconds
+
+
+def run_seed_script(script_path, timeout=SEED_TIMEOUT, cpu_seconds=SEED_CPU_SECONDS,
+                    memory_mb=SEED_MEMORY_MB, warm=SEED_WARM_POOL, cancel=None):
+    """
+    Run a seed script's tests and entry point under limits; return the result dict.
+
+    With a CancelScope (wheat/cancel.py) the run is cold — a warm server's
+    forked child is out of reach — and cancelling the scope kills it and
+    raises Cancelled.
+    """
+    # One limit for both paths, so warm and cold runs together stay within SEED_WORKERS
+    with _slots:
+        if cancel is not None:
+            report, output, exit_code, timed_out, seconds = _run_cold(script_path, timeout, cpu_seconds, memory_mb, cancel)
+        else:
+            run = warm_pool().run if warm and hasattr(os, "fork") else _run_cold
+            report, output, exit_code, timed_out, seconds = run(script_path, timeout, cpu_seconds, memory_mb)
+
+    if timed_out:
+        output += f"\nTIMEOUT: seed script exceeded {timeout}s wall clock and was killed"
+    report = report or {}
+    result = {
+        "tests_run": report.get("tests_run", 0),
+        "failures": report.get("failures", 0),
+        "errors": report.get("errors", 0),
+        "skipped": report.get("skipped", 0),
+        "load_error": report.get("load_error"),
+        "script_error": report.get("script_error"),
+        "seconds": seconds,
+        "peak_rss_kb": report.get("peak_rss_kb"),
+        "exit_code": exit_code,
+        "timed_out": timed_out,
+        "limit": _limit_hit(exit_code, timed_out, output),
+        "output": output,
+    }
+    if result["limit"] == "cpu":
+        result["output"] += f"\nCPU LIMIT: seed script used more than {cpu_seconds}s of CPU and was killed"
+    result["passed"] = bool(
+        report
+        and not result["load_error"]
+        and result["tests_run"] > 0
+        and result["failures"] == 0
+        and result["errors"] == 0
+    )
+    return result
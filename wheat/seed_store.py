@@ -0,0 +1,120 @@
+"""
+Seed Store — Batched, dirty-tracked persistence of one run's seed rows.
+
+A SeedStore belongs to one (project_id, run_id). FieldManager attaches it
+to every seed it owns; seeds and the manager only buffer changes here:
+
+  track(seed)        — adopt a seed (persisted=True if its row already exists)
+  forget(seed)       — stop writing a reaped seed
+  append_log(text)   — buffer a run log line (a run_events row)
+  add_tokens(p, c)   — buffer token usage for the run
+  flush()            — write what changed, in one transaction
+
+flush() only touches seed rows whose status/output/code_file/test_result
+differ from what it last wrote, keyed by (run_id, seed_id, project_id),
+and publishes the changed seeds and new log events to the field hub.
+"""
+
+import json
+import sqlite3
+import threading
+
+from wheat.paths import DB_PATH
+from wheat.run_events import append_events
+from wheat.field_hub import publish
+
+
+def _row(seed):
+    progress = seed.progress
+    return (progress["status"], json.dumps(progress["output"]), progress["code_file"], progress["test_result"])
+
+
+def seed_info(seed_or_row, task=None):
+    """The per-seed dict get_latest_run() returns, from a seed or a stored row."""
+    if isinstance(seed_or_row, tuple):
+        status, output, code_file, test_result = seed_or_row
+    else:
+        task = seed_or_row.task
+        status, output, code_file, test_result = _row(seed_or_row)
+    return {"task": task, "status": status, "output": json.loads(output), "code_file": code_file, "test_result": test_result}
+
+
+class SeedStore:
+    def __init__(self, project_id, run_id, db_path=DB_PATH):
+        self.project_id = project_id
+        self.run_id = run_id
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._seeds = {}     # seed_id -> WheatSeed
+        self._written = {}   # seed_id -> row as last written
+        self._log = []
+        self._tokens = [0, 0]
+
+    def track(self, seed, persisted=False):
+        """Adopt a seed; persisted=True means its row for this run already matches."""
+        seed.store = self
+        with self._lock:
+            self._seeds[seed.seed_id] = seed
+            if persisted:
+                self._written[seed.seed_id] = _row(seed)
+
+    def forget(self, seed):
+        with self._lock:
+            self._seeds.pop(seed.seed_id, None)
+
+    def append_log(self, text):
+        with self._lock:
+            self._log.append(text)
+
+    def add_tokens(self, prompt_tokens, completion_tokens):
+        with self._lock:
+            self._tokens[0] += prompt_tokens
+            self._tokens[1] += completion_tokens
+
+    def dirty(self):
+        """Seed ids whose current state differs from the stored row."""
+        with self._lock:
+            return [sid for sid, seed in self._seeds.items() if self._written.get(sid) != _row(seed)]
+
+    def flush(self):
+        """Write changed seeds, log lines and token usage in one transaction; returns rows written."""
+        with self._lock:
+            rows = {sid: _row(seed) for sid, seed in self._seeds.items()}
+            changed = {sid: row for sid, row in rows.items() if self._written.get(sid) != row}
+            updates = [row + (self.run_id, sid, self.project_id) for sid, row in changed.items() if sid in self._written]
+            inserts = [(self.run_id, sid, self._seeds[sid].task) + row + (self.project_id,)
+                       for sid, row in changed.items() if sid not in self._written]
+            log = list(self._log)
+            prompt_tokens, completion_tokens = self._tokens
+            if not changed and not log and not (prompt_tokens or completion_tokens):
+                return 0
+
+            conn = sqlite3.connect(self.db_path, timeout=15)
+            try:
+                with conn:
+                    c = conn.cursor()
+                    if updates:
+                        c.executemany("UPDATE seeds SET status = ?, output = ?, code_file = ?, test_result = ? "
+                                      "WHERE run_id = ? AND seed_id = ? AND project_id = ?", updates)
+                    if inserts:
+                        c.executemany("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) "
+                                      "VALUES (?, ?, ?, ?, ?, ?, ?, ?)", inserts)
+                    events = append_events(c, self.run_id, self.project_id, log) if log else []
+                    if prompt_tokens or completion_tokens:
+                        c.execute("UPDATE runs SET prompt_tokens = prompt_tokens + ?, completion_tokens = completion_tokens + ?, "
+                                  "total_tokens = total_tokens + ? WHERE id = ?",
+                                  (prompt_tokens, completion_tokens, prompt_tokens + completion_tokens, self.run_id))
+            finally:
+                conn.close()
+
+            self._written.update(changed)
+            self._log = []
+            self._tokens = [0, 0]
+            if changed:
+                publish(self.project_id, "seeds", {
+                    "run_id": self.run_id,
+                    "seeds": {sid: seed_info(row, self._seeds[sid].task) for sid, row in changed.items()},
+                })
+            if events:
+                publish(self.project_id, "log", {"run_id": self.run_id, "events": events})
+            return len(changed)
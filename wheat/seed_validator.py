@@ -0,0 +1,239 @@
+"""
+Seed Validator — Cheap static checks on generated code before it runs.
+
+validate_code() catches obvious failures without starting a process:
+
+  1. trivial autofixes — CRLF line endings, stray ``` fence lines, tabs,
+     chatty prose before/after the code ("Here is the script:")
+  2. ast.parse — syntax errors, reported with line, source and caret
+  3. a unittest.TestCase subclass with at least one test_* method
+  4. every absolute import resolves (find_spec, nothing is executed)
+     against the installed environment plus the seed's own directory
+
+Code that fails goes straight to rescue with a short error context, and
+summarize_failure() trims real test failures the same way.
+"""
+
+import ast
+import importlib.machinery
+import importlib.util
+import keyword
+import re
+import sys
+
+MAX_CONTEXT_CHARS = 1500  # Cap on error context handed to the rescuer
+MAX_PROSE_LINES = 5       # Leading/trailing non-code lines we'll strip
+SEPARATOR = "-" * 70
+
+_FENCE = re.compile(r"^\s*```")
+_PROSE = re.compile(r"^([A-Za-z][\w']*)[,:]?\s+[A-Za-z]")  # "Here is ...", "Note: this ..."
+_TRACE_FILE = re.compile(r'^\s*File ".*", line \d+')
+
+
+def _parse(code):
+    """Return (tree, None) or (None, SyntaxError)."""
+    try:
+        return ast.parse(code), None
+    except SyntaxError as e:  # includes IndentationError / TabError
+        return None, e
+
+
+def _is_prose(line):
+    if not line.strip():
+        return True
+    match = _PROSE.match(line)
+    return bool(match) and not keyword.iskeyword(match.group(1))
+
+
+def _strip_prose(code):
+    """Drop up to MAX_PROSE_LINES of leading and trailing prose if that makes the code parse."""
+    lines = code.split("\n")
+    head = 0
+    while head < min(MAX_PROSE_LINES, len(lines)) and _is_prose(lines[head]):
+        head += 1
+    tail = 0
+    while tail < min(MAX_PROSE_LINES, len(lines) - head) and _is_prose(lines[len(lines) - 1 - tail]):
+        tail += 1
+    candidate = "\n".join(lines[head:len(lines) - tail])
+    if candidate.strip() and _parse(candidate)[0] is not None:
+        return candidate
+    return None
+
+
+def autofix(code):
+    """Apply trivial fixes; returns (code, list of fixes applied)."""
+    fixes = []
+    if "\r" in code:
+        code = code.replace("\r\n", "\n").replace("\r", "\n")
+        fixes.append("normalized line endings")
+    lines = code.split("\n")
+    kept = [line for line in lines if not _FENCE.match(line)]
+    if len(kept) != len(lines):
+        code = "\n".join(kept)
+        fixes.append("removed markdown fences")
+    tree, error = _parse(code)
+    if tree is None and isinstance(error, TabError):
+        for tabsize in (4, 8):
+            expanded = code.expandtabs(tabsize)
+            tree, _ = _parse(expanded)
+            if tree is not None:
+                code = expanded
+                fixes.append("expanded tabs")
+                break
+    if tree is None:
+        stripped = _strip_prose(code)
+        if stripped is not None:
+            code = stripped
+            fixes.append("stripped surrounding prose")
+    if code and not code.endswith("\n"):
+        code += "\n"
+    return code, fixes
+
+
+def _syntax_context(code, error):
+    lines = code.split("\n")
+    lineno = error.lineno or 0
+    source = lines[lineno - 1] if 0 < lineno <= len(lines) else ""
+    context = f"{type(error).__name__}: {error.msg} (line {lineno})"
+    if source:
+        caret = " " * max((error.offset or 1) - 1, 0) + "^"
+        context += f"\n    {source}\n    {caret}"
+    return context
+
+
+def _is_testcase_base(base):
+    if isinstance(base, ast.Attribute):
+        return base.attr == "TestCase" or base.attr.endswith("TestCase")
+    if isinstance(base, ast.Name):
+        return base.id.endswith("TestCase")
+    return False
+
+
+def find_test_cases(tree):
+    """Names of TestCase subclasses that define at least one test_* method."""
+    return [
+        node.name
+        for node in ast.walk(tree)
+        if isinstance(node, ast.ClassDef)
+        and any(_is_testcase_base(b) for b in node.bases)
+        and any(
+            isinstance(item, (ast.FunctionDef, ast.AsyncFunctionDef)) and item.name.startswith("test")
+            for item in node.body
+        )
+    ]
+
+
+def _module_exists(name, search_paths):
+    if name in sys.builtin_module_names or name in getattr(sys, "stdlib_module_names", ()):
+        return True
+    if search_paths and importlib.machinery.PathFinder.find_spec(name, list(search_paths)):
+        return True
+    try:
+        return importlib.util.find_spec(name) is not None
+    except (ImportError, ValueError):
+        return False
+
+
+_IMPORT_ERRORS = {"ImportError", "ModuleNotFoundError"}
+
+
+def _catches_import_error(handler):
+    if handler.type is None:  # bare except
+        return True
+    types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+    return any(
+        (isinstance(t, ast.Name) and t.id in _IMPORT_ERRORS)
+        or (isinstance(t, ast.Attribute) and t.attr in _IMPORT_ERRORS)
+        for t in types
+    )
+
+
+def _guarded_imports(tree):
+    """Import nodes inside `try: ... except ImportError:` — optional dependencies."""
+    guarded = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Try) and any(_catches_import_error(h) for h in node.handlers):
+            for stmt in node.body:
+                guarded.update(id(n) for n in ast.walk(stmt) if isinstance(n, (ast.Import, ast.ImportFrom)))
+    return guarded
+
+
+def unresolved_imports(tree, search_paths=()):
+    """[(line, description)] for imports that can't be found, other than optional ones."""
+    missing = []
+    guarded = _guarded_imports(tree)
+    for node in ast.walk(tree):
+        if id(node) in guarded:
+            continue
+        if isinstance(node, ast.Import):
+            names = [alias.name for alias in node.names]
+        elif isinstance(node, ast.ImportFrom):
+            if node.level:
+                missing.append((node.lineno, f"relative import 'from {'.' * node.level}{node.module or ''}' in a standalone script"))
+                continue
+            names = [node.module]
+        else:
+            continue
+        for name in names:
+            top = name.split(".")[0]
+            if not _module_exists(top, search_paths):
+                missing.append((node.lineno, f"No module named '{top}'"))
+    return missing
+
+
+def validate_code(code, search_paths=()):
+    """
+    Statically check generated seed code.
+
+    Returns {"ok", "code" (after autofixes), "fixes", "errors", "context"};
+    "context" is the compact error text to hand the rescuer when not ok.
+    """
+    code, fixes = autofix(code or "")
+    errors = []
+    tree, error = _parse(code)
+    if tree is None:
+        errors.append(_syntax_context(code, error))
+    else:
+        if not find_test_cases(tree):
+            errors.append("No unittest.TestCase subclass with test_* methods — the seed must include its tests")
+        for lineno, problem in unresolved_imports(tree, search_paths):
+            errors.append(f"ImportError: {problem} (line {lineno})")
+    return {
+        "ok": not errors,
+        "code": code,
+        "fixes": fixes,
+        "errors": errors,
+        "context": "\n".join(errors)[:MAX_CONTEXT_CHARS],
+    }
+
+
+def summarize_failure(execution):
+    """
+    Compact error context from a seed_runner result: one header, location and
+    exception line per failing test, or the limit/load error that stopped it.
+    """
+    output = execution.get("output", "")
+    parts = []
+    if execution.get("timed_out") or execution.get("limit") in ("cpu", "wall_clock"):
+        parts.append(output.strip().split("\n")[-1])
+    if execution.get("load_error"):
+        parts.append(f"Script failed to import: {execution['load_error']}")
+
+    report = output.split(f"\n{SEPARATOR}\nRan ")[0]
+    for block in report.split("=" * 70)[1:]:
+        lines = [line for line in block.strip().split("\n") if line.strip() and line.strip() != SEPARATOR]
+        if not lines:
+            continue
+        header, body = lines[0], lines[1:]
+        summary = [header]
+        locations = [i for i, line in enumerate(body) if _TRACE_FILE.match(line)]
+        if locations:
+            i = locations[-1]
+            summary.extend(line.rstrip() for line in body[i:i + 2] if not line.strip().startswith("^"))
+        if body:
+            summary.append(body[-1].strip())
+        parts.append("\n".join(dict.fromkeys(summary)))
+
+    if not parts:
+        parts.append(output.strip()[-MAX_CONTEXT_CHARS // 2:] or "Unknown error")
+    return "\n\n".join(parts)[:MAX_CONTEXT_CHARS]
@@ -0,0 +1,126 @@
+"""
+Speculation — Race several candidate implementations of a seed; keep the first that passes.
+
+With speculative mode on (config.json, or a project's settings):
+
+    "speculative": {"enabled": true, "candidates": 3, "models": ["sonnet", "opus"]}
+
+the generate and rescue stages start `candidates` attempts at once, each
+on the next model of `models` (the stage's usual model when empty). Each
+candidate generates, validates and tests in its own
+seed_<id>/candidate_<n> directory. The first to pass wins and the race's
+CancelScope (wheat/cancel.py) kills the rest mid-flight; when none
+passes, the closest is carried into the seed's ordinary rescue. Each
+extra candidate takes its own token from the seed-generation bucket.
+
+Time to first fruitful candidate, total seconds and tokens (losers
+included; one killed mid-call counts its prompt, estimated) go into the
+seed's progress["speculation"] and the wheat_speculation_* metrics. An OpenAI-compatible API request can't be
+interrupted; a losing one finishes and its answer is dropped.
+"""
+
+import threading
+import time
+from concurrent.futures import as_completed
+
+from wheat.cancel import CancelScope, Cancelled
+from wheat.instrumentation import SPECULATION_CANDIDATES, SPECULATION_FIRST_FRUITFUL, SPECULATION_TOKENS
+from wheat.offload import native_executor
+
+DEFAULT_CANDIDATES = 3
+POOL_WORKERS = 8
+SUMMARY_KEYS = ("index", "model", "outcome", "seconds", "tokens", "error")
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def settings(config):
+    """The "speculative" block as {"candidates", "models"} when enabled, else None."""
+    spec = config.get("speculative") or {}
+    if not spec.get("enabled"):
+        return None
+    candidates = int(spec.get("candidates", DEFAULT_CANDIDATES))
+    if candidates < 1:
+        raise ValueError("speculative candidates must be at least 1")
+    return {"candidates": candidates, "models": list(spec.get("models") or [])}
+
+
+def candidate_models(spec, default_model):
+    """One model per candidate, cycling through the configured tiers."""
+    models = spec["models"] or [default_model]
+    return [models[i % len(models)] for i in range(spec["candidates"])]
+
+
+def _executor():
+    """The process-wide pool candidates run on, started on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = native_executor(POOL_WORKERS, thread_name_prefix="speculate")
+        return _pool
+
+
+def _run(run_candidate, record, scope, started, clock):
+    try:
+        run_candidate(record, scope)
+        record["outcome"] = "passed" if record["passed"] else "failed"
+    except Cancelled:
+        record["outcome"] = "cancelled"
+    except Exception as e:
+        record["outcome"] = "error"
+        record["error"] = str(e)[:200]
+    record["seconds"] = round(clock() - started, 3)
+    return record
+
+
+def race(run_candidate, models, clock=time.monotonic):
+    """
+    Run one candidate per model; the first to pass cancels the rest.
+
+    run_candidate(record, cancel) fills in its record — "passed" and
+    "tokens" at least, including tokens already spent when it is cancelled
+    — and should raise Cancelled once `cancel` fires.
+    Returns the report: winner (index or None), model, time_to_first_fruitful,
+    seconds, tokens, cancelled, and results (every candidate's record).
+    """
+    scope = CancelScope()
+    started = clock()
+    records = [{"index": i, "model": model, "outcome": "cancelled", "passed": False,
+                "seconds": None, "tokens": 0, "error": None}
+               for i, model in enumerate(models)]
+    pool = _executor()
+    futures = [pool.submit(_run, run_candidate, record, scope, started, clock) for record in records]
+    winner = None
+    for future in as_completed(futures):
+        if future.cancelled():
+            continue
+        record = future.result()
+        if winner is None and record["outcome"] == "passed":
+            winner = record
+            record["outcome"] = "won"
+            scope.cancel()
+            for other in futures:
+                other.cancel()
+
+    for record in records:
+        SPECULATION_CANDIDATES.inc(outcome=record["outcome"])
+        SPECULATION_TOKENS.inc(record["tokens"], outcome="won" if record is winner else "lost")
+    if winner is not None:
+        SPECULATION_FIRST_FRUITFUL.observe(winner["seconds"])
+    return {
+        "winner": winner["index"] if winner else None,
+        "model": winner["model"] if winner else None,
+        "time_to_first_fruitful": winner["seconds"] if winner else None,
+        "seconds": round(clock() - started, 3),
+        "tokens": sum(record["tokens"] for record in records),
+        "cancelled": sum(1 for record in records if record["outcome"] == "cancelled"),
+        "results": records,
+    }
+
+
+def summary(report):
+    """The report without candidates' code and test output, for progress.json."""
+    compact = {k: v for k, v in report.items() if k != "results"}
+    compact["results"] = [{k: record.get(k) for k in SUMMARY_KEYS} for record in report["results"]]
+    return compact
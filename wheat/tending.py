@@ -0,0 +1,275 @@
+"""
+Tending Supervisor — One bounded worker pool tending every active field.
+
+Dashboard fields and the daily runner's (FieldManager.tend_field) share
+one pool of `workers` native threads (config.json "tend_workers"). A
+field's work is queued as jobs: plan (FieldManager.begin_round), then one
+job per pipeline stage of each growing seed (wheat/seed_pipeline.py),
+ending in reap (FieldManager.settle_seed).
+
+The dispatcher hands a job to the pool only when a worker is free. The
+next job comes from the field with the least weighted service so far:
+each dispatch advances a field's virtual time by 1/priority, the
+priority being its project's "tending_priority" (default 1, changeable
+with set_priority()). A job over its stage's concurrency limit, or an LLM
+stage without a token from rate_limit.seed_generation(), is passed over
+for one that can start, so neither limit ties up a worker. Idle fields
+are polled every IDLE_POLL seconds. Queue depth and running jobs are
+exported as metrics; stats() is served at GET /api/tending.
+"""
+
+import threading
+import time
+
+from wheat import rate_limit, seed_pipeline
+from wheat.seed_pipeline import GENERATE, LLM_STAGES, REAP, stage_rank
+from wheat.instrumentation import TEND_QUEUE_DEPTH, TEND_RUNNING
+from wheat.offload import native_executor
+from wheat.paths import load_config
+
+DEFAULT_WORKERS = 6
+DEFAULT_PRIORITY = 1
+IDLE_POLL = 5
+
+
+class _Field:
+    """Scheduling state of one tended field."""
+
+    def __init__(self, project_id, manager, priority, vtime):
+        self.project_id = project_id
+        self.manager = manager
+        self.priority = priority
+        self.vtime = vtime        # weighted service received so far
+        self.jobs = []            # (stage, seed, fn, args) waiting for a worker
+        self.running = 0
+        self.stage = "idle"       # idle -> plan -> tending -> idle
+        self.in_flight = 0        # seeds of the current round not yet reaped
+        self.next_poll = 0.0      # monotonic time the next round may be planned
+        self.rounds = 0
+
+
+def _priority(value):
+    priority = float(value)
+    if priority <= 0:
+        raise ValueError("priority must be positive")
+    return priority
+
+
+class TendingSupervisor:
+    """Multiplexes every tended field's seed work onto one bounded pool."""
+
+    def __init__(self, workers=DEFAULT_WORKERS, idle_poll=IDLE_POLL, bucket=None, stage_limits=None):
+        self.workers = workers
+        self.idle_poll = idle_poll
+        self.bucket = bucket or rate_limit.seed_generation({})
+        self.stage_limits = stage_limits or seed_pipeline.stage_limits({})
+        self._stage_running = dict.fromkeys(self.stage_limits, 0)
+        self._pool = native_executor(workers, thread_name_prefix="tend")
+        self._cond = threading.Condition()
+        self._fields = {}  # project_id -> _Field
+        self._running = 0
+        self._stopped = False
+        self._dispatcher = threading.Thread(target=self._dispatch_loop, name="tend-dispatcher", daemon=True)
+        self._dispatcher.start()
+
+    # -- public API --------------------------------------------------------
+
+    def add(self, project_id, manager, priority=None):
+        """Tend `manager`'s field; replaces a different manager already tended for the project."""
+        if priority is None:
+            priority = manager.config.get("tending_priority", DEFAULT_PRIORITY)
+        priority = _priority(priority)
+        with self._cond:
+            field = self._fields.get(project_id)
+            if field is not None and field.manager is manager:
+                field.priority = priority
+                return
+            # Join at the current minimum so a newcomer neither jumps the queue nor waits out others' history
+            vtime = min((f.vtime for f in self._fields.values()), default=0.0)
+            self._fields[project_id] = _Field(project_id, manager, priority, vtime)
+            self._cond.notify()
+
+    def remove(self, project_id):
+        """Stop tending a field; its queued jobs are dropped, running ones finish unobserved."""
+        with self._cond:
+            removed = self._fields.pop(project_id, None) is not None
+            self._cond.notify()
+            return removed
+
+    def set_priority(self, project_id, priority):
+        with self._cond:
+            field = self._fields.get(project_id)
+            if field is None:
+                return False
+            field.priority = _priority(priority)
+            return True
+
+    def is_tending(self, project_id):
+        with self._cond:
+            return project_id in self._fields
+
+    def active(self):
+        """Project ids being tended."""
+        with self._cond:
+            return list(self._fields)
+
+    def queue_depth(self):
+        """Jobs waiting for a worker, across all fields."""
+        with self._cond:
+            return sum(len(f.jobs) for f in self._fields.values())
+
+    def stats(self):
+        with self._cond:
+            return {
+                "workers": self.workers,
+                "running": self._running,
+                "queue_depth": sum(len(f.jobs) for f in self._fields.values()),
+                "stages": {
+                    stage: {"limit": limit, "running": self._stage_running[stage],
+                            "queued": sum(1 for f in self._fields.values() for job in f.jobs if job[0] == stage)}
+                    for stage, limit in self.stage_limits.items()
+                },
+                "fields": {
+                    pid: {"priority": f.priority, "stage": f.stage, "queued": len(f.jobs),
+                          "running": f.running, "in_flight": f.in_flight, "rounds": f.rounds}
+                    for pid, f in self._fields.items()
+                },
+            }
+
+    def shutdown(self, wait=True):
+        with self._cond:
+            self._stopped = True
+            self._fields.clear()
+            self._cond.notify()
+        self._dispatcher.join()
+        self._pool.shutdown(wait=wait)
+
+    # -- dispatching -------------------------------------------------------
+
+    def _dispatch_loop(self):
+        with self._cond:
+            while not self._stopped:
+                now = time.monotonic()
+                busy = min((f.vtime for f in self._fields.values() if f.jobs or f.running), default=None)
+                for field in self._fields.values():
+                    if field.stage == "idle" and field.next_poll <= now:
+                        # Time spent idle earns no credit over fields that kept working
+                        if busy is not None:
+                            field.vtime = max(field.vtime, busy)
+                        field.stage = "plan"
+                        field.jobs.append(("plan", None, field.manager.begin_round, (False,)))
+                throttled = False
+                while self._running < self.workers:
+                    picked = self._next_job(throttled)
+                    if picked is None:
+                        break
+                    field, index = picked
+                    if field.jobs[index][0] in LLM_STAGES and not self.bucket.try_acquire():
+                        throttled = True
+                        continue
+                    self._start(field, field.jobs.pop(index))
+                self._publish()
+                waits = [f.next_poll - now for f in self._fields.values() if f.stage == "idle"]
+                if throttled:
+                    waits.append(self.bucket.delay())
+                self._cond.wait(max(0.0, min(waits)) if waits else None)
+
+    def _runnable(self, stage, throttled):
+        if stage in self.stage_limits and self._stage_running[stage] >= self.stage_limits[stage]:
+            return False
+        return not (throttled and stage in LLM_STAGES)
+
+    def _next_job(self, throttled):
+        """
+        (field, job index) to start next: from the field with the least
+        virtual time that has a job able to start, its job furthest along
+        the pipeline. None if nothing can start.
+        """
+        best = None
+        for field in self._fields.values():
+            if best is not None and (field.vtime, field.project_id) >= (best[0].vtime, best[0].project_id):
+                continue
+            runnable = [i for i, job in enumerate(field.jobs) if self._runnable(job[0], throttled)]
+            if runnable:
+                best = (field, max(runnable, key=lambda i: stage_rank(field.jobs[i][0])))
+        return best
+
+    def _start(self, field, job):
+        stage, seed, fn, args = job
+        field.vtime += 1 / field.priority
+        field.running += 1
+        self._running += 1
+        if stage in self._stage_running:
+            self._stage_running[stage] += 1
+        future = self._pool.submit(fn, *args)
+        future.add_done_callback(lambda f: self._done(field, stage, seed, f))
+
+    def _done(self, field, stage, seed, future):
+        with self._cond:
+            field.running -= 1
+            self._running -= 1
+            if stage in self._stage_running:
+                self._stage_running[stage] -= 1
+            try:
+                result, error = future.result(), None
+            except Exception as e:
+                result, error = None, e
+                print(f"[{field.project_id}] Tending {stage} failed: {str(e)[:200]}")
+            if self._fields.get(field.project_id) is field:
+                self._advance(field, stage, seed, result, error)
+            self._cond.notify()
+
+    def _advance(self, field, stage, seed, result, error):
+        """Queue what follows a finished job: a round's seeds, a seed's next stage, or the next round."""
+        if stage == "plan":
+            if error is not None or not result:
+                field.stage = "idle"
+                field.next_poll = time.monotonic() + self.idle_poll
+                return
+            field.stage = "tending"
+            field.in_flight = len(result)
+            field.jobs.extend((GENERATE, s, s.advance, (GENERATE,)) for s in result)
+        elif stage == REAP:
+            if result is not None:  # the reseed replacing this seed starts right away
+                field.jobs.append((GENERATE, result, result.advance, (GENERATE,)))
+                return
+            field.in_flight -= 1
+            if field.in_flight == 0:
+                field.rounds += 1
+                field.stage = "idle"
+                field.next_poll = time.monotonic()
+        else:
+            if error is not None:
+                next_stage = REAP
+                log_entry = f"[seed_{seed.seed_id}] [{seed.task}] [Error] [{stage}: {str(error)[:100]}]"
+            else:
+                next_stage, log_entry = result, seed.log_entry
+            if next_stage == REAP:
+                field.jobs.append((REAP, seed, field.manager.settle_seed, (seed, log_entry)))
+            else:
+                field.jobs.append((next_stage, seed, seed.advance, (next_stage,)))
+
+    def _publish(self):
+        TEND_QUEUE_DEPTH.set(sum(len(f.jobs) for f in self._fields.values()))
+        TEND_RUNNING.set(self._running)
+
+
+_supervisor = None
+_supervisor_lock = threading.Lock()
+
+
+def supervisor():
+    """The process-wide TendingSupervisor (created on first use, sized by config.json's "tend_workers")."""
+    global _supervisor
+    with _supervisor_lock:
+        if _supervisor is None:
+            try:
+                config = load_config()
+            except FileNotFoundError:
+                config = {}
+            _supervisor = TendingSupervisor(
+                workers=int(config.get("tend_workers", DEFAULT_WORKERS)),
+                bucket=rate_limit.seed_generation(config),
+                stage_limits=seed_pipeline.stage_limits(config),
+            )
+        return _supervisor
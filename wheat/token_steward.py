@@ -3,6 +3,8 @@ import json
 import os
 from datetime import datetime, timedelta
 
+from wheat.atomic_io import atomic_write_json, update_json
+
 class TokenSteward:
     def __init__(self):
         # Load config from central config.json
@@ -54,9 +56,8 @@ class TokenSteward:
             self.save_log()
 
     def save_log(self):
-        # Persist token usage to file
-        with open(self.file, "w") as f:
-            json.dump(self.data, f)
+        # Persist token usage to file (atomically, so a concurrent load never sees half of it)
+        atomic_write_json(self.file, self.data, indent=None)
 
     def can_water(self, tokens_needed, is_output=False):
         # No limits for now—just tracking
@@ -71,15 +72,22 @@ class TokenSteward:
         return True
 
     def water_used(self, prompt_tokens, completion_tokens):
-        # Accumulate token usage (water) for the day
-        current_time = datetime.now()
-        period_end = datetime.fromisoformat(self.data["period_end"])
-        if current_time >= period_end:
-            print("Daily period expired; resetting token counts.")
-            self.data = self._initialize_data()
-        self.data["prompt_tokens"] += prompt_tokens
-        self.data["completion_tokens"] += completion_tokens
-        self.data["total_tokens"] += prompt_tokens + completion_tokens
-        self.save_log()
+        # Accumulate token usage (water) for the day. The deltas are added to
+        # the file's totals under its lock, so every steward's usage counts.
+        def add(current):
+            try:
+                expired = datetime.now() >= datetime.fromisoformat(current["period_end"])
+            except (KeyError, TypeError, ValueError):
+                expired = True
+            if expired:
+                if current:
+                    print("Daily period expired; resetting token counts.")
+                current = self._initialize_data()
+            current["prompt_tokens"] = current.get("prompt_tokens", 0) + prompt_tokens
+            current["completion_tokens"] = current.get("completion_tokens", 0) + completion_tokens
+            current["total_tokens"] = current.get("total_tokens", 0) + prompt_tokens + completion_tokens
+            return current
+
+        self.data = update_json(self.file, add, indent=None)
         print(f"Tokens used: Prompt={self.data['prompt_tokens']}, Completion={self.data['completion_tokens']}, Total={self.data['total_tokens']} "
-              f"(Period ends: {self.data['period_end']})")
\ No newline at end of file
+              f"(Period ends: {self.data['period_end']})")
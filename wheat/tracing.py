@@ -0,0 +1,164 @@
+"""
+Tracing — Lightweight spans for profiling the daily cycle.
+
+Code that might be slow wraps itself in a span:
+
+  with span("claude -p", "provider", model="opus"):
+      subprocess.run(...)
+
+Spans nest and are cheap no-ops unless a trace is active. daily_runner
+starts one per cycle, writes it next to the cycle checkpoint in the
+Chrome trace-event format (chrome://tracing or https://ui.perfetto.dev)
+and puts p50/p95 per category into data/engine_status.json.
+
+Categories in use:
+  phase         — cycle graph nodes (scan:<channel>, correlation, field:<id>, ...)
+  field         — per-field work inside run_field (sowing, tending)
+  seed          — code generation, test and script runs per seed
+  provider      — LLM calls (claude CLI subprocess, HTTP API request)
+  db            — SQLite transactions
+  stewards_map  — stewards map walks
+  wait          — polling sleeps
+"""
+
+import json
+import math
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+_active = None  # The Tracer collecting spans, or None when tracing is off
+_local = threading.local()
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers (None when empty)."""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class Tracer:
+    """Collects finished spans from any thread."""
+
+    def __init__(self, name="cycle"):
+        self.name = name
+        self.pid = os.getpid()
+        self.origin = time.perf_counter()
+        self.started_at = time.time()
+        self.events = []
+        self.threads = {}  # tid -> thread name
+        self._lock = threading.Lock()
+
+    def record(self, name, category, start, end, args=None):
+        """Record a finished span; start/end are time.perf_counter() values."""
+        thread = threading.current_thread()
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self.origin) * 1e6),
+            "dur": round((end - start) * 1e6),
+            "pid": self.pid,
+            "tid": thread.ident,
+        }
+        if args:
+            event["args"] = args
+        with self._lock:
+            self.events.append(event)
+            self.threads.setdefault(thread.ident, thread.name)
+
+    def to_chrome(self):
+        """Return the trace as a Chrome trace-event JSON object."""
+        with self._lock:
+            events = list(self.events)
+            threads = dict(self.threads)
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self.pid, "args": {"name": self.name}},
+        ] + [
+            {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": tname}}
+            for tid, tname in threads.items()
+        ]
+        return {
+            "traceEvents": metadata + sorted(events, key=lambda e: e["ts"]),
+            "displayTimeUnit": "ms",
+            "otherData": {"started_at": self.started_at},
+        }
+
+    def write(self, path):
+        """Write the Chrome trace file and return its path."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome(), f)
+        return path
+
+    def summary(self):
+        """
+        Per-category duration stats in seconds:
+          {category: {"count", "total", "p50", "p95", "max"}}
+        """
+        with self._lock:
+            events = list(self.events)
+        by_category = {}
+        for event in events:
+            by_category.setdefault(event["cat"], []).append(event["dur"] / 1e6)
+        return {
+            category: {
+                "count": len(durations),
+                "total": round(sum(durations), 3),
+                "p50": round(percentile(durations, 50), 3),
+                "p95": round(percentile(durations, 95), 3),
+                "max": round(max(durations), 3),
+            }
+            for category, durations in sorted(by_category.items())
+        }
+
+
+def start_trace(name="cycle"):
+    """Begin collecting spans process-wide and return the Tracer."""
+    global _active
+    _active = Tracer(name)
+    return _active
+
+
+def stop_trace():
+    """Stop collecting spans and return the Tracer that was active (or None)."""
+    global _active
+    tracer, _active = _active, None
+    return tracer
+
+
+def current_tracer():
+    return _active
+
+
+@contextmanager
+def span(name, category="phase", **args):
+    """
+    Time the enclosed block as one span. Extra keyword args are attached to
+    the event. The enclosing span on the same thread is recorded as "parent".
+    A span that raises is still recorded, with the exception type in "error".
+    """
+    tracer = _active
+    if tracer is None:
+        yield
+        return
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    if stack:
+        args["parent"] = stack[-1]
+    stack.append(name)
+    start = time.perf_counter()
+    try:
+        yield
+    except BaseException as e:
+        args["error"] = type(e).__name__
+        raise
+    finally:
+        end = time.perf_counter()
+        stack.pop()
+        tracer.record(name, category, start, end, args)
@@ -1,15 +1,28 @@
 # wheat/wheat_seed.py
-import subprocess
-import sys
 import os
 import time
 import json
-import sqlite3
 from datetime import datetime
 import re
 import threading
+from functools import partial
+from wheat import rate_limit, speculation
+from wheat.cancel import Cancelled
 from wheat.token_steward import TokenSteward
 from wheat.providers import get_provider
+from wheat.seed_runner import run_seed_script, limits_from_config
+from wheat.seed_validator import validate_code, summarize_failure
+from wheat.tracing import span
+from wheat.seed_pipeline import GENERATE, VALIDATE, TEST, RESCUE, REAP, MAX_RESCUES
+
+
+def extract_code(text):
+    """The Python code in a model response (its ```python block, else the whole text)."""
+    start = text.find("```python") + 9
+    end = text.rfind("```")
+    code = text[start:end].strip() if start > 8 and end > start else text
+    code = "\n".join(line for line in code.split("\n") if not line.strip().startswith("```"))
+    return re.sub(r"logging\.basicConfig\((.*?)\)", r"logging.basicConfig(\1, filename='logs/api_usage.log', level=logging.INFO)", code)
 
 
 class WheatSeed:
@@ -31,7 +44,9 @@ class WheatSeed:
         self.rescuer_model = models.get("rescuer", self.coder_model)
 
         self.provider = get_provider(config)
+        self.exec_limits = limits_from_config(config)
         self.llm_api = config.get("llm_api", "venice")
+        self.speculative = speculation.settings(config)  # None unless speculative mode is on
         self.lifespan = config["lifespan"]
 
         # Project-aware paths
@@ -56,8 +71,13 @@ class WheatSeed:
         self.code = ""
         self.retry_count = 0
         self.coder_prompt = None  # Will be set by FieldManager
+        self.rescue_error = None  # failure context the next rescue works from
+        self.log_entry = None  # run log line, set when the seed settles
+        self.store = None  # SeedStore for this seed's run, attached by FieldManager
+        self._spend_lock = threading.Lock()
 
-    def generate_code(self, rescue_code=None, rescue_error=None, coder_prompt=None):
+    def _prompt(self, rescue_code=None, rescue_error=None, coder_prompt=None):
+        """(prompt, model) for a first attempt or, given the failed code and error, a rescue."""
         if coder_prompt:
             prompt = coder_prompt
         elif rescue_code and rescue_error:
@@ -68,110 +88,246 @@ class WheatSeed:
 
         # Use rescuer model for retries, coder model for first attempt
         model = self.rescuer_model if (rescue_code and rescue_error) else self.coder_model
+        return prompt, model
 
-        print(f"Seed {self.seed_id}: Starting code generation with {model}")
-        try:
-            text, usage = self.provider.generate(
-                prompt=prompt,
-                model=model,
-                max_tokens=self.config["max_tokens"],
-                sunshine_dir=self.sunshine_dir,
-            )
-
-            # Log to DB
-            db_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "wheat.db")
-            with sqlite3.connect(db_path, timeout=15) as conn:
-                c = conn.cursor()
-                c.execute("UPDATE runs SET prompt_tokens = prompt_tokens + ?, completion_tokens = completion_tokens + ?, total_tokens = total_tokens + ? WHERE id = (SELECT MAX(id) FROM runs WHERE project_id = ?)",
-                          (usage["prompt_tokens"], usage["completion_tokens"], usage["prompt_tokens"] + usage["completion_tokens"], self.project_id))
-                conn.commit()
-
+    def _spend(self, usage, model):
+        # Run token totals are written with the next save_progress() flush
+        with self._spend_lock:
+            if self.store is not None:
+                self.store.add_tokens(usage["prompt_tokens"], usage["completion_tokens"])
             self.token_steward.water_used(usage["prompt_tokens"], usage["completion_tokens"])
             self.progress["output"].append(f"Seed {self.seed_id}: Prompt={usage['prompt_tokens']}, Completion={usage['completion_tokens']}, Model={model}")
-            print(f"Seed {self.seed_id}: Response received from {model}")
-
-            # Extract code from response
-            raw_code = text
-            start = raw_code.find("```python") + 9
-            end = raw_code.rfind("```")
-            code = raw_code[start:end].strip() if start > 8 and end > start else raw_code
-            code = "\n".join(line for line in code.split("\n") if not line.strip().startswith("```"))
-            code = re.sub(r"logging\.basicConfig\((.*?)\)", r"logging.basicConfig(\1, filename='logs/api_usage.log', level=logging.INFO)", code)
-            self.code = code
-
-            # Save generated code
-            if self.project_id and self.project_id != "default":
-                log_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "projects", self.project_id, "seeds", "generated")
-            else:
-                log_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "seeds", "generated")
-            os.makedirs(log_dir, exist_ok=True)
-            self.progress["code_file"] = os.path.join(log_dir, f"seed_{self.seed_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.py")
-            with open(self.progress["code_file"], "w", encoding="utf-8") as f:
-                f.write(code)
-            print(f"Seed {self.seed_id}: Code saved to {self.progress['code_file']}")
-            self.save_progress()
 
-        except Exception as e:
-            print(f"Seed {self.seed_id}: Error in generate_code - {str(e)[:200]}")
-            self.progress["status"] = "Barren"
-            self.progress["output"].append(f"Seed {self.seed_id}: Failed - {str(e)[:100]}")
-            self.save_progress()
+    def _save_code(self, code):
+        if self.project_id and self.project_id != "default":
+            log_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "projects", self.project_id, "seeds", "generated")
+        else:
+            log_dir = os.path.join(os.path.dirname(os.path.realpath(__file__)), "seeds", "generated")
+        os.makedirs(log_dir, exist_ok=True)
+        self.progress["code_file"] = os.path.join(log_dir, f"seed_{self.seed_id}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.py")
+        with open(self.progress["code_file"], "w", encoding="utf-8") as f:
+            f.write(code)
+        print(f"Seed {self.seed_id}: Code saved to {self.progress['code_file']}")
 
-    def grow_and_reap(self):
+    def generate_code(self, rescue_code=None, rescue_error=None, coder_prompt=None):
+        prompt, model = self._prompt(rescue_code, rescue_error, coder_prompt)
+
+        print(f"Seed {self.seed_id}: Starting code generation with {model}")
+        with span(f"seed {self.seed_id} generate", "seed", project=self.project_id, model=model, rescue=bool(rescue_code)):
+            try:
+                text, usage = self.provider.generate(
+                    prompt=prompt,
+                    model=model,
+                    max_tokens=self.config["max_tokens"],
+                    sunshine_dir=self.sunshine_dir,
+                )
+
+                self._spend(usage, model)
+                print(f"Seed {self.seed_id}: Response received from {model}")
+
+                self.code = extract_code(text)
+                self._save_code(self.code)
+                self.save_progress()
+
+            except Exception as e:
+                print(f"Seed {self.seed_id}: Error in generate_code - {str(e)[:200]}")
+                self.progress["status"] = "Barren"
+                self.progress["output"].append(f"Seed {self.seed_id}: Failed - {str(e)[:100]}")
+                self.save_progress()
+
+    # -- pipeline stages (see wheat/seed_pipeline.py) ----------------------
+
+    def advance(self, stage):
+        """Run one pipeline stage; returns the stage the seed moves on to (REAP once settled)."""
+        if stage == GENERATE:
+            if self.speculative:
+                return self.speculate()
+            self.generate_code(coder_prompt=self.coder_prompt)
+            return VALIDATE
+        if stage == VALIDATE:
+            return self.validate()
+        if stage == TEST:
+            return self.test()
+        if stage == RESCUE:
+            return self.rescue()
+        raise ValueError(f"no stage {stage!r}")
+
+    def validate(self):
+        """Static checks (autofixes applied), then write script.py; malformed code goes to rescue without a test run."""
         if "API error" in self.task or not self.code:
             self.progress["status"] = "Barren"
             self.progress["timestamp"] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             self.save_progress()
-            return f"[{self.progress['timestamp']}] [seed_{self.seed_id}] [{self.task}] [Barren] [No code generated]"
-        script_path = os.path.join(self.seed_dir, "script.py")
-        with open(script_path, "w", encoding="utf-8") as f:
+            self.log_entry = f"[{self.progress['timestamp']}] [seed_{self.seed_id}] [{self.task}] [Barren] [No code generated]"
+            return REAP
+        with span(f"seed {self.seed_id} validate", "seed", project=self.project_id, attempt=self.retry_count):
+            validation = validate_code(self.code, search_paths=[self.seed_dir, os.getcwd()])
+        if validation["fixes"]:
+            self.code = validation["code"]
+            self.progress["output"].append(f"Seed {self.seed_id}: Autofixed - {', '.join(validation['fixes'])}")
+        self.progress["validation"] = {k: validation[k] for k in ("ok", "fixes", "errors")}
+        with open(os.path.join(self.seed_dir, "script.py"), "w", encoding="utf-8") as f:
             f.write(self.code)
-        cmd = [sys.executable, "-m", "unittest", script_path]
-        test_result = subprocess.run(cmd, capture_output=True, text=True)
-        run_result = subprocess.run([sys.executable, script_path], capture_output=True, text=True)
-        output = run_result.stdout or run_result.stderr
-        self.progress["test_result"] = test_result.stdout or test_result.stderr
+        if validation["ok"]:
+            return TEST
+        self.progress["test_result"] = f"Validation failed:\n{validation['context']}"
+        self.progress["execution"] = {"passed": False, "tests_run": 0}
+        return self.settle(False, validation["context"])
+
+    def test(self):
+        """Run script.py under the execution limits."""
+        with span(f"seed {self.seed_id} test", "seed", project=self.project_id, attempt=self.retry_count):
+            execution = run_seed_script(os.path.join(self.seed_dir, "script.py"), **self.exec_limits)
+        self.progress["test_result"] = execution["output"]
+        self.progress["execution"] = {k: v for k, v in execution.items() if k != "output"}
+        passed = execution["passed"]
+        return self.settle(passed, None if passed else summarize_failure(execution))
+
+    def settle(self, passed, error_context=None):
+        """Record a validation or test outcome: Fruitful, Barren, or Repairing while rescues remain."""
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         self.progress["timestamp"] = timestamp
-        if "OK" in self.progress["test_result"]:
+        if passed:
             self.progress["status"] = "Fruitful"
             log_entry = f"[{timestamp}] [seed_{self.seed_id}] [{self.task}] [Fruitful] [OK]"
         else:
-            error_msg = self.progress["test_result"] if self.progress["test_result"] else "Unknown error"
-            if self.retry_count < 2:
+            error_msg = error_context or "Unknown error"
+            if self.retry_count < MAX_RESCUES:
                 self.retry_count += 1
+                self.rescue_error = error_msg
                 self.progress["status"] = "Repairing"
-                self.progress["output"].append(f"Seed {self.seed_id}: Retry {self.retry_count}/2 with {self.rescuer_model} - {error_msg[-100:]}")
-                self.generate_code(self.code, error_msg)
-                return self.grow_and_reap()
-            else:
-                self.progress["status"] = "Barren"
-                log_entry = f"[{timestamp}] [seed_{self.seed_id}] [{self.task}] [Barren] [FAILED] [{error_msg[-100:]}]"
+                self.progress["output"].append(f"Seed {self.seed_id}: Retry {self.retry_count}/{MAX_RESCUES} with {self.rescuer_model} - {error_msg[-100:]}")
+                return RESCUE
+            self.progress["status"] = "Barren"
+            log_entry = f"[{timestamp}] [seed_{self.seed_id}] [{self.task}] [Barren] [FAILED] [{error_msg[-100:]}]"
         self.progress["output"].append(log_entry)
         self.save_progress()
-        return log_entry
+        self.log_entry = log_entry
+        return REAP
+
+    def rescue(self):
+        """Regenerate the code with the rescuer model, given the last failure."""
+        if self.speculative:
+            return self.speculate(rescue=True)
+        self.generate_code(self.code, self.rescue_error)
+        return VALIDATE
+
+    # -- speculative generation (see wheat/speculation.py) -----------------
+
+    def speculate(self, rescue=False):
+        """
+        Generate (or rescue) by racing speculative candidates. The winner's
+        code is adopted and the seed settles Fruitful; if none passed, the
+        closest candidate's failure goes to settle() like a failed test.
+        """
+        if rescue:
+            prompt, model = self._prompt(self.code, self.rescue_error)
+        else:
+            prompt, model = self._prompt(coder_prompt=self.coder_prompt)
+        models = speculation.candidate_models(self.speculative, model)
+        print(f"Seed {self.seed_id}: Racing {len(models)} candidates ({', '.join(models)})")
+        with span(f"seed {self.seed_id} speculate", "seed", project=self.project_id, rescue=rescue, candidates=len(models)):
+            report = speculation.race(partial(self._candidate, prompt), models)
+
+        self.progress.setdefault("speculation", []).append(speculation.summary(report))
+        if report["winner"] is not None:
+            outcome = f"candidate {report['winner']} ({report['model']}) fruitful after {report['time_to_first_fruitful']:.1f}s"
+        else:
+            outcome = "no candidate passed"
+        self.progress["output"].append(
+            f"Seed {self.seed_id}: Speculation - {outcome}, {report['tokens']} tokens, {report['cancelled']} cancelled")
+
+        tried = [r for r in report["results"] if r.get("execution")]
+        if not tried:
+            # No candidate got as far as a result: validate reaps the seed (or re-checks the code a rescue started from)
+            self.save_progress()
+            return VALIDATE
+        if report["winner"] is not None:
+            best = report["results"][report["winner"]]
+        else:
+            best = max(tried, key=lambda r: (r["validation"]["ok"], r["execution"].get("tests_run", 0)
+                                             - r["execution"].get("failures", 0) - r["execution"].get("errors", 0)))
+        self.code = best["code"]
+        self._save_code(self.code)
+        with open(os.path.join(self.seed_dir, "script.py"), "w", encoding="utf-8") as f:
+            f.write(self.code)
+        self.progress["validation"] = best["validation"]
+        self.progress["test_result"] = best["test_result"]
+        self.progress["execution"] = best["execution"]
+        return self.settle(best["passed"], best["error"])
+
+    def _candidate(self, prompt, record, cancel):
+        """One speculative candidate: generate with record["model"], then validate and test it in its own directory."""
+        model = record["model"]
+        candidate_dir = os.path.join(self.seed_dir, f"candidate_{record['index']}")
+        os.makedirs(candidate_dir, exist_ok=True)
+        if record["index"] > 0:  # the stage's own job took the first candidate's token
+            bucket = rate_limit.seed_generation(self.config)
+            while not bucket.acquire(timeout=0.5):
+                cancel.check()
+        cancel.check()
+        with span(f"seed {self.seed_id} candidate {record['index']}", "seed", project=self.project_id, model=model):
+            try:
+                text, usage = self.provider.generate(
+                    prompt=prompt,
+                    model=model,
+                    max_tokens=self.config["max_tokens"],
+                    sunshine_dir=self.sunshine_dir,
+                    cancel=cancel,
+                )
+            except Cancelled:
+                # Killed mid-call: the prompt was already sent, so count it (estimated
+                # the way the CLI provider does) rather than reporting the loser as free
+                usage = {"prompt_tokens": len(prompt) // 4, "completion_tokens": 0}
+                self._spend(usage, model)
+                record["tokens"] = usage["prompt_tokens"]
+                record["tokens_estimated"] = True
+                raise
+            self._spend(usage, model)
+            record["tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+            code = extract_code(text)
+            if not code.strip():
+                record["error"] = "No code generated"
+                return
+            validation = validate_code(code, search_paths=[candidate_dir, os.getcwd()])
+            record["code"] = validation["code"]
+            record["validation"] = {k: validation[k] for k in ("ok", "fixes", "errors")}
+            script_path = os.path.join(candidate_dir, "script.py")
+            with open(script_path, "w", encoding="utf-8") as f:
+                f.write(record["code"])
+            if not validation["ok"]:
+                record["error"] = validation["context"]
+                record["test_result"] = f"Validation failed:\n{validation['context']}"
+                record["execution"] = {"passed": False, "tests_run": 0}
+                return
+            cancel.check()
+            execution = run_seed_script(script_path, **{**self.exec_limits, "cancel": cancel})
+        record["test_result"] = execution["output"]
+        record["execution"] = {k: v for k, v in execution.items() if k != "output"}
+        record["passed"] = execution["passed"]
+        if not execution["passed"]:
+            record["error"] = summarize_failure(execution)
+
+    def grow_and_reap(self):
+        """Validate, test and rescue on the calling thread until the seed settles; returns its log entry."""
+        stage = VALIDATE
+        while stage != REAP:
+            stage = self.advance(stage)
+        return self.log_entry
 
     def is_alive(self):
         return time.time() - self.start_time < self.lifespan
 
     def fruitfulness(self):
-        fruitful = "API error" not in self.task and os.path.exists(os.path.join(self.seed_dir, "script.py")) and "OK" in self.progress.get("test_result", "")
+        execution = self.progress.get("execution")
+        passed = execution["passed"] if execution else "OK" in self.progress.get("test_result", "")
+        fruitful = "API error" not in self.task and os.path.exists(os.path.join(self.seed_dir, "script.py")) and passed
         return fruitful
 
     def save_progress(self):
-        conn = sqlite3.connect(os.path.join(os.path.dirname(os.path.realpath(__file__)), "..", "wheat.db"), timeout=15)
-        try:
-            c = conn.cursor()
-            c.execute("UPDATE seeds SET status = ?, output = ?, code_file = ?, test_result = ? WHERE seed_id = ? AND project_id = ?",
-                      (self.progress["status"], json.dumps(self.progress["output"]), self.progress["code_file"], self.progress["test_result"], self.seed_id, self.project_id))
-            if c.rowcount == 0:
-                max_id_row = c.execute("SELECT MAX(id) FROM runs WHERE project_id = ?", (self.project_id,)).fetchone()
-                run_id = max_id_row[0] if max_id_row and max_id_row[0] else 1
-                c.execute("INSERT INTO seeds (run_id, seed_id, task, status, output, code_file, test_result, project_id) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
-                          (run_id, self.seed_id, self.task, self.progress["status"], json.dumps(self.progress["output"]), self.progress["code_file"], self.progress["test_result"], self.project_id))
-            conn.commit()
-        finally:
-            conn.close()
+        if self.store is not None:
+            with span("save seed progress", "db", seed=self.seed_id):
+                self.store.flush()
         os.makedirs(self.seed_dir, exist_ok=True)
         with open(os.path.join(self.seed_dir, "progress.json"), "w", encoding="utf-8") as f:
             json.dump(self.progress, f)